@@ -5,7 +5,9 @@
 # found in the LICENSE.md file.
 """Main entry point for interfacing with Chrome's remote debugging protocol"""
 import base64
+import binascii
 import gzip
+import hashlib
 import io
 import logging
 import multiprocessing
@@ -19,20 +21,47 @@ import threading
 import time
 import uuid
 import zipfile
+from collections import deque
+from json import JSONDecoder
 if (sys.version_info >= (3, 0)):
     from time import monotonic
     from urllib.parse import urlsplit # pylint: disable=import-error
+    import queue
     unicode = str
     GZIP_TEXT = 'wt'
 else:
     from monotonic import monotonic
     from urlparse import urlsplit # pylint: disable=import-error
+    import Queue as queue
     GZIP_TEXT = 'w'
 try:
     import ujson as json
 except BaseException:
     import json
+try:
+    import xxhash
+    # xxh3 is only available in xxhash 2.0 and later
+    if not hasattr(xxhash, 'xxh3_128_digest'):
+        xxhash = None
+except BaseException:
+    xxhash = None
 from ws4py.client.threadedclient import WebSocketClient
+from internal.support.trace_parser import Trace, classify_category, CATEGORY_FLAGS, \
+    CAT_BLINK_USER_TIMING, CAT_RAIL, CAT_SCREENSHOT, CAT_NETLOG_ONLY
+
+# High-volume methods that are not echoed to the debug log
+UNLOGGED_METHODS = ['Timeline.eventRecorded',
+                    'Target.dispatchMessageFromTarget',
+                    'Target.receivedMessageFromTarget']
+# Base64 characters decoded per chunk when writing bodies (must be a multiple of 4)
+BODY_CHUNK_SIZE = 65536
+TRACE_OUTPUT_THREADS = 4
+SCREENSHOT_WRITER_THREADS = 2
+# Used to split raw trace data into the individual events and their json
+TRACE_EVENT_DECODER = JSONDecoder()
+RE_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# The trace file is ASCII-only (json.dumps escapes everything else)
+RE_NON_ASCII = re.compile(u'[^\x00-\x7f]')
 
 
 class DevTools(object):
@@ -49,6 +78,7 @@ class DevTools(object):
         self.command_id = 0
         self.command_responses = {}
         self.pending_body_requests = {}
+        self.pending_body_request_ids = set()
         self.pending_commands = []
         self.console_log = []
         self.audit_issues = []
@@ -60,6 +90,7 @@ class DevTools(object):
         self.is_navigating = False
         self.last_activity = monotonic()
         self.dev_tools_file = None
+        self.dev_tools_compact = False
         self.trace_file = None
         self.trace_enabled = False
         self.requests = {}
@@ -86,6 +117,7 @@ class DevTools(object):
         self.stylesheets = {}
         self.headers = {}
         self.trace_parser = None
+        self.body_writer = DevToolsBodyWriter()
         self.prepare()
         self.html_body = False
         self.all_bodies = False
@@ -125,6 +157,7 @@ class DevTools(object):
             os.makedirs(self.video_path)
         self.body_fail_count = 0
         self.body_index = 0
+        self.body_writer.stop()
         if self.bodies_zip_file is not None:
             self.bodies_zip_file.close()
             self.bodies_zip_file = None
@@ -220,7 +253,7 @@ class DevTools(object):
                                         websocket_url = tabs[index]['webSocketDebuggerUrl']
                             if websocket_url is not None:
                                 try:
-                                    self.websocket = DevToolsClient(websocket_url)
+                                    self.websocket = DevToolsClient(websocket_url, parse_messages=True)
                                     self.websocket.connect()
                                     self.job['shaper'].set_devtools(self)
                                     ret = True
@@ -230,7 +263,7 @@ class DevTools(object):
                                     # try connecting to 127.0.0.1 instead of localhost
                                     try:
                                         websocket_url = websocket_url.replace('localhost', '127.0.0.1')
-                                        self.websocket = DevToolsClient(websocket_url)
+                                        self.websocket = DevToolsClient(websocket_url, parse_messages=True)
                                         self.websocket.connect()
                                         ret = True
                                     except Exception as err:
@@ -331,6 +364,7 @@ class DevTools(object):
         if (self.bodies_zip_file is None and (self.html_body or self.all_bodies)):
             self.bodies_zip_file = zipfile.ZipFile(self.path_base + '_bodies.zip', 'w',
                                                    zipfile.ZIP_DEFLATED)
+        self.body_writer.start()
         self.recording = True
         if self.use_devtools_video and self.job['video'] and self.task['log_data']:
             self.grab_screenshot(self.video_prefix + '000000.jpg', png=False)
@@ -385,7 +419,6 @@ class DevTools(object):
                 self.job['keep_netlog'] = True
             if 'timeline' in self.job and self.job['timeline']:
                 if self.is_webkit:
-                    from internal.support.trace_parser import Trace
                     self.trace_parser = Trace()
                     self.trace_parser.cpu['main_thread'] = '0'
                     self.trace_parser.threads['0'] = {}
@@ -533,6 +566,7 @@ class DevTools(object):
             self.send_command('Console.disable', {})
             self.send_command('Timeline.stop', {})
             self.get_response_bodies()
+        self.body_writer.stop()
         if self.bodies_zip_file is not None:
             self.bodies_zip_file.close()
             self.bodies_zip_file = None
@@ -542,7 +576,8 @@ class DevTools(object):
                 self.send_command('Network.disable', {}, target_id=target['targetId'])
         self.send_command('ServiceWorker.disable', {})
         if self.dev_tools_file is not None:
-            self.dev_tools_file.write("\n]")
+            if not self.dev_tools_compact:
+                self.dev_tools_file.write("\n]")
             self.dev_tools_file.close()
             self.dev_tools_file = None
         # Save the console logs
@@ -583,16 +618,25 @@ class DevTools(object):
         try:
             raw = self.websocket.get_message(1)
             try:
-                if raw is not None and len(raw):
-                    if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
-                        logging.debug('<- %s', raw[:200])
-                    msg = json.loads(raw)
-                    self.process_message(msg)
+                if raw:
+                    self.process_raw_message(raw)
             except Exception:
                 logging.exception('Error processing websocket message')
         except Exception:
             pass
 
+    def process_raw_message(self, raw):
+        """Log and process a message pulled from the websocket queue"""
+        if isinstance(raw, DevToolsMessage):
+            if raw.method not in UNLOGGED_METHODS:
+                logging.debug('<- %s', raw.preview)
+            self.process_message(raw.msg)
+        else:
+            if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
+                logging.debug('<- %s', raw[:200])
+            msg = json.loads(raw)
+            self.process_message(msg)
+
     def start_collecting_trace(self):
         """Kick off the trace processing asynchronously"""
         if self.trace_enabled and not self.must_exit:
@@ -642,7 +686,7 @@ class DevTools(object):
                         try:
                             raw = self.websocket.get_message(1)
                             try:
-                                if raw is not None and len(raw):
+                                if raw:
                                     no_message_count = 0
                                 else:
                                     no_message_count += 1
@@ -663,7 +707,7 @@ class DevTools(object):
     def get_response_body(self, request_id, wait):
         """Retrieve and store the given response body (if necessary)"""
         if request_id not in self.response_bodies and self.body_fail_count < 3 and not self.is_ios and not self.must_exit:
-            request = self.get_request(request_id, True)
+            request = self.get_request(request_id, False)
             if request is not None and 'status' in request and request['status'] == 200 and \
                     'response_headers' in request and 'url' in request and request['url'].startswith('http'):
                 content_length = self.get_header_value(request['response_headers'], 'Content-Length')
@@ -701,12 +745,12 @@ class DevTools(object):
                             self.process_response_body(request_id, response)
 
     def process_response_body(self, request_id, response):
-        request = self.get_request(request_id, True)
+        request = self.get_request(request_id, False)
         path = os.path.join(self.task['dir'], 'bodies')
         if not os.path.isdir(path):
             os.makedirs(path)
         body_file_path = os.path.join(path, request_id)
-        if not os.path.exists(body_file_path):
+        if request_id not in self.response_bodies and not os.path.exists(body_file_path):
             is_text = False
             if request is not None and 'status' in request and request['status'] == 200 and 'response_headers' in request:
                 content_type = self.get_header_value(request['response_headers'], 'Content-Type')
@@ -729,14 +773,10 @@ class DevTools(object):
             elif len(response['result']['body']):
                 try:
                     self.body_fail_count = 0
-                    # Write the raw body to a file (all bodies)
-                    if 'base64Encoded' in response['result'] and \
-                            response['result']['base64Encoded']:
-                        body = base64.b64decode(response['result']['body'])
-                        is_text = False
-                    else:
-                        body = response['result']['body'].encode('utf-8')
-                        is_text = True
+                    # Write the raw body to a file (all bodies) on the body writer thread
+                    base64_encoded = bool('base64Encoded' in response['result'] and
+                                          response['result']['base64Encoded'])
+                    is_text = not base64_encoded
                     if 'request_headers' in request and 'Sec-Fetch-Dest' in request['request_headers']:
                         if request['request_headers']['Sec-Fetch-Dest'] in ['audio', 'audioworklet', 'font', 'image', 'object', 'track', 'video']:
                             is_text = False
@@ -744,32 +784,69 @@ class DevTools(object):
                     store_body = self.all_bodies
                     if self.html_body and request_id == self.main_request:
                         store_body = True
+                    zip_name = None
                     if store_body and self.bodies_zip_file is not None and is_text:
                         self.body_index += 1
-                        name = '{0:03d}-{1}-body.txt'.format(self.body_index, request_id)
-                        self.bodies_zip_file.writestr(name, body)
-                        logging.debug('%s: Stored body in zip', request_id)
-                    logging.debug('%s: Body length: %d', request_id, len(body))
-                    self.response_bodies[request_id] = body
-                    with open(body_file_path, 'wb') as body_file:
-                        body_file.write(body)
+                        zip_name = '{0:03d}-{1}-body.txt'.format(self.body_index, request_id)
+                    body_info = {'id': request_id, 'path': body_file_path, 'text': not base64_encoded,
+                                 'size': None, 'hash': None}
+                    self.response_bodies[request_id] = body_info
+                    self.body_writer.write(response['result']['body'], base64_encoded, body_info,
+                                           self.bodies_zip_file, zip_name)
                 except Exception:
                     logging.exception('Exception retrieving body')
             else:
                 self.body_fail_count = 0
-                self.response_bodies[request_id] = response['result']['body']
+                self.response_bodies[request_id] = {'id': request_id, 'path': None, 'text': True,
+                                                    'size': 0, 'hash': None}
 
     def get_response_bodies(self):
         """Retrieve all of the response bodies for the requests that we know about"""
         if self.must_exit:
             return
         self.profile_start('get_response_bodies')
-        requests = self.get_requests(True)
+        requests = self.get_requests(False)
         if self.task['error'] is None and requests:
+            # Keep a window of Network.getResponseBody commands in flight and
+            # process the bodies as the responses arrive
+            max_pending = max(1, self.options.bodyrequests)
+            if 'bodyRequests' in self.job:
+                try:
+                    max_pending = max(1, self._to_int(self.job['bodyRequests']))
+                except Exception:
+                    logging.exception('Invalid bodyRequests value')
             for request_id in requests:
-                self.get_response_body(request_id, True)
+                if self.must_exit:
+                    break
+                if request_id in self.pending_body_request_ids:
+                    continue
+                if not self.wait_for_pending_bodies(max_pending - 1, 10):
+                    self.discard_pending_bodies()
+                self.get_response_body(request_id, False)
+            if not self.wait_for_pending_bodies(0, 10):
+                self.discard_pending_bodies()
         self.profile_end('get_response_bodies')
 
+    def wait_for_pending_bodies(self, max_pending, timeout):
+        """Pump messages until no more than max_pending body requests are outstanding"""
+        end_time = monotonic() + timeout
+        while len(self.pending_body_requests) > max_pending and not self.must_exit:
+            if monotonic() >= end_time:
+                return False
+            self.pump_message()
+        return True
+
+    def discard_pending_bodies(self):
+        """Give up on body requests that did not get a response"""
+        # A stall is one failure no matter how many requests were in flight
+        if self.pending_body_requests:
+            self.body_fail_count += 1
+        for command_id in self.pending_body_requests:
+            logging.warning('No response to body request for request %s',
+                            self.pending_body_requests[command_id])
+        self.pending_body_requests = {}
+        self.pending_body_request_ids = set()
+
     def get_request(self, request_id, include_bodies):
         """Get the given request details if it is a real request"""
         request = None
@@ -785,7 +862,13 @@ class DevTools(object):
                 if os.path.isfile(body_file_path):
                     request['body'] = body_file_path
                 if request_id in self.response_bodies:
-                    request['response_body'] = self.response_bodies[request_id]
+                    # Only the metadata is kept in memory, load text bodies back from disk
+                    body_info = self.response_bodies[request_id]
+                    if body_info['path'] is None:
+                        request['response_body'] = ''
+                    elif body_info['text'] and os.path.isfile(body_info['path']):
+                        with open(body_info['path'], 'rb') as f_in:
+                            request['response_body'] = f_in.read()
             # Get the headers from responseReceived
             if 'response' in events:
                 response = events['response'][-1]
@@ -853,12 +936,8 @@ class DevTools(object):
                 while True:
                     raw = self.websocket.get_message(0)
                     try:
-                        if raw is not None and len(raw):
-                            if self.recording:
-                                if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
-                                    logging.debug('<- %s', raw[:200])
-                                msg = json.loads(raw)
-                                self.process_message(msg)
+                        if raw and self.recording:
+                            self.process_raw_message(raw)
                         if not raw:
                             break
                     except Exception:
@@ -895,11 +974,8 @@ class DevTools(object):
                         try:
                             raw = self.websocket.get_message(1)
                             try:
-                                if raw is not None and len(raw):
-                                    if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
-                                        logging.debug('<- %s', raw[:200])
-                                    msg = json.loads(raw)
-                                    self.process_message(msg)
+                                if raw:
+                                    self.process_raw_message(raw)
                                     if command_id in self.command_responses:
                                         ret = self.command_responses[command_id]
                                         del self.command_responses[command_id]
@@ -909,6 +985,7 @@ class DevTools(object):
                             pass
             elif method == 'Network.getResponseBody' and 'requestId' in params:
                 self.pending_body_requests[command_id] = params['requestId']
+                self.pending_body_request_ids.add(params['requestId'])
 
         elif self.websocket:
             self.command_id += 1
@@ -926,11 +1003,8 @@ class DevTools(object):
                         try:
                             raw = self.websocket.get_message(1)
                             try:
-                                if raw is not None and len(raw):
-                                    if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
-                                        logging.debug('<- %s', raw[:200])
-                                    msg = json.loads(raw)
-                                    self.process_message(msg)
+                                if raw:
+                                    self.process_raw_message(raw)
                                     if command_id in self.command_responses:
                                         ret = self.command_responses[command_id]
                                         del self.command_responses[command_id]
@@ -940,6 +1014,7 @@ class DevTools(object):
                             pass
                 elif method == 'Network.getResponseBody' and 'requestId' in params:
                     self.pending_body_requests[command_id] = params['requestId']
+                    self.pending_body_request_ids.add(params['requestId'])
             except Exception as err:
                 logging.exception("Websocket send error: %s", err.__str__())
         return ret
@@ -960,11 +1035,8 @@ class DevTools(object):
                 try:
                     raw = self.websocket.get_message(interval)
                     try:
-                        if raw is not None and len(raw):
-                            if raw.find("Timeline.eventRecorded") == -1 and raw.find("Target.dispatchMessageFromTarget") == -1 and raw.find("Target.receivedMessageFromTarget") == -1:
-                                logging.debug('<- %s', raw[:200])
-                            msg = json.loads(raw)
-                            self.process_message(msg)
+                        if raw:
+                            self.process_raw_message(raw)
                     except Exception:
                         logging.exception('Error processing message while waiting for page load')
                 except Exception:
@@ -1337,6 +1409,7 @@ class DevTools(object):
                 request_id = self.pending_body_requests[response_id]
                 self.process_response_body(request_id, msg)
                 del(self.pending_body_requests[response_id])
+                self.pending_body_request_ids.discard(request_id)
             if response_id in self.pending_commands:
                 self.pending_commands.remove(response_id)
                 self.command_responses[response_id] = msg
@@ -1632,12 +1705,21 @@ class DevTools(object):
         """Log the dev tools events to a file"""
         if self.task['log_data']:
             if self.dev_tools_file is None:
-                path = self.path_base + '_devtools.json.gz'
-                self.dev_tools_file = gzip.open(path, GZIP_TEXT, 7)
-                self.dev_tools_file.write("[{}")
+                self.dev_tools_compact = bool('compactDevtoolsLog' in self.job and self.job['compactDevtoolsLog'])
+                if self.dev_tools_compact:
+                    # One event per line with fast compression so it can be streamed back
+                    path = self.path_base + '_devtools.jsonl.gz'
+                    self.dev_tools_file = gzip.open(path, GZIP_TEXT, 1)
+                else:
+                    path = self.path_base + '_devtools.json.gz'
+                    self.dev_tools_file = gzip.open(path, GZIP_TEXT, 7)
+                    self.dev_tools_file.write("[{}")
             if self.dev_tools_file is not None:
-                self.dev_tools_file.write(",\n")
-                self.dev_tools_file.write(json.dumps(msg))
+                if self.dev_tools_compact:
+                    self.dev_tools_file.write(json.dumps(msg) + "\n")
+                else:
+                    self.dev_tools_file.write(",\n")
+                    self.dev_tools_file.write(json.dumps(msg))
 
     def get_header_value(self, headers, name):
         """Get the value for the requested header"""
@@ -1694,14 +1776,250 @@ class DevTools(object):
                     self.task['profile_data'][event_name]['d'] = round(self.task['profile_data'][event_name]['e'] - self.task['profile_data'][event_name]['s'], 3)
 
 
+class DevToolsBodyWriter(object):
+    """Background thread that decodes response bodies and writes them to disk"""
+    def __init__(self):
+        self.bodies = queue.Queue()
+        self.thread = None
+
+    def start(self):
+        """Start the writer thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def stop(self):
+        """Finish writing any queued bodies and stop the writer thread"""
+        if self.thread is not None:
+            self.bodies.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def write(self, body, base64_encoded, body_info, zip_file=None, zip_name=None):
+        """Queue a body to be written (writes inline if the thread is not running)"""
+        if self.thread is not None:
+            self.bodies.put((body, base64_encoded, body_info, zip_file, zip_name))
+        else:
+            self.write_body(body, base64_encoded, body_info, zip_file, zip_name)
+
+    def run(self):
+        """Writer thread"""
+        while True:
+            item = self.bodies.get()
+            if item is None:
+                break
+            try:
+                self.write_body(*item)
+            except Exception:
+                logging.exception('Error writing response body')
+
+    def write_body(self, body, base64_encoded, body_info, zip_file, zip_name):
+        """Write the body to disk and record its size and hash"""
+        digest = hashlib.sha1()
+        size = 0
+        with open(body_info['path'], 'wb') as body_file:
+            if base64_encoded:
+                # Decode in fixed-size chunks so only one small decoded piece exists at a time
+                for offset in range(0, len(body), BODY_CHUNK_SIZE):
+                    chunk = binascii.a2b_base64(body[offset:offset + BODY_CHUNK_SIZE])
+                    digest.update(chunk)
+                    body_file.write(chunk)
+                    size += len(chunk)
+            else:
+                data = body.encode('utf-8')
+                digest.update(data)
+                body_file.write(data)
+                size = len(data)
+                if zip_file is not None and zip_name is not None:
+                    zip_file.writestr(zip_name, data)
+                    logging.debug('%s: Stored body in zip', body_info['id'])
+        body_info['size'] = size
+        body_info['hash'] = digest.hexdigest()
+        logging.debug('%s: Body length: %d', body_info['id'], size)
+
+
+class DevToolsTraceWriter(object):
+    """Background thread that processes trace data off of the websocket thread"""
+    def __init__(self, client):
+        self.client = client
+        self.messages = queue.Queue()
+        self.thread = None
+
+    def start(self):
+        """Start the writer thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+            self.thread.start()
+
+    def stop(self):
+        """Finish processing any queued trace data and stop the writer thread"""
+        if self.thread is not None:
+            self.messages.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def write(self, message):
+        """Queue a Tracing.dataCollected message (processes inline if the thread is not running)"""
+        if self.thread is not None:
+            self.messages.put((message, False))
+        else:
+            self.client.process_trace_event(message)
+
+    def complete(self):
+        """Queue the end of the trace behind any pending trace data"""
+        if self.thread is not None:
+            self.messages.put((None, True))
+        else:
+            self.client.trace_complete()
+
+    def run(self):
+        """Writer thread"""
+        while True:
+            item = self.messages.get()
+            if item is None:
+                break
+            message, is_complete = item
+            try:
+                if is_complete:
+                    self.client.trace_complete()
+                else:
+                    self.client.process_trace_event(message)
+            except Exception:
+                logging.exception('Error processing trace data')
+
+
+class DevToolsScreenshotWriter(object):
+    """Small pool of threads that decode devtools screenshots and write them to disk"""
+    def __init__(self, thread_count=SCREENSHOT_WRITER_THREADS):
+        self.images = queue.Queue()
+        self.thread_count = thread_count
+        self.threads = []
+
+    def start(self):
+        """Start the writer threads"""
+        if not self.threads:
+            for _ in range(self.thread_count):
+                thread = threading.Thread(target=self.run)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+
+    def stop(self):
+        """Finish writing any queued screenshots and stop the writer threads"""
+        if self.threads:
+            for _ in self.threads:
+                self.images.put(None)
+            for thread in self.threads:
+                thread.join()
+            self.threads = []
+
+    def write(self, path, img):
+        """Queue a base64 screenshot to be written (writes inline if the threads are not running)"""
+        if self.threads:
+            self.images.put((path, img))
+        else:
+            self.write_image(path, img)
+
+    def run(self):
+        """Writer thread"""
+        while True:
+            item = self.images.get()
+            if item is None:
+                break
+            try:
+                self.write_image(*item)
+            except Exception:
+                logging.exception('Error writing screenshot')
+
+    def write_image(self, path, img):
+        """Decode the screenshot and write it to disk"""
+        with open(path, 'wb') as image_file:
+            image_file.write(base64.b64decode(img))
+
+
+class DevToolsMessage(object):
+    """Websocket message that was already parsed on the reader thread"""
+    def __init__(self, msg, raw):
+        self.msg = msg
+        self.method = None
+        self.id = None
+        if isinstance(msg, dict):
+            self.method = msg.get('method')
+            self.id = msg.get('id')
+        self.preview = raw[:200]
+
+
+class DevToolsMessageQueue(object):
+    """In-process FIFO for handing websocket messages from the reader thread to the consumer"""
+    def __init__(self):
+        self.messages = deque()
+        self.lock = threading.Lock()
+        self.available = threading.Condition(self.lock)
+        self.message_count = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def put(self, message):
+        """Add a message to the queue and wake up any waiting consumer"""
+        with self.available:
+            self.messages.append((message, monotonic()))
+            depth = len(self.messages)
+            if depth > self.max_depth:
+                self.max_depth = depth
+            self.available.notify()
+
+    def get(self, timeout=None):
+        """Return the next message, waiting up to timeout seconds (None if nothing arrives)"""
+        message = None
+        with self.available:
+            if not self.messages and timeout is not None and timeout > 0:
+                end_time = monotonic() + timeout
+                remaining = timeout
+                while not self.messages and remaining > 0:
+                    self.available.wait(remaining)
+                    remaining = end_time - monotonic()
+            if self.messages:
+                message, queued = self.messages.popleft()
+                latency = monotonic() - queued
+                self.message_count += 1
+                self.total_latency += latency
+                if latency > self.max_latency:
+                    self.max_latency = latency
+        return message
+
+    def depth(self):
+        """Number of messages waiting to be consumed"""
+        with self.lock:
+            return len(self.messages)
+
+    def get_stats(self):
+        """Queue depth and enqueue-to-dequeue latency counters"""
+        with self.lock:
+            avg_latency = self.total_latency / self.message_count if self.message_count else 0.0
+            return {'count': self.message_count,
+                    'depth': len(self.messages),
+                    'max_depth': self.max_depth,
+                    'avg_latency': avg_latency,
+                    'max_latency': self.max_latency}
+
+    def clear(self):
+        """Discard any pending messages"""
+        with self.lock:
+            self.messages.clear()
+
+
 class DevToolsClient(WebSocketClient):
     """DevTools WebSocket client"""
     def __init__(self, url, protocols=None, extensions=None, heartbeat_freq=None,
-                 ssl_options=None, headers=None):
+                 ssl_options=None, headers=None, parse_messages=False):
         WebSocketClient.__init__(self, url, protocols, extensions, heartbeat_freq,
                                  ssl_options, headers)
         self.connected = False
-        self.messages = multiprocessing.JoinableQueue()
+        self.parse_messages = parse_messages
+        self.messages = DevToolsMessageQueue()
         self.trace_file = None
         self.video_prefix = None
         self.trace_ts_start = None
@@ -1718,6 +2036,8 @@ class DevToolsClient(WebSocketClient):
         self.last_data = None
         self.keep_timeline = True
         self.trace_done = True
+        self.trace_writer = DevToolsTraceWriter(self)
+        self.screenshot_writer = DevToolsScreenshotWriter()
 
     def opened(self):
         """WebSocket interface - connection opened"""
@@ -1728,33 +2048,47 @@ class DevToolsClient(WebSocketClient):
         """WebSocket interface - connection closed"""
         logging.debug("DevTools websocket disconnected")
         self.connected = False
+        stats = self.messages.get_stats()
+        logging.debug("DevTools message queue: %d messages, max depth %d, latency avg %0.3fms max %0.3fms",
+                      stats['count'], stats['max_depth'],
+                      stats['avg_latency'] * 1000.0, stats['max_latency'] * 1000.0)
 
     def received_message(self, raw):
         """WebSocket interface - message received"""
         try:
             if raw.is_text:
                 message = raw.data.decode(raw.encoding) if raw.encoding is not None else raw.data
+                msg = None
+                # Trace data is recognized from the start of the message so the
+                # raw text can be handed to the trace writer without parsing it
                 compare = message[:50]
-                if self.path_base is not None and compare.find('"Tracing.dataCollected') > -1:
-                    now = monotonic()
+                is_trace_data = compare.find('"Tracing.dataCollected') > -1
+                is_trace_complete = compare.find('"Tracing.tracingComplete') > -1
+                if self.parse_messages and not (is_trace_data and self.path_base is not None):
+                    # Parse once here so the consumer gets a dict with the routing details
                     msg = json.loads(message)
+                    method = msg.get('method') if isinstance(msg, dict) else None
+                    is_trace_data = method == 'Tracing.dataCollected'
+                    is_trace_complete = method == 'Tracing.tracingComplete'
+                if self.path_base is not None and is_trace_data:
+                    now = monotonic()
+                    self.trace_writer.write(msg if msg is not None else message)
                     message = None
-                    if msg is not None:
-                        self.process_trace_event(msg)
                     if self.last_data is None or now - self.last_data >= 1.0:
                         self.last_data = now
-                        self.messages.put('{"method":"got_message"}')
+                        if self.parse_messages:
+                            self.messages.put(DevToolsMessage({"method": "got_message"}, ''))
+                        else:
+                            self.messages.put('{"method":"got_message"}')
                         logging.debug('Processed %d trace events', self.processed_event_count)
                         self.processed_event_count = 0
-                elif self.trace_file is not None and compare.find('"Tracing.tracingComplete') > -1:
-                    if self.processed_event_count:
-                        logging.debug('Processed %d trace events', self.processed_event_count)
-                    self.trace_file.write("\n]}")
-                    self.trace_file.close()
-                    self.trace_file = None
-                    self.trace_done = True
+                elif self.path_base is not None and is_trace_complete:
+                    self.trace_writer.complete()
                 if message is not None:
-                    self.messages.put(message)
+                    if self.parse_messages:
+                        self.messages.put(DevToolsMessage(msg, message))
+                    else:
+                        self.messages.put(message)
         except Exception:
             logging.exception('Error processing received websocket message')
 
@@ -1762,11 +2096,7 @@ class DevToolsClient(WebSocketClient):
         """Wait for and return a message from the queue"""
         message = None
         try:
-            if timeout is None or timeout <= 0:
-                message = self.messages.get_nowait()
-            else:
-                message = self.messages.get(True, timeout)
-            self.messages.task_done()
+            message = self.messages.get(timeout)
         except Exception:
             pass
         return message
@@ -1787,19 +2117,33 @@ class DevToolsClient(WebSocketClient):
         self.dom_tree = dom_tree
         self.performance_timing = performance_timing
         self.trace_done = False
+        self.screenshot_writer.start()
+        self.trace_writer.start()
+
+    def trace_complete(self):
+        """Tracing.tracingComplete, called after all of the trace data was processed"""
+        if self.processed_event_count:
+            logging.debug('Processed %d trace events', self.processed_event_count)
+        if self.trace_file is not None:
+            self.trace_file.write("\n]}")
+            self.trace_file.close()
+            self.trace_file = None
+            self.trace_done = True
 
     def stop_processing_trace(self, job):
         """All done"""
+        self.trace_writer.stop()
         if self.pending_image is not None and self.last_image is not None and\
-                self.pending_image["image"] != self.last_image["image"]:
-            with open(self.pending_image["path"], 'wb') as image_file:
-                image_file.write(base64.b64decode(self.pending_image["image"]))
+                self.pending_image_hash() != self.last_image["hash"]:
+            self.screenshot_writer.write(self.pending_image["path"], self.pending_image["image"])
+        self.screenshot_writer.stop()
         self.pending_image = None
         self.trace_ts_start = None
         if self.trace_file is not None:
             self.trace_file.write("\n]}")
             self.trace_file.close()
             self.trace_file = None
+        task = self.task
         self.options = None
         self.job = None
         self.task = None
@@ -1811,6 +2155,27 @@ class DevToolsClient(WebSocketClient):
             self.trace_parser.post_process_netlog_events()
             logging.debug("Processing the trace timeline events")
             self.trace_parser.ProcessTimelineEvents()
+            # Each output is serialized as it is generated and then compressed
+            # and written by a pool of writer threads.
+            if 'traceGzipLevel' in job:
+                try:
+                    self.trace_parser.gzip_level = min(9, max(1, int(job['traceGzipLevel'])))
+                except Exception:
+                    logging.exception('Invalid traceGzipLevel value')
+            output_queue = queue.Queue()
+            self.trace_parser.output_queue = output_queue
+            threads = []
+            thread_count = TRACE_OUTPUT_THREADS
+            try:
+                thread_count = max(1, min(TRACE_OUTPUT_THREADS, multiprocessing.cpu_count()))
+            except Exception:
+                pass
+            for _ in range(thread_count):
+                thread = threading.Thread(target=self.trace_output_thread,
+                                          args=(output_queue, self.trace_parser, self.path_base, task))
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
             self.trace_parser.WriteUserTiming(self.path_base + '_user_timing.json.gz', self.dom_tree, self.performance_timing)
             if 'timeline' in job and job['timeline']:
                 self.trace_parser.WriteCPUSlices(self.path_base + '_timeline_cpu.json.gz')
@@ -1821,6 +2186,11 @@ class DevToolsClient(WebSocketClient):
             self.trace_parser.WriteFeatureUsage(self.path_base + '_feature_usage.json.gz')
             self.trace_parser.WriteNetlog(self.path_base + '_netlog_requests.json.gz')
             self.trace_parser.WriteV8Stats(self.path_base + '_v8stats.json.gz')
+            self.trace_parser.output_queue = None
+            for _ in threads:
+                output_queue.put(None)
+            for thread in threads:
+                thread.join()
             elapsed = monotonic() - start
             logging.debug("Done processing the trace events: %0.3fs", elapsed)
         self.trace_parser = None
@@ -1830,55 +2200,126 @@ class DevToolsClient(WebSocketClient):
             logging.debug('    %s: %s', cat, self.trace_event_counts[cat])
         self.trace_event_counts = {}
 
+    def trace_output_thread(self, output_queue, trace_parser, path_base, task):
+        """Background thread that writes the trace parser outputs"""
+        while True:
+            output = output_queue.get()
+            if output is None:
+                break
+            out_file, serialized = output
+            start = monotonic()
+            trace_parser.write_json_text(out_file, serialized)
+            end = monotonic()
+            if task is not None and 'profile_data' in task:
+                # Record the time for each output (i.e. dt.write_user_timing)
+                name = out_file[len(path_base):] if out_file.startswith(path_base) else os.path.basename(out_file)
+                if name.endswith('.json.gz'):
+                    name = name[:-8]
+                with task['profile_data']['lock']:
+                    profile_start = task['profile_data']['start']
+                    task['profile_data']['dt.write' + name] = {
+                        's': round(start - profile_start, 3),
+                        'e': round(end - profile_start, 3),
+                        'd': round(end - start, 3)}
+
+    def split_trace_events(self, message):
+        """Split the raw text of a Tracing.dataCollected message into a list of
+        (event, event json) tuples so kept events don't need to be re-serialized"""
+        trace_events = []
+        try:
+            ascii_only = RE_NON_ASCII.search(message) is None
+            start = message.find('"value"')
+            pos = message.index('[', start) + 1 if start >= 0 else len(message)
+            pos = RE_JSON_WHITESPACE.match(message, pos).end()
+            while pos < len(message) and message[pos] != ']':
+                trace_event, end = TRACE_EVENT_DECODER.raw_decode(message, pos)
+                trace_json = message[pos:end]
+                # Keep the one-event-per-line layout of the trace file and
+                # re-serialize (escaped) any events with non-ASCII text
+                if trace_json.find('\n') >= 0 or \
+                        (not ascii_only and RE_NON_ASCII.search(trace_json) is not None):
+                    trace_json = None
+                trace_events.append((trace_event, trace_json))
+                pos = RE_JSON_WHITESPACE.match(message, end).end()
+                if pos < len(message) and message[pos] == ',':
+                    pos = RE_JSON_WHITESPACE.match(message, pos + 1).end()
+        except Exception:
+            msg = json.loads(message)
+            trace_events = []
+            if 'params' in msg and 'value' in msg['params']:
+                trace_events = [(trace_event, None) for trace_event in msg['params']['value']]
+        return trace_events
+
     def process_trace_event(self, msg):
-        """Process Tracing.* dev tools events"""
-        if 'params' in msg and 'value' in msg['params'] and len(msg['params']['value']):
+        """Process Tracing.dataCollected dev tools events (raw message text or
+        an already parsed message)"""
+        trace_events = []
+        if isinstance(msg, dict):
+            if 'params' in msg and 'value' in msg['params']:
+                trace_events = [(trace_event, None) for trace_event in msg['params']['value']]
+        elif msg:
+            trace_events = self.split_trace_events(msg)
+        if len(trace_events):
             if self.trace_file is None and self.keep_timeline:
                 self.trace_file = gzip.open(self.path_base + '_trace.json.gz',
                                             GZIP_TEXT, compresslevel=7)
                 self.trace_file.write('{"traceEvents":[{}')
             if self.trace_parser is None:
-                from internal.support.trace_parser import Trace
                 self.trace_parser = Trace()
             # write out the trace events one-per-line but pull out any
             # devtools screenshots as separate files.
-            trace_events = msg['params']['value']
-            out = ''
-            for _, trace_event in enumerate(trace_events):
+            out = []
+            for trace_event, trace_json in trace_events:
                 self.processed_event_count += 1
                 keep_event = self.keep_timeline
                 process_event = True
-                if self.video_prefix is not None and 'cat' in trace_event and \
+                cat = trace_event.get('cat')
+                flags = 0
+                if cat is not None:
+                    flags = CATEGORY_FLAGS.get(cat)
+                    if flags is None:
+                        flags = classify_category(cat)
+                if self.video_prefix is not None and cat is not None and \
                         'name' in trace_event and 'ts' in trace_event:
                     if self.trace_ts_start is None and \
                             (trace_event['name'] == 'navigationStart' or
                                 trace_event['name'] == 'fetchStart') and \
-                            trace_event['cat'].find('blink.user_timing') > -1:
-                        logging.debug("Trace start detected: %d", trace_event['ts'])
-                        self.trace_ts_start = trace_event['ts']
-                    if self.trace_ts_start is None and \
-                            (trace_event['name'] == 'navigationStart' or
-                                trace_event['name'] == 'fetchStart') and \
-                            trace_event['cat'].find('rail') > -1:
+                            flags & (CAT_BLINK_USER_TIMING | CAT_RAIL):
                         logging.debug("Trace start detected: %d", trace_event['ts'])
                         self.trace_ts_start = trace_event['ts']
-                    if trace_event['name'] == 'Screenshot' and \
-                            trace_event['cat'].find('devtools.screenshot') > -1:
+                    if trace_event['name'] == 'Screenshot' and flags & CAT_SCREENSHOT:
                         keep_event = False
                         process_event = False
                         self.process_screenshot(trace_event)
-                if 'cat' in trace_event:
-                    if trace_event['cat'] not in self.trace_event_counts:
-                        self.trace_event_counts[trace_event['cat']] = 0
-                    self.trace_event_counts[trace_event['cat']] += 1
-                    if not self.job['keep_netlog'] and trace_event['cat'] == 'netlog':
+                if cat is not None:
+                    if cat not in self.trace_event_counts:
+                        self.trace_event_counts[cat] = 0
+                    self.trace_event_counts[cat] += 1
+                    if not self.job['keep_netlog'] and flags & CAT_NETLOG_ONLY:
                         keep_event = False
                     if process_event and self.trace_parser is not None:
                         self.trace_parser.ProcessTraceEvent(trace_event)
                 if keep_event:
-                    out += ",\n" + json.dumps(trace_event)
-            if self.trace_file is not None and len(out):
-                self.trace_file.write(out)
+                    if trace_json is None:
+                        trace_json = json.dumps(trace_event)
+                    out.append(",\n" + trace_json)
+            if self.trace_file is not None and out:
+                self.trace_file.write(''.join(out))
+
+    def screenshot_hash(self, img):
+        """Digest of the base64 screenshot data, used to detect duplicate frames"""
+        data = img if isinstance(img, bytes) else img.encode('ascii')
+        if xxhash is not None:
+            return xxhash.xxh3_128_digest(data)
+        if hasattr(hashlib, 'blake2b'):
+            return hashlib.blake2b(data, digest_size=16).digest()
+        return hashlib.sha1(data).digest()
+
+    def pending_image_hash(self):
+        """Digest of the pending screenshot, only calculated if it is compared"""
+        if self.pending_image["hash"] is None:
+            self.pending_image["hash"] = self.screenshot_hash(self.pending_image["image"])
+        return self.pending_image["hash"]
 
     def process_screenshot(self, trace_event):
         """Process an individual screenshot event"""
@@ -1905,15 +2346,17 @@ class DevToolsClient(WebSocketClient):
                             logging.debug("Discarding pending image: %s",
                                           self.pending_image["path"])
                         self.pending_image = {"image": str(img),
+                                              "hash": None,
                                               "time": int(ms_elapsed),
                                               "path": str(path)}
                 if keep_image:
+                    img_hash = self.screenshot_hash(img)
                     is_duplicate = False
                     if self.pending_image is not None:
-                        if self.pending_image["image"] == img:
+                        if self.pending_image_hash() == img_hash:
                             is_duplicate = True
                     elif self.last_image is not None and \
-                            self.last_image["image"] == img:
+                            self.last_image["hash"] == img_hash:
                         is_duplicate = True
                     if is_duplicate:
                         logging.debug('Dropping duplicate image: %s', path)
@@ -1921,18 +2364,17 @@ class DevToolsClient(WebSocketClient):
                         # write both the pending image and the current one if
                         # the interval is double the normal sampling rate
                         if self.last_image is not None and self.pending_image is not None and \
-                                self.pending_image["image"] != self.last_image["image"]:
+                                self.pending_image_hash() != self.last_image["hash"]:
                             elapsed_interval = ms_elapsed - self.last_image["time"]
                             if elapsed_interval > 2 * min_interval:
-                                pending = self.pending_image["path"]
-                                with open(pending, 'wb') as image_file:
-                                    image_file.write(base64.b64decode(self.pending_image["image"]))
+                                self.screenshot_writer.write(self.pending_image["path"],
+                                                             self.pending_image["image"])
                         self.pending_image = None
-                        with open(path, 'wb') as image_file:
-                            self.last_image = {"image": str(img),
-                                               "time": int(ms_elapsed),
-                                               "path": str(path)}
-                            image_file.write(base64.b64decode(img))
+                        # Only the digest of the last image is needed to detect duplicates
+                        self.last_image = {"hash": img_hash,
+                                           "time": int(ms_elapsed),
+                                           "path": str(path)}
+                        self.screenshot_writer.write(path, img)
 
 class WebKitGTKInspector():
     """Interface for communicating with the WebKitGTK remote inspector protocol"""
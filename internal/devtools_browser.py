@@ -346,7 +346,9 @@ class DevtoolsBrowser(object):
             return
         self.profile_start('dtbrowser.process_devtools_requests')
         path_base = os.path.join(self.task['dir'], self.task['prefix'])
-        devtools_file = path_base + '_devtools.json.gz'
+        devtools_file = path_base + '_devtools.jsonl.gz'
+        if not os.path.isfile(devtools_file):
+            devtools_file = path_base + '_devtools.json.gz'
         if os.path.isfile(devtools_file):
             from internal.support.devtools_parser import DevToolsParser
             out_file = path_base + '_devtools_requests.json.gz'
@@ -963,7 +963,10 @@ class iWptBrowser(BaseBrowser):
                         '-d', video_path, '--force', '--quality',
                         '{0:d}'.format(self.job['imageQuality']),
                         '--viewport', '--orange', '--maxframes', '50', '--histogram', histograms,
-                        '--progress', progress_file]
+                        '--progress', progress_file,
+                        '--jobs', str(self.options.videojobs)]
+                if self.options.fastcompare:
+                    args.append('--fastcompare')
                 if 'debug' in self.job and self.job['debug']:
                     args.append('-vvvv')
                 if 'renderVideo' in self.job and self.job['renderVideo']:
@@ -34,6 +34,10 @@ try:
 except BaseException:
     import json
 
+# Netlog values that should be copied as integers
+RE_NETLOG_NUMBER = re.compile(r'^\d+\.?(\d+)?$')
+RE_NETLOG_NUMBER_PREFIX = re.compile(r'\d+\.?(\d+)?')
+
 class DevToolsParser(object):
     """Main class"""
     def __init__(self, options):
@@ -51,6 +55,7 @@ class DevToolsParser(object):
         self.result = {'pageData': {}, 'requests': []}
         self.request_ids = {}
         self.script_ids = {}
+        self.url_index = None
         self.PRIORITY_MAP = {
             "VeryHigh": "Highest",
             "HIGHEST": "Highest",
@@ -138,19 +143,47 @@ class DevToolsParser(object):
                 except Exception:
                     logging.exception("Error writing to " + self.out_file)
 
+    def iterate_devtools_events(self):
+        """Yield the raw devtools events from the log file"""
+        name, ext = os.path.splitext(self.devtools_file)
+        if ext.lower() == '.gz':
+            f_in = gzip.open(self.devtools_file, GZIP_READ_TEXT)
+            _, ext = os.path.splitext(name)
+        else:
+            f_in = open(self.devtools_file, 'r')
+        try:
+            if ext.lower() == '.jsonl':
+                # Compact log, one event per line
+                for line in f_in:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+            else:
+                first_line = f_in.readline()
+                if first_line.strip() in ['[{}', '[{},']:
+                    # The agent writes the array one event per line so it
+                    # can be streamed instead of loading the whole array
+                    for line in f_in:
+                        line = line.strip()
+                        if line.endswith(','):
+                            line = line[:-1]
+                        if line and line != ']':
+                            yield json.loads(line)
+                else:
+                    raw_events = json.loads(first_line + f_in.read())
+                    if raw_events is not None:
+                        for raw_event in raw_events:
+                            yield raw_event
+        finally:
+            f_in.close()
+
     def extract_net_requests(self):
         """Load the events we are interested in"""
         has_request_headers = False
         net_requests = []
         page_data = {'endTime': 0}
-        _, ext = os.path.splitext(self.devtools_file)
-        if ext.lower() == '.gz':
-            f_in = gzip.open(self.devtools_file, GZIP_READ_TEXT)
-        else:
-            f_in = open(self.devtools_file, 'r')
-        raw_events = json.load(f_in)
-        f_in.close()
-        if raw_events is not None and len(raw_events):
+        raw_events = self.iterate_devtools_events()
+        if raw_events is not None:
             first_timestamp = None
             raw_requests = {}
             extra_headers = {}
@@ -406,9 +439,21 @@ class DevToolsParser(object):
         return net_requests, page_data
 
 
+    def get_requests_by_url(self):
+        """Index of full_url -> list of requests (rebuilt after the request list changes)"""
+        if self.url_index is None:
+            self.url_index = {}
+            for request in self.result['requests']:
+                if 'full_url' in request:
+                    if request['full_url'] not in self.url_index:
+                        self.url_index[request['full_url']] = []
+                    self.url_index[request['full_url']].append(request)
+        return self.url_index
+
     def process_requests(self, raw_requests, raw_page_data):
         """Process the raw requests into high-level requests"""
         self.result = {'pageData': {}, 'requests': []}
+        self.url_index = None
         if 'startTime' not in raw_page_data:
             raw_page_data['startTime'] = 0
         page_data = self.result['pageData']
@@ -873,20 +918,26 @@ class DevToolsParser(object):
                 f_in = open(self.netlog_requests_file, 'r')
             netlog = json.load(f_in)
             f_in.close()
+            # Index the candidate netlog entries by URL (in netlog order)
+            netlog_urls = {}
+            for entry in netlog:
+                if 'url' in entry and 'start' in entry:
+                    if entry['url'] not in netlog_urls:
+                        netlog_urls[entry['url']] = []
+                    netlog_urls[entry['url']].append(entry)
             keep_requests = []
             for request in requests:
                 if 'request_id' not in request and 'id' in request:
                     request['request_id'] = request['id']
-                if 'full_url' in request:
-                    for entry in netlog:
-                        url_matches = False
-                        if 'url' in entry and entry['url'] == request['full_url']:
-                            url_matches = True
+                if 'full_url' in request and request['full_url'] in netlog_urls:
+                    candidates = netlog_urls[request['full_url']]
+                    for index, entry in enumerate(candidates):
                         method_matches = False
                         if 'method' not in entry or 'method' not in request or entry['method'] == request['method']:
                             method_matches = True
-                        if url_matches and method_matches and 'start' in entry and 'claimed' not in entry:
+                        if method_matches:
                             entry['claimed'] = True
+                            del candidates[index]
                             # Keep the protocol from devtools if we have it because it is more accurate
                             protocol = request['protocol'] if 'protocol' in request else None
                             for key in mapping:
@@ -896,7 +947,7 @@ class DevToolsParser(object):
                                             request[mapping[key]] = entry[key]
                                         elif type(entry[key]) is dict:
                                             request[mapping[key]] = entry[key]
-                                        elif re.match(r'^\d+\.?(\d+)?$', str(entry[key]).strip()):
+                                        elif RE_NETLOG_NUMBER.match(str(entry[key]).strip()):
                                             request[mapping[key]] = \
                                                     int(round(float(str(entry[key]).strip())))
                                         else:
@@ -962,6 +1013,7 @@ class DevToolsParser(object):
                             break
             # Just keep the requests that had matching entries in the netlog
             self.result['requests'] = keep_requests
+            self.url_index = None
             requests = self.result['requests']
 
             # Add any requests we didn't know about
@@ -1018,7 +1070,7 @@ class DevToolsParser(object):
                             if key in entry:
                                 if type(entry[key]) is list:
                                     request[mapping[key]] = entry[key]
-                                elif re.match(r'\d+\.?(\d+)?', str(entry[key])):
+                                elif RE_NETLOG_NUMBER_PREFIX.match(str(entry[key])):
                                     request[mapping[key]] = int(round(float(entry[key])))
                                 else:
                                     request[mapping[key]] = str(entry[key])
@@ -1368,7 +1420,6 @@ class DevToolsParser(object):
         """Merge the data from the code coverage file"""
         try:
             page_data = self.result['pageData']
-            requests = self.result['requests']
             if self.coverage is not None and os.path.isfile(self.coverage):
                 _, ext = os.path.splitext(self.coverage)
                 if ext.lower() == '.gz':
@@ -1385,6 +1436,7 @@ class DevToolsParser(object):
                         page_coverage['{0}_bytes_used'.format(category)] = 0
                         page_coverage['{0}_percent_used'.format(category)] = 100.0
                     valid = False
+                    requests_by_url = self.get_requests_by_url()
                     for url in coverage:
                         for category in categories:
                             total = '{0}_bytes'.format(category)
@@ -1395,8 +1447,8 @@ class DevToolsParser(object):
                             if used in coverage[url]:
                                 page_coverage[used] += coverage[url][used]
                                 valid = True
-                        for request in requests:
-                            if 'full_url' in request and request['full_url'] == url:
+                        if url in requests_by_url:
+                            for request in requests_by_url[url]:
                                 request['code_coverage'] = dict(coverage[url])
                     if valid:
                         for category in categories:
@@ -7,12 +7,14 @@ Use of this source code is governed by the Polyform Shield 1.0.0 license that ca
 found in the LICENSE.md file.
 """
 import gzip
+import heapq
 import logging
 import math
 import os
 import re
 import sys
 import time
+from array import array
 if (sys.version_info >= (3, 0)):
     from urllib.parse import urlparse # pylint: disable=import-error
     unicode = str
@@ -29,6 +31,91 @@ try:
 except BaseException:
     import json
 
+# numpy is optional and only used to update the CPU slices of long events
+try:
+    import numpy
+except BaseException:
+    numpy = None
+
+# Trace category classification flags. Chrome traces only use a few dozen
+# distinct category strings so each one is only analyzed once and the flags
+# are cached for every event that follows.
+CAT_TOPLEVEL = 0x01
+CAT_METADATA = 0x02
+CAT_TIMELINE = 0x04
+CAT_FEATURE_USAGE = 0x08
+CAT_USER_TIMING = 0x10
+CAT_BLINK_USER_TIMING = 0x20
+CAT_RAIL = 0x40
+CAT_NETLOG = 0x80
+CAT_NETLOG_ONLY = 0x100
+CAT_V8 = 0x200
+CAT_SCREENSHOT = 0x400
+CAT_KEEP = 0x800
+CATEGORY_FLAGS = {}
+
+# Timeline events spanning at least this many CPU slices are accumulated with
+# vectorized numpy operations (when numpy is available)
+SLICE_VECTOR_MIN = 16
+
+def classify_category(cat):
+    """Get the (cached) classification flags for a trace category string"""
+    flags = CATEGORY_FLAGS.get(cat)
+    if flags is None:
+        flags = 0
+        if cat == 'toplevel' or cat == 'ipc,toplevel':
+            flags |= CAT_TOPLEVEL
+        if cat == '__metadata':
+            flags |= CAT_METADATA
+        if cat.find('devtools.timeline') >= 0:
+            flags |= CAT_TIMELINE
+        if cat.find('blink.feature_usage') >= 0:
+            flags |= CAT_FEATURE_USAGE
+        if cat.find('blink.user_timing') >= 0:
+            flags |= CAT_BLINK_USER_TIMING
+        if cat.find('rail') >= 0:
+            flags |= CAT_RAIL
+        if flags & (CAT_BLINK_USER_TIMING | CAT_RAIL) or \
+                cat.find('loading') >= 0 or cat.find('navigation') >= 0:
+            flags |= CAT_USER_TIMING
+        if cat.find('netlog') >= 0:
+            flags |= CAT_NETLOG
+        if cat == 'netlog':
+            flags |= CAT_NETLOG_ONLY
+        if cat.find('v8') >= 0:
+            flags |= CAT_V8
+        if cat.find('devtools.screenshot') >= 0:
+            flags |= CAT_SCREENSHOT
+        if not flags & CAT_TOPLEVEL and \
+                flags & (CAT_METADATA | CAT_TIMELINE | CAT_FEATURE_USAGE | CAT_USER_TIMING |
+                         CAT_NETLOG | CAT_V8):
+            flags |= CAT_KEEP
+        CATEGORY_FLAGS[cat] = flags
+    return flags
+
+class TimelineEvent(object):
+    """Compact record for a timeline event: thread, event name id, start and
+    end timestamps, script url and child events"""
+    __slots__ = ['t', 'n', 's', 'e', 'js', 'c']
+
+    def __init__(self, thread, name, start, end=None):
+        self.t = thread
+        self.n = name
+        self.s = start
+        self.e = end
+        self.js = None
+        self.c = None
+
+
+class NetlogChunk(object):
+    """Compact record for the bytes transferred by a netlog request, stream or
+    socket at a point in time"""
+    __slots__ = ['ts', 'bytes']
+
+    def __init__(self, ts, byte_count):
+        self.ts = ts
+        self.bytes = byte_count
+
 ##########################################################################
 #   Trace processing
 ##########################################################################
@@ -45,6 +132,12 @@ class Trace():
         self.timeline_events = []
         self.timeline_requests = {}
         self.trace_events = []
+        self.reorder_window = None
+        self.reorder_count = 0
+        self.reorder_last_ts = None
+        self.reorder_late = 0
+        self.reorder_metadata = []
+        self.reorder_thread_keys = {}
         self.interactive = None
         self.long_tasks = None
         self.interactive_start = 0
@@ -60,6 +153,9 @@ class Trace():
         self.netlog_event_types = {}
         self.v8stats = None
         self.v8stack = {}
+        self.slice_views = None
+        self.gzip_level = 9
+        self.output_queue = None
         self.PRIORITY_MAP = {
             "VeryHigh": "Highest",
             "HIGHEST": "Highest",
@@ -75,15 +171,32 @@ class Trace():
     #   Output Logging
     ##########################################################################
     def write_json(self, out_file, json_data):
-        """Write out one of the internal structures as a json blob"""
+        """Write out one of the internal structures as a json blob. The structure
+        is always serialized here, only the compression and writing are handed to
+        the background writers (if an output queue is set) so they never see the
+        live structures that later processing keeps modifying."""
+        try:
+            # Serializing in one call and writing a single buffer keeps the
+            # encoder in C and lets the compression run outside of the GIL
+            serialized = json.dumps(json_data)
+        except BaseException:
+            logging.exception("Error serializing " + out_file)
+            return
+        if self.output_queue is not None:
+            self.output_queue.put((out_file, serialized))
+        else:
+            self.write_json_text(out_file, serialized)
+
+    def write_json_text(self, out_file, serialized):
+        """Write a serialized json blob, gzip compressed for .gz files"""
         try:
             _, ext = os.path.splitext(out_file)
             if ext.lower() == '.gz':
-                with gzip.open(out_file, GZIP_TEXT) as f:
-                    json.dump(json_data, f)
+                with gzip.open(out_file, GZIP_TEXT, compresslevel=self.gzip_level) as f:
+                    f.write(serialized)
             else:
                 with open(out_file, 'w') as f:
-                    json.dump(json_data, f)
+                    f.write(serialized)
         except BaseException:
             logging.exception("Error writing to " + out_file)
 
@@ -148,10 +261,16 @@ class Trace():
     ##########################################################################
     #   Top-level processing
     ##########################################################################
-    def Process(self, trace):
+    def Process(self, trace, reorder_window=None):
+        """Load and process a trace file. If a reorder_window is provided the
+        events are processed as they are read, using a heap of at most
+        reorder_window events to restore timestamp order, instead of
+        buffering and sorting the whole trace."""
         f = None
         line_mode = False
         self.__init__()
+        if reorder_window:
+            self.reorder_window = int(reorder_window)
         logging.debug("Loading trace: %s", trace)
         try:
             _, ext = os.path.splitext(trace)
@@ -218,21 +337,74 @@ class Trace():
 
     def FilterTraceEvent(self, trace_event):
         cat = trace_event['cat']
-        if cat == 'toplevel' or cat == 'ipc,toplevel':
+        flags = CATEGORY_FLAGS.get(cat)
+        if flags is None:
+            flags = classify_category(cat)
+        if flags & CAT_KEEP:
+            if self.reorder_window:
+                self.StreamTraceEvent(trace_event)
+            else:
+                self.trace_events.append(trace_event)
+
+    def StreamTraceEvent(self, trace_event):
+        """Queue an event in the reorder window and process the oldest event
+        once the window is full"""
+        # The sequence number keeps events with the same timestamp in file
+        # order, matching the stable sort used in the buffered mode.
+        entry = (trace_event['ts'], self.reorder_count, trace_event)
+        self.reorder_count += 1
+        if trace_event.get('ph') == 'M' or trace_event['cat'] == '__metadata':
+            # Chrome writes the metadata events (ts=0) at the end of the trace,
+            # they are held out of the window and applied when it is flushed.
+            self.reorder_metadata.append(entry)
             return
-        if cat == 'devtools.timeline' or \
-                cat == '__metadata' or \
-                cat.find('devtools.timeline') >= 0 or \
-                cat.find('blink.feature_usage') >= 0 or \
-                cat.find('blink.user_timing') >= 0 or \
-                cat.find('loading') >= 0 or \
-                cat.find('navigation') >= 0 or \
-                cat.find('rail') >= 0 or \
-                cat.find('netlog') >= 0 or \
-                cat.find('v8') >= 0:
-            self.trace_events.append(trace_event)
+        heapq.heappush(self.trace_events, entry)
+        if len(self.trace_events) > self.reorder_window:
+            self.ProcessStreamedTraceEvent(heapq.heappop(self.trace_events))
+
+    def ProcessStreamedTraceEvent(self, entry):
+        """Process an event that came out of the reorder window"""
+        ts = entry[0]
+        if self.reorder_last_ts is not None and ts < self.reorder_last_ts:
+            # Arrived further out of order than the window could absorb
+            self.reorder_late += 1
+        else:
+            self.reorder_last_ts = ts
+        self.ProcessOrderedTraceEvent(entry)
+
+    def ProcessOrderedTraceEvent(self, entry):
+        """Process a streamed event, remembering the position in timestamp order
+        of the event that first identified each main thread"""
+        ts, count, trace_event = entry
+        main_thread_count = len(self.cpu['main_threads'])
+        self.ProcessTraceEvent(trace_event)
+        for thread in self.cpu['main_threads'][main_thread_count:]:
+            key = (ts, count)
+            if thread not in self.reorder_thread_keys or key < self.reorder_thread_keys[thread]:
+                self.reorder_thread_keys[thread] = key
+
+    def ProcessStreamedMetadata(self):
+        """Apply the held metadata events and put the main threads in the order
+        the buffered mode would have found them"""
+        streamed_threads = self.cpu['main_threads']
+        # Start from an empty list so every thread the metadata names gets a key
+        self.cpu['main_threads'] = []
+        for entry in sorted(self.reorder_metadata, key=lambda entry: entry[:2]):
+            self.ProcessOrderedTraceEvent(entry)
+        self.reorder_metadata = []
+        threads = set(streamed_threads)
+        threads.update(self.cpu['main_threads'])
+        self.cpu['main_threads'] = sorted(threads, key=lambda thread: self.reorder_thread_keys[thread])
 
     def ProcessTraceEvents(self):
+        # flush any events still waiting in the streaming reorder window
+        if self.reorder_window:
+            while self.trace_events:
+                self.ProcessStreamedTraceEvent(heapq.heappop(self.trace_events))
+            self.ProcessStreamedMetadata()
+            if self.reorder_late:
+                logging.warning("%d trace events were out of order by more than the %d event reorder window",
+                                self.reorder_late, self.reorder_window)
         # sort the raw trace events by timestamp and then process them
         if len(self.trace_events):
             logging.debug("Sorting %d trace events", len(self.trace_events))
@@ -252,10 +424,12 @@ class Trace():
 
     def ProcessTraceEvent(self, trace_event):
         cat = trace_event['cat']
+        flags = CATEGORY_FLAGS.get(cat)
+        if flags is None:
+            flags = classify_category(cat)
         if 'ts' in trace_event:
             trace_event['ts'] = int(trace_event['ts'])
-        if cat.find('blink.user_timing') >= 0 or cat.find('rail') >= 0 or \
-                cat.find('loading') >= 0 or cat.find('navigation') >= 0:
+        if flags & CAT_USER_TIMING:
             keep = False
             if 'args' in trace_event and \
                     'data' in trace_event['args'] and \
@@ -287,13 +461,13 @@ class Trace():
                 thread = '{0}:{1}'.format(trace_event['pid'], trace_event['tid'])
                 if thread not in self.cpu['main_threads']:
                     self.cpu['main_threads'].append(thread)
-        if cat == '__metadata' and 'name' in trace_event and \
+        if flags & CAT_METADATA and 'name' in trace_event and \
                 trace_event['name'] == 'process_labels' and \
                 'pid' in trace_event and 'args' in trace_event and \
                 'labels' in trace_event['args'] and \
                 trace_event['args']['labels'].startswith('Subframe:'):
             self.cpu['subframes'].append(str(trace_event['pid']))
-        if cat == '__metadata' and 'name' in trace_event and \
+        if flags & CAT_METADATA and 'name' in trace_event and \
                 trace_event['name'] == 'thread_name' and \
                 'args' in trace_event and \
                 'name' in trace_event['args'] and \
@@ -301,13 +475,13 @@ class Trace():
             thread = '{0}:{1}'.format(trace_event['pid'], trace_event['tid'])
             if thread not in self.cpu['main_threads']:
                 self.cpu['main_threads'].append(thread)
-        if cat == 'netlog' or cat.find('netlog') >= 0:
+        if flags & CAT_NETLOG:
             self.ProcessNetlogEvent(trace_event)
-        elif cat == 'devtools.timeline' or cat.find('devtools.timeline') >= 0:
+        elif flags & CAT_TIMELINE:
             self.ProcessTimelineTraceEvent(trace_event)
-        elif cat.find('blink.feature_usage') >= 0:
+        elif flags & CAT_FEATURE_USAGE:
             self.ProcessFeatureUsageEvent(trace_event)
-        if cat.find('v8') >= 0:
+        if flags & CAT_V8:
             self.ProcessV8Event(trace_event)
     
     def post_process_user_timing(self, dom_tree, performance_timing):
@@ -543,36 +717,36 @@ class Trace():
             if trace_event['ph'] == 'E':
                 if len(self.thread_stack[thread]) > 0:
                     e = self.thread_stack[thread].pop()
-                    if e['n'] == self.event_names[trace_event['name']]:
-                        e['e'] = trace_event['ts']
+                    if e.n == self.event_names[trace_event['name']]:
+                        e.e = trace_event['ts']
             else:
-                e = {'t': thread, 'n': self.event_names[trace_event['name']], 's': trace_event['ts']}
+                e = TimelineEvent(thread, self.event_names[trace_event['name']], trace_event['ts'])
                 if trace_event['name'] in ['EvaluateScript', 'v8.compile', 'v8.parseOnBackground'] and \
                         'args' in trace_event and 'data' in trace_event['args'] and \
                         'url' in trace_event['args']['data'] and \
                         trace_event['args']['data']['url'].startswith('http'):
-                    e['js'] = trace_event['args']['data']['url']
+                    e.js = trace_event['args']['data']['url']
                 if trace_event['name'] == 'FunctionCall' and 'args' in trace_event and 'data' in trace_event['args']:
                     if 'scriptName' in trace_event['args']['data'] and trace_event['args']['data']['scriptName'].startswith(
                             'http'):
-                        e['js'] = trace_event['args']['data']['scriptName']
+                        e.js = trace_event['args']['data']['scriptName']
                     elif 'url' in trace_event['args']['data'] and trace_event['args']['data']['url'].startswith('http'):
-                        e['js'] = trace_event['args']['data']['url'].split('#', 1)[0]
+                        e.js = trace_event['args']['data']['url'].split('#', 1)[0]
                 if trace_event['ph'] == 'B':
                     self.thread_stack[thread].append(e)
                     e = None
                 elif 'dur' in trace_event:
-                    e['e'] = e['s'] + trace_event['dur']
+                    e.e = e.s + trace_event['dur']
 
-            if e is not None and 'e' in e and e['s'] >= self.start_time and e['e'] >= e['s']:
-                if self.end_time is None or e['e'] > self.end_time:
-                    self.end_time = e['e']
+            if e is not None and e.e is not None and e.s >= self.start_time and e.e >= e.s:
+                if self.end_time is None or e.e > self.end_time:
+                    self.end_time = e.e
                 # attach it to a parent event if there is one
                 if len(self.thread_stack[thread]) > 0:
                     parent = self.thread_stack[thread].pop()
-                    if 'c' not in parent:
-                        parent['c'] = []
-                    parent['c'].append(e)
+                    if parent.c is None:
+                        parent.c = []
+                    parent.c.append(e)
                     self.thread_stack[thread].append(parent)
                 else:
                     self.timeline_events.append(e)
@@ -623,38 +797,37 @@ class Trace():
                             self.long_tasks.append([ms_start, ms_end])
             if end > self.end_time:
                 self.end_time = end
-            e = {'t': thread,
-                 'n': self.event_names[type], 's': start, 'e': end}
+            e = TimelineEvent(thread, self.event_names[type], start, end)
             if 'callInfo' in event and 'url' in event and event['url'].startswith(
                     'http'):
-                e['js'] = event['url'].split('#', 1)[0]
+                e.js = event['url'].split('#', 1)[0]
             elif 'data' in event and 'url' in event['data'] and \
                     event['data']['url'].startswith('http'):
-                e['js'] = event['data']['url'].split('#', 1)[0]
+                e.js = event['data']['url'].split('#', 1)[0]
             elif 'data' in event and 'scriptName' in event['data'] and \
                     event['data']['scriptName'].startswith('http'):
-                e['js'] = event['data']['scriptName'].split('#', 1)[0]
+                e.js = event['data']['scriptName'].split('#', 1)[0]
             elif 'stackTrace' in event and event['stackTrace']:
                 for stack_frame in event['stackTrace']:
                     if 'url' in stack_frame and stack_frame['url'].startswith('http'):
-                        e['js'] = stack_frame['url'].split('#', 1)[0]
+                        e.js = stack_frame['url'].split('#', 1)[0]
                         break
             # Process profile child events
             if 'data' in event and 'profile' in event['data'] and 'rootNodes' in event['data']['profile']:
                 for child in event['data']['profile']['rootNodes']:
                     c = self.ProcessOldTimelineEvent(child, type, depth + 1)
                     if c is not None:
-                        if 'c' not in e:
-                            e['c'] = []
-                        e['c'].append(c)
+                        if e.c is None:
+                            e.c = []
+                        e.c.append(c)
             # recursively process any child events
             if 'children' in event:
                 for child in event['children']:
                     c = self.ProcessOldTimelineEvent(child, type, depth + 1)
                     if c is not None:
-                        if 'c' not in e:
-                            e['c'] = []
-                        e['c'].append(c)
+                        if e.c is None:
+                            e.c = []
+                        e.c.append(c)
         return e
 
     def ProcessTimelineEvents(self):
@@ -676,12 +849,24 @@ class Trace():
             slice_count = int(math.ceil(
                 float(self.end_time - self.start_time) / float(self.cpu['slice_usecs'])))
 
-            # Create the empty time slices for all of the threads
+            # Create the empty time slices for all of the threads. If numpy is
+            # available they are packed arrays of doubles that are also exposed
+            # as numpy views for bulk updates of long events.
             self.cpu['slices'] = {}
+            self.slice_views = {} if numpy is not None else None
             for thread in self.threads.keys():
-                self.cpu['slices'][thread] = {'total': [0.0] * slice_count}
-                for name in self.threads[thread].keys():
-                    self.cpu['slices'][thread][name] = [0.0] * slice_count
+                if numpy is not None:
+                    self.cpu['slices'][thread] = {'total': array('d', [0.0]) * slice_count}
+                    for name in self.threads[thread].keys():
+                        self.cpu['slices'][thread][name] = array('d', [0.0]) * slice_count
+                    self.slice_views[thread] = {}
+                    for name in self.cpu['slices'][thread]:
+                        self.slice_views[thread][name] = \
+                            numpy.frombuffer(self.cpu['slices'][thread][name], dtype=numpy.float64)
+                else:
+                    self.cpu['slices'][thread] = {'total': [0.0] * slice_count}
+                    for name in self.threads[thread].keys():
+                        self.cpu['slices'][thread][name] = [0.0] * slice_count
 
             # Go through all of the timeline events recursively and account for
             # the time they consumed
@@ -694,13 +879,19 @@ class Trace():
 
             # Go through all of the fractional times and convert the float
             # fractional times to integer usecs
+            slice_usecs = self.cpu['slice_usecs']
             for thread in self.cpu['slices'].keys():
                 del self.cpu['slices'][thread]['total']
                 for name in self.cpu['slices'][thread].keys():
-                    for slice in range(len(self.cpu['slices'][thread][name])):
-                        self.cpu['slices'][thread][name][slice] =\
-                            int(self.cpu['slices'][thread][name]
-                                [slice] * self.cpu['slice_usecs'])
+                    if self.slice_views is not None:
+                        view = self.slice_views[thread][name]
+                        self.cpu['slices'][thread][name] = \
+                            (view * slice_usecs).astype(numpy.int64).tolist()
+                    else:
+                        for slice in range(len(self.cpu['slices'][thread][name])):
+                            self.cpu['slices'][thread][name][slice] =\
+                                int(self.cpu['slices'][thread][name][slice] * slice_usecs)
+            self.slice_views = None
 
             # Pick the candidate main thread with the most activity
             main_threads = list(self.cpu['main_threads'])
@@ -724,17 +915,24 @@ class Trace():
                 self.cpu['main_thread'] = main_thread
 
     def ProcessTimelineEvent(self, timeline_event, parent, stack=None):
-        start = timeline_event['s'] - self.start_time
-        end = timeline_event['e'] - self.start_time
+        """Account for the time used by a timeline event and all of its children.
+        The event tree is walked depth-first with an explicit stack so deeply
+        nested call trees don't hit the recursion limit."""
         if self.long_tasks is None:
             self.long_tasks = []
         self.cpu['valid'] = True
         if stack is None:
             stack = {}
-        if end > start:
+        pending = [(timeline_event, parent, stack)]
+        while pending:
+            timeline_event, parent, stack = pending.pop()
+            start = timeline_event.s - self.start_time
+            end = timeline_event.e - self.start_time
+            if end <= start:
+                continue
             elapsed = end - start
-            thread = timeline_event['t']
-            name = self.event_name_lookup[timeline_event['n']]
+            thread = timeline_event.t
+            name = self.event_name_lookup[timeline_event.n]
 
             # Keep track of periods on the main thread where at least 500ms are
             # available with no tasks longer than 50ms
@@ -771,8 +969,8 @@ class Trace():
                         else:
                             self.long_tasks.append([ms_start, ms_end])
 
-            if 'js' in timeline_event:
-                script = timeline_event['js']
+            if timeline_event.js is not None:
+                script = timeline_event.js
                 js_start = start / 1000.0
                 js_end = end / 1000.0
                 if self.scripts is None:
@@ -786,6 +984,9 @@ class Trace():
                 if name not in self.scripts[thread][script]:
                     self.scripts[thread][script][name] = []
                 if thread not in stack:
+                    # The thread mapping is shared with sibling events so copy
+                    # it before adding to it (children get the copy)
+                    stack = dict(stack)
                     stack[thread] = {}
                 if script not in stack[thread]:
                     stack[thread][script] = {}
@@ -806,7 +1007,11 @@ class Trace():
             slice_usecs = self.cpu['slice_usecs']
             first_slice = int(float(start) / float(slice_usecs))
             last_slice = int(float(end) / float(slice_usecs))
-            for slice_number in range(first_slice, last_slice + 1):
+            slice_numbers = range(first_slice, last_slice + 1)
+            if self.slice_views is not None and last_slice - first_slice >= SLICE_VECTOR_MIN:
+                slice_numbers = self.AdjustTimelineSlices(
+                    thread, first_slice, last_slice, start, end, name, parent)
+            for slice_number in slice_numbers:
                 slice_start = slice_number * slice_usecs
                 slice_end = slice_start + slice_usecs
                 used_start = max(slice_start, start)
@@ -815,10 +1020,56 @@ class Trace():
                 self.AdjustTimelineSlice(
                     thread, slice_number, name, parent, slice_elapsed)
 
-            # Recursively process any child events
-            if 'c' in timeline_event:
-                for child in timeline_event['c']:
-                    self.ProcessTimelineEvent(child, name, dict(stack))
+            # Queue the child events so they are processed next, in order
+            if timeline_event.c is not None:
+                for child in reversed(timeline_event.c):
+                    pending.append((child, name, stack))
+
+    # Vectorized version of AdjustTimelineSlice for all of the slices an event
+    # covers. Each slice is independent so applying the per-slice steps to the
+    # whole range at once gives identical results. Returns the slice numbers
+    # that still need to go through AdjustTimelineSlice.
+    def AdjustTimelineSlices(self, thread, first_slice, last_slice, start, end, name, parent):
+        if name == parent:
+            return []
+        views = self.slice_views[thread]
+        slice_count = len(views['total'])
+        range_start = max(first_slice, 0)
+        range_end = min(last_slice + 1, slice_count)
+        if range_end - range_start < SLICE_VECTOR_MIN:
+            return range(first_slice, last_slice + 1)
+        try:
+            slice_usecs = self.cpu['slice_usecs']
+            slice_start = numpy.arange(range_start, range_end, dtype=numpy.int64) * slice_usecs
+            used_start = numpy.maximum(slice_start, start)
+            used_end = numpy.minimum(slice_start + slice_usecs, end)
+            fraction = numpy.minimum(1.0, (used_end - used_start).astype(numpy.float64) / float(slice_usecs))
+            current = views[name][range_start:range_end]
+            total = views['total'][range_start:range_end]
+            current += fraction
+            total += fraction
+            if parent is not None:
+                parent_slices = views[parent][range_start:range_end]
+                mask = parent_slices >= fraction
+                parent_slices[mask] -= fraction[mask]
+                total[mask] -= fraction[mask]
+            numpy.minimum(current, 1.0, out=current)
+
+            # make sure we don't exceed 100% for any slot
+            over = numpy.nonzero(total > 1.0)[0]
+            if len(over):
+                over += range_start
+                available = numpy.maximum(0.0, 1.0 - fraction[over - range_start])
+                for slice_name in views:
+                    if slice_name != name:
+                        clamped = numpy.minimum(views[slice_name][over], available)
+                        views[slice_name][over] = clamped
+                        available = numpy.maximum(0.0, available - clamped)
+                views['total'][over] = numpy.minimum(1.0, numpy.maximum(0.0, 1.0 - available))
+        except BaseException:
+            logging.exception('Error adjusting timeline slices')
+        # Any slices outside of the array go through the normal (logged) path
+        return list(range(first_slice, range_start)) + list(range(range_end, last_slice + 1))
 
     # Add the time to the given slice and subtract the time from a parent event
     def AdjustTimelineSlice(self, thread, slice_number, name, parent, elapsed):
@@ -857,7 +1108,6 @@ class Trace():
     #   Blink Features
     ##########################################################################
     def ProcessFeatureUsageEvent(self, trace_event):
-        global BLINK_FEATURES
         if 'name' in trace_event and\
                 'args' in trace_event and\
                 'feature' in trace_event['args'] and\
@@ -865,27 +1115,27 @@ class Trace():
             if self.feature_usage is None:
                 self.feature_usage = {
                     'Features': {}, 'CSSFeatures': {}, 'AnimatedCSSFeatures': {}}
-            id = '{0:d}'.format(trace_event['args']['feature'])
+            if BLINK_FEATURES is None:
+                load_feature_names()
+            feature_id = trace_event['args']['feature']
+            id = '{0:d}'.format(feature_id)
             if trace_event['name'] == 'FeatureFirstUsed':
-                if id in BLINK_FEATURES:
-                    name = BLINK_FEATURES[id]
-                else:
+                name = get_feature_name(BLINK_FEATURES, feature_id)
+                if name is None:
                     name = 'Feature_{0}'.format(id)
                 if id not in self.feature_usage['Features']:
                     self.feature_usage['Features'][id] = {'name': name, 'firstUsed': []}
                 self.feature_usage['Features'][id]['firstUsed'].append(trace_event['ts'])
             elif trace_event['name'] == 'CSSFirstUsed':
-                if id in CSS_FEATURES:
-                    name = CSS_FEATURES[id]
-                else:
+                name = get_feature_name(CSS_FEATURES, feature_id)
+                if name is None:
                     name = 'CSSFeature_{0}'.format(id)
                 if id not in self.feature_usage['CSSFeatures']:
                     self.feature_usage['CSSFeatures'][id] = {'name': name, 'firstUsed': []}
                 self.feature_usage['CSSFeatures'][id]['firstUsed'].append(trace_event['ts'])
             elif trace_event['name'] == 'AnimatedCSSFirstUsed':
-                if id in CSS_FEATURES:
-                    name = CSS_FEATURES[id]
-                else:
+                name = get_feature_name(CSS_FEATURES, feature_id)
+                if name is None:
                     name = 'CSSFeature_{0}'.format(id)
                 if id not in self.feature_usage['AnimatedCSSFeatures']:
                     self.feature_usage['AnimatedCSSFeatures'][id] = {'name': name, 'firstUsed': []}
@@ -954,7 +1204,7 @@ class Trace():
         if self.netlog_requests is not None:
             return self.netlog_requests
         requests = []
-        known_hosts = ['cache.pack.google.com', 'clients1.google.com', 'redirector.gvt1.com']
+        known_hosts = set(['cache.pack.google.com', 'clients1.google.com', 'redirector.gvt1.com'])
         last_time = 0
         if 'url_request' in self.netlog:
             for request_id in self.netlog['url_request']:
@@ -1003,17 +1253,16 @@ class Trace():
                 if 'url' in request and not request['url'].startswith('http://127.0.0.1') and \
                         not request['url'].startswith('http://192.168.10.'):
                     request_host = urlparse(request['url']).hostname
-                    if request_host not in known_hosts:
-                        known_hosts.append(request_host)
-                    # Match orphaned request streams with their h2 sessions
-                    if 'stream_id' in request and 'h2_session' not in request and 'url' in request:
-                        for h2_session_id in self.netlog['h2_session']:
+                    known_hosts.add(request_host)
+                    # Match orphaned request streams with the h2 sessions for the same host
+                    if 'stream_id' in request and 'h2_session' not in request and 'url' in request and \
+                            'h2_host_sessions' in self.netlog and \
+                            request_host in self.netlog['h2_host_sessions']:
+                        for h2_session_id in self.netlog['h2_host_sessions'][request_host]:
                             h2_session = self.netlog['h2_session'][h2_session_id]
                             if 'host' in h2_session:
-                                session_host = h2_session['host'].split(':')[0]
                                 if 'stream' in h2_session and \
                                         request['stream_id'] in h2_session['stream'] and \
-                                        session_host == request_host and \
                                         'request_headers' in request and \
                                         'request_headers' in h2_session['stream'][request['stream_id']]:
                                     # See if the path header matches
@@ -1143,32 +1392,33 @@ class Trace():
                                     request['tls_cipher_suite'] = socket['tls_cipher_suite']
 
                 # Assign the DNS lookup to the first request that connected to the DocumentSetDomain
-                if 'dns' in self.netlog:
-                    # Build a mapping of the DNS lookups for each domain
+                if 'dns' in self.netlog and 'dns_hosts' in self.netlog:
+                    # Build a mapping of the DNS lookups for each domain. The
+                    # host index is in the order hosts were reported so walk
+                    # each host's lookups in the order they started instead.
                     dns_lookups = {}
-                    for dns_id in self.netlog['dns']:
-                        dns = self.netlog['dns'][dns_id]
-                        if 'host' in dns and 'start' in dns and 'end' in dns \
-                                and dns['end'] >= dns['start'] and 'address_list' in dns:
-                            hostname = dns['host']
-                            separator = hostname.find(':')
-                            if separator > 0:
-                                hostname = hostname[:separator]
-                            dns['elapsed'] = dns['end'] - dns['start']
-                            if hostname not in dns_lookups:
-                                dns_lookups[hostname] = dns
-                            # collect all of the times for all of the DNS lookups for that host
-                            if 'times' not in dns_lookups[hostname]:
-                                dns_lookups[hostname]['times'] = []
-                            dns_lookups[hostname]['times'].append({
-                                'start': dns['start'],
-                                'end': dns['end'],
-                                'elapsed': dns['elapsed'],
-                            })
+                    dns_order = dict((dns_id, position) for position, dns_id in
+                                     enumerate(self.netlog['dns']))
+                    for hostname in self.netlog['dns_hosts']:
+                        for dns_id in sorted(self.netlog['dns_hosts'][hostname], key=dns_order.get):
+                            dns = self.netlog['dns'][dns_id]
+                            if 'start' in dns and 'end' in dns \
+                                    and dns['end'] >= dns['start'] and 'address_list' in dns:
+                                dns['elapsed'] = dns['end'] - dns['start']
+                                if hostname not in dns_lookups:
+                                    dns_lookups[hostname] = dns
+                                # collect all of the times for all of the DNS lookups for that host
+                                if 'times' not in dns_lookups[hostname]:
+                                    dns_lookups[hostname]['times'] = []
+                                dns_lookups[hostname]['times'].append({
+                                    'start': dns['start'],
+                                    'end': dns['end'],
+                                    'elapsed': dns['elapsed'],
+                                })
                     # Go through the requests and assign the DNS lookups as needed
-                    for request in requests:
+                    request_hosts = [urlparse(request['url']).hostname for request in requests]
+                    for request, hostname in zip(requests, request_hosts):
                         if 'connect_start' in request:
-                            hostname = urlparse(request['url']).hostname
                             if hostname in dns_lookups and 'claimed' not in dns_lookups[hostname]:
                                 dns = dns_lookups[hostname]
                                 dns['claimed'] = True
@@ -1184,8 +1434,7 @@ class Trace():
                                                 request['dns_start'] = dns['start']
                                                 request['dns_end'] = dns['end']
                     # Make another pass for any DNS lookups that didn't establish a connection (HTTP/2 coalescing)
-                    for request in requests:
-                        hostname = urlparse(request['url']).hostname
+                    for request, hostname in zip(requests, request_hosts):
                         if hostname in dns_lookups and 'claimed' not in dns_lookups[hostname]:
                             dns = dns_lookups[hostname]
                             dns['claimed'] = True
@@ -1220,9 +1469,8 @@ class Trace():
                                         float(request[time_name] - self.start_time) / 1000.0
                         for key in ['chunks', 'chunks_in', 'chunks_out']:
                             if key in request:
-                                for chunk in request[key]:
-                                    if 'ts' in chunk:
-                                        chunk['ts'] = float(chunk['ts'] - self.start_time) / 1000.0
+                                request[key] = [{'ts': float(chunk.ts - self.start_time) / 1000.0,
+                                                 'bytes': chunk.bytes} for chunk in request[key]]
                 else:
                     requests = []
         if not len(requests):
@@ -1230,6 +1478,15 @@ class Trace():
         self.netlog_requests = requests
         return requests
 
+    def AddNetlogIndex(self, index, key, entry_id):
+        """Index netlog entries by a secondary key as they are created so
+        post-processing can join them without scanning every entry"""
+        if index not in self.netlog:
+            self.netlog[index] = {}
+        if key not in self.netlog[index]:
+            self.netlog[index][key] = []
+        self.netlog[index][key].append(entry_id)
+
     def ProcessNetlogConnectJobEvent(self, trace_event):
         """Connect jobs link sockets to DNS lookups/group names"""
         if 'connect_job' not in self.netlog:
@@ -1328,6 +1585,7 @@ class Trace():
                     self.netlog['socket']['h2_session'] = session_id
         if 'host' not in entry and 'host' in params:
             entry['host'] = params['host']
+            self.AddNetlogIndex('h2_host_sessions', entry['host'].split(':')[0], session_id)
         if 'protocol' not in entry and 'protocol' in params:
             entry['protocol'] = params['protocol']
         if 'stream_id' in params:
@@ -1353,7 +1611,7 @@ class Trace():
                 if 'first_byte' not in stream:
                     stream['first_byte'] = trace_event['ts']
                 stream['bytes_in'] += params['size']
-                stream['chunks'].append({'ts': trace_event['ts'], 'bytes': params['size']})
+                stream['chunks'].append(NetlogChunk(trace_event['ts'], params['size']))
             if name == 'HTTP2_SESSION_SEND_HEADERS':
                 if 'start' not in stream:
                     stream['start'] = trace_event['ts']
@@ -1509,6 +1767,11 @@ class Trace():
                 entry['end'] = trace_event['ts']
         if 'host' not in entry and 'host' in params:
             entry['host'] = params['host']
+            hostname = entry['host']
+            separator = hostname.find(':')
+            if separator > 0:
+                hostname = hostname[:separator]
+            self.AddNetlogIndex('dns_hosts', hostname, request_id)
         if 'address_list' in params:
             entry['address_list'] = params['address_list']
 
@@ -1550,10 +1813,10 @@ class Trace():
             if 'connect_end' not in entry:
                 entry['connect_end'] = trace_event['ts']
             entry['bytes_out'] += params['byte_count']
-            entry['chunks_out'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+            entry['chunks_out'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
         if name == 'SOCKET_BYTES_RECEIVED' and 'byte_count' in params:
             entry['bytes_in'] += params['byte_count']
-            entry['chunks_in'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+            entry['chunks_in'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
         if name == 'SSL_CERTIFICATES_RECEIVED' and 'certificates' in params:
             if 'certificates' not in entry:
                 entry['certificates'] = []
@@ -1580,10 +1843,10 @@ class Trace():
             entry['connect_end'] = trace_event['ts']
         if name == 'UDP_BYTES_SENT' and 'byte_count' in params:
             entry['bytes_out'] += params['byte_count']
-            entry['chunks_out'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+            entry['chunks_out'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
         if name == 'UDP_BYTES_RECEIVED' and 'byte_count' in params:
             entry['bytes_in'] += params['byte_count']
-            entry['chunks_in'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+            entry['chunks_in'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
 
     def ProcessNetlogUrlRequestEvent(self, trace_event):
         if 'url_request' not in self.netlog:
@@ -1647,7 +1910,7 @@ class Trace():
             entry['has_raw_bytes'] = True
             entry['end'] = trace_event['ts']
             entry['bytes_in'] += params['byte_count']
-            entry['chunks'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+            entry['chunks'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
         if 'byte_count' in params and name == 'URL_REQUEST_JOB_FILTERED_BYTES_READ':
             entry['end'] = trace_event['ts']
             if 'uncompressed_bytes_in' not in entry:
@@ -1655,7 +1918,7 @@ class Trace():
             entry['uncompressed_bytes_in'] += params['byte_count']
             if 'has_raw_bytes' not in entry or not entry['has_raw_bytes']:
                 entry['bytes_in'] += params['byte_count']
-                entry['chunks'].append({'ts': trace_event['ts'], 'bytes': params['byte_count']})
+                entry['chunks'].append(NetlogChunk(trace_event['ts'], params['byte_count']))
         if 'stream_id' in params:
             entry['stream_id'] = params['stream_id']
         if name == 'URL_REQUEST_REDIRECTED':
@@ -1741,6 +2004,8 @@ def main():
     parser.add_argument('-n', '--netlog', help="Output netlog details file.")
     parser.add_argument('-r', '--requests', help="Output timeline requests file.")
     parser.add_argument('-s', '--stats', help="Output v8 Call stats file.")
+    parser.add_argument('-w', '--window', type=int,
+                        help="Stream the trace in bounded memory, re-ordering events within a window of this many events.")
     options, _ = parser.parse_known_args()
 
     # Set up logging
@@ -1762,7 +2027,7 @@ def main():
     start = time.time()
     trace = Trace()
     if options.trace:
-        trace.Process(options.trace)
+        trace.Process(options.trace, options.window)
     elif options.timeline:
         trace.ProcessTimeline(options.timeline)
 
@@ -1799,4255 +2064,36 @@ def main():
 
 
 ##########################################################################
-#   Blink feature names from https://source.chromium.org/chromium/chromium/src/+/master:third_party/blink/public/mojom/web_feature/web_feature.mojom
+#   Blink and CSS feature names, indexed by feature id. They are loaded from
+#   blink_features.json when the first feature usage event is processed.
+#   Blink features: https://source.chromium.org/chromium/chromium/src/+/master:third_party/blink/public/mojom/web_feature/web_feature.mojom
+#   CSS features: https://source.chromium.org/chromium/chromium/src/+/master:third_party/blink/public/mojom/use_counter/css_property_id.mojom
 ##########################################################################
-BLINK_FEATURES = {
-    "0": "PageDestruction",
-    "3": "PrefixedIndexedDB",
-    "4": "WorkerStart",
-    "5": "SharedWorkerStart",
-    "9": "UnprefixedIndexedDB",
-    "10": "OpenWebDatabase",
-    "13": "UnprefixedRequestAnimationFrame",
-    "14": "PrefixedRequestAnimationFrame",
-    "15": "ContentSecurityPolicy",
-    "16": "ContentSecurityPolicyReportOnly",
-    "18": "PrefixedTransitionEndEvent",
-    "19": "UnprefixedTransitionEndEvent",
-    "20": "PrefixedAndUnprefixedTransitionEndEvent",
-    "21": "AutoFocusAttribute",
-    "23": "DataListElement",
-    "24": "FormAttribute",
-    "25": "IncrementalAttribute",
-    "26": "InputTypeColor",
-    "27": "InputTypeDate",
-    "29": "InputTypeDateTimeFallback",
-    "30": "InputTypeDateTimeLocal",
-    "31": "InputTypeEmail",
-    "32": "InputTypeMonth",
-    "33": "InputTypeNumber",
-    "34": "InputTypeRange",
-    "35": "InputTypeSearch",
-    "36": "InputTypeTel",
-    "37": "InputTypeTime",
-    "38": "InputTypeURL",
-    "39": "InputTypeWeek",
-    "40": "InputTypeWeekFallback",
-    "41": "ListAttribute",
-    "42": "MaxAttribute",
-    "43": "MinAttribute",
-    "44": "PatternAttribute",
-    "45": "PlaceholderAttribute",
-    "47": "PrefixedDirectoryAttribute",
-    "49": "RequiredAttribute",
-    "51": "StepAttribute",
-    "52": "PageVisits",
-    "53": "HTMLMarqueeElement",
-    "55": "Reflection",
-    "57": "PrefixedStorageInfo",
-    "58": "XFrameOptions",
-    "59": "XFrameOptionsSameOrigin",
-    "60": "XFrameOptionsSameOriginWithBadAncestorChain",
-    "61": "DeprecatedFlexboxWebContent",
-    "62": "DeprecatedFlexboxChrome",
-    "63": "DeprecatedFlexboxChromeExtension",
-    "65": "UnprefixedPerformanceTimeline",
-    "67": "UnprefixedUserTiming",
-    "69": "WindowEvent",
-    "70": "ContentSecurityPolicyWithBaseElement",
-    "74": "DocumentClear",
-    "77": "XMLDocument",
-    "78": "XSLProcessingInstruction",
-    "79": "XSLTProcessor",
-    "80": "SVGSwitchElement",
-    "83": "DocumentAll",
-    "84": "FormElement",
-    "85": "DemotedFormElement",
-    "90": "SVGAnimationElement",
-    "96": "LineClamp",
-    "97": "SubFrameBeforeUnloadRegistered",
-    "98": "SubFrameBeforeUnloadFired",
-    "102": "ConsoleMarkTimeline",
-    "111": "DocumentCreateAttribute",
-    "112": "DocumentCreateAttributeNS",
-    "113": "DocumentCreateCDATASection",
-    "115": "DocumentXMLEncoding",
-    "116": "DocumentXMLStandalone",
-    "117": "DocumentXMLVersion",
-    "123": "NavigatorProductSub",
-    "124": "NavigatorVendor",
-    "125": "NavigatorVendorSub",
-    "128": "PrefixedAnimationEndEvent",
-    "129": "UnprefixedAnimationEndEvent",
-    "130": "PrefixedAndUnprefixedAnimationEndEvent",
-    "131": "PrefixedAnimationStartEvent",
-    "132": "UnprefixedAnimationStartEvent",
-    "133": "PrefixedAndUnprefixedAnimationStartEvent",
-    "134": "PrefixedAnimationIterationEvent",
-    "135": "UnprefixedAnimationIterationEvent",
-    "136": "PrefixedAndUnprefixedAnimationIterationEvent",
-    "137": "EventReturnValue",
-    "138": "SVGSVGElement",
-    "143": "DOMSubtreeModifiedEvent",
-    "144": "DOMNodeInsertedEvent",
-    "145": "DOMNodeRemovedEvent",
-    "146": "DOMNodeRemovedFromDocumentEvent",
-    "147": "DOMNodeInsertedIntoDocumentEvent",
-    "148": "DOMCharacterDataModifiedEvent",
-    "150": "DocumentAllLegacyCall",
-    "152": "HTMLEmbedElementLegacyCall",
-    "153": "HTMLObjectElementLegacyCall",
-    "155": "GetMatchedCSSRules",
-    "160": "AttributeOwnerElement",
-    "162": "AttributeSpecified",
-    "164": "PrefixedAudioDecodedByteCount",
-    "165": "PrefixedVideoDecodedByteCount",
-    "166": "PrefixedVideoSupportsFullscreen",
-    "167": "PrefixedVideoDisplayingFullscreen",
-    "168": "PrefixedVideoEnterFullscreen",
-    "169": "PrefixedVideoExitFullscreen",
-    "170": "PrefixedVideoEnterFullScreen",
-    "171": "PrefixedVideoExitFullScreen",
-    "172": "PrefixedVideoDecodedFrameCount",
-    "173": "PrefixedVideoDroppedFrameCount",
-    "176": "PrefixedElementRequestFullscreen",
-    "177": "PrefixedElementRequestFullScreen",
-    "178": "BarPropLocationbar",
-    "179": "BarPropMenubar",
-    "180": "BarPropPersonalbar",
-    "181": "BarPropScrollbars",
-    "182": "BarPropStatusbar",
-    "183": "BarPropToolbar",
-    "184": "InputTypeEmailMultiple",
-    "185": "InputTypeEmailMaxLength",
-    "186": "InputTypeEmailMultipleMaxLength",
-    "190": "InputTypeText",
-    "191": "InputTypeTextMaxLength",
-    "192": "InputTypePassword",
-    "193": "InputTypePasswordMaxLength",
-    "196": "PrefixedPageVisibility",
-    "198": "CSSStyleSheetInsertRuleOptionalArg",
-    "200": "DocumentBeforeUnloadRegistered",
-    "201": "DocumentBeforeUnloadFired",
-    "202": "DocumentUnloadRegistered",
-    "203": "DocumentUnloadFired",
-    "204": "SVGLocatableNearestViewportElement",
-    "205": "SVGLocatableFarthestViewportElement",
-    "209": "SVGPointMatrixTransform",
-    "211": "DOMFocusInOutEvent",
-    "212": "FileGetLastModifiedDate",
-    "213": "HTMLElementInnerText",
-    "214": "HTMLElementOuterText",
-    "215": "ReplaceDocumentViaJavaScriptURL",
-    "217": "ElementPrefixedMatchesSelector",
-    "219": "CSSStyleSheetRules",
-    "220": "CSSStyleSheetAddRule",
-    "221": "CSSStyleSheetRemoveRule",
-    "222": "InitMessageEvent",
-    "233": "PrefixedDevicePixelRatioMediaFeature",
-    "234": "PrefixedMaxDevicePixelRatioMediaFeature",
-    "235": "PrefixedMinDevicePixelRatioMediaFeature",
-    "237": "PrefixedTransform3dMediaFeature",
-    "240": "PrefixedStorageQuota",
-    "243": "ResetReferrerPolicy",
-    "244": "CaseInsensitiveAttrSelectorMatch",
-    "246": "FormNameAccessForImageElement",
-    "247": "FormNameAccessForPastNamesMap",
-    "248": "FormAssociationByParser",
-    "250": "SVGSVGElementInDocument",
-    "251": "SVGDocumentRootElement",
-    "257": "WorkerSubjectToCSP",
-    "258": "WorkerAllowedByChildBlockedByScript",
-    "260": "DeprecatedWebKitGradient",
-    "261": "DeprecatedWebKitLinearGradient",
-    "262": "DeprecatedWebKitRepeatingLinearGradient",
-    "263": "DeprecatedWebKitRadialGradient",
-    "264": "DeprecatedWebKitRepeatingRadialGradient",
-    "267": "PrefixedImageSmoothingEnabled",
-    "268": "UnprefixedImageSmoothingEnabled",
-    "274": "TextAutosizing",
-    "276": "HTMLAnchorElementPingAttribute",
-    "279": "SVGClassName",
-    "281": "HTMLMediaElementSeekToFragmentStart",
-    "282": "HTMLMediaElementPauseAtFragmentEnd",
-    "283": "PrefixedWindowURL",
-    "285": "WindowOrientation",
-    "286": "DOMStringListContains",
-    "287": "DocumentCaptureEvents",
-    "288": "DocumentReleaseEvents",
-    "289": "WindowCaptureEvents",
-    "290": "WindowReleaseEvents",
-    "295": "DocumentXPathCreateExpression",
-    "296": "DocumentXPathCreateNSResolver",
-    "297": "DocumentXPathEvaluate",
-    "298": "AttrGetValue",
-    "299": "AttrSetValue",
-    "300": "AnimationConstructorKeyframeListEffectObjectTiming",
-    "302": "AnimationConstructorKeyframeListEffectNoTiming",
-    "303": "AttrSetValueWithElement",
-    "304": "PrefixedCancelAnimationFrame",
-    "305": "PrefixedCancelRequestAnimationFrame",
-    "306": "NamedNodeMapGetNamedItem",
-    "307": "NamedNodeMapSetNamedItem",
-    "308": "NamedNodeMapRemoveNamedItem",
-    "309": "NamedNodeMapItem",
-    "310": "NamedNodeMapGetNamedItemNS",
-    "311": "NamedNodeMapSetNamedItemNS",
-    "312": "NamedNodeMapRemoveNamedItemNS",
-    "318": "PrefixedDocumentIsFullscreen",
-    "320": "PrefixedDocumentCurrentFullScreenElement",
-    "321": "PrefixedDocumentCancelFullScreen",
-    "322": "PrefixedDocumentFullscreenEnabled",
-    "323": "PrefixedDocumentFullscreenElement",
-    "324": "PrefixedDocumentExitFullscreen",
-    "325": "SVGForeignObjectElement",
-    "327": "SelectionSetPosition",
-    "328": "AnimationFinishEvent",
-    "329": "SVGSVGElementInXMLDocument",
-    "341": "PrefixedPerformanceClearResourceTimings",
-    "342": "PrefixedPerformanceSetResourceTimingBufferSize",
-    "343": "EventSrcElement",
-    "344": "EventCancelBubble",
-    "345": "EventPath",
-    "347": "NodeIteratorDetach",
-    "348": "AttrNodeValue",
-    "349": "AttrTextContent",
-    "350": "EventGetReturnValueTrue",
-    "351": "EventGetReturnValueFalse",
-    "352": "EventSetReturnValueTrue",
-    "353": "EventSetReturnValueFalse",
-    "356": "WindowOffscreenBuffering",
-    "357": "WindowDefaultStatus",
-    "358": "WindowDefaultstatus",
-    "361": "PrefixedTransitionEventConstructor",
-    "362": "PrefixedMutationObserverConstructor",
-    "363": "PrefixedIDBCursorConstructor",
-    "364": "PrefixedIDBDatabaseConstructor",
-    "365": "PrefixedIDBFactoryConstructor",
-    "366": "PrefixedIDBIndexConstructor",
-    "367": "PrefixedIDBKeyRangeConstructor",
-    "368": "PrefixedIDBObjectStoreConstructor",
-    "369": "PrefixedIDBRequestConstructor",
-    "370": "PrefixedIDBTransactionConstructor",
-    "371": "NotificationPermission",
-    "372": "RangeDetach",
-    "386": "PrefixedFileRelativePath",
-    "387": "DocumentCaretRangeFromPoint",
-    "389": "ElementScrollIntoViewIfNeeded",
-    "393": "RangeExpand",
-    "396": "HTMLImageElementX",
-    "397": "HTMLImageElementY",
-    "400": "SelectionBaseNode",
-    "401": "SelectionBaseOffset",
-    "402": "SelectionExtentNode",
-    "403": "SelectionExtentOffset",
-    "404": "SelectionType",
-    "405": "SelectionModify",
-    "406": "SelectionSetBaseAndExtent",
-    "407": "SelectionEmpty",
-    "409": "VTTCue",
-    "410": "VTTCueRender",
-    "411": "VTTCueRenderVertical",
-    "412": "VTTCueRenderSnapToLinesFalse",
-    "413": "VTTCueRenderLineNotAuto",
-    "414": "VTTCueRenderPositionNot50",
-    "415": "VTTCueRenderSizeNot100",
-    "416": "VTTCueRenderAlignNotMiddle",
-    "417": "ElementRequestPointerLock",
-    "418": "VTTCueRenderRtl",
-    "419": "PostMessageFromSecureToInsecure",
-    "420": "PostMessageFromInsecureToSecure",
-    "421": "DocumentExitPointerLock",
-    "422": "DocumentPointerLockElement",
-    "424": "PrefixedCursorZoomIn",
-    "425": "PrefixedCursorZoomOut",
-    "429": "TextEncoderConstructor",
-    "430": "TextEncoderEncode",
-    "431": "TextDecoderConstructor",
-    "432": "TextDecoderDecode",
-    "433": "FocusInOutEvent",
-    "434": "MouseEventMovementX",
-    "435": "MouseEventMovementY",
-    "440": "DocumentFonts",
-    "441": "MixedContentFormsSubmitted",
-    "442": "FormsSubmitted",
-    "443": "TextInputEventOnInput",
-    "444": "TextInputEventOnTextArea",
-    "445": "TextInputEventOnContentEditable",
-    "446": "TextInputEventOnNotNode",
-    "447": "WebkitBeforeTextInsertedOnInput",
-    "448": "WebkitBeforeTextInsertedOnTextArea",
-    "449": "WebkitBeforeTextInsertedOnContentEditable",
-    "450": "WebkitBeforeTextInsertedOnNotNode",
-    "451": "WebkitEditableContentChangedOnInput",
-    "452": "WebkitEditableContentChangedOnTextArea",
-    "453": "WebkitEditableContentChangedOnContentEditable",
-    "454": "WebkitEditableContentChangedOnNotNode",
-    "455": "HTMLImports",
-    "456": "ElementCreateShadowRoot",
-    "457": "DocumentRegisterElement",
-    "458": "EditingAppleInterchangeNewline",
-    "459": "EditingAppleConvertedSpace",
-    "460": "EditingApplePasteAsQuotation",
-    "461": "EditingAppleStyleSpanClass",
-    "462": "EditingAppleTabSpanClass",
-    "463": "HTMLImportsAsyncAttribute",
-    "465": "XMLHttpRequestSynchronous",
-    "466": "CSSSelectorPseudoUnresolved",
-    "467": "CSSSelectorPseudoShadow",
-    "468": "CSSSelectorPseudoContent",
-    "469": "CSSSelectorPseudoHost",
-    "470": "CSSSelectorPseudoHostContext",
-    "471": "CSSDeepCombinator",
-    "473": "UseAsm",
-    "475": "DOMWindowOpen",
-    "476": "DOMWindowOpenFeatures",
-    "478": "MediaStreamTrackGetSources",
-    "479": "AspectRatioFlexItem",
-    "480": "DetailsElement",
-    "481": "DialogElement",
-    "482": "MapElement",
-    "483": "MeterElement",
-    "484": "ProgressElement",
-    "490": "PrefixedHTMLElementDropzone",
-    "491": "WheelEventWheelDeltaX",
-    "492": "WheelEventWheelDeltaY",
-    "493": "WheelEventWheelDelta",
-    "494": "SendBeacon",
-    "495": "SendBeaconQuotaExceeded",
-    "501": "SVGSMILElementInDocument",
-    "502": "MouseEventOffsetX",
-    "503": "MouseEventOffsetY",
-    "504": "MouseEventX",
-    "505": "MouseEventY",
-    "506": "MouseEventFromElement",
-    "507": "MouseEventToElement",
-    "508": "RequestFileSystem",
-    "509": "RequestFileSystemWorker",
-    "510": "RequestFileSystemSyncWorker",
-    "519": "SVGStyleElementTitle",
-    "520": "PictureSourceSrc",
-    "521": "Picture",
-    "522": "Sizes",
-    "523": "SrcsetXDescriptor",
-    "524": "SrcsetWDescriptor",
-    "525": "SelectionContainsNode",
-    "529": "XMLExternalResourceLoad",
-    "530": "MixedContentPrivateHostnameInPublicHostname",
-    "531": "LegacyProtocolEmbeddedAsSubresource",
-    "532": "RequestedSubresourceWithEmbeddedCredentials",
-    "533": "NotificationCreated",
-    "534": "NotificationClosed",
-    "535": "NotificationPermissionRequested",
-    "538": "ConsoleTimeline",
-    "539": "ConsoleTimelineEnd",
-    "540": "SRIElementWithMatchingIntegrityAttribute",
-    "541": "SRIElementWithNonMatchingIntegrityAttribute",
-    "542": "SRIElementWithUnparsableIntegrityAttribute",
-    "545": "V8Animation_StartTime_AttributeGetter",
-    "546": "V8Animation_StartTime_AttributeSetter",
-    "547": "V8Animation_CurrentTime_AttributeGetter",
-    "548": "V8Animation_CurrentTime_AttributeSetter",
-    "549": "V8Animation_PlaybackRate_AttributeGetter",
-    "550": "V8Animation_PlaybackRate_AttributeSetter",
-    "551": "V8Animation_PlayState_AttributeGetter",
-    "552": "V8Animation_Finish_Method",
-    "553": "V8Animation_Play_Method",
-    "554": "V8Animation_Pause_Method",
-    "555": "V8Animation_Reverse_Method",
-    "556": "BreakIterator",
-    "557": "ScreenOrientationAngle",
-    "558": "ScreenOrientationType",
-    "559": "ScreenOrientationLock",
-    "560": "ScreenOrientationUnlock",
-    "561": "GeolocationSecureOrigin",
-    "562": "GeolocationInsecureOrigin",
-    "563": "NotificationSecureOrigin",
-    "564": "NotificationInsecureOrigin",
-    "565": "NotificationShowEvent",
-    "569": "SVGTransformListConsolidate",
-    "570": "SVGAnimatedTransformListBaseVal",
-    "571": "QuotedAnimationName",
-    "572": "QuotedKeyframesRule",
-    "573": "SrcsetDroppedCandidate",
-    "574": "WindowPostMessage",
-    "575": "WindowPostMessageWithLegacyTargetOriginArgument",
-    "576": "RenderRuby",
-    "578": "ScriptElementWithInvalidTypeHasSrc",
-    "581": "XMLHttpRequestSynchronousInNonWorkerOutsideBeforeUnload",
-    "582": "CSSSelectorPseudoScrollbar",
-    "583": "CSSSelectorPseudoScrollbarButton",
-    "584": "CSSSelectorPseudoScrollbarThumb",
-    "585": "CSSSelectorPseudoScrollbarTrack",
-    "586": "CSSSelectorPseudoScrollbarTrackPiece",
-    "587": "LangAttribute",
-    "588": "LangAttributeOnHTML",
-    "589": "LangAttributeOnBody",
-    "590": "LangAttributeDoesNotMatchToUILocale",
-    "591": "InputTypeSubmit",
-    "592": "InputTypeSubmitWithValue",
-    "593": "SetReferrerPolicy",
-    "595": "MouseEventWhich",
-    "598": "UIEventWhich",
-    "599": "TextWholeText",
-    "603": "NotificationCloseEvent",
-    "606": "StyleMedia",
-    "607": "StyleMediaType",
-    "608": "StyleMediaMatchMedium",
-    "609": "MixedContentPresent",
-    "610": "MixedContentBlockable",
-    "611": "MixedContentAudio",
-    "612": "MixedContentDownload",
-    "613": "MixedContentFavicon",
-    "614": "MixedContentImage",
-    "615": "MixedContentInternal",
-    "616": "MixedContentPlugin",
-    "617": "MixedContentPrefetch",
-    "618": "MixedContentVideo",
-    "620": "AudioListenerDopplerFactor",
-    "621": "AudioListenerSpeedOfSound",
-    "622": "AudioListenerSetVelocity",
-    "628": "CSSSelectorPseudoFullScreenAncestor",
-    "629": "CSSSelectorPseudoFullScreen",
-    "630": "WebKitCSSMatrix",
-    "631": "AudioContextCreateAnalyser",
-    "632": "AudioContextCreateBiquadFilter",
-    "633": "AudioContextCreateBufferSource",
-    "634": "AudioContextCreateChannelMerger",
-    "635": "AudioContextCreateChannelSplitter",
-    "636": "AudioContextCreateConvolver",
-    "637": "AudioContextCreateDelay",
-    "638": "AudioContextCreateDynamicsCompressor",
-    "639": "AudioContextCreateGain",
-    "640": "AudioContextCreateMediaElementSource",
-    "641": "AudioContextCreateMediaStreamDestination",
-    "642": "AudioContextCreateMediaStreamSource",
-    "643": "AudioContextCreateOscillator",
-    "645": "AudioContextCreatePeriodicWave",
-    "646": "AudioContextCreateScriptProcessor",
-    "647": "AudioContextCreateStereoPanner",
-    "648": "AudioContextCreateWaveShaper",
-    "649": "AudioContextDecodeAudioData",
-    "650": "AudioContextResume",
-    "651": "AudioContextSuspend",
-    "652": "AudioContext",
-    "653": "OfflineAudioContext",
-    "654": "PrefixedAudioContext",
-    "655": "PrefixedOfflineAudioContext",
-    "661": "MixedContentInNonHTTPSFrameThatRestrictsMixedContent",
-    "662": "MixedContentInSecureFrameThatDoesNotRestrictMixedContent",
-    "663": "MixedContentWebSocket",
-    "664": "SyntheticKeyframesInCompositedCSSAnimation",
-    "665": "MixedContentFormPresent",
-    "666": "GetUserMediaInsecureOrigin",
-    "667": "GetUserMediaSecureOrigin",
-    "668": "DeviceMotionInsecureOrigin",
-    "669": "DeviceMotionSecureOrigin",
-    "670": "DeviceOrientationInsecureOrigin",
-    "671": "DeviceOrientationSecureOrigin",
-    "672": "SandboxViaIFrame",
-    "673": "SandboxViaCSP",
-    "674": "BlockedSniffingImageToScript",
-    "675": "Fetch",
-    "676": "FetchBodyStream",
-    "677": "XMLHttpRequestAsynchronous",
-    "679": "WhiteSpacePreFromXMLSpace",
-    "680": "WhiteSpaceNowrapFromXMLSpace",
-    "685": "SVGSVGElementForceRedraw",
-    "686": "SVGSVGElementSuspendRedraw",
-    "687": "SVGSVGElementUnsuspendRedraw",
-    "688": "SVGSVGElementUnsuspendRedrawAll",
-    "689": "AudioContextClose",
-    "691": "CSSZoomNotEqualToOne",
-    "694": "ClientRectListItem",
-    "695": "WindowClientInformation",
-    "696": "WindowFind",
-    "697": "WindowScreenLeft",
-    "698": "WindowScreenTop",
-    "699": "V8Animation_Cancel_Method",
-    "700": "V8Animation_Onfinish_AttributeGetter",
-    "701": "V8Animation_Onfinish_AttributeSetter",
-    "707": "V8Window_WebKitAnimationEvent_ConstructorGetter",
-    "710": "CryptoGetRandomValues",
-    "711": "SubtleCryptoEncrypt",
-    "712": "SubtleCryptoDecrypt",
-    "713": "SubtleCryptoSign",
-    "714": "SubtleCryptoVerify",
-    "715": "SubtleCryptoDigest",
-    "716": "SubtleCryptoGenerateKey",
-    "717": "SubtleCryptoImportKey",
-    "718": "SubtleCryptoExportKey",
-    "719": "SubtleCryptoDeriveBits",
-    "720": "SubtleCryptoDeriveKey",
-    "721": "SubtleCryptoWrapKey",
-    "722": "SubtleCryptoUnwrapKey",
-    "723": "CryptoAlgorithmAesCbc",
-    "724": "CryptoAlgorithmHmac",
-    "725": "CryptoAlgorithmRsaSsaPkcs1v1_5",
-    "726": "CryptoAlgorithmSha1",
-    "727": "CryptoAlgorithmSha256",
-    "728": "CryptoAlgorithmSha384",
-    "729": "CryptoAlgorithmSha512",
-    "730": "CryptoAlgorithmAesGcm",
-    "731": "CryptoAlgorithmRsaOaep",
-    "732": "CryptoAlgorithmAesCtr",
-    "733": "CryptoAlgorithmAesKw",
-    "734": "CryptoAlgorithmRsaPss",
-    "735": "CryptoAlgorithmEcdsa",
-    "736": "CryptoAlgorithmEcdh",
-    "737": "CryptoAlgorithmHkdf",
-    "738": "CryptoAlgorithmPbkdf2",
-    "739": "DocumentSetDomain",
-    "740": "UpgradeInsecureRequestsEnabled",
-    "741": "UpgradeInsecureRequestsUpgradedRequest",
-    "742": "DocumentDesignMode",
-    "743": "GlobalCacheStorage",
-    "744": "NetInfo",
-    "745": "BackgroundSync",
-    "748": "LegacyConst",
-    "750": "V8Permissions_Query_Method",
-    "754": "V8HTMLInputElement_Autocapitalize_AttributeGetter",
-    "755": "V8HTMLInputElement_Autocapitalize_AttributeSetter",
-    "756": "V8HTMLTextAreaElement_Autocapitalize_AttributeGetter",
-    "757": "V8HTMLTextAreaElement_Autocapitalize_AttributeSetter",
-    "758": "SVGHrefBaseVal",
-    "759": "SVGHrefAnimVal",
-    "760": "V8CSSRuleList_Item_Method",
-    "761": "V8MediaList_Item_Method",
-    "762": "V8StyleSheetList_Item_Method",
-    "763": "StyleSheetListAnonymousNamedGetter",
-    "764": "AutocapitalizeAttribute",
-    "765": "FullscreenSecureOrigin",
-    "766": "FullscreenInsecureOrigin",
-    "767": "DialogInSandboxedContext",
-    "768": "SVGSMILAnimationInImageRegardlessOfCache",
-    "770": "EncryptedMediaSecureOrigin",
-    "771": "EncryptedMediaInsecureOrigin",
-    "772": "PerformanceFrameTiming",
-    "773": "V8Element_Animate_Method",
-    "778": "V8SVGSVGElement_GetElementById_Method",
-    "779": "ElementCreateShadowRootMultiple",
-    "780": "V8MessageChannel_Constructor",
-    "781": "V8MessagePort_PostMessage_Method",
-    "782": "V8MessagePort_Start_Method",
-    "783": "V8MessagePort_Close_Method",
-    "784": "MessagePortsTransferred",
-    "785": "CSSKeyframesRuleAnonymousIndexedGetter",
-    "786": "V8Screen_AvailLeft_AttributeGetter",
-    "787": "V8Screen_AvailTop_AttributeGetter",
-    "791": "V8SVGFEConvolveMatrixElement_PreserveAlpha_AttributeGetter",
-    "798": "V8SVGStyleElement_Disabled_AttributeGetter",
-    "799": "V8SVGStyleElement_Disabled_AttributeSetter",
-    "801": "InputTypeFileSecureOrigin",
-    "802": "InputTypeFileInsecureOrigin",
-    "804": "ElementAttachShadow",
-    "806": "V8SecurityPolicyViolationEvent_DocumentURI_AttributeGetter",
-    "807": "V8SecurityPolicyViolationEvent_BlockedURI_AttributeGetter",
-    "808": "V8SecurityPolicyViolationEvent_StatusCode_AttributeGetter",
-    "809": "HTMLLinkElementDisabled",
-    "810": "V8HTMLLinkElement_Disabled_AttributeGetter",
-    "811": "V8HTMLLinkElement_Disabled_AttributeSetter",
-    "812": "V8HTMLStyleElement_Disabled_AttributeGetter",
-    "813": "V8HTMLStyleElement_Disabled_AttributeSetter",
-    "816": "V8DOMError_Constructor",
-    "817": "V8DOMError_Name_AttributeGetter",
-    "818": "V8DOMError_Message_AttributeGetter",
-    "823": "V8Location_AncestorOrigins_AttributeGetter",
-    "824": "V8IDBDatabase_ObjectStoreNames_AttributeGetter",
-    "825": "V8IDBObjectStore_IndexNames_AttributeGetter",
-    "826": "V8IDBTransaction_ObjectStoreNames_AttributeGetter",
-    "830": "TextInputFired",
-    "831": "V8TextEvent_Data_AttributeGetter",
-    "832": "V8TextEvent_InitTextEvent_Method",
-    "833": "V8SVGSVGElement_UseCurrentView_AttributeGetter",
-    "834": "V8SVGSVGElement_CurrentView_AttributeGetter",
-    "835": "ClientHintsDPR",
-    "836": "ClientHintsResourceWidth",
-    "837": "ClientHintsViewportWidth",
-    "838": "SRIElementIntegrityAttributeButIneligible",
-    "839": "FormDataAppendFile",
-    "840": "FormDataAppendFileWithFilename",
-    "841": "FormDataAppendBlob",
-    "842": "FormDataAppendBlobWithFilename",
-    "843": "FormDataAppendNull",
-    "844": "HTMLDocumentCreateAttributeNameNotLowercase",
-    "845": "NonHTMLElementSetAttributeNodeFromHTMLDocumentNameNotLowercase",
-    "846": "DOMStringList_Item_AttributeGetter_IndexedDB",
-    "847": "DOMStringList_Item_AttributeGetter_Location",
-    "848": "DOMStringList_Contains_Method_IndexedDB",
-    "849": "DOMStringList_Contains_Method_Location",
-    "850": "NavigatorVibrate",
-    "851": "NavigatorVibrateSubFrame",
-    "853": "V8XPathEvaluator_Constructor",
-    "854": "V8XPathEvaluator_CreateExpression_Method",
-    "855": "V8XPathEvaluator_CreateNSResolver_Method",
-    "856": "V8XPathEvaluator_Evaluate_Method",
-    "857": "RequestMIDIAccess",
-    "858": "V8MouseEvent_LayerX_AttributeGetter",
-    "859": "V8MouseEvent_LayerY_AttributeGetter",
-    "860": "InnerTextWithShadowTree",
-    "861": "SelectionToStringWithShadowTree",
-    "862": "WindowFindWithShadowTree",
-    "863": "V8CompositionEvent_InitCompositionEvent_Method",
-    "864": "V8CustomEvent_InitCustomEvent_Method",
-    "865": "V8DeviceMotionEvent_InitDeviceMotionEvent_Method",
-    "866": "V8DeviceOrientationEvent_InitDeviceOrientationEvent_Method",
-    "867": "V8Event_InitEvent_Method",
-    "868": "V8KeyboardEvent_InitKeyboardEvent_Method",
-    "869": "V8MouseEvent_InitMouseEvent_Method",
-    "870": "V8MutationEvent_InitMutationEvent_Method",
-    "871": "V8StorageEvent_InitStorageEvent_Method",
-    "872": "V8TouchEvent_InitTouchEvent_Method",
-    "873": "V8UIEvent_InitUIEvent_Method",
-    "874": "V8Document_CreateTouch_Method",
-    "876": "RequestFileSystemNonWebbyOrigin",
-    "879": "V8MemoryInfo_TotalJSHeapSize_AttributeGetter",
-    "880": "V8MemoryInfo_UsedJSHeapSize_AttributeGetter",
-    "881": "V8MemoryInfo_JSHeapSizeLimit_AttributeGetter",
-    "882": "V8Performance_Timing_AttributeGetter",
-    "883": "V8Performance_Navigation_AttributeGetter",
-    "884": "V8Performance_Memory_AttributeGetter",
-    "885": "V8SharedWorker_WorkerStart_AttributeGetter",
-    "886": "HTMLKeygenElement",
-    "892": "HTMLMediaElementPreloadNone",
-    "893": "HTMLMediaElementPreloadMetadata",
-    "894": "HTMLMediaElementPreloadAuto",
-    "895": "HTMLMediaElementPreloadDefault",
-    "896": "MixedContentBlockableAllowed",
-    "897": "PseudoBeforeAfterForInputElement",
-    "898": "V8Permissions_Revoke_Method",
-    "899": "LinkRelDnsPrefetch",
-    "900": "LinkRelPreconnect",
-    "901": "LinkRelPreload",
-    "902": "LinkHeaderDnsPrefetch",
-    "903": "LinkHeaderPreconnect",
-    "904": "ClientHintsMetaAcceptCH",
-    "905": "HTMLElementDeprecatedWidth",
-    "906": "ClientHintsContentDPR",
-    "907": "ElementAttachShadowOpen",
-    "908": "ElementAttachShadowClosed",
-    "909": "AudioParamSetValueAtTime",
-    "910": "AudioParamLinearRampToValueAtTime",
-    "911": "AudioParamExponentialRampToValueAtTime",
-    "912": "AudioParamSetTargetAtTime",
-    "913": "AudioParamSetValueCurveAtTime",
-    "914": "AudioParamCancelScheduledValues",
-    "915": "V8Permissions_Request_Method",
-    "917": "LinkRelPrefetch",
-    "918": "LinkRelPrerender",
-    "919": "LinkRelNext",
-    "920": "PrefixedPerformanceResourceTimingBufferFull",
-    "921": "CSSValuePrefixedMinContent",
-    "922": "CSSValuePrefixedMaxContent",
-    "923": "CSSValuePrefixedFitContent",
-    "924": "CSSValuePrefixedFillAvailable",
-    "926": "PresentationDefaultRequest",
-    "927": "PresentationAvailabilityChangeEventListener",
-    "928": "PresentationRequestConstructor",
-    "929": "PresentationRequestStart",
-    "930": "PresentationRequestReconnect",
-    "931": "PresentationRequestGetAvailability",
-    "932": "PresentationRequestConnectionAvailableEventListener",
-    "933": "PresentationConnectionTerminate",
-    "934": "PresentationConnectionSend",
-    "936": "PresentationConnectionMessageEventListener",
-    "937": "CSSAnimationsStackedNeutralKeyframe",
-    "938": "ReadingCheckedInClickHandler",
-    "939": "FlexboxIntrinsicSizeAlgorithmIsDifferent",
-    "940": "HTMLImportsHasStyleSheets",
-    "944": "ClipPathOfPositionedElement",
-    "945": "ClipCssOfPositionedElement",
-    "946": "NetInfoType",
-    "947": "NetInfoDownlinkMax",
-    "948": "NetInfoOnChange",
-    "949": "NetInfoOnTypeChange",
-    "950": "V8Window_Alert_Method",
-    "951": "V8Window_Confirm_Method",
-    "952": "V8Window_Prompt_Method",
-    "953": "V8Window_Print_Method",
-    "954": "V8Window_RequestIdleCallback_Method",
-    "955": "FlexboxPercentagePaddingVertical",
-    "956": "FlexboxPercentageMarginVertical",
-    "957": "BackspaceNavigatedBack",
-    "958": "BackspaceNavigatedBackAfterFormInteraction",
-    "959": "CSPSourceWildcardWouldMatchExactHost",
-    "960": "CredentialManagerGet",
-    "961": "CredentialManagerGetWithUI",
-    "962": "CredentialManagerGetWithoutUI",
-    "963": "CredentialManagerStore",
-    "964": "CredentialManagerRequireUserMediation",
-    "966": "BlockableMixedContentInSubframeBlocked",
-    "967": "AddEventListenerThirdArgumentIsObject",
-    "968": "RemoveEventListenerThirdArgumentIsObject",
-    "969": "CSSAtRuleCharset",
-    "970": "CSSAtRuleFontFace",
-    "971": "CSSAtRuleImport",
-    "972": "CSSAtRuleKeyframes",
-    "973": "CSSAtRuleMedia",
-    "974": "CSSAtRuleNamespace",
-    "975": "CSSAtRulePage",
-    "976": "CSSAtRuleSupports",
-    "977": "CSSAtRuleViewport",
-    "978": "CSSAtRuleWebkitKeyframes",
-    "979": "V8HTMLFieldSetElement_Elements_AttributeGetter",
-    "980": "HTMLMediaElementPreloadForcedNone",
-    "981": "ExternalAddSearchProvider",
-    "982": "ExternalIsSearchProviderInstalled",
-    "983": "V8Permissions_RequestAll_Method",
-    "987": "DeviceOrientationAbsoluteInsecureOrigin",
-    "988": "DeviceOrientationAbsoluteSecureOrigin",
-    "989": "FontFaceConstructor",
-    "990": "ServiceWorkerControlledPage",
-    "993": "MeterElementWithMeterAppearance",
-    "994": "MeterElementWithNoneAppearance",
-    "997": "SelectionAnchorNode",
-    "998": "SelectionAnchorOffset",
-    "999": "SelectionFocusNode",
-    "1000": "SelectionFocusOffset",
-    "1001": "SelectionIsCollapsed",
-    "1002": "SelectionRangeCount",
-    "1003": "SelectionGetRangeAt",
-    "1004": "SelectionAddRange",
-    "1005": "SelectionRemoveAllRanges",
-    "1006": "SelectionCollapse",
-    "1007": "SelectionCollapseToStart",
-    "1008": "SelectionCollapseToEnd",
-    "1009": "SelectionExtend",
-    "1010": "SelectionSelectAllChildren",
-    "1011": "SelectionDeleteDromDocument",
-    "1012": "SelectionDOMString",
-    "1013": "InputTypeRangeVerticalAppearance",
-    "1014": "CSSFilterReference",
-    "1015": "CSSFilterGrayscale",
-    "1016": "CSSFilterSepia",
-    "1017": "CSSFilterSaturate",
-    "1018": "CSSFilterHueRotate",
-    "1019": "CSSFilterInvert",
-    "1020": "CSSFilterOpacity",
-    "1021": "CSSFilterBrightness",
-    "1022": "CSSFilterContrast",
-    "1023": "CSSFilterBlur",
-    "1024": "CSSFilterDropShadow",
-    "1025": "BackgroundSyncRegister",
-    "1027": "ExecCommandOnInputOrTextarea",
-    "1028": "V8History_ScrollRestoration_AttributeGetter",
-    "1029": "V8History_ScrollRestoration_AttributeSetter",
-    "1030": "SVG1DOMFilter",
-    "1031": "OfflineAudioContextStartRendering",
-    "1032": "OfflineAudioContextSuspend",
-    "1033": "OfflineAudioContextResume",
-    "1034": "AttrCloneNode",
-    "1035": "SVG1DOMPaintServer",
-    "1036": "SVGSVGElementFragmentSVGView",
-    "1037": "SVGSVGElementFragmentSVGViewElement",
-    "1038": "PresentationConnectionClose",
-    "1039": "SVG1DOMShape",
-    "1040": "SVG1DOMText",
-    "1041": "RTCPeerConnectionConstructorConstraints",
-    "1042": "RTCPeerConnectionConstructorCompliant",
-    "1044": "RTCPeerConnectionCreateOfferLegacyFailureCallback",
-    "1045": "RTCPeerConnectionCreateOfferLegacyConstraints",
-    "1046": "RTCPeerConnectionCreateOfferLegacyOfferOptions",
-    "1047": "RTCPeerConnectionCreateOfferLegacyCompliant",
-    "1049": "RTCPeerConnectionCreateAnswerLegacyFailureCallback",
-    "1050": "RTCPeerConnectionCreateAnswerLegacyConstraints",
-    "1051": "RTCPeerConnectionCreateAnswerLegacyCompliant",
-    "1052": "RTCPeerConnectionSetLocalDescriptionLegacyNoSuccessCallback",
-    "1053": "RTCPeerConnectionSetLocalDescriptionLegacyNoFailureCallback",
-    "1054": "RTCPeerConnectionSetLocalDescriptionLegacyCompliant",
-    "1055": "RTCPeerConnectionSetRemoteDescriptionLegacyNoSuccessCallback",
-    "1056": "RTCPeerConnectionSetRemoteDescriptionLegacyNoFailureCallback",
-    "1057": "RTCPeerConnectionSetRemoteDescriptionLegacyCompliant",
-    "1058": "RTCPeerConnectionGetStatsLegacyNonCompliant",
-    "1059": "NodeFilterIsFunction",
-    "1060": "NodeFilterIsObject",
-    "1062": "CSSSelectorInternalPseudoListBox",
-    "1063": "CSSSelectorInternalMediaControlsCastButton",
-    "1064": "CSSSelectorInternalMediaControlsOverlayCastButton",
-    "1065": "CSSSelectorInternalPseudoSpatialNavigationFocus",
-    "1066": "SameOriginTextScript",
-    "1067": "SameOriginApplicationScript",
-    "1068": "SameOriginOtherScript",
-    "1069": "CrossOriginTextScript",
-    "1070": "CrossOriginApplicationScript",
-    "1071": "CrossOriginOtherScript",
-    "1072": "SVG1DOMSVGTests",
-    "1073": "V8SVGViewElement_ViewTarget_AttributeGetter",
-    "1074": "DisableRemotePlaybackAttribute",
-    "1075": "V8SloppyMode",
-    "1076": "V8StrictMode",
-    "1077": "V8StrongMode",
-    "1078": "AudioNodeConnectToAudioNode",
-    "1079": "AudioNodeConnectToAudioParam",
-    "1080": "AudioNodeDisconnectFromAudioNode",
-    "1081": "AudioNodeDisconnectFromAudioParam",
-    "1082": "V8CSSFontFaceRule_Style_AttributeGetter",
-    "1083": "SelectionCollapseNull",
-    "1084": "SelectionSetBaseAndExtentNull",
-    "1085": "V8SVGSVGElement_CreateSVGNumber_Method",
-    "1086": "V8SVGSVGElement_CreateSVGLength_Method",
-    "1087": "V8SVGSVGElement_CreateSVGAngle_Method",
-    "1088": "V8SVGSVGElement_CreateSVGPoint_Method",
-    "1089": "V8SVGSVGElement_CreateSVGMatrix_Method",
-    "1090": "V8SVGSVGElement_CreateSVGRect_Method",
-    "1091": "V8SVGSVGElement_CreateSVGTransform_Method",
-    "1092": "V8SVGSVGElement_CreateSVGTransformFromMatrix_Method",
-    "1093": "FormNameAccessForNonDescendantImageElement",
-    "1095": "V8SVGSVGElement_Viewport_AttributeGetter",
-    "1096": "V8RegExpPrototypeStickyGetter",
-    "1097": "V8RegExpPrototypeToString",
-    "1098": "V8InputDeviceCapabilities_FiresTouchEvents_AttributeGetter",
-    "1099": "DataElement",
-    "1100": "TimeElement",
-    "1101": "SVG1DOMUriReference",
-    "1102": "SVG1DOMZoomAndPan",
-    "1103": "V8SVGGraphicsElement_Transform_AttributeGetter",
-    "1104": "MenuItemElement",
-    "1105": "MenuItemCloseTag",
-    "1106": "SVG1DOMMarkerElement",
-    "1107": "SVG1DOMUseElement",
-    "1108": "SVG1DOMMaskElement",
-    "1109": "V8SVGAElement_Target_AttributeGetter",
-    "1110": "V8SVGClipPathElement_ClipPathUnits_AttributeGetter",
-    "1111": "SVG1DOMFitToViewBox",
-    "1112": "SVG1DOMCursorElement",
-    "1113": "V8SVGPathElement_PathLength_AttributeGetter",
-    "1114": "SVG1DOMSVGElement",
-    "1115": "SVG1DOMImageElement",
-    "1116": "SVG1DOMForeignObjectElement",
-    "1117": "AudioContextCreateIIRFilter",
-    "1118": "CSSSelectorPseudoSlotted",
-    "1119": "MediaDevicesEnumerateDevices",
-    "1120": "NonSecureSharedWorkerAccessedFromSecureContext",
-    "1121": "SecureSharedWorkerAccessedFromNonSecureContext",
-    "1123": "EventComposedPath",
-    "1124": "LinkHeaderPreload",
-    "1125": "MouseWheelEvent",
-    "1126": "WheelEvent",
-    "1127": "MouseWheelAndWheelEvent",
-    "1128": "BodyScrollsInAdditionToViewport",
-    "1129": "DocumentDesignModeEnabeld",
-    "1130": "ContentEditableTrue",
-    "1131": "ContentEditableTrueOnHTML",
-    "1132": "ContentEditablePlainTextOnly",
-    "1133": "V8RegExpPrototypeUnicodeGetter",
-    "1134": "V8IntlV8Parse",
-    "1135": "V8IntlPattern",
-    "1136": "V8IntlResolved",
-    "1137": "V8PromiseChain",
-    "1138": "V8PromiseAccept",
-    "1139": "V8PromiseDefer",
-    "1140": "EventComposed",
-    "1141": "GeolocationInsecureOriginIframe",
-    "1142": "GeolocationSecureOriginIframe",
-    "1143": "RequestMIDIAccessIframe",
-    "1144": "GetUserMediaInsecureOriginIframe",
-    "1145": "GetUserMediaSecureOriginIframe",
-    "1146": "ElementRequestPointerLockIframe",
-    "1147": "NotificationAPIInsecureOriginIframe",
-    "1148": "NotificationAPISecureOriginIframe",
-    "1149": "WebSocket",
-    "1150": "MediaStreamConstraintsNameValue",
-    "1151": "MediaStreamConstraintsFromDictionary",
-    "1152": "MediaStreamConstraintsConformant",
-    "1153": "CSSSelectorIndirectAdjacent",
-    "1156": "CreateImageBitmap",
-    "1157": "PresentationConnectionConnectEventListener",
-    "1158": "PresentationConnectionCloseEventListener",
-    "1159": "PresentationConnectionTerminateEventListener",
-    "1160": "DocumentCreateEventFontFaceSetLoadEvent",
-    "1161": "DocumentCreateEventMediaQueryListEvent",
-    "1162": "DocumentCreateEventAnimationEvent",
-    "1164": "DocumentCreateEventApplicationCacheErrorEvent",
-    "1166": "DocumentCreateEventBeforeUnloadEvent",
-    "1167": "DocumentCreateEventClipboardEvent",
-    "1168": "DocumentCreateEventCompositionEvent",
-    "1169": "DocumentCreateEventDragEvent",
-    "1170": "DocumentCreateEventErrorEvent",
-    "1171": "DocumentCreateEventFocusEvent",
-    "1172": "DocumentCreateEventHashChangeEvent",
-    "1173": "DocumentCreateEventMutationEvent",
-    "1174": "DocumentCreateEventPageTransitionEvent",
-    "1176": "DocumentCreateEventPopStateEvent",
-    "1177": "DocumentCreateEventProgressEvent",
-    "1178": "DocumentCreateEventPromiseRejectionEvent",
-    "1180": "DocumentCreateEventResourceProgressEvent",
-    "1181": "DocumentCreateEventSecurityPolicyViolationEvent",
-    "1182": "DocumentCreateEventTextEvent",
-    "1183": "DocumentCreateEventTransitionEvent",
-    "1184": "DocumentCreateEventWheelEvent",
-    "1186": "DocumentCreateEventTrackEvent",
-    "1187": "DocumentCreateEventWebKitAnimationEvent",
-    "1188": "DocumentCreateEventMutationEvents",
-    "1189": "DocumentCreateEventOrientationEvent",
-    "1190": "DocumentCreateEventSVGEvents",
-    "1191": "DocumentCreateEventWebKitTransitionEvent",
-    "1192": "DocumentCreateEventBeforeInstallPromptEvent",
-    "1193": "DocumentCreateEventSyncEvent",
-    "1195": "DocumentCreateEventDeviceMotionEvent",
-    "1196": "DocumentCreateEventDeviceOrientationEvent",
-    "1197": "DocumentCreateEventMediaEncryptedEvent",
-    "1198": "DocumentCreateEventMediaKeyMessageEvent",
-    "1199": "DocumentCreateEventGamepadEvent",
-    "1201": "DocumentCreateEventIDBVersionChangeEvent",
-    "1202": "DocumentCreateEventBlobEvent",
-    "1203": "DocumentCreateEventMediaStreamEvent",
-    "1204": "DocumentCreateEventMediaStreamTrackEvent",
-    "1205": "DocumentCreateEventRTCDTMFToneChangeEvent",
-    "1206": "DocumentCreateEventRTCDataChannelEvent",
-    "1207": "DocumentCreateEventRTCIceCandidateEvent",
-    "1209": "DocumentCreateEventNotificationEvent",
-    "1210": "DocumentCreateEventPresentationConnectionAvailableEvent",
-    "1211": "DocumentCreateEventPresentationConnectionCloseEvent",
-    "1212": "DocumentCreateEventPushEvent",
-    "1213": "DocumentCreateEventExtendableEvent",
-    "1214": "DocumentCreateEventExtendableMessageEvent",
-    "1215": "DocumentCreateEventFetchEvent",
-    "1217": "DocumentCreateEventServiceWorkerMessageEvent",
-    "1218": "DocumentCreateEventSpeechRecognitionError",
-    "1219": "DocumentCreateEventSpeechRecognitionEvent",
-    "1220": "DocumentCreateEventSpeechSynthesisEvent",
-    "1221": "DocumentCreateEventStorageEvent",
-    "1222": "DocumentCreateEventAudioProcessingEvent",
-    "1223": "DocumentCreateEventOfflineAudioCompletionEvent",
-    "1224": "DocumentCreateEventWebGLContextEvent",
-    "1225": "DocumentCreateEventMIDIConnectionEvent",
-    "1226": "DocumentCreateEventMIDIMessageEvent",
-    "1227": "DocumentCreateEventCloseEvent",
-    "1228": "DocumentCreateEventKeyboardEvents",
-    "1229": "HTMLMediaElement",
-    "1230": "HTMLMediaElementInDocument",
-    "1231": "HTMLMediaElementControlsAttribute",
-    "1233": "V8Animation_Oncancel_AttributeGetter",
-    "1234": "V8Animation_Oncancel_AttributeSetter",
-    "1235": "V8HTMLCommentInExternalScript",
-    "1236": "V8HTMLComment",
-    "1237": "V8SloppyModeBlockScopedFunctionRedefinition",
-    "1238": "V8ForInInitializer",
-    "1239": "V8Animation_Id_AttributeGetter",
-    "1240": "V8Animation_Id_AttributeSetter",
-    "1243": "WebAnimationHyphenatedProperty",
-    "1244": "FormControlsCollectionReturnsRadioNodeListForFieldSet",
-    "1245": "ApplicationCacheManifestSelectInsecureOrigin",
-    "1246": "ApplicationCacheManifestSelectSecureOrigin",
-    "1247": "ApplicationCacheAPIInsecureOrigin",
-    "1248": "ApplicationCacheAPISecureOrigin",
-    "1249": "CSSAtRuleApply",
-    "1250": "CSSSelectorPseudoAny",
-    "1251": "PannerNodeSetVelocity",
-    "1252": "DocumentAllItemNoArguments",
-    "1253": "DocumentAllItemNamed",
-    "1254": "DocumentAllItemIndexed",
-    "1255": "DocumentAllItemIndexedWithNonNumber",
-    "1256": "DocumentAllLegacyCallNoArguments",
-    "1257": "DocumentAllLegacyCallNamed",
-    "1258": "DocumentAllLegacyCallIndexed",
-    "1259": "DocumentAllLegacyCallIndexedWithNonNumber",
-    "1260": "DocumentAllLegacyCallTwoArguments",
-    "1263": "HTMLLabelElementControlForNonFormAssociatedElement",
-    "1265": "HTMLMediaElementLoadNetworkEmptyNotPaused",
-    "1267": "V8Window_WebkitSpeechGrammar_ConstructorGetter",
-    "1268": "V8Window_WebkitSpeechGrammarList_ConstructorGetter",
-    "1269": "V8Window_WebkitSpeechRecognition_ConstructorGetter",
-    "1270": "V8Window_WebkitSpeechRecognitionError_ConstructorGetter",
-    "1271": "V8Window_WebkitSpeechRecognitionEvent_ConstructorGetter",
-    "1272": "V8Window_SpeechSynthesis_AttributeGetter",
-    "1273": "V8IDBFactory_WebkitGetDatabaseNames_Method",
-    "1274": "ImageDocument",
-    "1275": "ScriptPassesCSPDynamic",
-    "1277": "CSPWithStrictDynamic",
-    "1278": "ScrollAnchored",
-    "1279": "AddEventListenerFourArguments",
-    "1280": "RemoveEventListenerFourArguments",
-    "1281": "InvalidReportUriDirectiveInMetaCSP",
-    "1282": "InvalidSandboxDirectiveInMetaCSP",
-    "1283": "InvalidFrameAncestorsDirectiveInMetaCSP",
-    "1287": "SVGCalcModeDiscrete",
-    "1288": "SVGCalcModeLinear",
-    "1289": "SVGCalcModePaced",
-    "1290": "SVGCalcModeSpline",
-    "1291": "FormSubmissionStarted",
-    "1292": "FormValidationStarted",
-    "1293": "FormValidationAbortedSubmission",
-    "1294": "FormValidationShowedMessage",
-    "1295": "WebAnimationsEasingAsFunctionLinear",
-    "1296": "WebAnimationsEasingAsFunctionOther",
-    "1297": "V8Document_Images_AttributeGetter",
-    "1298": "V8Document_Embeds_AttributeGetter",
-    "1299": "V8Document_Plugins_AttributeGetter",
-    "1300": "V8Document_Links_AttributeGetter",
-    "1301": "V8Document_Forms_AttributeGetter",
-    "1302": "V8Document_Scripts_AttributeGetter",
-    "1303": "V8Document_Anchors_AttributeGetter",
-    "1304": "V8Document_Applets_AttributeGetter",
-    "1305": "XMLHttpRequestCrossOriginWithCredentials",
-    "1306": "MediaStreamTrackRemote",
-    "1307": "V8Node_IsConnected_AttributeGetter",
-    "1308": "ShadowRootDelegatesFocus",
-    "1309": "MixedShadowRootV0AndV1",
-    "1310": "ImageDocumentInFrame",
-    "1311": "MediaDocument",
-    "1312": "MediaDocumentInFrame",
-    "1313": "PluginDocument",
-    "1314": "PluginDocumentInFrame",
-    "1315": "SinkDocument",
-    "1316": "SinkDocumentInFrame",
-    "1317": "TextDocument",
-    "1318": "TextDocumentInFrame",
-    "1319": "ViewSourceDocument",
-    "1320": "FileAPINativeLineEndings",
-    "1321": "PointerEventAttributeCount",
-    "1322": "CompositedReplication",
-    "1323": "EncryptedMediaAllSelectedContentTypesHaveCodecs",
-    "1324": "EncryptedMediaAllSelectedContentTypesMissingCodecs",
-    "1325": "V8DataTransferItem_WebkitGetAsEntry_Method",
-    "1326": "V8HTMLInputElement_WebkitEntries_AttributeGetter",
-    "1327": "Entry_Filesystem_AttributeGetter_IsolatedFileSystem",
-    "1328": "Entry_GetMetadata_Method_IsolatedFileSystem",
-    "1329": "Entry_MoveTo_Method_IsolatedFileSystem",
-    "1330": "Entry_CopyTo_Method_IsolatedFileSystem",
-    "1331": "Entry_Remove_Method_IsolatedFileSystem",
-    "1332": "Entry_GetParent_Method_IsolatedFileSystem",
-    "1333": "Entry_ToURL_Method_IsolatedFileSystem",
-    "1334": "During_Microtask_Alert",
-    "1335": "During_Microtask_Confirm",
-    "1336": "During_Microtask_Print",
-    "1337": "During_Microtask_Prompt",
-    "1338": "During_Microtask_SyncXHR",
-    "1342": "CredentialManagerGetReturnedCredential",
-    "1343": "GeolocationInsecureOriginDeprecatedNotRemoved",
-    "1344": "GeolocationInsecureOriginIframeDeprecatedNotRemoved",
-    "1345": "ProgressElementWithNoneAppearance",
-    "1346": "ProgressElementWithProgressBarAppearance",
-    "1347": "PointerEventAddListenerCount",
-    "1348": "EventCancelBubbleAffected",
-    "1349": "EventCancelBubbleWasChangedToTrue",
-    "1350": "EventCancelBubbleWasChangedToFalse",
-    "1351": "CSSValueAppearanceNone",
-    "1352": "CSSValueAppearanceNotNone",
-    "1353": "CSSValueAppearanceOthers",
-    "1354": "CSSValueAppearanceButton",
-    "1355": "CSSValueAppearanceCaret",
-    "1356": "CSSValueAppearanceCheckbox",
-    "1357": "CSSValueAppearanceMenulist",
-    "1358": "CSSValueAppearanceMenulistButton",
-    "1359": "CSSValueAppearanceListbox",
-    "1360": "CSSValueAppearanceRadio",
-    "1361": "CSSValueAppearanceSearchField",
-    "1362": "CSSValueAppearanceTextField",
-    "1363": "AudioContextCreatePannerAutomated",
-    "1364": "PannerNodeSetPosition",
-    "1365": "PannerNodeSetOrientation",
-    "1366": "AudioListenerSetPosition",
-    "1367": "AudioListenerSetOrientation",
-    "1368": "IntersectionObserver_Constructor",
-    "1369": "DurableStoragePersist",
-    "1370": "DurableStoragePersisted",
-    "1371": "DurableStorageEstimate",
-    "1372": "UntrustedEventDefaultHandled",
-    "1375": "CSSDeepCombinatorAndShadow",
-    "1376": "OpacityWithPreserve3DQuirk",
-    "1377": "CSSSelectorPseudoReadOnly",
-    "1378": "CSSSelectorPseudoReadWrite",
-    "1379": "UnloadHandler_Navigation",
-    "1380": "TouchStartUserGestureUtilized",
-    "1381": "TouchMoveUserGestureUtilized",
-    "1382": "TouchEndDuringScrollUserGestureUtilized",
-    "1383": "CSSSelectorPseudoDefined",
-    "1384": "RTCPeerConnectionAddIceCandidatePromise",
-    "1385": "RTCPeerConnectionAddIceCandidateLegacy",
-    "1386": "RTCIceCandidateDefaultSdpMLineIndex",
-    "1389": "MediaStreamConstraintsOldAndNew",
-    "1390": "V8ArrayProtectorDirtied",
-    "1391": "V8ArraySpeciesModified",
-    "1392": "V8ArrayPrototypeConstructorModified",
-    "1393": "V8ArrayInstanceProtoModified",
-    "1394": "V8ArrayInstanceConstructorModified",
-    "1395": "V8LegacyFunctionDeclaration",
-    "1396": "V8RegExpPrototypeSourceGetter",
-    "1397": "V8RegExpPrototypeOldFlagGetter",
-    "1398": "V8DecimalWithLeadingZeroInStrictMode",
-    "1399": "FormSubmissionNotInDocumentTree",
-    "1400": "GetUserMediaPrefixed",
-    "1401": "GetUserMediaLegacy",
-    "1402": "GetUserMediaPromise",
-    "1403": "CSSFilterFunctionNoArguments",
-    "1404": "V8LegacyDateParser",
-    "1405": "OpenSearchInsecureOriginInsecureTarget",
-    "1406": "OpenSearchInsecureOriginSecureTarget",
-    "1407": "OpenSearchSecureOriginInsecureTarget",
-    "1408": "OpenSearchSecureOriginSecureTarget",
-    "1409": "RegisterProtocolHandlerSecureOrigin",
-    "1410": "RegisterProtocolHandlerInsecureOrigin",
-    "1411": "CrossOriginWindowAlert",
-    "1412": "CrossOriginWindowConfirm",
-    "1413": "CrossOriginWindowPrompt",
-    "1414": "CrossOriginWindowPrint",
-    "1415": "MediaStreamOnActive",
-    "1416": "MediaStreamOnInactive",
-    "1417": "AddEventListenerPassiveTrue",
-    "1418": "AddEventListenerPassiveFalse",
-    "1419": "CSPReferrerDirective",
-    "1420": "DocumentOpen",
-    "1421": "ElementRequestPointerLockInShadow",
-    "1422": "ShadowRootPointerLockElement",
-    "1423": "DocumentPointerLockElementInV0Shadow",
-    "1424": "TextAreaMaxLength",
-    "1425": "TextAreaMinLength",
-    "1426": "TopNavigationFromSubFrame",
-    "1427": "PrefixedElementRequestFullscreenInShadow",
-    "1428": "MediaSourceAbortRemove",
-    "1429": "MediaSourceDurationTruncatingBuffered",
-    "1430": "AudioContextCrossOriginIframe",
-    "1431": "PointerEventSetCapture",
-    "1432": "PointerEventDispatch",
-    "1433": "MIDIMessageEventReceivedTime",
-    "1434": "SummaryElementWithDisplayBlockAuthorRule",
-    "1435": "V8MediaStream_Active_AttributeGetter",
-    "1436": "BeforeInstallPromptEvent",
-    "1437": "BeforeInstallPromptEventUserChoice",
-    "1438": "BeforeInstallPromptEventPreventDefault",
-    "1439": "BeforeInstallPromptEventPrompt",
-    "1440": "ExecCommandAltersHTMLStructure",
-    "1441": "SecureContextCheckPassed",
-    "1442": "SecureContextCheckFailed",
-    "1443": "SecureContextCheckForSandboxedOriginPassed",
-    "1444": "SecureContextCheckForSandboxedOriginFailed",
-    "1445": "V8DefineGetterOrSetterWouldThrow",
-    "1446": "V8FunctionConstructorReturnedUndefined",
-    "1447": "V8BroadcastChannel_Constructor",
-    "1448": "V8BroadcastChannel_PostMessage_Method",
-    "1449": "V8BroadcastChannel_Close_Method",
-    "1450": "TouchStartFired",
-    "1451": "MouseDownFired",
-    "1452": "PointerDownFired",
-    "1453": "PointerDownFiredForTouch",
-    "1454": "PointerEventDispatchPointerDown",
-    "1455": "SVGSMILBeginOrEndEventValue",
-    "1456": "SVGSMILBeginOrEndSyncbaseValue",
-    "1457": "SVGSMILElementInsertedAfterLoad",
-    "1458": "V8VisualViewport_ScrollLeft_AttributeGetter",
-    "1459": "V8VisualViewport_ScrollTop_AttributeGetter",
-    "1460": "V8VisualViewport_PageX_AttributeGetter",
-    "1461": "V8VisualViewport_PageY_AttributeGetter",
-    "1462": "V8VisualViewport_ClientWidth_AttributeGetter",
-    "1463": "V8VisualViewport_ClientHeight_AttributeGetter",
-    "1464": "V8VisualViewport_Scale_AttributeGetter",
-    "1465": "VisualViewportScrollFired",
-    "1466": "VisualViewportResizeFired",
-    "1467": "NodeGetRootNode",
-    "1468": "SlotChangeEventAddListener",
-    "1469": "CSSValueAppearanceButtonRendered",
-    "1470": "CSSValueAppearanceButtonForAnchor",
-    "1471": "CSSValueAppearanceButtonForButton",
-    "1472": "CSSValueAppearanceButtonForOtherButtons",
-    "1473": "CSSValueAppearanceTextFieldRendered",
-    "1474": "CSSValueAppearanceTextFieldForSearch",
-    "1475": "CSSValueAppearanceTextFieldForTextField",
-    "1476": "RTCPeerConnectionGetStats",
-    "1477": "SVGSMILAnimationAppliedEffect",
-    "1478": "PerformanceResourceTimingSizes",
-    "1479": "EventSourceDocument",
-    "1480": "EventSourceWorker",
-    "1481": "SingleOriginInTimingAllowOrigin",
-    "1482": "MultipleOriginsInTimingAllowOrigin",
-    "1483": "StarInTimingAllowOrigin",
-    "1484": "SVGSMILAdditiveAnimation",
-    "1485": "SendBeaconWithNonSimpleContentType",
-    "1486": "ChromeLoadTimesRequestTime",
-    "1487": "ChromeLoadTimesStartLoadTime",
-    "1488": "ChromeLoadTimesCommitLoadTime",
-    "1489": "ChromeLoadTimesFinishDocumentLoadTime",
-    "1490": "ChromeLoadTimesFinishLoadTime",
-    "1491": "ChromeLoadTimesFirstPaintTime",
-    "1492": "ChromeLoadTimesFirstPaintAfterLoadTime",
-    "1493": "ChromeLoadTimesNavigationType",
-    "1494": "ChromeLoadTimesWasFetchedViaSpdy",
-    "1495": "ChromeLoadTimesWasNpnNegotiated",
-    "1496": "ChromeLoadTimesNpnNegotiatedProtocol",
-    "1497": "ChromeLoadTimesWasAlternateProtocolAvailable",
-    "1498": "ChromeLoadTimesConnectionInfo",
-    "1499": "ChromeLoadTimesUnknown",
-    "1500": "SVGViewElement",
-    "1501": "WebShareShare",
-    "1502": "AuxclickAddListenerCount",
-    "1503": "HTMLCanvasElement",
-    "1504": "SVGSMILAnimationElementTiming",
-    "1505": "SVGSMILBeginEndAnimationElement",
-    "1506": "SVGSMILPausing",
-    "1507": "SVGSMILCurrentTime",
-    "1508": "HTMLBodyElementOnSelectionChangeAttribute",
-    "1509": "ForeignFetchInterception",
-    "1510": "MapNameMatchingStrict",
-    "1511": "MapNameMatchingASCIICaseless",
-    "1512": "MapNameMatchingUnicodeLower",
-    "1513": "RadioNameMatchingStrict",
-    "1514": "RadioNameMatchingASCIICaseless",
-    "1515": "RadioNameMatchingCaseFolding",
-    "1517": "InputSelectionGettersThrow",
-    "1519": "UsbGetDevices",
-    "1520": "UsbRequestDevice",
-    "1521": "UsbDeviceOpen",
-    "1522": "UsbDeviceClose",
-    "1523": "UsbDeviceSelectConfiguration",
-    "1524": "UsbDeviceClaimInterface",
-    "1525": "UsbDeviceReleaseInterface",
-    "1526": "UsbDeviceSelectAlternateInterface",
-    "1527": "UsbDeviceControlTransferIn",
-    "1528": "UsbDeviceControlTransferOut",
-    "1529": "UsbDeviceClearHalt",
-    "1530": "UsbDeviceTransferIn",
-    "1531": "UsbDeviceTransferOut",
-    "1532": "UsbDeviceIsochronousTransferIn",
-    "1533": "UsbDeviceIsochronousTransferOut",
-    "1534": "UsbDeviceReset",
-    "1535": "PointerEnterLeaveFired",
-    "1536": "PointerOverOutFired",
-    "1539": "DraggableAttribute",
-    "1540": "CleanScriptElementWithNonce",
-    "1541": "PotentiallyInjectedScriptElementWithNonce",
-    "1542": "PendingStylesheetAddedAfterBodyStarted",
-    "1543": "UntrustedMouseDownEventDispatchedToSelect",
-    "1544": "BlockedSniffingAudioToScript",
-    "1545": "BlockedSniffingVideoToScript",
-    "1546": "BlockedSniffingCSVToScript",
-    "1547": "MetaSetCookie",
-    "1548": "MetaRefresh",
-    "1549": "MetaSetCookieWhenCSPBlocksInlineScript",
-    "1550": "MetaRefreshWhenCSPBlocksInlineScript",
-    "1551": "MiddleClickAutoscrollStart",
-    "1552": "ClipCssOfFixedPositionElement",
-    "1553": "RTCPeerConnectionCreateOfferOptionsOfferToReceive",
-    "1554": "DragAndDropScrollStart",
-    "1555": "PresentationConnectionListConnectionAvailableEventListener",
-    "1556": "WebAudioAutoplayCrossOriginIframe",
-    "1557": "ScriptInvalidTypeOrLanguage",
-    "1558": "VRGetDisplays",
-    "1559": "VRPresent",
-    "1560": "VRDeprecatedGetPose",
-    "1561": "WebAudioAnalyserNode",
-    "1562": "WebAudioAudioBuffer",
-    "1563": "WebAudioAudioBufferSourceNode",
-    "1564": "WebAudioBiquadFilterNode",
-    "1565": "WebAudioChannelMergerNode",
-    "1566": "WebAudioChannelSplitterNode",
-    "1567": "WebAudioConvolverNode",
-    "1568": "WebAudioDelayNode",
-    "1569": "WebAudioDynamicsCompressorNode",
-    "1570": "WebAudioGainNode",
-    "1571": "WebAudioIIRFilterNode",
-    "1572": "WebAudioMediaElementAudioSourceNode",
-    "1573": "WebAudioOscillatorNode",
-    "1574": "WebAudioPannerNode",
-    "1575": "WebAudioPeriodicWave",
-    "1576": "WebAudioStereoPannerNode",
-    "1577": "WebAudioWaveShaperNode",
-    "1578": "CSSZoomReset",
-    "1579": "CSSZoomDocument",
-    "1580": "PaymentAddressCareOf",
-    "1581": "XSSAuditorBlockedScript",
-    "1582": "XSSAuditorBlockedEntirePage",
-    "1583": "XSSAuditorDisabled",
-    "1584": "XSSAuditorEnabledFilter",
-    "1585": "XSSAuditorEnabledBlock",
-    "1586": "XSSAuditorInvalid",
-    "1587": "SVGCursorElement",
-    "1588": "SVGCursorElementHasClient",
-    "1589": "TextInputEventOnInput",
-    "1590": "TextInputEventOnTextArea",
-    "1591": "TextInputEventOnContentEditable",
-    "1592": "TextInputEventOnNotNode",
-    "1593": "WebkitBeforeTextInsertedOnInput",
-    "1594": "WebkitBeforeTextInsertedOnTextArea",
-    "1595": "WebkitBeforeTextInsertedOnContentEditable",
-    "1596": "WebkitBeforeTextInsertedOnNotNode",
-    "1597": "WebkitEditableContentChangedOnInput",
-    "1598": "WebkitEditableContentChangedOnTextArea",
-    "1599": "WebkitEditableContentChangedOnContentEditable",
-    "1600": "WebkitEditableContentChangedOnNotNode",
-    "1601": "V8NavigatorUserMediaError_ConstraintName_AttributeGetter",
-    "1602": "V8HTMLMediaElement_SrcObject_AttributeGetter",
-    "1603": "V8HTMLMediaElement_SrcObject_AttributeSetter",
-    "1604": "CreateObjectURLBlob",
-    "1605": "CreateObjectURLMediaSource",
-    "1606": "CreateObjectURLMediaStream",
-    "1607": "DocumentCreateTouchWindowNull",
-    "1608": "DocumentCreateTouchWindowWrongType",
-    "1609": "DocumentCreateTouchTargetNull",
-    "1610": "DocumentCreateTouchTargetWrongType",
-    "1611": "DocumentCreateTouchLessThanSevenArguments",
-    "1612": "DocumentCreateTouchMoreThanSevenArguments",
-    "1613": "EncryptedMediaCapabilityProvided",
-    "1614": "EncryptedMediaCapabilityNotProvided",
-    "1615": "LongTaskObserver",
-    "1616": "CSSMotionInEffect",
-    "1617": "CSSOffsetInEffect",
-    "1618": "VRGetDisplaysInsecureOrigin",
-    "1619": "VRRequestPresent",
-    "1620": "VRRequestPresentInsecureOrigin",
-    "1621": "VRDeprecatedFieldOfView",
-    "1622": "VideoInCanvas",
-    "1623": "HiddenAutoplayedVideoInCanvas",
-    "1624": "OffscreenCanvas",
-    "1625": "GamepadPose",
-    "1626": "GamepadHand",
-    "1627": "GamepadDisplayId",
-    "1628": "GamepadButtonTouched",
-    "1629": "GamepadPoseHasOrientation",
-    "1630": "GamepadPoseHasPosition",
-    "1631": "GamepadPosePosition",
-    "1632": "GamepadPoseLinearVelocity",
-    "1633": "GamepadPoseLinearAcceleration",
-    "1634": "GamepadPoseOrientation",
-    "1635": "GamepadPoseAngularVelocity",
-    "1636": "GamepadPoseAngularAcceleration",
-    "1638": "V8RTCDataChannel_MaxRetransmitTime_AttributeGetter",
-    "1639": "V8RTCDataChannel_MaxRetransmits_AttributeGetter",
-    "1640": "V8RTCDataChannel_Reliable_AttributeGetter",
-    "1641": "V8RTCPeerConnection_AddStream_Method",
-    "1642": "V8RTCPeerConnection_CreateDTMFSender_Method",
-    "1643": "V8RTCPeerConnection_GetLocalStreams_Method",
-    "1644": "V8RTCPeerConnection_GetRemoteStreams_Method",
-    "1645": "V8RTCPeerConnection_GetStreamById_Method",
-    "1646": "V8RTCPeerConnection_RemoveStream_Method",
-    "1647": "V8RTCPeerConnection_UpdateIce_Method",
-    "1648": "RTCPeerConnectionCreateDataChannelMaxRetransmitTime",
-    "1649": "RTCPeerConnectionCreateDataChannelMaxRetransmits",
-    "1650": "AudioContextCreateConstantSource",
-    "1651": "WebAudioConstantSourceNode",
-    "1652": "LoopbackEmbeddedInSecureContext",
-    "1653": "LoopbackEmbeddedInNonSecureContext",
-    "1654": "BlinkMacSystemFont",
-    "1655": "RTCConfigurationIceTransportsNone",
-    "1656": "RTCIceServerURL",
-    "1657": "RTCIceServerURLs",
-    "1658": "OffscreenCanvasTransferToImageBitmap2D",
-    "1659": "OffscreenCanvasTransferToImageBitmapWebGL",
-    "1660": "OffscreenCanvasCommit2D",
-    "1661": "OffscreenCanvasCommitWebGL",
-    "1662": "RTCConfigurationIceTransportPolicy",
-    "1663": "RTCConfigurationIceTransportPolicyNone",
-    "1664": "RTCConfigurationIceTransports",
-    "1665": "DocumentFullscreenElementInV0Shadow",
-    "1666": "ScriptWithCSPBypassingSchemeParserInserted",
-    "1667": "ScriptWithCSPBypassingSchemeNotParserInserted",
-    "1668": "DocumentCreateElement2ndArgStringHandling",
-    "1669": "V8MediaRecorder_Start_Method",
-    "1670": "WebBluetoothRequestDevice",
-    "1671": "UnitlessPerspectiveInPerspectiveProperty",
-    "1672": "UnitlessPerspectiveInTransformProperty",
-    "1673": "V8RTCSessionDescription_Type_AttributeGetter",
-    "1674": "V8RTCSessionDescription_Type_AttributeSetter",
-    "1675": "V8RTCSessionDescription_Sdp_AttributeGetter",
-    "1676": "V8RTCSessionDescription_Sdp_AttributeSetter",
-    "1677": "RTCSessionDescriptionInitNoType",
-    "1678": "RTCSessionDescriptionInitNoSdp",
-    "1679": "HTMLMediaElementPreloadForcedMetadata",
-    "1680": "GenericSensorStart",
-    "1681": "GenericSensorStop",
-    "1682": "TouchEventPreventedNoTouchAction",
-    "1683": "TouchEventPreventedForcedDocumentPassiveNoTouchAction",
-    "1684": "V8Event_StopPropagation_Method",
-    "1685": "V8Event_StopImmediatePropagation_Method",
-    "1686": "ImageCaptureConstructor",
-    "1687": "V8Document_RootScroller_AttributeGetter",
-    "1688": "V8Document_RootScroller_AttributeSetter",
-    "1689": "CustomElementRegistryDefine",
-    "1690": "LinkHeaderServiceWorker",
-    "1691": "CSSShadowPiercingDescendantCombinator",
-    "1692": "CSSFlexibleBox",
-    "1693": "CSSGridLayout",
-    "1694": "V8BarcodeDetector_Detect_Method",
-    "1695": "V8FaceDetector_Detect_Method",
-    "1696": "FullscreenAllowedByOrientationChange",
-    "1697": "ServiceWorkerRespondToNavigationRequestWithRedirectedResponse",
-    "1698": "V8AudioContext_Constructor",
-    "1699": "V8OfflineAudioContext_Constructor",
-    "1700": "AppInstalledEventAddListener",
-    "1701": "AudioContextGetOutputTimestamp",
-    "1702": "V8MediaStreamAudioDestinationNode_Constructor",
-    "1703": "V8AnalyserNode_Constructor",
-    "1704": "V8AudioBuffer_Constructor",
-    "1705": "V8AudioBufferSourceNode_Constructor",
-    "1706": "V8AudioProcessingEvent_Constructor",
-    "1707": "V8BiquadFilterNode_Constructor",
-    "1708": "V8ChannelMergerNode_Constructor",
-    "1709": "V8ChannelSplitterNode_Constructor",
-    "1710": "V8ConstantSourceNode_Constructor",
-    "1711": "V8ConvolverNode_Constructor",
-    "1712": "V8DelayNode_Constructor",
-    "1713": "V8DynamicsCompressorNode_Constructor",
-    "1714": "V8GainNode_Constructor",
-    "1715": "V8IIRFilterNode_Constructor",
-    "1716": "V8MediaElementAudioSourceNode_Constructor",
-    "1717": "V8MediaStreamAudioSourceNode_Constructor",
-    "1718": "V8OfflineAudioCompletionEvent_Constructor",
-    "1719": "V8OscillatorNode_Constructor",
-    "1720": "V8PannerNode_Constructor",
-    "1721": "V8PeriodicWave_Constructor",
-    "1722": "V8StereoPannerNode_Constructor",
-    "1723": "V8WaveShaperNode_Constructor",
-    "1724": "V8Headers_GetAll_Method",
-    "1725": "NavigatorVibrateEngagementNone",
-    "1726": "NavigatorVibrateEngagementMinimal",
-    "1727": "NavigatorVibrateEngagementLow",
-    "1728": "NavigatorVibrateEngagementMedium",
-    "1729": "NavigatorVibrateEngagementHigh",
-    "1730": "NavigatorVibrateEngagementMax",
-    "1731": "AlertEngagementNone",
-    "1732": "AlertEngagementMinimal",
-    "1733": "AlertEngagementLow",
-    "1734": "AlertEngagementMedium",
-    "1735": "AlertEngagementHigh",
-    "1736": "AlertEngagementMax",
-    "1737": "ConfirmEngagementNone",
-    "1738": "ConfirmEngagementMinimal",
-    "1739": "ConfirmEngagementLow",
-    "1740": "ConfirmEngagementMedium",
-    "1741": "ConfirmEngagementHigh",
-    "1742": "ConfirmEngagementMax",
-    "1743": "PromptEngagementNone",
-    "1744": "PromptEngagementMinimal",
-    "1745": "PromptEngagementLow",
-    "1746": "PromptEngagementMedium",
-    "1747": "PromptEngagementHigh",
-    "1748": "PromptEngagementMax",
-    "1749": "TopNavInSandbox",
-    "1750": "TopNavInSandboxWithoutGesture",
-    "1751": "TopNavInSandboxWithPerm",
-    "1752": "TopNavInSandboxWithPermButNoGesture",
-    "1753": "ReferrerPolicyHeader",
-    "1754": "HTMLAnchorElementReferrerPolicyAttribute",
-    "1755": "HTMLIFrameElementReferrerPolicyAttribute",
-    "1756": "HTMLImageElementReferrerPolicyAttribute",
-    "1757": "HTMLLinkElementReferrerPolicyAttribute",
-    "1758": "BaseElement",
-    "1759": "BaseWithCrossOriginHref",
-    "1760": "BaseWithDataHref",
-    "1761": "BaseWithNewlinesInTarget",
-    "1762": "BaseWithOpenBracketInTarget",
-    "1763": "BaseWouldBeBlockedByDefaultSrc",
-    "1764": "V8AssigmentExpressionLHSIsCallInSloppy",
-    "1765": "V8AssigmentExpressionLHSIsCallInStrict",
-    "1766": "V8PromiseConstructorReturnedUndefined",
-    "1767": "FormSubmittedWithUnclosedFormControl",
-    "1768": "DocumentCompleteURLHTTPContainingNewline",
-    "1770": "DocumentCompleteURLHTTPContainingNewlineAndLessThan",
-    "1771": "DocumentCompleteURLNonHTTPContainingNewline",
-    "1772": "CSSSelectorInternalMediaControlsTextTrackList",
-    "1773": "CSSSelectorInternalMediaControlsTextTrackListItem",
-    "1774": "CSSSelectorInternalMediaControlsTextTrackListItemInput",
-    "1775": "CSSSelectorInternalMediaControlsTextTrackListKindCaptions",
-    "1776": "CSSSelectorInternalMediaControlsTextTrackListKindSubtitles",
-    "1777": "ScrollbarUseVerticalScrollbarButton",
-    "1778": "ScrollbarUseVerticalScrollbarThumb",
-    "1779": "ScrollbarUseVerticalScrollbarTrack",
-    "1780": "ScrollbarUseHorizontalScrollbarButton",
-    "1781": "ScrollbarUseHorizontalScrollbarThumb",
-    "1782": "ScrollbarUseHorizontalScrollbarTrack",
-    "1783": "HTMLTableCellElementColspan",
-    "1784": "HTMLTableCellElementColspanGreaterThan1000",
-    "1785": "HTMLTableCellElementColspanGreaterThan8190",
-    "1786": "SelectionAddRangeIntersect",
-    "1787": "PostMessageFromInsecureToSecureToplevel",
-    "1788": "V8MediaSession_Metadata_AttributeGetter",
-    "1789": "V8MediaSession_Metadata_AttributeSetter",
-    "1790": "V8MediaSession_PlaybackState_AttributeGetter",
-    "1791": "V8MediaSession_PlaybackState_AttributeSetter",
-    "1792": "V8MediaSession_SetActionHandler_Method",
-    "1793": "WebNFCPush",
-    "1794": "WebNFCCancelPush",
-    "1795": "WebNFCWatch",
-    "1796": "WebNFCCancelWatch",
-    "1797": "AudioParamCancelAndHoldAtTime",
-    "1798": "CSSValueUserModifyReadOnly",
-    "1799": "CSSValueUserModifyReadWrite",
-    "1800": "CSSValueUserModifyReadWritePlaintextOnly",
-    "1801": "V8TextDetector_Detect_Method",
-    "1802": "CSSValueOnDemand",
-    "1803": "ServiceWorkerNavigationPreload",
-    "1804": "FullscreenRequestWithPendingElement",
-    "1805": "HTMLIFrameElementAllowfullscreenAttributeSetAfterContentLoad",
-    "1806": "PointerEventSetCaptureOutsideDispatch",
-    "1807": "NotificationPermissionRequestedInsecureOrigin",
-    "1808": "V8DeprecatedStorageInfo_QueryUsageAndQuota_Method",
-    "1809": "V8DeprecatedStorageInfo_RequestQuota_Method",
-    "1810": "V8DeprecatedStorageQuota_QueryUsageAndQuota_Method",
-    "1811": "V8DeprecatedStorageQuota_RequestQuota_Method",
-    "1812": "V8FileReaderSync_Constructor",
-    "1813": "UncancellableTouchEventPreventDefaulted",
-    "1814": "UncancellableTouchEventDueToMainThreadResponsivenessPreventDefaulted",
-    "1815": "V8HTMLVideoElement_Poster_AttributeGetter",
-    "1816": "V8HTMLVideoElement_Poster_AttributeSetter",
-    "1817": "NotificationPermissionRequestedIframe",
-    "1818": "FileReaderSyncInServiceWorker",
-    "1819": "PresentationReceiverInsecureOrigin",
-    "1820": "PresentationReceiverSecureOrigin",
-    "1821": "PresentationRequestInsecureOrigin",
-    "1822": "PresentationRequestSecureOrigin",
-    "1823": "RtcpMuxPolicyNegotiate",
-    "1824": "DOMClobberedVariableAccessed",
-    "1825": "HTMLDocumentCreateProcessingInstruction",
-    "1826": "FetchResponseConstructionWithStream",
-    "1827": "LocationOrigin",
-    "1828": "DocumentOrigin",
-    "1829": "SubtleCryptoOnlyStrictSecureContextCheckFailed",
-    "1830": "Canvas2DFilter",
-    "1831": "Canvas2DImageSmoothingQuality",
-    "1832": "CanvasToBlob",
-    "1833": "CanvasToDataURL",
-    "1834": "OffscreenCanvasConvertToBlob",
-    "1835": "SVGInCanvas2D",
-    "1836": "SVGInWebGL",
-    "1837": "SelectionFuncionsChangeFocus",
-    "1838": "HTMLObjectElementGetter",
-    "1839": "HTMLObjectElementSetter",
-    "1840": "HTMLEmbedElementGetter",
-    "1841": "HTMLEmbedElementSetter",
-    "1842": "TransformUsesBoxSizeOnSVG",
-    "1843": "ScrollByKeyboardArrowKeys",
-    "1844": "ScrollByKeyboardPageUpDownKeys",
-    "1845": "ScrollByKeyboardHomeEndKeys",
-    "1846": "ScrollByKeyboardSpacebarKey",
-    "1847": "ScrollByTouch",
-    "1848": "ScrollByWheel",
-    "1849": "ScheduledActionIgnored",
-    "1850": "GetCanvas2DContextAttributes",
-    "1851": "V8HTMLInputElement_Capture_AttributeGetter",
-    "1852": "V8HTMLInputElement_Capture_AttributeSetter",
-    "1853": "HTMLMediaElementControlsListAttribute",
-    "1854": "HTMLMediaElementControlsListNoDownload",
-    "1855": "HTMLMediaElementControlsListNoFullscreen",
-    "1856": "HTMLMediaElementControlsListNoRemotePlayback",
-    "1857": "PointerEventClickRetargetCausedByCapture",
-    "1861": "VRDisplayDisplayName",
-    "1862": "VREyeParametersOffset",
-    "1863": "VRPoseLinearVelocity",
-    "1864": "VRPoseLinearAcceleration",
-    "1865": "VRPoseAngularVelocity",
-    "1866": "VRPoseAngularAcceleration",
-    "1867": "CSSOverflowPaged",
-    "1868": "ChildSrcAllowedWorkerThatScriptSrcBlocked",
-    "1869": "HTMLTableElementPresentationAttributeBackground",
-    "1870": "V8Navigator_GetInstalledRelatedApps_Method",
-    "1871": "NamedAccessOnWindow_ChildBrowsingContext",
-    "1872": "NamedAccessOnWindow_ChildBrowsingContext_CrossOriginNameMismatch",
-    "1873": "V0CustomElementsRegisterHTMLCustomTag",
-    "1874": "V0CustomElementsRegisterHTMLTypeExtension",
-    "1875": "V0CustomElementsRegisterSVGElement",
-    "1876": "V0CustomElementsRegisterEmbedderElement",
-    "1877": "V0CustomElementsCreateCustomTagElement",
-    "1878": "V0CustomElementsCreateTypeExtensionElement",
-    "1879": "V0CustomElementsConstruct",
-    "1880": "V8IDBObserver_Observe_Method",
-    "1881": "V8IDBObserver_Unobserve_Method",
-    "1882": "WebBluetoothRemoteCharacteristicGetDescriptor",
-    "1883": "WebBluetoothRemoteCharacteristicGetDescriptors",
-    "1884": "WebBluetoothRemoteCharacteristicReadValue",
-    "1885": "WebBluetoothRemoteCharacteristicWriteValue",
-    "1886": "WebBluetoothRemoteCharacteristicStartNotifications",
-    "1887": "WebBluetoothRemoteCharacteristicStopNotifications",
-    "1888": "WebBluetoothRemoteDescriptorReadValue",
-    "1889": "WebBluetoothRemoteDescriptorWriteValue",
-    "1890": "WebBluetoothRemoteServerConnect",
-    "1891": "WebBluetoothRemoteServerDisconnect",
-    "1892": "WebBluetoothRemoteServerGetPrimaryService",
-    "1893": "WebBluetoothRemoteServerGetPrimaryServices",
-    "1894": "WebBluetoothRemoteServiceGetCharacteristic",
-    "1895": "WebBluetoothRemoteServiceGetCharacteristics",
-    "1896": "HTMLContentElement",
-    "1897": "HTMLShadowElement",
-    "1898": "HTMLSlotElement",
-    "1899": "AccelerometerConstructor",
-    "1900": "AbsoluteOrientationSensorConstructor",
-    "1901": "AmbientLightSensorConstructor",
-    "1902": "GenericSensorOnActivate",
-    "1903": "GenericSensorOnChange",
-    "1904": "GenericSensorOnError",
-    "1905": "GenericSensorActivated",
-    "1906": "GyroscopeConstructor",
-    "1907": "MagnetometerConstructor",
-    "1908": "OrientationSensorPopulateMatrix",
-    "1909": "WindowOpenWithInvalidURL",
-    "1910": "CrossOriginMainFrameNulledNameAccessed",
-    "1911": "MenuItemElementIconAttribute",
-    "1912": "WebkitCSSMatrixSetMatrixValue",
-    "1913": "WebkitCSSMatrixConstructFromString",
-    "1914": "CanRequestURLHTTPContainingNewline",
-    "1915": "CanRequestURLNonHTTPContainingNewline",
-    "1916": "GetGamepads",
-    "1917": "V8SVGPathElement_GetPathSegAtLength_Method",
-    "1918": "MediaStreamConstraintsAudio",
-    "1919": "MediaStreamConstraintsAudioUnconstrained",
-    "1920": "MediaStreamConstraintsVideo",
-    "1921": "MediaStreamConstraintsVideoUnconstrained",
-    "1922": "MediaStreamConstraintsWidth",
-    "1923": "MediaStreamConstraintsHeight",
-    "1924": "MediaStreamConstraintsAspectRatio",
-    "1925": "MediaStreamConstraintsFrameRate",
-    "1926": "MediaStreamConstraintsFacingMode",
-    "1927": "MediaStreamConstraintsVolume",
-    "1928": "MediaStreamConstraintsSampleRate",
-    "1929": "MediaStreamConstraintsSampleSize",
-    "1930": "MediaStreamConstraintsEchoCancellation",
-    "1931": "MediaStreamConstraintsLatency",
-    "1932": "MediaStreamConstraintsChannelCount",
-    "1933": "MediaStreamConstraintsDeviceIdAudio",
-    "1934": "MediaStreamConstraintsDeviceIdVideo",
-    "1935": "MediaStreamConstraintsDisableLocalEcho",
-    "1936": "MediaStreamConstraintsGroupIdAudio",
-    "1937": "MediaStreamConstraintsGroupIdVideo",
-    "1938": "MediaStreamConstraintsVideoKind",
-    "1939": "MediaStreamConstraintsDepthNear",
-    "1940": "MediaStreamConstraintsDepthFar",
-    "1941": "MediaStreamConstraintsFocalLengthX",
-    "1942": "MediaStreamConstraintsFocalLengthY",
-    "1943": "MediaStreamConstraintsMediaStreamSourceAudio",
-    "1944": "MediaStreamConstraintsMediaStreamSourceVideo",
-    "1945": "MediaStreamConstraintsRenderToAssociatedSink",
-    "1946": "MediaStreamConstraintsHotwordEnabled",
-    "1947": "MediaStreamConstraintsGoogEchoCancellation",
-    "1948": "MediaStreamConstraintsGoogExperimentalEchoCancellation",
-    "1949": "MediaStreamConstraintsGoogAutoGainControl",
-    "1950": "MediaStreamConstraintsGoogExperimentalAutoGainControl",
-    "1951": "MediaStreamConstraintsGoogNoiseSuppression",
-    "1952": "MediaStreamConstraintsGoogHighpassFilter",
-    "1953": "MediaStreamConstraintsGoogTypingNoiseDetection",
-    "1954": "MediaStreamConstraintsGoogExperimentalNoiseSuppression",
-    "1955": "MediaStreamConstraintsGoogBeamforming",
-    "1956": "MediaStreamConstraintsGoogArrayGeometry",
-    "1957": "MediaStreamConstraintsGoogAudioMirroring",
-    "1958": "MediaStreamConstraintsGoogDAEchoCancellation",
-    "1959": "MediaStreamConstraintsGoogNoiseReduction",
-    "1960": "MediaStreamConstraintsGoogPowerLineFrequency",
-    "1961": "ViewportFixedPositionUnderFilter",
-    "1962": "RequestMIDIAccessWithSysExOption",
-    "1963": "RequestMIDIAccessIframeWithSysExOption",
-    "1964": "GamepadAxes",
-    "1965": "GamepadButtons",
-    "1966": "VibrateWithoutUserGesture",
-    "1967": "DispatchMouseEventOnDisabledFormControl",
-    "1968": "ElementNameDOMInvalidHTMLParserValid",
-    "1969": "ElementNameDOMValidHTMLParserInvalid",
-    "1970": "GATTServerDisconnectedEvent",
-    "1971": "AnchorClickDispatchForNonConnectedNode",
-    "1972": "HTMLParseErrorNestedForm",
-    "1973": "FontShapingNotDefGlyphObserved",
-    "1974": "PostMessageOutgoingWouldBeBlockedByConnectSrc",
-    "1975": "PostMessageIncomingWouldBeBlockedByConnectSrc",
-    "1976": "PaymentRequestNetworkNameInSupportedMethods",
-    "1977": "CrossOriginPropertyAccess",
-    "1978": "CrossOriginPropertyAccessFromOpener",
-    "1979": "CredentialManagerCreate",
-    "1980": "WebDatabaseCreateDropFTS3Table",
-    "1981": "FieldEditInSecureContext",
-    "1982": "FieldEditInNonSecureContext",
-    "1983": "CredentialManagerCredentialRequestOptionsUnmediated",
-    "1984": "CredentialManagerGetMediationRequired",
-    "1985": "CredentialManagerIdName",
-    "1986": "CredentialManagerPasswordName",
-    "1987": "CredentialManagerAdditionalData",
-    "1988": "CredentialManagerCustomFetch",
-    "1989": "NetInfoRtt",
-    "1990": "NetInfoDownlink",
-    "1991": "ShapeDetection_BarcodeDetectorConstructor",
-    "1992": "ShapeDetection_FaceDetectorConstructor",
-    "1993": "ShapeDetection_TextDetectorConstructor",
-    "1994": "CredentialManagerCredentialRequestOptionsOnlyUnmediated",
-    "1995": "InertAttribute",
-    "1996": "PluginInstanceAccessFromIsolatedWorld",
-    "1997": "PluginInstanceAccessFromMainWorld",
-    "1998": "RequestFullscreenForDialogElement",
-    "1999": "RequestFullscreenForDialogElementInTopLayer",
-    "2000": "ShowModalForElementInFullscreenStack",
-    "2001": "ThreeValuedPositionBackground",
-    "2002": "ThreeValuedPositionBasicShape",
-    "2003": "ThreeValuedPositionGradient",
-    "2004": "ThreeValuedPositionObjectPosition",
-    "2005": "ThreeValuedPositionPerspectiveOrigin",
-    "2007": "UnitlessZeroAngleFilter",
-    "2008": "UnitlessZeroAngleGradient",
-    "2010": "UnitlessZeroAngleTransform",
-    "2011": "HTMLOListElementStartGetterReversedWithoutStartAttribute",
-    "2012": "CredentialManagerPreventSilentAccess",
-    "2013": "NetInfoEffectiveType",
-    "2014": "V8SpeechRecognition_Start_Method",
-    "2015": "TableRowDirectionDifferentFromTable",
-    "2016": "TableSectionDirectionDifferentFromTable",
-    "2017": "ClientHintsDeviceRAM",
-    "2018": "CSSRegisterProperty",
-    "2019": "RelativeOrientationSensorConstructor",
-    "2020": "SmoothScrollJSInterventionActivated",
-    "2021": "BudgetAPIGetCost",
-    "2022": "BudgetAPIGetBudget",
-    "2023": "CrossOriginMainFrameNulledNonEmptyNameAccessed",
-    "2024": "DeprecatedTimingFunctionStepMiddle",
-    "2025": "DocumentDomainSetWithNonDefaultPort",
-    "2026": "DocumentDomainSetWithDefaultPort",
-    "2027": "FeaturePolicyHeader",
-    "2028": "FeaturePolicyAllowAttribute",
-    "2029": "MIDIPortOpen",
-    "2030": "MIDIOutputSend",
-    "2031": "MIDIMessageEvent",
-    "2032": "FetchEventIsReload",
-    "2033": "ServiceWorkerClientFrameType",
-    "2034": "QuirksModeDocument",
-    "2035": "LimitedQuirksModeDocument",
-    "2036": "EncryptedMediaCrossOriginIframe",
-    "2037": "CSSSelectorWebkitMediaControls",
-    "2038": "CSSSelectorWebkitMediaControlsOverlayEnclosure",
-    "2039": "CSSSelectorWebkitMediaControlsOverlayPlayButton",
-    "2040": "CSSSelectorWebkitMediaControlsEnclosure",
-    "2041": "CSSSelectorWebkitMediaControlsPanel",
-    "2042": "CSSSelectorWebkitMediaControlsPlayButton",
-    "2043": "CSSSelectorWebkitMediaControlsCurrentTimeDisplay",
-    "2044": "CSSSelectorWebkitMediaControlsTimeRemainingDisplay",
-    "2045": "CSSSelectorWebkitMediaControlsTimeline",
-    "2046": "CSSSelectorWebkitMediaControlsTimelineContainer",
-    "2047": "CSSSelectorWebkitMediaControlsMuteButton",
-    "2048": "CSSSelectorWebkitMediaControlsVolumeSlider",
-    "2049": "CSSSelectorWebkitMediaControlsFullscreenButton",
-    "2050": "CSSSelectorWebkitMediaControlsToggleClosedCaptionsButton",
-    "2051": "LinearAccelerationSensorConstructor",
-    "2052": "ReportUriMultipleEndpoints",
-    "2053": "ReportUriSingleEndpoint",
-    "2054": "V8ConstructorNonUndefinedPrimitiveReturn",
-    "2055": "EncryptedMediaDisallowedByFeaturePolicyInCrossOriginIframe",
-    "2056": "GeolocationDisallowedByFeaturePolicyInCrossOriginIframe",
-    "2057": "GetUserMediaMicDisallowedByFeaturePolicyInCrossOriginIframe",
-    "2058": "GetUserMediaCameraDisallowedByFeaturePolicyInCrossOriginIframe",
-    "2059": "RequestMIDIAccessDisallowedByFeaturePolicyInCrossOriginIframe",
-    "2060": "MediaSourceKeyframeTimeGreaterThanDependant",
-    "2061": "MediaSourceMuxedSequenceMode",
-    "2062": "PrepareModuleScript",
-    "2063": "PresentationRequestStartSecureOrigin",
-    "2064": "PresentationRequestStartInsecureOrigin",
-    "2065": "PersistentClientHintHeader",
-    "2066": "StyleSheetListNonNullAnonymousNamedGetter",
-    "2067": "OffMainThreadFetch",
-    "2069": "ARIAActiveDescendantAttribute",
-    "2070": "ARIAAtomicAttribute",
-    "2071": "ARIAAutocompleteAttribute",
-    "2072": "ARIABusyAttribute",
-    "2073": "ARIACheckedAttribute",
-    "2074": "ARIAColCountAttribute",
-    "2075": "ARIAColIndexAttribute",
-    "2076": "ARIAColSpanAttribute",
-    "2077": "ARIAControlsAttribute",
-    "2078": "ARIACurrentAttribute",
-    "2079": "ARIADescribedByAttribute",
-    "2080": "ARIADetailsAttribute",
-    "2081": "ARIADisabledAttribute",
-    "2082": "ARIADropEffectAttribute",
-    "2083": "ARIAErrorMessageAttribute",
-    "2084": "ARIAExpandedAttribute",
-    "2085": "ARIAFlowToAttribute",
-    "2086": "ARIAGrabbedAttribute",
-    "2087": "ARIAHasPopupAttribute",
-    "2088": "ARIAHelpAttribute",
-    "2089": "ARIAHiddenAttribute",
-    "2090": "ARIAInvalidAttribute",
-    "2091": "ARIAKeyShortcutsAttribute",
-    "2092": "ARIALabelAttribute",
-    "2093": "ARIALabeledByAttribute",
-    "2094": "ARIALabelledByAttribute",
-    "2095": "ARIALevelAttribute",
-    "2096": "ARIALiveAttribute",
-    "2097": "ARIAModalAttribute",
-    "2098": "ARIAMultilineAttribute",
-    "2099": "ARIAMultiselectableAttribute",
-    "2100": "ARIAOrientationAttribute",
-    "2101": "ARIAOwnsAttribute",
-    "2102": "ARIAPlaceholderAttribute",
-    "2103": "ARIAPosInSetAttribute",
-    "2104": "ARIAPressedAttribute",
-    "2105": "ARIAReadOnlyAttribute",
-    "2106": "ARIARelevantAttribute",
-    "2107": "ARIARequiredAttribute",
-    "2108": "ARIARoleDescriptionAttribute",
-    "2109": "ARIARowCountAttribute",
-    "2110": "ARIARowIndexAttribute",
-    "2111": "ARIARowSpanAttribute",
-    "2112": "ARIASelectedAttribute",
-    "2113": "ARIASetSizeAttribute",
-    "2114": "ARIASortAttribute",
-    "2115": "ARIAValueMaxAttribute",
-    "2116": "ARIAValueMinAttribute",
-    "2117": "ARIAValueNowAttribute",
-    "2118": "ARIAValueTextAttribute",
-    "2119": "V8LabeledExpressionStatement",
-    "2120": "PaymentRequestSupportedMethodsArray",
-    "2121": "NavigatorDeviceMemory",
-    "2122": "FixedWidthTableDistributionChanged",
-    "2123": "WebkitBoxLayout",
-    "2124": "WebkitBoxLayoutHorizontal",
-    "2125": "WebkitBoxLayoutVertical",
-    "2126": "WebkitBoxAlignNotInitial",
-    "2127": "WebkitBoxDirectionNotInitial",
-    "2128": "WebkitBoxLinesNotInitial",
-    "2129": "WebkitBoxPackNotInitial",
-    "2130": "WebkitBoxChildFlexNotInitial",
-    "2131": "WebkitBoxChildFlexGroupNotInitial",
-    "2132": "WebkitBoxChildOrdinalGroupNotInitial",
-    "2133": "WebkitBoxNotDefaultOrder",
-    "2134": "WebkitBoxNoChildren",
-    "2135": "WebkitBoxOneChild",
-    "2136": "WebkitBoxOneChildIsLayoutBlockFlowInline",
-    "2137": "WebkitBoxManyChildren",
-    "2138": "WebkitBoxLineClamp",
-    "2139": "WebkitBoxLineClampPercentage",
-    "2140": "WebkitBoxLineClampNoChildren",
-    "2141": "WebkitBoxLineClampOneChild",
-    "2142": "WebkitBoxLineClampOneChildIsLayoutBlockFlowInline",
-    "2143": "WebkitBoxLineClampManyChildren",
-    "2144": "WebkitBoxLineClampDoesSomething",
-    "2145": "FeaturePolicyAllowAttributeDeprecatedSyntax",
-    "2146": "SuppressHistoryEntryWithoutUserGesture",
-    "2147": "ImageInputTypeFormDataWithNonEmptyValue",
-    "2157": "PerformanceServerTiming",
-    "2158": "FileReaderResultBeforeCompletion",
-    "2159": "SyncXhrInPageDismissal",
-    "2160": "AsyncXhrInPageDismissal",
-    "2162": "AnimationSetPlaybackRateCompensatorySeek",
-    "2163": "DeepCombinatorInStaticProfile",
-    "2164": "PseudoShadowInStaticProfile",
-    "2165": "SchemeBypassesCSP",
-    "2166": "InnerSchemeBypassesCSP",
-    "2167": "SameOriginApplicationOctetStream",
-    "2168": "SameOriginApplicationXml",
-    "2169": "SameOriginTextHtml",
-    "2170": "SameOriginTextPlain",
-    "2171": "SameOriginTextXml",
-    "2172": "CrossOriginApplicationOctetStream",
-    "2173": "CrossOriginApplicationXml",
-    "2174": "CrossOriginTextHtml",
-    "2175": "CrossOriginTextPlain",
-    "2176": "CrossOriginTextXml",
-    "2177": "SameOriginWorkerApplicationOctetStream",
-    "2178": "SameOriginWorkerApplicationXml",
-    "2179": "SameOriginWorkerTextHtml",
-    "2180": "SameOriginWorkerTextPlain",
-    "2181": "SameOriginWorkerTextXml",
-    "2182": "CrossOriginWorkerApplicationOctetStream",
-    "2183": "CrossOriginWorkerApplicationXml",
-    "2184": "CrossOriginWorkerTextHtml",
-    "2185": "CrossOriginWorkerTextPlain",
-    "2186": "CrossOriginWorkerTextXml",
-    "2188": "PerformanceObserverForWindow",
-    "2189": "PerformanceObserverForWorker",
-    "2190": "PaintTimingObserved",
-    "2191": "PaintTimingRequested",
-    "2192": "HTMLMediaElementMediaPlaybackRateOutOfRange",
-    "2193": "CSSFilterFunctionNegativeBrightness",
-    "2194": "CookieSet",
-    "2195": "CookieGet",
-    "2196": "GeolocationDisabledByFeaturePolicy",
-    "2197": "EncryptedMediaDisabledByFeaturePolicy",
-    "2198": "BatteryStatusGetBattery",
-    "2199": "BatteryStatusInsecureOrigin",
-    "2200": "BatteryStatusCrossOrigin",
-    "2201": "BatteryStatusSameOriginABA",
-    "2203": "HasIDClassTagAttribute",
-    "2204": "HasBeforeOrAfterPseudoElement",
-    "2205": "ShapeOutsideMaybeAffectedInlineSize",
-    "2206": "ShapeOutsideMaybeAffectedInlinePosition",
-    "2207": "GamepadVibrationActuator",
-    "2208": "MicrophoneDisabledByFeaturePolicyEstimate",
-    "2209": "CameraDisabledByFeaturePolicyEstimate",
-    "2210": "MidiDisabledByFeaturePolicy",
-    "2211": "DocumentGetPreferredStylesheetSet",
-    "2212": "DocumentGetSelectedStylesheetSet",
-    "2213": "DocumentSetSelectedStylesheetSet",
-    "2214": "GeolocationGetCurrentPosition",
-    "2215": "GeolocationWatchPosition",
-    "2216": "DataUriHasOctothorpe",
-    "2217": "NetInfoSaveData",
-    "2218": "V8Element_GetClientRects_Method",
-    "2219": "V8Element_GetBoundingClientRect_Method",
-    "2220": "V8Range_GetClientRects_Method",
-    "2221": "V8Range_GetBoundingClientRect_Method",
-    "2222": "V8ErrorCaptureStackTrace",
-    "2223": "V8ErrorPrepareStackTrace",
-    "2224": "V8ErrorStackTraceLimit",
-    "2225": "PaintWorklet",
-    "2226": "DocumentPageHideRegistered",
-    "2227": "DocumentPageHideFired",
-    "2228": "DocumentPageShowRegistered",
-    "2229": "DocumentPageShowFired",
-    "2230": "ReplaceCharsetInXHR",
-    "2231": "RespondToSameOriginRequestWithCrossOriginResponse",
-    "2232": "LinkRelModulePreload",
-    "2233": "PerformanceMeasurePassedInObject",
-    "2234": "PerformanceMeasurePassedInNavigationTiming",
-    "2235": "HTMLFrameSetElementNonNullAnonymousNamedGetter",
-    "2236": "CSPWithUnsafeEval",
-    "2237": "WebAssemblyInstantiation",
-    "2238": "V8IndexAccessor",
-    "2239": "V8MediaCapabilities_DecodingInfo_Method",
-    "2240": "V8MediaCapabilities_EncodingInfo_Method",
-    "2241": "V8MediaCapabilitiesInfo_Supported_AttributeGetter",
-    "2242": "V8MediaCapabilitiesInfo_Smooth_AttributeGetter",
-    "2243": "V8MediaCapabilitiesInfo_PowerEfficient_AttributeGetter",
-    "2244": "WindowEventInV0ShadowTree",
-    "2245": "HTMLAnchorElementDownloadInSandboxWithUserGesture",
-    "2246": "HTMLAnchorElementDownloadInSandboxWithoutUserGesture",
-    "2247": "WindowOpenRealmMismatch",
-    "2248": "GridRowTrackPercentIndefiniteHeight",
-    "2249": "VRGetDisplaysSupportsPresent",
-    "2250": "DuplicatedAttribute",
-    "2251": "DuplicatedAttributeForExecutedScript",
-    "2252": "V8RTCPeerConnection_GetSenders_Method",
-    "2253": "V8RTCPeerConnection_GetReceivers_Method",
-    "2254": "V8RTCPeerConnection_AddTrack_Method",
-    "2255": "V8RTCPeerConnection_RemoveTrack_Method",
-    "2256": "LocalCSSFile",
-    "2257": "LocalCSSFileExtensionRejected",
-    "2258": "UserMediaDisableHardwareNoiseSuppression",
-    "2259": "CertificateTransparencyRequiredErrorOnResourceLoad",
-    "2260": "CSSSelectorPseudoWebkitAnyLink",
-    "2261": "AudioWorkletAddModule",
-    "2262": "AudioWorkletGlobalScopeRegisterProcessor",
-    "2263": "AudioWorkletNodeConstructor",
-    "2264": "HTMLMediaElementEmptyLoadWithFutureData",
-    "2265": "CSSValueDisplayContents",
-    "2266": "CSSSelectorPseudoAnyLink",
-    "2267": "FileAccessedCache",
-    "2268": "FileAccessedCookies",
-    "2269": "FileAccessedDatabase",
-    "2270": "FileAccessedFileSystem",
-    "2271": "FileAccessedLocalStorage",
-    "2272": "FileAccessedLocks",
-    "2273": "FileAccessedServiceWorker",
-    "2274": "FileAccessedSessionStorage",
-    "2275": "FileAccessedSharedWorker",
-    "2276": "V8MediaKeys_GetStatusForPolicy_Method",
-    "2277": "V8DeoptimizerDisableSpeculation",
-    "2278": "CSSSelectorCue",
-    "2279": "CSSSelectorWebkitCalendarPickerIndicator",
-    "2280": "CSSSelectorWebkitClearButton",
-    "2281": "CSSSelectorWebkitColorSwatch",
-    "2282": "CSSSelectorWebkitColorSwatchWrapper",
-    "2283": "CSSSelectorWebkitDateAndTimeValue",
-    "2284": "CSSSelectorWebkitDatetimeEdit",
-    "2285": "CSSSelectorWebkitDatetimeEditAmpmField",
-    "2286": "CSSSelectorWebkitDatetimeEditDayField",
-    "2287": "CSSSelectorWebkitDatetimeEditFieldsWrapper",
-    "2288": "CSSSelectorWebkitDatetimeEditHourField",
-    "2289": "CSSSelectorWebkitDatetimeEditMillisecondField",
-    "2290": "CSSSelectorWebkitDatetimeEditMinuteField",
-    "2291": "CSSSelectorWebkitDatetimeEditMonthField",
-    "2292": "CSSSelectorWebkitDatetimeEditSecondField",
-    "2293": "CSSSelectorWebkitDatetimeEditText",
-    "2294": "CSSSelectorWebkitDatetimeEditWeekField",
-    "2295": "CSSSelectorWebkitDatetimeEditYearField",
-    "2296": "CSSSelectorWebkitDetailsMarker",
-    "2297": "CSSSelectorWebkitFileUploadButton",
-    "2298": "CSSSelectorWebkitInnerSpinButton",
-    "2299": "CSSSelectorWebkitInputPlaceholder",
-    "2300": "CSSSelectorWebkitMediaSliderContainer",
-    "2301": "CSSSelectorWebkitMediaSliderThumb",
-    "2302": "CSSSelectorWebkitMediaTextTrackContainer",
-    "2303": "CSSSelectorWebkitMediaTextTrackDisplay",
-    "2304": "CSSSelectorWebkitMediaTextTrackRegion",
-    "2305": "CSSSelectorWebkitMediaTextTrackRegionContainer",
-    "2306": "CSSSelectorWebkitMeterBar",
-    "2307": "CSSSelectorWebkitMeterEvenLessGoodValue",
-    "2308": "CSSSelectorWebkitMeterInnerElement",
-    "2309": "CSSSelectorWebkitMeterOptimumValue",
-    "2310": "CSSSelectorWebkitMeterSuboptimumValue",
-    "2311": "CSSSelectorWebkitProgressBar",
-    "2312": "CSSSelectorWebkitProgressInnerElement",
-    "2313": "CSSSelectorWebkitProgressValue",
-    "2314": "CSSSelectorWebkitSearchCancelButton",
-    "2315": "CSSSelectorWebkitSliderContainer",
-    "2316": "CSSSelectorWebkitSliderRunnableTrack",
-    "2317": "CSSSelectorWebkitSliderThumb",
-    "2318": "CSSSelectorWebkitTextfieldDecorationContainer",
-    "2319": "CSSSelectorWebkitUnknownPseudo",
-    "2320": "FilterAsContainingBlockMayChangeOutput",
-    "2321": "DispatchMouseUpDownEventOnDisabledFormControl",
-    "2322": "CSSSelectorPseudoMatches",
-    "2323": "V8RTCRtpSender_ReplaceTrack_Method",
-    "2324": "InputTypeFileSecureOriginOpenChooser",
-    "2325": "InputTypeFileInsecureOriginOpenChooser",
-    "2326": "BasicShapeEllipseNoRadius",
-    "2327": "BasicShapeEllipseOneRadius",
-    "2328": "BasicShapeEllipseTwoRadius",
-    "2329": "TemporalInputTypeChooserByTrustedClick",
-    "2330": "TemporalInputTypeChooserByUntrustedClick",
-    "2331": "TemporalInputTypeIgnoreUntrustedClick",
-    "2332": "ColorInputTypeChooserByTrustedClick",
-    "2333": "ColorInputTypeChooserByUntrustedClick",
-    "2334": "CSSTypedOMStylePropertyMap",
-    "2335": "ScrollToFragmentRequested",
-    "2336": "ScrollToFragmentSucceedWithRaw",
-    "2337": "ScrollToFragmentSucceedWithASCII",
-    "2338": "ScrollToFragmentSucceedWithUTF8",
-    "2339": "ScrollToFragmentSucceedWithIsomorphic",
-    "2340": "ScrollToFragmentSucceedWithMixed",
-    "2341": "ScrollToFragmentFailWithASCII",
-    "2342": "ScrollToFragmentFailWithUTF8",
-    "2343": "ScrollToFragmentFailWithIsomorphic",
-    "2344": "ScrollToFragmentFailWithMixed",
-    "2345": "ScrollToFragmentFailWithInvalidEncoding",
-    "2346": "RTCPeerConnectionWithActiveCsp",
-    "2347": "ImageDecodingAttribute",
-    "2348": "ImageDecodeAPI",
-    "2349": "V8HTMLElement_Autocapitalize_AttributeGetter",
-    "2350": "V8HTMLElement_Autocapitalize_AttributeSetter",
-    "2351": "CSSLegacyAlignment",
-    "2352": "SRISignatureCheck",
-    "2353": "SRISignatureSuccess",
-    "2354": "CSSBasicShape",
-    "2355": "CSSGradient",
-    "2356": "CSSPaintFunction",
-    "2357": "WebkitCrossFade",
-    "2358": "DisablePictureInPictureAttribute",
-    "2359": "CertificateTransparencyNonCompliantSubresourceInMainFrame",
-    "2360": "CertificateTransparencyNonCompliantResourceInSubframe",
-    "2361": "V8AbortController_Constructor",
-    "2362": "ReplaceCharsetInXHRIgnoringCase",
-    "2363": "HTMLIFrameElementGestureMedia",
-    "2364": "WorkletAddModule",
-    "2365": "AnimationWorkletRegisterAnimator",
-    "2366": "WorkletAnimationConstructor",
-    "2367": "ScrollTimelineConstructor",
-    "2368": "V8Document_CreateTouchList_Method",
-    "2369": "AsyncClipboardAPIRead",
-    "2370": "AsyncClipboardAPIWrite",
-    "2371": "AsyncClipboardAPIReadText",
-    "2372": "AsyncClipboardAPIWriteText",
-    "2373": "OpenerNavigationWithoutGesture",
-    "2374": "GetComputedStyleWebkitAppearance",
-    "2375": "V8LockManager_Request_Method",
-    "2376": "V8LockManager_Query_Method",
-    "2377": "UserMediaEnableExperimentalHardwareEchoCancellation",
-    "2378": "V8RTCDTMFSender_Track_AttributeGetter",
-    "2379": "V8RTCDTMFSender_Duration_AttributeGetter",
-    "2380": "V8RTCDTMFSender_InterToneGap_AttributeGetter",
-    "2381": "V8RTCRtpSender_Dtmf_AttributeGetter",
-    "2382": "RTCConstraintEnableDtlsSrtpTrue",
-    "2383": "RTCConstraintEnableDtlsSrtpFalse",
-    "2384": "RtcPeerConnectionId",
-    "2385": "V8PaintWorkletGlobalScope_RegisterPaint_Method",
-    "2386": "V8PaintWorkletGlobalScope_DevicePixelRatio_AttributeGetter",
-    "2387": "CSSSelectorPseudoFocus",
-    "2388": "CSSSelectorPseudoFocusVisible",
-    "2389": "DistrustedLegacySymantecSubresource",
-    "2390": "VRDisplayGetFrameData",
-    "2391": "XMLHttpRequestResponseXML",
-    "2392": "MessagePortTransferClosedPort",
-    "2393": "RTCLocalSdpModification",
-    "2394": "KeyboardApiLock",
-    "2395": "KeyboardApiUnlock",
-    "2396": "PPAPIURLRequestStreamToFile",
-    "2397": "PaymentHandler",
-    "2398": "PaymentRequestShowWithoutGesture",
-    "2399": "ReadableStreamConstructor",
-    "2400": "WritableStreamConstructor",
-    "2401": "TransformStreamConstructor",
-    "2402": "NegativeBackgroundSize",
-    "2403": "NegativeMaskSize",
-    "2404": "ClientHintsRtt",
-    "2405": "ClientHintsDownlink",
-    "2406": "ClientHintsEct",
-    "2407": "CrossOriginHTMLIFrameElementContentDocument",
-    "2408": "CrossOriginHTMLIFrameElementGetSVGDocument",
-    "2409": "CrossOriginHTMLEmbedElementGetSVGDocument",
-    "2410": "CrossOriginHTMLFrameElementContentDocument",
-    "2411": "CrossOriginHTMLObjectElementContentDocument",
-    "2412": "CrossOriginHTMLObjectElementGetSVGDocument",
-    "2413": "NavigatorXR",
-    "2414": "XRRequestDevice",
-    "2415": "XRRequestSession",
-    "2416": "XRSupportsSession",
-    "2417": "XRSessionGetInputSources",
-    "2418": "CSSResizeAuto",
-    "2419": "PrefixedCursorGrab",
-    "2420": "PrefixedCursorGrabbing",
-    "2421": "CredentialManagerCreatePublicKeyCredential",
-    "2422": "CredentialManagerGetPublicKeyCredential",
-    "2423": "CredentialManagerMakePublicKeyCredentialSuccess",
-    "2424": "CredentialManagerGetPublicKeyCredentialSuccess",
-    "2425": "ShapeOutsideContentBox",
-    "2426": "ShapeOutsidePaddingBox",
-    "2427": "ShapeOutsideBorderBox",
-    "2428": "ShapeOutsideMarginBox",
-    "2429": "PerformanceTimeline",
-    "2430": "UserTiming",
-    "2431": "CSSSelectorPseudoIS",
-    "2432": "KeyboardApiGetLayoutMap",
-    "2434": "PerformanceResourceTimingInitiatorType",
-    "2436": "V8ArraySortNoElementsProtector",
-    "2437": "V8ArrayPrototypeSortJSArrayModifiedPrototype",
-    "2438": "V8Document_PictureInPictureEnabled_AttributeGetter",
-    "2439": "V8Document_PictureInPictureElement_AttributeGetter",
-    "2440": "V8Document_ExitPictureInPicture_Method",
-    "2441": "V8ShadowRoot_PictureInPictureElement_AttributeGetter",
-    "2442": "V8HTMLVideoElement_DisablePictureInPicture_AttributeGetter",
-    "2443": "V8HTMLVideoElement_DisablePictureInPicture_AttributeSetter",
-    "2444": "V8HTMLVideoElement_RequestPictureInPicture_Method",
-    "2445": "EnterPictureInPictureEventListener",
-    "2446": "LeavePictureInPictureEventListener",
-    "2447": "V8PictureInPictureWindow_Height_AttributeGetter",
-    "2448": "V8PictureInPictureWindow_Width_AttributeGetter",
-    "2449": "PictureInPictureWindowResizeEventListener",
-    "2450": "V8CookieStore_Delete_Method",
-    "2451": "V8CookieStore_Get_Method",
-    "2452": "V8CookieStore_GetAll_Method",
-    "2453": "V8CookieStore_GetChangeSubscriptions_Method",
-    "2454": "V8CookieStore_Has_Method",
-    "2455": "V8CookieStore_Set_Method",
-    "2456": "V8CookieStore_SubscribeToChanges_Method",
-    "2457": "V8CookieChangeEvent_Changed_AttributeGetter",
-    "2458": "V8CookieChangeEvent_Deleted_AttributeGetter",
-    "2459": "V8ExtendableCookieChangeEvent_Changed_AttributeGetter",
-    "2460": "V8ExtendableCookieChangeEvent_Deleted_AttributeGetter",
-    "2461": "ShapeOutsideContentBoxDifferentFromMarginBox",
-    "2462": "ShapeOutsidePaddingBoxDifferentFromMarginBox",
-    "2463": "CSSContainLayoutPositionedDescendants",
-    "2464": "HTMLFrameSetElementAnonymousNamedGetter",
-    "2465": "CanvasConvertToBlob",
-    "2466": "PolymerV1Detected",
-    "2467": "PolymerV2Detected",
-    "2468": "PerformanceEventTimingBuffer",
-    "2469": "PerformanceEventTimingConstructor",
-    "2470": "ReverseIterateDOMStorage",
-    "2471": "TextToSpeech_Speak",
-    "2472": "TextToSpeech_SpeakCrossOrigin",
-    "2473": "TextToSpeech_SpeakDisallowedByAutoplay",
-    "2474": "StaleWhileRevalidateEnabled",
-    "2475": "MediaElementSourceOnOfflineContext",
-    "2476": "MediaStreamDestinationOnOfflineContext",
-    "2477": "MediaStreamSourceOnOfflineContext",
-    "2478": "RTCDataChannelInitMaxRetransmitTime",
-    "2479": "RTCPeerConnectionCreateDataChannelMaxPacketLifeTime",
-    "2480": "V8SpeechGrammarList_AddFromUri_Method",
-    "2481": "V8SpeechRecognitionEvent_Interpretation_AttributeGetter",
-    "2482": "V8SpeechRecognitionEvent_Emma_AttributeGetter",
-    "2483": "V8SpeechSynthesis_Speak_Method",
-    "2484": "LegacySymantecCertMainFrameResource",
-    "2485": "LegacySymantecCertInSubresource",
-    "2486": "LegacySymantecCertInSubframeMainResource",
-    "2487": "EventTimingExplicitlyRequested",
-    "2488": "CSSEnvironmentVariable",
-    "2489": "CSSEnvironmentVariable_SafeAreaInsetTop",
-    "2490": "CSSEnvironmentVariable_SafeAreaInsetLeft",
-    "2491": "CSSEnvironmentVariable_SafeAreaInsetBottom",
-    "2492": "CSSEnvironmentVariable_SafeAreaInsetRight",
-    "2493": "MediaControlsDisplayCutoutGesture",
-    "2494": "DocumentOpenTwoArgs",
-    "2495": "DocumentOpenTwoArgsWithReplace",
-    "2496": "DocumentOpenThreeArgs",
-    "2497": "V8FunctionTokenOffsetTooLongForToString",
-    "2498": "ServiceWorkerImportScriptNotInstalled",
-    "2499": "NestedDedicatedWorker",
-    "2500": "ClientHintsMetaAcceptCHLifetime",
-    "2501": "DOMNodeRemovedEventDelayed",
-    "2502": "DOMNodeRemovedEventHandlerAccessDetachingNode",
-    "2503": "DOMNodeRemovedEventListenedAtNonTarget",
-    "2504": "DOMNodeRemovedFromDocumentEventDelayed",
-    "2505": "DOMNodeRemovedFromDocumentEventHandlerAccessDetachingNode",
-    "2506": "DOMNodeRemovedFromDocumentEventListenedAtNonTarget",
-    "2507": "CSSFillAvailableLogicalWidth",
-    "2508": "CSSFillAvailableLogicalHeight",
-    "2509": "PopupOpenWhileFileChooserOpened",
-    "2510": "CookieStoreAPI",
-    "2511": "FeaturePolicyJSAPI",
-    "2512": "V8RTCPeerConnection_GetTransceivers_Method",
-    "2513": "V8RTCPeerConnection_AddTransceiver_Method",
-    "2514": "V8RTCRtpTransceiver_Direction_AttributeGetter",
-    "2515": "V8RTCRtpTransceiver_Direction_AttributeSetter",
-    "2516": "HTMLLinkElementDisabledByParser",
-    "2517": "RequestIsHistoryNavigation",
-    "2518": "AddDocumentLevelPassiveTrueWheelEventListener",
-    "2519": "AddDocumentLevelPassiveFalseWheelEventListener",
-    "2520": "AddDocumentLevelPassiveDefaultWheelEventListener",
-    "2521": "DocumentLevelPassiveDefaultEventListenerPreventedWheel",
-    "2522": "ShapeDetectionAPI",
-    "2523": "V8SourceBuffer_ChangeType_Method",
-    "2524": "PPAPIWebSocket",
-    "2525": "V8MediaStreamTrack_ContentHint_AttributeGetter",
-    "2526": "V8MediaStreamTrack_ContentHint_AttributeSetter",
-    "2527": "V8IDBFactory_Open_Method",
-    "2528": "EvaluateScriptMovedBetweenDocuments",
-    "2529": "ReportingObserver",
-    "2530": "DeprecationReport",
-    "2531": "InterventionReport",
-    "2532": "V8WasmSharedMemory",
-    "2533": "V8WasmThreadOpcodes",
-    "2534": "CacheStorageAddAllSuccessWithDuplicate",
-    "2535": "LegendDelegateFocusOrAccessKey",
-    "2536": "FeaturePolicyReport",
-    "2537": "V8Window_WebkitRTCPeerConnection_ConstructorGetter",
-    "2538": "V8Window_WebkitMediaStream_ConstructorGetter",
-    "2539": "TextEncoderStreamConstructor",
-    "2540": "TextDecoderStreamConstructor",
-    "2541": "SignedExchangeInnerResponse",
-    "2542": "PaymentAddressLanguageCode",
-    "2543": "DocumentDomainBlockedCrossOriginAccess",
-    "2544": "DocumentDomainEnabledCrossOriginAccess",
-    "2545": "SerialGetPorts",
-    "2546": "SerialRequestPort",
-    "2547": "SerialPortOpen",
-    "2548": "SerialPortClose",
-    "2549": "BackgroundFetchManagerFetch",
-    "2550": "BackgroundFetchManagerGet",
-    "2551": "BackgroundFetchManagerGetIds",
-    "2552": "BackgroundFetchRegistrationAbort",
-    "2553": "BackgroundFetchRegistrationMatch",
-    "2554": "BackgroundFetchRegistrationMatchAll",
-    "2555": "V8AtomicsNotify",
-    "2556": "V8AtomicsWake",
-    "2557": "FormDisabledAttributePresent",
-    "2558": "FormDisabledAttributePresentAndSubmit",
-    "2559": "CSSValueAppearanceCheckboxRendered",
-    "2560": "CSSValueAppearanceCheckboxForOthersRendered",
-    "2561": "CSSValueAppearanceRadioRendered",
-    "2562": "CSSValueAppearanceRadioForOthersRendered",
-    "2563": "CSSValueAppearanceInnerSpinButtonRendered",
-    "2564": "CSSValueAppearanceInnerSpinButtonForOthersRendered",
-    "2565": "CSSValueAppearanceMenuListRendered",
-    "2566": "CSSValueAppearanceMenuListForOthersRendered",
-    "2567": "CSSValueAppearanceProgressBarRendered",
-    "2568": "CSSValueAppearanceSliderHorizontalRendered",
-    "2569": "CSSValueAppearanceSliderHorizontalForOthersRendered",
-    "2570": "CSSValueAppearanceSliderVerticalRendered",
-    "2571": "CSSValueAppearanceSliderVerticalForOthersRendered",
-    "2572": "CSSValueAppearanceSliderThumbHorizontalRendered",
-    "2573": "CSSValueAppearanceSliderThumbHorizontalForOthersRendered",
-    "2574": "CSSValueAppearanceSliderThumbVerticalRendered",
-    "2575": "CSSValueAppearanceSliderThumbVerticalForOthersRendered",
-    "2576": "CSSValueAppearanceSearchFieldRendered",
-    "2577": "CSSValueAppearanceSearchFieldForOthersRendered",
-    "2578": "CSSValueAppearanceSearchCancelRendered",
-    "2579": "CSSValueAppearanceSearchCancelForOthersRendered",
-    "2580": "CSSValueAppearanceTextAreaRendered",
-    "2581": "CSSValueAppearanceTextAreaForOthersRendered",
-    "2582": "CSSValueAppearanceMenuListButtonRendered",
-    "2583": "CSSValueAppearanceMenuListButtonForOthersRendered",
-    "2584": "CSSValueAppearancePushButtonRendered",
-    "2585": "CSSValueAppearancePushButtonForOthersRendered",
-    "2586": "CSSValueAppearanceSquareButtonRendered",
-    "2587": "CSSValueAppearanceSquareButtonForOthersRendered",
-    "2588": "GetComputedStyleForWebkitAppearance",
-    "2589": "CursorImageLE32x32",
-    "2590": "CursorImageGT32x32",
-    "2591": "RTCPeerConnectionComplexPlanBSdpUsingDefaultSdpSemantics",
-    "2592": "ResizeObserver_Constructor",
-    "2593": "Collator",
-    "2594": "NumberFormat",
-    "2595": "DateTimeFormat",
-    "2596": "PluralRules",
-    "2597": "RelativeTimeFormat",
-    "2598": "Locale",
-    "2599": "ListFormat",
-    "2600": "Segmenter",
-    "2601": "StringLocaleCompare",
-    "2602": "StringToLocaleUpperCase",
-    "2603": "StringToLocaleLowerCase",
-    "2604": "NumberToLocaleString",
-    "2605": "DateToLocaleString",
-    "2606": "DateToLocaleDateString",
-    "2607": "DateToLocaleTimeString",
-    "2608": "MalformedCSP",
-    "2609": "V8AttemptOverrideReadOnlyOnPrototypeSloppy",
-    "2610": "V8AttemptOverrideReadOnlyOnPrototypeStrict",
-    "2611": "HTMLCanvasElementLowLatency",
-    "2612": "V8OptimizedFunctionWithOneShotBytecode",
-    "2613": "SVGGeometryPropertyHasNonZeroUnitlessValue",
-    "2614": "CSSValueAppearanceNoImplementationSkipBorder",
-    "2615": "InstantiateModuleScript",
-    "2616": "DynamicImportModuleScript",
-    "2617": "HistoryPushState",
-    "2618": "HistoryReplaceState",
-    "2619": "GetDisplayMedia",
-    "2620": "CursorImageGT64x64",
-    "2621": "AdClick",
-    "2622": "UpdateWithoutShippingOptionOnShippingAddressChange",
-    "2623": "UpdateWithoutShippingOptionOnShippingOptionChange",
-    "2624": "CSSSelectorEmptyWhitespaceOnlyFail",
-    "2625": "ActivatedImplicitRootScroller",
-    "2626": "CSSUnknownNamespacePrefixInSelector",
-    "2627": "PageLifeCycleFreeze",
-    "2628": "DefaultInCustomIdent",
-    "2629": "HTMLAnchorElementHrefTranslateAttribute",
-    "2630": "WebKitUserModifyEffective",
-    "2631": "PlainTextEditingEffective",
-    "2632": "NavigationDownloadInSandboxWithUserGesture",
-    "2633": "NavigationDownloadInSandboxWithoutUserGesture",
-    "2634": "LegacyTLSVersionInMainFrameResource",
-    "2635": "LegacyTLSVersionInSubresource",
-    "2636": "LegacyTLSVersionInSubframeMainResource",
-    "2637": "RTCMaxAudioBufferSize",
-    "2638": "WebKitUserModifyReadWriteEffective",
-    "2639": "WebKitUserModifyReadOnlyEffective",
-    "2640": "WebKitUserModifyPlainTextEffective",
-    "2641": "CSSAtRuleFontFeatureValues",
-    "2642": "FlexboxSingleLineAlignContent",
-    "2643": "SignedExchangeInnerResponseInMainFrame",
-    "2644": "SignedExchangeInnerResponseInSubFrame",
-    "2645": "CSSSelectorNotWithValidList",
-    "2646": "CSSSelectorNotWithInvalidList",
-    "2647": "CSSSelectorNotWithPartiallyValidList",
-    "2648": "V8IDBFactory_Databases_Method",
-    "2649": "OpenerNavigationDownloadCrossOriginNoGesture",
-    "2650": "V8RegExpMatchIsTrueishOnNonJSRegExp",
-    "2651": "V8RegExpMatchIsFalseishOnJSRegExp",
-    "2652": "DownloadInAdFrameWithUserGesture",
-    "2653": "DownloadInAdFrameWithoutUserGesture",
-    "2654": "NavigatorAppVersion",
-    "2655": "NavigatorDoNotTrack",
-    "2656": "NavigatorHardwareConcurrency",
-    "2657": "NavigatorLanguage",
-    "2658": "NavigatorLanguages",
-    "2659": "NavigatorMaxTouchPoints",
-    "2660": "NavigatorMimeTypes",
-    "2661": "NavigatorPlatform",
-    "2662": "NavigatorPlugins",
-    "2663": "NavigatorUserAgent",
-    "2664": "WebBluetoothRequestScan",
-    "2665": "V8SVGGeometryElement_IsPointInFill_Method",
-    "2666": "V8SVGGeometryElement_IsPointInStroke_Method",
-    "2667": "V8SVGGeometryElement_GetTotalLength_Method",
-    "2668": "V8SVGGeometryElement_GetPointAtLength_Method",
-    "2669": "OffscreenCanvasTransferToImageBitmap",
-    "2670": "OffscreenCanvasIsPointInPath",
-    "2671": "OffscreenCanvasIsPointInStroke",
-    "2672": "OffscreenCanvasMeasureText",
-    "2673": "OffscreenCanvasGetImageData",
-    "2674": "V8SVGTextContentElement_GetComputedTextLength_Method",
-    "2675": "V8SVGTextContentElement_GetEndPositionOfChar_Method",
-    "2676": "V8SVGTextContentElement_GetExtentOfChar_Method",
-    "2677": "V8SVGTextContentElement_GetStartPositionOfChar_Method",
-    "2678": "V8SVGTextContentElement_GetSubStringLength_Method",
-    "2679": "V8BatteryManager_ChargingTime_AttributeGetter",
-    "2680": "V8BatteryManager_Charging_AttributeGetter",
-    "2681": "V8BatteryManager_DischargingTime_AttributeGetter",
-    "2682": "V8BatteryManager_Level_AttributeGetter",
-    "2683": "V8PaintRenderingContext2D_IsPointInPath_Method",
-    "2684": "V8PaintRenderingContext2D_IsPointInStroke_Method",
-    "2685": "V8PaymentRequest_CanMakePayment_Method",
-    "2686": "V8AnalyserNode_GetByteFrequencyData_Method",
-    "2687": "V8AnalyserNode_GetByteTimeDomainData_Method",
-    "2688": "V8AnalyserNode_GetFloatFrequencyData_Method",
-    "2689": "V8AnalyserNode_GetFloatTimeDomainData_Method",
-    "2690": "V8AudioBuffer_CopyFromChannel_Method",
-    "2691": "V8AudioBuffer_GetChannelData_Method",
-    "2692": "WebGLDebugRendererInfo",
-    "2693": "V8WebGL2ComputeRenderingContext_GetExtension_Method",
-    "2694": "V8WebGL2ComputeRenderingContext_GetSupportedExtensions_Method",
-    "2695": "V8WebGL2RenderingContext_GetExtension_Method",
-    "2696": "V8WebGL2RenderingContext_GetSupportedExtensions_Method",
-    "2697": "V8WebGLRenderingContext_GetExtension_Method",
-    "2698": "V8WebGLRenderingContext_GetSupportedExtensions_Method",
-    "2699": "V8Screen_AvailHeight_AttributeGetter",
-    "2700": "V8Screen_AvailWidth_AttributeGetter",
-    "2701": "V8Screen_ColorDepth_AttributeGetter",
-    "2702": "V8Screen_Height_AttributeGetter",
-    "2703": "V8Screen_PixelDepth_AttributeGetter",
-    "2704": "V8Screen_Width_AttributeGetter",
-    "2705": "WindowInnerWidth",
-    "2706": "WindowInnerHeight",
-    "2707": "V8Window_MatchMedia_Method",
-    "2708": "WindowScrollX",
-    "2709": "WindowScrollY",
-    "2710": "WindowPageXOffset",
-    "2711": "WindowPageYOffset",
-    "2712": "WindowScreenX",
-    "2713": "WindowScreenY",
-    "2714": "WindowOuterHeight",
-    "2715": "WindowOuterWidth",
-    "2716": "WindowDevicePixelRatio",
-    "2717": "CanvasCaptureStream",
-    "2718": "V8HTMLMediaElement_CanPlayType_Method",
-    "2719": "HistoryLength",
-    "2720": "FeaturePolicyReportOnlyHeader",
-    "2721": "V8PaymentRequest_HasEnrolledInstrument_Method",
-    "2722": "TrustedTypesEnabled",
-    "2723": "TrustedTypesCreatePolicy",
-    "2724": "TrustedTypesDefaultPolicyUsed",
-    "2725": "TrustedTypesAssignmentError",
-    "2726": "BadgeSet",
-    "2727": "BadgeClear",
-    "2728": "ElementTimingExplicitlyRequested",
-    "2729": "V8HTMLMediaElement_CaptureStream_Method",
-    "2730": "QuirkyLineBoxBackgroundSize",
-    "2731": "DirectlyCompositedImage",
-    "2732": "ForbiddenSyncXhrInPageDismissal",
-    "2733": "V8HTMLVideoElement_AutoPictureInPicture_AttributeGetter",
-    "2734": "V8HTMLVideoElement_AutoPictureInPicture_AttributeSetter",
-    "2735": "AutoPictureInPictureAttribute",
-    "2736": "RTCAudioJitterBufferRtxHandling",
-    "2737": "WebShareCanShare",
-    "2738": "PriorityHints",
-    "2739": "TextAutosizedCrossSiteIframe",
-    "2740": "V8RTCQuicTransport_Constructor",
-    "2741": "V8RTCQuicTransport_Transport_AttributeGetter",
-    "2742": "V8RTCQuicTransport_State_AttributeGetter",
-    "2743": "V8RTCQuicTransport_GetKey_Method",
-    "2744": "V8RTCQuicTransport_GetStats_Method",
-    "2745": "V8RTCQuicTransport_Connect_Method",
-    "2746": "V8RTCQuicTransport_Listen_Method",
-    "2747": "V8RTCQuicTransport_Stop_Method",
-    "2748": "V8RTCQuicTransport_CreateStream_Method",
-    "2749": "V8RTCIceTransport_Constructor",
-    "2750": "V8RTCIceTransport_Role_AttributeGetter",
-    "2751": "V8RTCIceTransport_State_AttributeGetter",
-    "2752": "V8RTCIceTransport_GatheringState_AttributeGetter",
-    "2753": "V8RTCIceTransport_GetLocalCandidates_Method",
-    "2754": "V8RTCIceTransport_GetRemoteCandidates_Method",
-    "2755": "V8RTCIceTransport_GetSelectedCandidatePair_Method",
-    "2756": "V8RTCIceTransport_GetLocalParameters_Method",
-    "2757": "V8RTCIceTransport_GetRemoteParameters_Method",
-    "2758": "V8RTCQuicStream_Transport_AttributeGetter",
-    "2759": "V8RTCQuicStream_State_AttributeGetter",
-    "2760": "V8RTCQuicStream_ReadBufferedAmount_AttributeGetter",
-    "2761": "V8RTCQuicStream_MaxReadBufferedAmount_AttributeGetter",
-    "2762": "V8RTCQuicStream_WriteBufferedAmount_AttributeGetter",
-    "2763": "V8RTCQuicStream_MaxWriteBufferedAmount_AttributeGetter",
-    "2764": "V8RTCQuicStream_ReadInto_Method",
-    "2765": "V8RTCQuicStream_Write_Method",
-    "2766": "V8RTCQuicStream_Reset_Method",
-    "2767": "V8RTCQuicStream_WaitForWriteBufferedAmountBelow_Method",
-    "2768": "V8RTCQuicStream_WaitForReadable_Method",
-    "2769": "HTMLTemplateElement",
-    "2770": "NoSysexWebMIDIWithoutPermission",
-    "2771": "NoSysexWebMIDIOnInsecureOrigin",
-    "2772": "ApplicationCacheInstalledButNoManifest",
-    "2773": "PerMethodCanMakePaymentQuota",
-    "2774": "CSSValueAppearanceButtonForNonButtonRendered",
-    "2775": "CSSValueAppearanceButtonForOthersRendered",
-    "2776": "CustomCursorIntersectsViewport",
-    "2777": "ClientHintsLang",
-    "2778": "LinkRelPreloadImageSrcset",
-    "2779": "V8HTMLMediaElement_Remote_AttributeGetter",
-    "2780": "V8RemotePlayback_WatchAvailability_Method",
-    "2781": "V8RemotePlayback_Prompt_Method",
-    "2782": "LayoutJankExplicitlyRequested",
-    "2783": "MediaSessionSkipAd",
-    "2784": "AdFrameSizeIntervention",
-    "2785": "V8UserActivation_HasBeenActive_AttributeGetter",
-    "2786": "V8UserActivation_IsActive_AttributeGetter",
-    "2787": "TextEncoderEncodeInto",
-    "2788": "InvalidBasicCardMethodData",
-    "2789": "ClientHintsUA",
-    "2790": "ClientHintsUAArch",
-    "2791": "ClientHintsUAPlatform",
-    "2792": "ClientHintsUAModel",
-    "2793": "AnimationFrameCancelledWithinFrame",
-    "2794": "SchedulingIsInputPending",
-    "2795": "V8StringNormalize",
-    "2796": "CSSValueAppearanceButtonBevel",
-    "2797": "CSSValueAppearanceListitem",
-    "2798": "CSSValueAppearanceMediaControlsBackground",
-    "2799": "CSSValueAppearanceMediaControlsFullscreenBackground",
-    "2800": "CSSValueAppearanceMediaCurrentTimeDisplay",
-    "2801": "CSSValueAppearanceMediaEnterFullscreenButton",
-    "2802": "CSSValueAppearanceMediaExitFullscreenButton",
-    "2803": "CSSValueAppearanceMediaMuteButton",
-    "2804": "CSSValueAppearanceMediaOverlayPlayButton",
-    "2805": "CSSValueAppearanceMediaPlayButton",
-    "2806": "CSSValueAppearanceMediaTimeRemainingDisplay",
-    "2807": "CSSValueAppearanceMediaToggleClosedCaptionsButton",
-    "2808": "CSSValueAppearanceMediaVolumeSliderContainer",
-    "2809": "CSSValueAppearanceMenulistTextfield",
-    "2810": "CSSValueAppearanceMenulistText",
-    "2811": "CSSValueAppearanceProgressBarValue",
-    "2812": "U2FCryptotokenRegister",
-    "2813": "U2FCryptotokenSign",
-    "2814": "CSSValueAppearanceInnerSpinButton",
-    "2815": "CSSValueAppearanceMeter",
-    "2816": "CSSValueAppearanceProgressBar",
-    "2817": "CSSValueAppearanceProgressBarForOthersRendered",
-    "2818": "CSSValueAppearancePushButton",
-    "2819": "CSSValueAppearanceSquareButton",
-    "2820": "CSSValueAppearanceSearchCancel",
-    "2821": "CSSValueAppearanceTextarea",
-    "2822": "CSSValueAppearanceTextFieldForOthersRendered",
-    "2823": "CSSValueAppearanceTextFieldForTemporalRendered",
-    "2824": "BuiltInModuleKvStorage",
-    "2825": "BuiltInModuleVirtualScroller",
-    "2826": "AdClickNavigation",
-    "2827": "RTCStatsRelativePacketArrivalDelay",
-    "2829": "CSSSelectorHostContextInSnapshotProfile",
-    "2830": "CSSSelectorHostContextInLiveProfile",
-    "2831": "ImportMap",
-    "2832": "RefreshHeader",
-    "2833": "SearchEventFired",
-    "2834": "IdleDetectionStart",
-    "2835": "TargetCurrent",
-    "2836": "SandboxBackForwardStaysWithinSubtree",
-    "2837": "SandboxBackForwardAffectsFramesOutsideSubtree",
-    "2838": "DownloadPrePolicyCheck",
-    "2839": "DownloadPostPolicyCheck",
-    "2840": "DownloadInSandboxWithoutUserGesture",
-    "2841": "ReadableStreamGetReader",
-    "2842": "ReadableStreamPipeThrough",
-    "2843": "ReadableStreamPipeTo",
-    "2844": "CSSStyleSheetReplace",
-    "2845": "CSSStyleSheetReplaceSync",
-    "2846": "AdoptedStyleSheets",
-    "2847": "HTMLImportsOnReverseOriginTrials",
-    "2848": "ElementCreateShadowRootOnReverseOriginTrials",
-    "2849": "DocumentRegisterElementOnReverseOriginTrials",
-    "2850": "InputTypeRadio",
-    "2851": "InputTypeCheckbox",
-    "2852": "InputTypeImage",
-    "2853": "InputTypeButton",
-    "2854": "InputTypeHidden",
-    "2855": "InputTypeReset",
-    "2856": "SelectElementSingle",
-    "2857": "SelectElementMultiple",
-    "2858": "V8Animation_Effect_AttributeGetter",
-    "2859": "V8Animation_Effect_AttributeSetter",
-    "2860": "HidDeviceClose",
-    "2861": "HidDeviceOpen",
-    "2862": "HidDeviceReceiveFeatureReport",
-    "2863": "HidDeviceSendFeatureReport",
-    "2864": "HidDeviceSendReport",
-    "2865": "HidGetDevices",
-    "2866": "HidRequestDevice",
-    "2867": "V8RTCQuicTransport_MaxDatagramLength_AttributeGetter",
-    "2868": "V8RTCQuicTransport_ReadyToSendDatagram_Method",
-    "2869": "V8RTCQuicTransport_SendDatagram_Method",
-    "2870": "V8RTCQuicTransport_ReceiveDatagrams_Method",
-    "2871": "CSSValueContainStyle",
-    "2872": "WebShareSuccessfulContainingFiles",
-    "2873": "WebShareSuccessfulWithoutFiles",
-    "2874": "WebShareUnsuccessfulContainingFiles",
-    "2875": "WebShareUnsuccessfulWithoutFiles",
-    "2876": "VerticalScrollbarThumbScrollingWithMouse",
-    "2877": "VerticalScrollbarThumbScrollingWithTouch",
-    "2878": "HorizontalScrollbarThumbScrollingWithMouse",
-    "2879": "HorizontalScrollbarThumbScrollingWithTouch",
-    "2880": "SMSReceiverStart",
-    "2881": "V8Animation_Pending_AttributeGetter",
-    "2882": "FocusWithoutUserActivationNotSandboxedNotAdFrame",
-    "2883": "FocusWithoutUserActivationNotSandboxedAdFrame",
-    "2884": "FocusWithoutUserActivationSandboxedNotAdFrame",
-    "2885": "FocusWithoutUserActivationSandboxedAdFrame",
-    "2886": "V8RTCRtpReceiver_JitterBufferDelayHint_AttributeGetter",
-    "2887": "V8RTCRtpReceiver_JitterBufferDelayHint_AttributeSetter",
-    "2888": "MediaCapabilitiesDecodingInfoWithKeySystemConfig",
-    "2889": "RevertInCustomIdent",
-    "2890": "UnoptimizedImagePolicies",
-    "2891": "VTTCueParser",
-    "2892": "MediaElementTextTrackContainer",
-    "2893": "MediaElementTextTrackList",
-    "2894": "PaymentRequestInitialized",
-    "2895": "PaymentRequestShow",
-    "2896": "PaymentRequestShippingAddressChange",
-    "2897": "PaymentRequestShippingOptionChange",
-    "2898": "PaymentRequestPaymentMethodChange",
-    "2899": "V8Animation_UpdatePlaybackRate_Method",
-    "2900": "TwoValuedOverflow",
-    "2901": "TextFragmentAnchor",
-    "2902": "TextFragmentAnchorMatchFound",
-    "2903": "NonPassiveTouchEventListener",
-    "2904": "PassiveTouchEventListener",
-    "2905": "CSSValueAppearanceSearchCancelForOthers2Rendered",
-    "2906": "WebXrFramebufferScale",
-    "2907": "WebXrIgnoreDepthValues",
-    "2908": "WebXrSessionCreated",
-    "2909": "V8XRReferenceSpace_GetOffsetReferenceSpace_Method",
-    "2910": "V8XRInputSource_Gamepad_AttributeGetter",
-    "2911": "V8XRSession_End_Method",
-    "2912": "V8XRWebGLLayer_Constructor",
-    "2913": "FetchKeepalive",
-    "2914": "CSSTransitionCancelledByRemovingStyle",
-    "2915": "V8RTCRtpSender_SetStreams_Method",
-    "2916": "CookieNoSameSite",
-    "2917": "CookieInsecureAndSameSiteNone",
-    "2918": "UnsizedMediaPolicy",
-    "2919": "ScrollByPrecisionTouchPad",
-    "2920": "PinchZoom",
-    "2921": "BuiltInModuleSwitchImported",
-    "2922": "FeaturePolicyCommaSeparatedDeclarations",
-    "2923": "FeaturePolicySemicolonSeparatedDeclarations",
-    "2924": "V8CallSiteAPIGetFunctionSloppyCall",
-    "2925": "V8CallSiteAPIGetThisSloppyCall",
-    "2926": "BuiltInModuleToast",
-    "2927": "LargestContentfulPaintExplicitlyRequested",
-    "2928": "PageLifecycleTransitionsOptIn",
-    "2929": "PageLifecycleTransitionsOptOut",
-    "2930": "PeriodicBackgroundSync",
-    "2931": "PeriodicBackgroundSyncRegister",
-    "2932": "LazyLoadFrameLoadingAttributeEager",
-    "2933": "LazyLoadFrameLoadingAttributeLazy",
-    "2934": "LazyLoadImageLoadingAttributeEager",
-    "2935": "LazyLoadImageLoadingAttributeLazy",
-    "2936": "LazyLoadImageMissingDimensionsForLazy",
-    "2937": "PeriodicBackgroundSyncGetTags",
-    "2938": "PeriodicBackgroundSyncUnregister",
-    "2939": "CreateObjectURLMediaSourceFromWorker",
-    "2940": "CSSAtRuleProperty",
-    "2941": "ServiceWorkerInterceptedRequestFromOriginDirtyStyleSheet",
-    "2942": "WebkitMarginBeforeCollapseDiscard",
-    "2943": "WebkitMarginBeforeCollapseSeparate",
-    "2944": "WebkitMarginBeforeCollapseSeparateMaybeDoesSomething",
-    "2945": "WebkitMarginAfterCollapseDiscard",
-    "2946": "WebkitMarginAfterCollapseSeparate",
-    "2947": "WebkitMarginAfterCollapseSeparateMaybeDoesSomething",
-    "2949": "CredentialManagerGetWithUVM",
-    "2951": "CredentialManagerGetSuccessWithUVM",
-    "2952": "DiscardInputEventToMovingIframe",
-    "2953": "SignedExchangeSubresourcePrefetch",
-    "2954": "BasicCardType",
-    "2955": "ExecutedJavaScriptURL",
-    "2956": "LinkPrefetchLoadEvent",
-    "2957": "LinkPrefetchErrorEvent",
-    "2958": "FontSizeWebkitXxxLarge",
-    "2959": "V8Database_ChangeVersion_Method",
-    "2960": "V8Database_Transaction_Method",
-    "2961": "V8Database_ReadTransaction_Method",
-    "2962": "V8SQLTransaction_ExecuteSql_Method",
-    "2963": "CSSValueAppearanceButtonForBootstrapLooseSelectorRendered",
-    "2964": "CSSValueAppearanceButtonForOthers2Rendered",
-    "2965": "CSSValueAppearanceButtonForSelectRendered",
-    "2966": "CSSValueAppearanceListboxForOthersRendered",
-    "2967": "CSSValueAppearanceMeterForOthersRendered",
-    "2968": "SVGSMILDiscardElementParsed",
-    "2969": "SVGSMILDiscardElementTriggered",
-    "2971": "V8PointerEvent_GetPredictedEvents_Method",
-    "2972": "ScrollSnapOnViewportBreaks",
-    "2973": "ScrollPaddingOnViewportBreaks",
-    "2974": "DownloadInAdFrame",
-    "2975": "DownloadInSandbox",
-    "2976": "DownloadWithoutUserGesture",
-    "2977": "AutoplayDynamicDelegation",
-    "2978": "ToggleEventHandlerDuringParsing",
-    "2979": "FragmentDoubleHash",
-    "2981": "OBSOLETE_CSSValueOverflowXOverlay",
-    "2982": "OBSOLETE_CSSValueOverflowYOverlay",
-    "2983": "ContentIndexAdd",
-    "2984": "ContentIndexDelete",
-    "2985": "ContentIndexGet",
-    "2986": "V8SpeechGrammar_Constructor",
-    "2987": "V8SpeechGrammarList_AddFromString_Method",
-    "2988": "V8SpeechGrammarList_Constructor",
-    "2989": "V8SpeechGrammarList_Item_Method",
-    "2990": "V8SpeechRecognition_Constructor",
-    "2991": "V8SpeechRecognition_Grammars_AttributeGetter",
-    "2992": "V8SpeechRecognition_Grammars_AttributeSetter",
-    "2993": "ContactsManagerSelect",
-    "2994": "V8MediaSession_SetPositionState_Method",
-    "2995": "CSSValueOverflowOverlay",
-    "2996": "RequestedFileSystemTemporary",
-    "2997": "RequestedFileSystemPersistent",
-    "2998": "ElementWithLeftwardOrUpwardOverflowDirection_ScrollLeftOrTop",
-    "2999": "ElementWithLeftwardOrUpwardOverflowDirection_ScrollLeftOrTopSetPositive",
-    "3000": "XMLHttpRequestSynchronousInMainFrame",
-    "3001": "XMLHttpRequestSynchronousInCrossOriginSubframe",
-    "3002": "XMLHttpRequestSynchronousInSameOriginSubframe",
-    "3003": "XMLHttpRequestSynchronousInWorker",
-    "3004": "PerformanceObserverBufferedFlag",
-    "3005": "WakeLockAcquireScreenLock",
-    "3006": "WakeLockAcquireSystemLock",
-    "3007": "ThirdPartyServiceWorker",
-    "3008": "JSSelfProfiling",
-    "3009": "HTMLFrameSetElement",
-    "3010": "MediaCapabilitiesFramerateRatio",
-    "3011": "MediaCapabilitiesFramerateNumber",
-    "3012": "FetchRedirectError",
-    "3013": "FetchRedirectManual",
-    "3014": "FetchCacheReload",
-    "3015": "V8Window_ChooseFileSystemEntries_Method",
-    "3016": "V8FileSystemDirectoryHandle_GetSystemDirectory_Method",
-    "3017": "NotificationShowTrigger",
-    "3018": "WebSocketStreamConstructor",
-    "3019": "DOMStorageRead",
-    "3020": "DOMStorageWrite",
-    "3021": "CacheStorageRead",
-    "3022": "CacheStorageWrite",
-    "3023": "IndexedDBRead",
-    "3024": "IndexedDBWrite",
-    "3025": "DeprecatedFileSystemRead",
-    "3026": "DeprecatedFileSystemWrite",
-    "3027": "PointerLockUnadjustedMovement",
-    "3028": "CreateObjectBlob",
-    "3029": "QuotaRead",
-    "3030": "DelegateFocus",
-    "3031": "DelegateFocusNotFirstInFlatTree",
-    "3032": "ThirdPartySharedWorker",
-    "3033": "ThirdPartyBroadcastChannel",
-    "3034": "MediaSourceGroupEndTimestampDecreaseWithinMediaSegment",
-    "3035": "TextFragmentAnchorTapToDismiss",
-    "3036": "XRIsSessionSupported",
-    "3037": "ScrollbarUseScrollbarButtonReversedDirection",
-    "3038": "CSSSelectorPseudoScrollbarButtonReversedDirection",
-    "3039": "FragmentHasTildeAmpersandTilde",
-    "3040": "FragmentHasColonTildeColon",
-    "3041": "FragmentHasTildeAtTilde",
-    "3042": "FragmentHasAmpersandDelimiterQuestion",
-    "3043": "InvalidFragmentDirective",
-    "3044": "ContactsManagerGetProperties",
-    "3045": "EvaluateScriptMovedBetweenElementDocuments",
-    "3046": "PluginElementLoadedDocument",
-    "3047": "PluginElementLoadedImage",
-    "3048": "PluginElementLoadedExternal",
-    "3049": "RenderSubtreeAttribute",
-    "3050": "ARIAAnnotationRoles",
-    "3051": "IntersectionObserverV2",
-    "3052": "HeavyAdIntervention",
-    "3053": "UserTimingL3",
-    "3054": "GetGamepadsFromCrossOriginSubframe",
-    "3055": "GetGamepadsFromInsecureContext",
-    "3056": "OriginCleanImageBitmapSerialization",
-    "3057": "NonOriginCleanImageBitmapSerialization",
-    "3058": "OriginCleanImageBitmapTransfer",
-    "3059": "NonOriginCleanImageBitmapTransfer",
-    "3060": "CompressionStreamConstructor",
-    "3061": "DecompressionStreamConstructor",
-    "3062": "V8RTCRtpReceiver_PlayoutDelayHint_AttributeGetter",
-    "3063": "V8RTCRtpReceiver_PlayoutDelayHint_AttributeSetter",
-    "3064": "V8RegExpExecCalledOnSlowRegExp",
-    "3065": "V8RegExpReplaceCalledOnSlowRegExp",
-    "3066": "HasMarkerPseudoElement",
-    "3067": "WindowMove",
-    "3068": "WindowResize",
-    "3069": "MovedOrResizedPopup",
-    "3070": "MovedOrResizedPopup2sAfterCreation",
-    "3071": "DOMWindowOpenPositioningFeatures",
-    "3072": "MouseEventScreenX",
-    "3073": "MouseEventScreenY",
-    "3074": "CredentialManagerIsUserVerifyingPlatformAuthenticatorAvailable",
-    "3075": "ObsoleteWebrtcTlsVersion",
-    "3076": "UpgradeInsecureRequestsUpgradedRequestBlockable",
-    "3077": "UpgradeInsecureRequestsUpgradedRequestOptionallyBlockable",
-    "3078": "UpgradeInsecureRequestsUpgradedRequestWebsocket",
-    "3079": "UpgradeInsecureRequestsUpgradedRequestForm",
-    "3080": "UpgradeInsecureRequestsUpgradedRequestUnknown",
-    "3081": "HasGlyphRelativeUnits",
-    "3082": "CountQueuingStrategyConstructor",
-    "3083": "ByteLengthQueuingStrategyConstructor",
-    "3084": "ClassicDedicatedWorker",
-    "3085": "ModuleDedicatedWorker",
-    "3086": "FetchBodyStreamInServiceWorker",
-    "3087": "FetchBodyStreamOutsideServiceWorker",
-    "3088": "GetComputedStyleOutsideFlatTree",
-    "3089": "ARIADescriptionAttribute",
-    "3090": "StrictMimeTypeChecksWouldBlockWorker",
-    "3091": "ResourceTimingTaintedOriginFlagFail",
-    "3092": "RegisterProtocolHandlerSameOriginAsTop",
-    "3093": "RegisterProtocolHandlerCrossOriginSubframe",
-    "3094": "WebNfcNdefReaderScan",
-    "3095": "WebNfcNdefWriterWrite",
-    "3096": "HTMLPortalElement",
-    "3097": "V8HTMLPortalElement_Activate_Method",
-    "3098": "V8HTMLPortalElement_PostMessage_Method",
-    "3099": "V8Window_PortalHost_AttributeGetter",
-    "3100": "V8PortalHost_PostMessage_Method",
-    "3101": "V8PortalActivateEvent_Data_AttributeGetter",
-    "3102": "V8PortalActivateEvent_AdoptPredecessor_Method",
-    "3103": "LinkRelPrefetchForSignedExchanges",
-    "3104": "MessageEventSharedArrayBufferSameOrigin",
-    "3105": "MessageEventSharedArrayBufferSameAgentCluster",
-    "3106": "MessageEventSharedArrayBufferDifferentAgentCluster",
-    "3107": "CacheStorageCodeCacheHint",
-    "3108": "V8Metadata_ModificationTime_AttributeGetter",
-    "3109": "V8RTCLegacyStatsReport_Timestamp_AttributeGetter",
-    "3110": "InputElementValueAsDateGetter",
-    "3111": "InputElementValueAsDateSetter",
-    "3112": "HTMLMetaElementReferrerPolicy",
-    "3113": "NonWebbyMixedContent",
-    "3114": "V8SharedArrayBufferConstructed",
-    "3115": "ScrollSnapCausesScrollOnInitialLayout",
-    "3116": "ClientHintsUAMobile",
-    "3117": "V8VideoPlaybackQuality_CorruptedVideoFrames_AttributeGetter",
-    "3118": "LongTaskBufferFull",
-    "3119": "HTMLMetaElementMonetization",
-    "3120": "HTMLLinkElementMonetization",
-    "3121": "InputTypeCheckboxRenderedNonSquare",
-    "3122": "InputTypeRadioRenderedNonSquare",
-    "3123": "WebkitBoxPackJustifyDoesSomething",
-    "3124": "WebkitBoxPackCenterDoesSomething",
-    "3125": "WebkitBoxPackEndDoesSomething",
-    "3126": "V8KeyframeEffect_Constructor",
-    "3127": "WebNfcAPI",
-    "3128": "HostCandidateAttributeGetter",
-    "3129": "CSPWithReasonableObjectRestrictions",
-    "3130": "CSPWithReasonableBaseRestrictions",
-    "3131": "CSPWithReasonableScriptRestrictions",
-    "3132": "CSPWithReasonableRestrictions",
-    "3133": "CSPROWithReasonableObjectRestrictions",
-    "3134": "CSPROWithReasonableBaseRestrictions",
-    "3135": "CSPROWithReasonableScriptRestrictions",
-    "3136": "CSPROWithReasonableRestrictions",
-    "3137": "CSPWithBetterThanReasonableRestrictions",
-    "3138": "CSPROWithBetterThanReasonableRestrictions",
-    "3139": "MeasureMemory",
-    "3140": "V8Animation_ReplaceState_AttributeGetter",
-    "3141": "V8Animation_Persist_Method",
-    "3142": "TaskControllerConstructor",
-    "3143": "TaskControllerSetPriority",
-    "3144": "TaskSignalPriority",
-    "3145": "SchedulerPostTask",
-    "3146": "V8Animation_Onremove_AttributeGetter",
-    "3147": "V8Animation_Onremove_AttributeSetter",
-    "3148": "ClassicSharedWorker",
-    "3149": "ModuleSharedWorker",
-    "3150": "V8Animation_CommitStyles_Method",
-    "3151": "SameOriginIframeWindowAlert",
-    "3152": "SameOriginIframeWindowConfirm",
-    "3153": "SameOriginIframeWindowPrompt",
-    "3154": "SameOriginIframeWindowPrint",
-    "3155": "LargeStickyAd",
-    "3156": "OverlayInterstitialAd",
-    "3157": "CSSComparisonFunctions",
-    "3158": "FeaturePolicyProposalWouldChangeBehaviour",
-    "3159": "RTCLocalSdpModificationSimulcast",
-    "3160": "TrustedTypesEnabledEnforcing",
-    "3161": "TrustedTypesEnabledReportOnly",
-    "3162": "TrustedTypesAllowDuplicates",
-    "3163": "V8ArrayPrototypeHasElements",
-    "3164": "V8ObjectPrototypeHasElements",
-    "3165": "DisallowDocumentAccess",
-    "3166": "XRSessionRequestHitTestSource",
-    "3167": "XRSessionRequestHitTestSourceForTransientInput",
-    "3168": "XRDOMOverlay",
-    "3169": "CssStyleSheetReplaceWithImport",
-    "3170": "CryptoAlgorithmEd25519",
-    "3171": "CryptoAlgorithmX25519",
-    "3172": "DisplayNames",
-    "3173": "NumberFormatStyleUnit",
-    "3174": "DateTimeFormatRange",
-    "3175": "DateTimeFormatDateTimeStyle",
-    "3176": "BreakIteratorTypeWord",
-    "3177": "BreakIteratorTypeLine",
-    "3178": "V8FileSystemDirectoryHandle_Resolve_Method",
-    "3179": "V8FileSystemHandle_IsSameEntry_Method",
-    "3180": "V8RTCRtpSender_CreateEncodedAudioStreams_Method",
-    "3181": "V8RTCRtpSender_CreateEncodedVideoStreams_Method",
-    "3182": "V8RTCRtpReceiver_CreateEncodedAudioStreams_Method",
-    "3183": "V8RTCRtpReceiver_CreateEncodedVideoStreams_Method",
-    "3184": "QuicTransport",
-    "3185": "QuicTransportStreamApis",
-    "3186": "QuicTransportDatagramApis",
-    "3187": "V8Document_GetAnimations_Method",
-    "3188": "V8ShadowRoot_GetAnimations_Method",
-    "3189": "ClientHintsUAFullVersion",
-    "3190": "SchedulerCurrentTaskSignal",
-    "3191": "ThirdPartyFileSystem",
-    "3192": "ThirdPartyIndexedDb",
-    "3193": "ThirdPartyCacheStorage",
-    "3194": "ThirdPartyLocalStorage",
-    "3195": "ThirdPartySessionStorage",
-    "3196": "DeclarativeShadowRoot",
-    "3197": "CrossOriginOpenerPolicySameOrigin",
-    "3198": "CrossOriginOpenerPolicySameOriginAllowPopups",
-    "3199": "CrossOriginEmbedderPolicyRequireCorp",
-    "3200": "CoopAndCoepIsolated",
-    "3201": "WrongBaselineOfButtonElement",
-    "3202": "V8Document_HasTrustToken_Method",
-    "3203": "ForceLoadAtTop",
-    "3204": "LegacyLayoutByButton",
-    "3205": "LegacyLayoutByDeprecatedFlexBox",
-    "3206": "LegacyLayoutByDetailsMarker",
-    "3207": "LegacyLayoutByEditing",
-    "3208": "LegacyLayoutByFieldSet",
-    "3209": "LegacyLayoutByFileUploadControl",
-    "3210": "LegacyLayoutByFlexBox",
-    "3211": "LegacyLayoutByFrameSet",
-    "3212": "LegacyLayoutByGrid",
-    "3213": "LegacyLayoutByMenuList",
-    "3214": "LegacyLayoutByMultiCol",
-    "3215": "LegacyLayoutByPrinting",
-    "3216": "LegacyLayoutByRuby",
-    "3217": "LegacyLayoutBySVG",
-    "3218": "LegacyLayoutBySlider",
-    "3219": "LegacyLayoutByTable",
-    "3220": "LegacyLayoutByTextCombine",
-    "3221": "LegacyLayoutByTextControl",
-    "3222": "LegacyLayoutByVTTCue",
-    "3223": "LegacyLayoutByWebkitBoxWithoutVerticalLineClamp",
-    "3224": "LegacyLayoutByTableFlexGridBlockInNGFragmentationContext",
-    "3225": "DocumentPolicyHeader",
-    "3226": "DocumentPolicyReportOnlyHeader",
-    "3227": "RequireDocumentPolicyHeader",
-    "3228": "DocumentPolicyIframePolicyAttribute",
-    "3229": "DocumentPolicyCausedPageUnload",
-    "3230": "RequiredDocumentPolicy",
-    "3231": "PerformanceObserverEntryTypesAndBuffered",
-    "3232": "PerformanceObserverTypeError",
-    "3233": "ImageCaptureWhiteBalanceMode",
-    "3234": "ImageCaptureExposureMode",
-    "3235": "ImageCaptureFocusMode",
-    "3236": "ImageCapturePointsOfInterest",
-    "3237": "ImageCaptureExposureCompensation",
-    "3238": "ImageCaptureExposureTime",
-    "3239": "ImageCaptureColorTemperature",
-    "3240": "ImageCaptureIso",
-    "3241": "ImageCaptureBrightness",
-    "3242": "ImageCaptureContrast",
-    "3243": "ImageCaptureSaturation",
-    "3244": "ImageCaptureSharpness",
-    "3245": "ImageCaptureFocusDistance",
-    "3246": "ImageCapturePan",
-    "3247": "ImageCaptureTilt",
-    "3248": "ImageCaptureZoom",
-    "3249": "ImageCaptureTorch",
-    "3250": "XRFrameCreateAnchor",
-    "3251": "XRHitTestResultCreateAnchor",
-    "3252": "CSSKeywordRevert",
-    "3253": "OverlayPopupAd",
-    "3254": "EventTimingFirstInputExplicitlyRequested",
-    "3255": "CustomScrollbarPercentThickness",
-    "3256": "CustomScrollbarPartPercentLength",
-    "3257": "V8InvalidatedArrayBufferDetachingProtector",
-    "3258": "V8InvalidatedArrayConstructorProtector",
-    "3259": "V8InvalidatedArrayIteratorLookupChainProtector",
-    "3260": "V8InvalidatedArraySpeciesLookupChainProtector",
-    "3261": "V8InvalidatedIsConcatSpreadableLookupChainProtector",
-    "3262": "V8InvalidatedMapIteratorLookupChainProtector",
-    "3263": "V8InvalidatedNoElementsProtector",
-    "3264": "V8InvalidatedPromiseHookProtector",
-    "3265": "V8InvalidatedPromiseResolveLookupChainProtector",
-    "3266": "V8InvalidatedPromiseSpeciesLookupChainProtector",
-    "3267": "V8InvalidatedPromiseThenLookupChainProtector",
-    "3268": "V8InvalidatedRegExpSpeciesLookupChainProtector",
-    "3269": "V8InvalidatedSetIteratorLookupChainProtector",
-    "3270": "V8InvalidatedStringIteratorLookupChainProtector",
-    "3271": "V8InvalidatedStringLengthOverflowLookupChainProtector",
-    "3272": "V8InvalidatedTypedArraySpeciesLookupChainProtector",
-    "3273": "ClientHintsUAPlatformVersion",
-    "3274": "IFrameCSPAttribute",
-    "3275": "NavigatorCookieEnabled",
-    "3276": "TrustTokenFetch",
-    "3277": "TrustTokenXhr",
-    "3278": "TrustTokenIframe",
-    "3279": "TrustedTypesPolicyCreated",
-    "3280": "V8HTMLVideoElement_RequestVideoFrameCallback_Method",
-    "3281": "V8HTMLVideoElement_CancelVideoFrameCallback_Method",
-    "3282": "RubyElementWithDisplayBlock",
-    "3283": "LocationFragmentDirectiveAccessed",
-    "3284": "CanvasRenderingContext",
-    "3285": "SchemefulSameSiteContextDowngrade",
-    "3286": "OriginIsolationHeader",
-    "3287": "V8WasmSimdOpcodes",
-    "3288": "GridRowGapPercent",
-    "3289": "GridRowGapPercentIndefinite",
-    "3290": "FlexRowGapPercent",
-    "3291": "FlexRowGapPercentIndefinite",
-    "3292": "V8RTCRtpSender_CreateEncodedStreams_Method",
-    "3293": "V8RTCRtpReceiver_CreateEncodedStreams_Method",
-    "3294": "ForceEncodedAudioInsertableStreams",
-    "3295": "ForceEncodedVideoInsertableStreams",
-    "3296": "TransformStyleContainingBlockComputedUsedMismatch",
-    "3297": "AdditionalGroupingPropertiesForCompat",
-    "3298": "PopupDoesNotExceedOwnerWindowBounds",
-    "3299": "PopupExceedsOwnerWindowBounds",
-    "3300": "PopupExceedsOwnerWindowBoundsForIframe",
-    "3301": "PopupGestureTapExceedsOwnerWindowBounds",
-    "3302": "PopupMouseDownExceedsOwnerWindowBounds",
-    "3303": "PopupMouseWheelExceedsOwnerWindowBounds",
-    "3304": "V8VarRedeclaredCatchBinding",
-    "3305": "WebBluetoothRemoteCharacteristicWriteValueWithResponse",
-    "3306": "WebBluetoothRemoteCharacteristicWriteValueWithoutResponse",
-    "3307": "FlexGapSpecified",
-    "3308": "FlexGapPositive",
-    "3309": "PluginInstanceAccessSuccessful",
-    "3310": "StorageAccessAPI_HasStorageAccess_Method",
-    "3311": "StorageAccessAPI_requestStorageAccess_Method",
-    "3312": "WebBluetoothWatchAdvertisements",
-    "3313": "RubyTextWithNonDefaultTextAlign",
-    "3314": "HTMLMetaElementReferrerPolicyOutsideHead",
-    "3315": "HTMLMetaElementReferrerPolicyMultipleTokens",
-    "3316": "FetchAPINonGetOrHeadOpaqueResponse",
-    "3317": "FetchAPINonGetOrHeadOpaqueResponseWithRedirect",
-    "3318": "DynamicImportModuleScriptRelativeClassicSameOrigin",
-    "3319": "DynamicImportModuleScriptRelativeClassicCrossOrigin",
-    "3320": "V8WasmBulkMemory",
-    "3321": "V8WasmRefTypes",
-    "3322": "V8WasmMultiValue",
-    "3323": "HiddenBackfaceWithPossible3D",
-    "3324": "HiddenBackfaceWithPreserve3D",
-    "3325": "CSSAtRuleScrollTimeline",
-    "3326": "FetchUploadStreaming",
-    "3327": "WebkitLineClampWithoutWebkitBox",
-    "3328": "WebBluetoothGetDevices",
-    "3329": "DialogWithNonZeroScrollOffset",
-    "3330": "DialogHeightLargerThanViewport",
-    "3331": "OverlayPopup",
-    "3332": "ContentVisibilityAuto",
-    "3333": "ContentVisibilityHidden",
-    "3334": "ContentVisibilityHiddenMatchable",
-    "3335": "InlineOverflowAutoWithInlineEndPadding",
-    "3336": "InlineOverflowScrollWithInlineEndPadding",
-    "3337": "CSSSelectorPseudoWebKitDetailsMarker",
-    "3338": "SerialPortGetInfo",
-    "3339": "FileSystemPickerMethod",
-    "3340": "V8Window_ShowOpenFilePicker_Method",
-    "3341": "V8Window_ShowSaveFilePicker_Method",
-    "3342": "V8Window_ShowDirectoryPicker_Method",
-    "3343": "V8Window_GetOriginPrivateDirectory_Method",
-    "3344": "RTCConstraintEnableRtpDataChannelsTrue",
-    "3345": "RTCConstraintEnableRtpDataChannelsFalse",
-    "3346": "NativeFileSystemDragAndDrop",
-    "3347": "RTCAdaptivePtime",
-    "3348": "HTMLMetaElementReferrerPolicyMultipleTokensAffectingRequest",
-    "3349": "NavigationTimingL2",
-    "3350": "ResourceTiming",
-    "3351": "V8PointerEvent_AzimuthAngle_AttributeGetter",
-    "3352": "V8PointerEvent_AltitudeAngle_AttributeGetter",
-    "3353": "CrossBrowsingContextGroupMainFrameNulledNonEmptyNameAccessed",
-    "3354": "PositionSticky",
-    "3355": "CommaSeparatorInAllowAttribute",
-    "3359": "MainFrameCSPViaHTTP",
-    "3360": "MainFrameCSPViaMeta",
-    "3361": "MainFrameCSPViaOriginPolicy",
-    "3362": "HtmlClipboardApiRead",
-    "3363": "HtmlClipboardApiWrite",
-    "3364": "CSSSystemColorComputeToSelf",
-    "3365": "ConversionAPIAll",
-    "3366": "ImpressionRegistration",
-    "3367": "ConversionRegistration",
-    "3368": "WebSharePolicyAllow",
-    "3369": "WebSharePolicyDisallow",
-    "3370": "FormAssociatedCustomElement",
-    "3371": "WindowClosed",
-    "3372": "WrongBaselineOfMultiLineButton",
-    "3373": "WrongBaselineOfEmptyLineButton",
-    "3374": "V8RTCRtpTransceiver_Stopped_AttributeGetter",
-    "3375": "V8RTCRtpTransceiver_Stop_Method",
-    "3376": "SecurePaymentConfirmation",
-    "3377": "CSSInvalidVariableUnset",
-    "3378": "ElementInternalsShadowRoot",
-    "3379": "AnyPiiFieldDetected_PredictedTypeMatch",
-    "3380": "EmailFieldDetected_PredictedTypeMatch",
-    "3381": "PhoneFieldDetected_PredictedTypeMatch",
-    "3382": "EmailFieldDetected_PatternMatch",
-    "3383": "LastLetterSpacingAffectsRendering",
-    "3384": "V8FontMetadata_GetTables_Method",
-    "3385": "V8FontMetadata_Blob_Method",
-    "3386": "V8FontManager_Query_Method",
-    "3387": "AudioContextBaseLatency",
-    "3388": "V8Window_GetScreens_Method",
-    "3389": "V8Window_IsMultiScreen_Method",
-    "3390": "V8Window_Onscreenschange_AttributeGetter",
-    "3391": "V8Window_Onscreenschange_AttributeSetter",
-    "3392": "DOMWindowOpenPositioningFeaturesCrossScreen",
-    "3393": "DOMWindowSetWindowRectCrossScreen",
-    "3394": "FullscreenCrossScreen",
-    "3395": "BatterySavingsMeta",
-    "3396": "DigitalGoodsGetDigitalGoodsService",
-    "3397": "DigitalGoodsGetDetails",
-    "3398": "DigitalGoodsAcknowledge",
-    "3399": "MediaRecorder_MimeType",
-    "3400": "MediaRecorder_VideoBitsPerSecond",
-    "3401": "MediaRecorder_AudioBitsPerSecond",
-    "3402": "OBSOLETE_BluetoothRemoteGATTCharacteristic_Uuid",
-    "3403": "OBSOLETE_BluetoothRemoteGATTDescriptor_Uuid",
-    "3404": "OBSOLETE_BluetoothRemoteGATTService_Uuid",
-    "3405": "GPUAdapter_Name",
-    "3406": "WindowScreenInternal",
-    "3407": "WindowScreenPrimary",
-    "3408": "ThirdPartyCookieRead",
-    "3409": "ThirdPartyCookieWrite",
-    "3410": "RTCLegacyRtpDataChannelNegotiated",
-    "3411": "CrossSitePostMessage",
-    "3412": "SchemelesslySameSitePostMessage",
-    "3413": "SchemefulSameSitePostMessage",
-    "3414": "UnspecifiedTargetOriginPostMessage",
-    "3415": "SchemelesslySameSitePostMessageSecureToInsecure",
-    "3416": "SchemelesslySameSitePostMessageInsecureToSecure",
-    "3417": "OBSOLETE_BCPBroadcast",
-    "3418": "OBSOLETE_BCPRead",
-    "3419": "OBSOLETE_BCPWriteWithoutResponse",
-    "3420": "OBSOLETE_BCPWrite",
-    "3421": "OBSOLETE_BCPNotify",
-    "3422": "OBSOLETE_BCPIndicate",
-    "3423": "OBSOLETE_BCPAuthenticatedSignedWrites",
-    "3424": "OBSOLETE_BCPReliableWrite",
-    "3425": "OBSOLETE_BCPWritableAuxiliaries",
-    "3426": "TextAlignSpecifiedToLegend",
-    "3427": "V8Document_FragmentDirective_AttributeGetter",
-    "3428": "V8StorageManager_GetDirectory_Method",
-    "3429": "BeforematchHandlerRegistered",
-    "3430": "BluetoothAdvertisingEventName",
-    "3431": "BluetoothAdvertisingEventAppearance",
-    "3432": "BluetoothAdvertisingEventTxPower",
-    "3433": "CrossOriginOpenerPolicyReporting",
-    "3434": "GamepadId",
-    "3435": "ElementAttachInternals",
-    "3436": "BluetoothDeviceName",
-    "3437": "RTCIceCandidateAddress",
-    "3438": "RTCIceCandidateCandidate",
-    "3439": "RTCIceCandidatePort",
-    "3440": "RTCIceCandidateRelatedAddress",
-    "3441": "RTCIceCandidateRelatedPort",
-    "3442": "SlotAssignNode",
-    "3443": "PluginName",
-    "3444": "PluginFilename",
-    "3445": "PluginDescription",
-    "3446": "SubresourceWebBundles",
-    "3447": "RTCPeerConnectionSetRemoteDescriptionPromise",
-    "3448": "RTCPeerConnectionSetLocalDescriptionPromise",
-    "3449": "RTCPeerConnectionCreateOfferPromise",
-    "3450": "RTCPeerConnectionCreateAnswerPromise",
-    "3451": "RTCPeerConnectionSetRemoteDescription",
-    "3452": "RTCPeerConnectionSetLocalDescription",
-    "3453": "RTCPeerConnectionCreateOffer",
-    "3454": "RTCPeerConnectionCreateAnswer",
-    "3455": "V8AuthenticatorAttestationResponse_GetTransports_Method",
-    "3456": "WebCodecsAudioDecoder",
-    "3457": "WebCodecsVideoDecoder",
-    "3458": "WebCodecsVideoEncoder",
-    "3459": "WebCodecsVideoTrackReader",
-    "3460": "WebCodecsImageDecoder",
-    "3461": "BackForwardCacheExperimentHTTPHeader",
-    "3462": "V8Navigator_OpenTCPSocket_Method",
-    "3463": "V8Navigator_OpenUDPSocket_Method",
-    "3464": "WebCodecs",
-    "3465": "CredentialManagerCrossOriginPublicKeyGetRequest",
-    "3466": "CSSContainStrictWithoutContentVisibility",
-    "3467": "CSSContainAllWithoutContentVisibility",
-    "3468": "TimerInstallFromBeforeUnload",
-    "3469": "TimerInstallFromUnload",
-    "3470": "OBSOLETE_ElementAttachInternalsBeforeConstructor",
-    "3471": "SMILElementHasRepeatNEventListener",
-    "3472": "WebTransport",
-    "3477": "IdleDetectionPermissionRequested",
-    "3478": "IdentifiabilityStudyReserved3478",
-    "3479": "SpeechSynthesis_GetVoices_Method",
-    "3480": "IdentifiabilityStudyReserved3480",
-    "3481": "V8Navigator_JavaEnabled_Method",
-    "3482": "IdentifiabilityStudyReserved3482",
-    "3483": "IdentifiabilityStudyReserved3483",
-    "3484": "IdentifiabilityStudyReserved3484",
-    "3485": "IdentifiabilityStudyReserved3485",
-    "3486": "IdentifiabilityStudyReserved3486",
-    "3487": "IdentifiabilityStudyReserved3487",
-    "3488": "IdentifiabilityStudyReserved3488",
-    "3489": "IdentifiabilityStudyReserved3489",
-    "3490": "IdentifiabilityStudyReserved3490",
-    "3491": "IdentifiabilityStudyReserved3491",
-    "3492": "IdentifiabilityStudyReserved3492",
-    "3493": "IdentifiabilityStudyReserved3493",
-    "3494": "IdentifiabilityStudyReserved3494",
-    "3495": "IdentifiabilityStudyReserved3495",
-    "3496": "IdentifiabilityStudyReserved3496",
-    "3497": "IdentifiabilityStudyReserved3497",
-    "3498": "IdentifiabilityStudyReserved3498",
-    "3499": "V8BackgroundFetchRegistration_FailureReason_AttributeGetter",
-    "3500": "V8Document_ElementFromPoint_Method",
-    "3501": "V8Document_ElementsFromPoint_Method",
-    "3502": "V8ShadowRoot_ElementFromPoint_Method",
-    "3503": "V8ShadowRoot_ElementsFromPoint_Method",
-    "3504": "WindowScreenTouchSupport",
-    "3505": "IdentifiabilityStudyReserved3505",
-    "3506": "IdentifiabilityStudyReserved3506",
-    "3507": "V8PushManager_SupportedContentEncodings_AttributeGetter",
-    "3508": "IdentifiabilityStudyReserved3508",
-    "3509": "V8RTCRtpReceiver_GetCapabilities_Method",
-    "3510": "V8RTCRtpSender_GetCapabilities_Method",
-    "3511": "IdentifiabilityStudyReserved3511",
-    "3512": "IdentifiabilityStudyReserved3512",
-    "3513": "IdentifiabilityStudyReserved3513",
-    "3514": "IdentifiabilityStudyReserved3514",
-    "3515": "IdentifiabilityStudyReserved3515",
-    "3516": "IdentifiabilityStudyReserved3516",
-    "3517": "IdentifiabilityStudyReserved3517",
-    "3518": "IdentifiabilityStudyReserved3518",
-    "3519": "IdentifiabilityStudyReserved3519",
-    "3520": "IdentifiabilityStudyReserved3520",
-    "3521": "IdentifiabilityStudyReserved3521",
-    "3522": "IdentifiabilityStudyReserved3522",
-    "3523": "IdentifiabilityStudyReserved3523",
-    "3524": "IdentifiabilityStudyReserved3524",
-    "3525": "IdentifiabilityStudyReserved3525",
-    "3526": "IdentifiabilityStudyReserved3526",
-    "3527": "IdentifiabilityStudyReserved3527",
-    "3528": "IdentifiabilityStudyReserved3528",
-    "3529": "IdentifiabilityStudyReserved3529",
-    "3530": "IdentifiabilityStudyReserved3530",
-    "3531": "IdentifiabilityStudyReserved3531",
-    "3532": "IdentifiabilityStudyReserved3532",
-    "3533": "IdentifiabilityStudyReserved3533",
-    "3534": "IdentifiabilityStudyReserved3534",
-    "3535": "IdentifiabilityStudyReserved3535",
-    "3536": "IdentifiabilityStudyReserved3536",
-    "3537": "IdentifiabilityStudyReserved3537",
-    "3538": "IdentifiabilityStudyReserved3538",
-    "3539": "IdentifiabilityStudyReserved3539",
-    "3540": "IdentifiabilityStudyReserved3540",
-    "3541": "V8WheelEvent_DeltaMode_AttributeGetter",
-    "3542": "V8Touch_Force_AttributeGetter",
-    "3543": "WebGLRenderingContextMakeXRCompatible",
-    "3544": "V8WebGLCompressedTextureASTC_GetSupportedProfiles_Method",
-    "3545": "HTMLCanvasGetContext",
-    "3546": "V8BeforeInstallPromptEvent_Platforms_AttributeGetter",
-    "3547": "IdentifiabilityStudyReserved3547",
-    "3548": "IdentifiabilityStudyReserved3548",
-    "3549": "IdentifiabilityStudyReserved3549",
-    "3550": "IdentifiabilityStudyReserved3550",
-    "3551": "IdentifiabilityStudyReserved3551",
-    "3552": "IdentifiabilityStudyReserved3552",
-    "3553": "IdentifiabilityStudyReserved3553",
-    "3554": "IdentifiabilityStudyReserved3554",
-    "3555": "IdentifiabilityStudyReserved3555",
-    "3556": "IdentifiabilityStudyReserved3556",
-    "3557": "IdentifiabilityStudyReserved3557",
-    "3558": "IdentifiabilityStudyReserved3558",
-    "3559": "IdentifiabilityStudyReserved3559",
-    "3560": "IdentifiabilityStudyReserved3560",
-    "3561": "IdentifiabilityStudyReserved3561",
-    "3562": "IdentifiabilityStudyReserved3562",
-    "3563": "IdentifiabilityStudyReserved3563",
-    "3564": "IdentifiabilityStudyReserved3564",
-    "3565": "IdentifiabilityStudyReserved3565",
-    "3566": "V8BaseAudioContext_SampleRate_AttributeGetter",
-    "3567": "WindowScreenId",
-    "3568": "WebGLRenderingContextGetParameter",
-    "3569": "WebGLRenderingContextGetRenderbufferParameter",
-    "3570": "WebGLRenderingContextGetShaderPrecisionFormat",
-    "3571": "WebGL2RenderingContextGetInternalFormatParameter",
-    "3572": "IdentifiabilityStudyReserved3572",
-    "3573": "IdentifiabilityStudyReserved3573",
-    "3574": "IdentifiabilityStudyReserved3574",
-    "3575": "IdentifiabilityStudyReserved3575",
-    "3576": "IdentifiabilityStudyReserved3576",
-    "3577": "IdentifiabilityStudyReserved3577",
-    "3578": "CascadedCSSZoomNotEqualToOne",
-    "3579": "ForcedDarkMode",
-    "3580": "PreferredColorSchemeDark",
-    "3581": "PreferredColorSchemeDarkSetting",
-    "3582": "IdentifiabilityStudyReserved3582",
-    "3583": "IdentifiabilityStudyReserved3583",
-    "3584": "IdentifiabilityStudyReserved3584",
-    "3585": "IdentifiabilityStudyReserved3585",
-    "3586": "IdentifiabilityStudyReserved3586",
-    "3587": "IdentifiabilityStudyReserved3587",
-    "3588": "IdentifiabilityStudyReserved3588",
-    "3589": "IdentifiabilityStudyReserved3589",
-    "3590": "IdentifiabilityStudyReserved3590",
-    "3591": "IdentifiabilityStudyReserved3591",
-    "3592": "IdentifiabilityStudyReserved3592",
-    "3593": "IdentifiabilityStudyReserved3593",
-    "3594": "IdentifiabilityStudyReserved3594",
-    "3595": "IdentifiabilityStudyReserved3595",
-    "3596": "IdentifiabilityStudyReserved3596",
-    "3597": "IdentifiabilityStudyReserved3597",
-    "3598": "IdentifiabilityStudyReserved3598",
-    "3599": "IdentifiabilityStudyReserved3599",
-    "3600": "IdentifiabilityStudyReserved3600",
-    "3601": "IdentifiabilityStudyReserved3601",
-    "3602": "IdentifiabilityStudyReserved3602",
-    "3603": "IdentifiabilityStudyReserved3603",
-    "3604": "IdentifiabilityStudyReserved3604",
-    "3605": "IdentifiabilityStudyReserved3605",
-    "3606": "IdentifiabilityStudyReserved3606",
-    "3607": "IdentifiabilityStudyReserved3607",
-    "3608": "IdentifiabilityStudyReserved3608",
-    "3609": "IdentifiabilityStudyReserved3609",
-    "3610": "BarcodeDetector_GetSupportedFormats",
-    "3611": "IdentifiabilityStudyReserved3611",
-    "3612": "IdentifiabilityStudyReserved3612",
-    "3613": "IdentifiabilityStudyReserved3613",
-    "3614": "IdentifiabilityStudyReserved3614",
-    "3615": "IdentifiabilityStudyReserved3615",
-    "3616": "IdentifiabilityStudyReserved3616",
-    "3617": "IdentifiabilityStudyReserved3617",
-    "3618": "IdentifiabilityStudyReserved3618",
-    "3619": "IdentifiabilityStudyReserved3619",
-    "3620": "IdentifiabilityStudyReserved3620",
-    "3621": "IdentifiabilityStudyReserved3621",
-    "3622": "IdentifiabilityStudyReserved3622",
-    "3623": "IdentifiabilityStudyReserved3623",
-    "3624": "IdentifiabilityStudyReserved3624",
-    "3625": "IdentifiabilityStudyReserved3625",
-    "3626": "IdentifiabilityStudyReserved3626",
-    "3627": "IdentifiabilityStudyReserved3627",
-    "3628": "IdentifiabilityStudyReserved3628",
-    "3629": "IdentifiabilityStudyReserved3629",
-    "3630": "IdentifiabilityStudyReserved3630",
-    "3631": "IdentifiabilityStudyReserved3631",
-    "3632": "IdentifiabilityStudyReserved3632",
-    "3633": "IdentifiabilityStudyReserved3633",
-    "3634": "IdentifiabilityStudyReserved3634",
-    "3635": "IdentifiabilityStudyReserved3635",
-    "3636": "IdentifiabilityStudyReserved3636",
-    "3637": "IdentifiabilityStudyReserved3637",
-    "3638": "IdentifiabilityStudyReserved3638",
-    "3639": "IdentifiabilityStudyReserved3639",
-    "3640": "IdentifiabilityStudyReserved3640",
-    "3641": "IdentifiabilityStudyReserved3641",
-    "3642": "IdentifiabilityStudyReserved3642",
-    "3643": "IdentifiabilityStudyReserved3643",
-    "3644": "IdentifiabilityStudyReserved3644",
-    "3645": "IdentifiabilityStudyReserved3645",
-    "3646": "IdentifiabilityStudyReserved3646",
-    "3647": "IdentifiabilityStudyReserved3647",
-    "3648": "IdentifiabilityStudyReserved3648",
-    "3649": "IdentifiabilityStudyReserved3649",
-    "3650": "IdentifiabilityStudyReserved3650",
-    "3651": "IdentifiabilityStudyReserved3651",
-    "3652": "IdentifiabilityStudyReserved3652",
-    "3653": "IdentifiabilityStudyReserved3653",
-    "3654": "IdentifiabilityStudyReserved3654",
-    "3655": "IdentifiabilityStudyReserved3655",
-    "3656": "IdentifiabilityStudyReserved3656",
-    "3657": "IdentifiabilityStudyReserved3657",
-    "3658": "IdentifiabilityStudyReserved3658",
-    "3659": "IdentifiabilityStudyReserved3659",
-    "3660": "IdentifiabilityStudyReserved3660",
-    "3661": "IdentifiabilityStudyReserved3661",
-    "3662": "IdentifiabilityStudyReserved3662",
-    "3663": "IdentifiabilityStudyReserved3663",
-    "3664": "IdentifiabilityStudyReserved3664",
-    "3665": "IdentifiabilityStudyReserved3665",
-    "3666": "IdentifiabilityStudyReserved3666",
-    "3667": "IdentifiabilityStudyReserved3667",
-    "3668": "IdentifiabilityStudyReserved3668",
-    "3669": "IdentifiabilityStudyReserved3669",
-    "3670": "IdentifiabilityStudyReserved3670",
-    "3671": "IdentifiabilityStudyReserved3671",
-    "3672": "IdentifiabilityStudyReserved3672",
-    "3673": "IdentifiabilityStudyReserved3673",
-    "3674": "IdentifiabilityStudyReserved3674",
-    "3675": "IdentifiabilityStudyReserved3675",
-    "3676": "IdentifiabilityStudyReserved3676",
-    "3677": "IdentifiabilityStudyReserved3677",
-    "3678": "IdentifiabilityStudyReserved3678",
-    "3679": "IdentifiabilityStudyReserved3679",
-    "3680": "IdentifiabilityStudyReserved3680",
-    "3681": "IdentifiabilityStudyReserved3681",
-    "3682": "UndeferrableThirdPartySubresourceRequestWithCookie",
-    "3683": "XRDepthSensing",
-    "3684": "XRFrameGetDepthInformation",
-    "3685": "XRDepthInformationGetDepth",
-    "3686": "XRDepthInformationDataAttribute",
-    "3687": "InterestCohortAPI_interestCohort_Method",
-    "3688": "AddressSpaceLocalEmbeddedInPrivateSecureContext",
-    "3689": "AddressSpaceLocalEmbeddedInPrivateNonSecureContext",
-    "3690": "AddressSpaceLocalEmbeddedInPublicSecureContext",
-    "3691": "AddressSpaceLocalEmbeddedInPublicNonSecureContext",
-    "3692": "AddressSpaceLocalEmbeddedInUnknownSecureContext",
-    "3693": "AddressSpaceLocalEmbeddedInUnknownNonSecureContext",
-    "3694": "AddressSpacePrivateEmbeddedInPublicSecureContext",
-    "3695": "AddressSpacePrivateEmbeddedInPublicNonSecureContext",
-    "3696": "AddressSpacePrivateEmbeddedInUnknownSecureContext",
-    "3697": "AddressSpacePrivateEmbeddedInUnknownNonSecureContext",
-    "3698": "ThirdPartyAccess",
-    "3699": "ThirdPartyActivation",
-    "3700": "ThirdPartyAccessAndActivation",
-    "3701": "FullscreenAllowedByScreensChange",
-    "3702": "NewLayoutOverflowDifferentBlock",
-    "3703": "NewLayoutOverflowDifferentFlex",
-    "3704": "NewLayoutOverflowDifferentAndAlreadyScrollsBlock",
-    "3705": "NewLayoutOverflowDifferentAndAlreadyScrollsFlex",
-    "3706": "UnicodeBidiPlainText",
-    "3707": "ColorSchemeDarkSupportedOnRoot",
-    "3708": "WebBluetoothGetAvailability",
-    "3709": "DigitalGoodsListPurchases",
-    "3710": "CompositedSVG",
-    "3711": "BarcodeDetectorDetect",
-    "3712": "FaceDetectorDetect",
-    "3713": "TextDetectorDetect",
-    "3714": "LocalStorageFirstUsedBeforeFcp",
-    "3715": "LocalStorageFirstUsedAfterFcp",
-    "3716": "CSSPseudoHostCompoundList",
-    "3717": "CSSPseudoHostContextCompoundList",
-    "3718": "CSSPseudoHostDynamicSpecificity",
-    "3719": "GetCurrentBrowsingContextMedia",
-    "3720": "MouseEventRelativePositionForInlineElement",
-    "3721": "V8SharedArrayBufferConstructedWithoutIsolation",
-    "3722": "V8HTMLVideoElement_GetVideoPlaybackQuality_Method",
-    "3723": "XRWebGLBindingGetReflectionCubeMap",
-    "3724": "XRFrameGetLightEstimate",
-    "3725": "V8HTMLDialogElement_Show_Method",
-    "3726": "V8HTMLDialogElement_ShowModal_Method",
-    "3727": "AdFrameDetected",
-    "3728": "MediaStreamTrackGenerator",
-    "3729": "MediaStreamTrackProcessor",
-    "3730": "AddEventListenerWithAbortSignal",
-    "3731": "XRSessionRequestLightProbe",
-    "3732": "BeforematchRevealedHiddenMatchable",
-    "3733": "AddSourceBufferUsingConfig",
-    "3734": "ChangeTypeUsingConfig",
-    "3735": "V8SourceBuffer_AppendEncodedChunks_Method",
-    "3736": "OversrollBehaviorOnViewportBreaks",
-    "3737": "SameOriginJsonTypeForScript",
-    "3738": "CrossOriginJsonTypeForScript",
-    "3739": "SameOriginStrictNosniffWouldBlock",
-    "3740": "CrossOriginStrictNosniffWouldBlock",
-    "3741": "CSSSelectorPseudoDir",
-    "3742": "CrossOriginSubframeWithoutEmbeddingControl",
-    "3743": "ReadableStreamWithByteSource",
-    "3744": "ReadableStreamBYOBReader",
-    "3746": "SamePartyCookieAttribute",
-    "3747": "SamePartyCookieExclusionOverruledSameSite",
-    "3748": "SamePartyCookieInclusionOverruledSameSite",
-    "3749": "EmbedElementWithoutTypeSrcChanged",
-    "3750": "PaymentHandlerStandardizedPaymentMethodIdentifier",
-    "3751": "WebCodecsAudioEncoder",
-    "3752": "EmbeddedCrossOriginFrameWithoutFrameAncestorsOrXFO",
-    "3753": "AddressSpacePrivateSecureContextEmbeddedLocal",
-    "3754": "AddressSpacePrivateNonSecureContextEmbeddedLocal",
-    "3755": "AddressSpacePublicSecureContextEmbeddedLocal",
-    "3756": "AddressSpacePublicNonSecureContextEmbeddedLocal",
-    "3757": "AddressSpacePublicSecureContextEmbeddedPrivate",
-    "3758": "AddressSpacePublicNonSecureContextEmbeddedPrivate",
-    "3759": "AddressSpaceUnknownSecureContextEmbeddedLocal",
-    "3760": "AddressSpaceUnknownNonSecureContextEmbeddedLocal",
-    "3761": "AddressSpaceUnknownSecureContextEmbeddedPrivate",
-    "3762": "AddressSpaceUnknownNonSecureContextEmbeddedPrivate",
-    "3763": "AddressSpacePrivateSecureContextNavigatedToLocal",
-    "3764": "AddressSpacePrivateNonSecureContextNavigatedToLocal",
-    "3765": "AddressSpacePublicSecureContextNavigatedToLocal",
-    "3766": "AddressSpacePublicNonSecureContextNavigatedToLocal",
-    "3767": "AddressSpacePublicSecureContextNavigatedToPrivate",
-    "3768": "AddressSpacePublicNonSecureContextNavigatedToPrivate",
-    "3769": "AddressSpaceUnknownSecureContextNavigatedToLocal",
-    "3770": "AddressSpaceUnknownNonSecureContextNavigatedToLocal",
-    "3771": "AddressSpaceUnknownSecureContextNavigatedToPrivate",
-    "3772": "AddressSpaceUnknownNonSecureContextNavigatedToPrivate",
-    "3773": "RTCPeerConnectionSdpSemanticsPlanB",
-    "3774": "FetchRespondWithNoResponseWithUsedRequestBody",
-    "3775": "V8TCPSocket_Close_Method",
-    "3776": "V8TCPSocket_Readable_AttributeGetter",
-    "3777": "V8TCPSocket_Writable_AttributeGetter",
-    "3778": "V8TCPSocket_RemoteAddress_AttributeGetter",
-    "3779": "V8TCPSocket_RemotePort_AttributeGetter",
-    "3780": "CSSSelectorTargetText",
-    "3781": "PopupElement",
-    "3782": "V8HTMLPopupElement_Show_Method",
-    "3783": "V8HTMLPopupElement_Hide_Method",
-    "3784": "WindowOpenWithAdditionalBoolParameter",
-    "3785": "RTCPeerConnectionConstructedWithPlanB",
-    "3786": "RTCPeerConnectionConstructedWithUnifiedPlan",
-    "3787": "RTCPeerConnectionUsingComplexPlanB",
-    "3788": "RTCPeerConnectionUsingComplexUnifiedPlan",
-    "3789": "WindowScreenIsExtended",
-    "3790": "WindowScreenChange",
-    "3791": "XRWebGLDepthInformationTextureAttribute",
-    "3792": "XRWebGLBindingGetDepthInformation",
-    "3793": "SessionStorageFirstUsedBeforeFcp",
-    "3794": "SessionStorageFirstUsedAfterFcp",
-    "3795": "GravitySensorConstructor",
-    "3796": "ElementInternalsStates",
-    "3797": "WebPImage",
-    "3798": "AVIFImage",
-    "3799": "SVGTextEdited",
-    "3800": "V8WasmExceptionHandling",
-    "3801": "WasmModuleSharing",
-    "3802": "CrossOriginWasmModuleSharing",
-    "3803": "OverflowClipAlongEitherAxis",
-    "3804": "CreateJSONModuleScript",
-    "3805": "CreateCSSModuleScript",
-    "3806": "InsertHTMLCommandOnInput",
-    "3807": "InsertHTMLCommandOnTextarea",
-    "3808": "InsertHTMLCommandOnReadWritePlainText",
-    "3809": "CSSAtRuleCounterStyle",
-    "3810": "CanvasUseColorSpace",
-    "3811": "SelectMenuElement",
-    "3812": "RTCPeerConnectionSdpSemanticsPlanBWithReverseOriginTrial",
-    "3813": "WebAppManifestCaptureLinks",
-    "3814": "SanitizerAPICreated",
-    "3815": "SanitizerAPIDefaultConfiguration",
-    "3816": "SanitizerAPIToString",
-    "3817": "SanitizerAPIToFragment",
-    "3818": "SanitizerAPIActionTaken",
-    "3819": "SanitizerAPIFromString",
-    "3820": "SanitizerAPIFromDocument",
-    "3821": "SanitizerAPIFromFragment",
-    "3822": "StorageFoundationOpen",
-    "3823": "StorageFoundationRead",
-    "3824": "StorageFoundationReadSync",
-    "3825": "StorageFoundationWrite",
-    "3826": "StorageFoundationWriteSync",
-    "3827": "StorageFoundationFlush",
-    "3828": "StorageFoundationFlushSync",
-    "3829": "UnrestrictedSharedArrayBuffer",
-    "3830": "FeaturePolicyJSAPIAllowsFeatureIFrame",
-    "3831": "FeaturePolicyJSAPIAllowsFeatureDocument",
-    "3832": "FeaturePolicyJSAPIAllowsFeatureOriginIFrame",
-    "3833": "FeaturePolicyJSAPIAllowsFeatureOriginDocument",
-    "3834": "FeaturePolicyJSAPIAllowedFeaturesIFrame",
-    "3835": "FeaturePolicyJSAPIAllowedFeaturesDocument",
-    "3836": "FeaturePolicyJSAPIFeaturesIFrame",
-    "3837": "FeaturePolicyJSAPIFeaturesDocument",
-    "3838": "FeaturePolicyJSAPIGetAllowlistIFrame",
-    "3839": "FeaturePolicyJSAPIGetAllowlistDocument",
-    "3840": "V8Screens_Onchange_AttributeGetter",
-    "3841": "V8Screens_Onchange_AttributeSetter",
-    "3842": "V8ScreenAdvanced_Left_AttributeGetter",
-    "3843": "V8ScreenAdvanced_Top_AttributeGetter",
-    "3844": "V8ScreenAdvanced_IsPrimary_AttributeGetter",
-    "3845": "V8ScreenAdvanced_IsInternal_AttributeGetter",
-    "3846": "V8ScreenAdvanced_DevicePixelRatio_AttributeGetter",
-    "3847": "V8ScreenAdvanced_Id_AttributeGetter",
-    "3848": "V8ScreenAdvanced_PointerTypes_AttributeGetter",
-    "3849": "V8ScreenAdvanced_Label_AttributeGetter",
-    "3850": "PermissionsPolicyHeader",
-    "3851": "WebAppManifestUrlHandlers",
-    "3852": "LaxAllowingUnsafeCookies",
-    "3853": "V8MediaSession_SetMicrophoneActive_Method",
-    "3854": "V8MediaSession_SetCameraActive_Method",
-    "3855": "V8Navigator_JoinAdInterestGroup_Method",
-    "3856": "V8Navigator_LeaveAdInterestGroup_Method",
-    "3857": "V8Navigator_RunAdAuction_Method",
-    "3858": "XHRJSONEncodingDetection",
-    "3859": "WorkerControlledByServiceWorkerOutOfScope",
-    "3860": "XRPlaneDetection",
-    "3861": "XRFrameDetectedPlanes",
-    "3862": "XRImageTracking",
-    "3863": "XRSessionGetTrackedImageScores",
-    "3864": "XRFrameGetImageTrackingResults",
-    "3865": "OpenWebDatabaseThirdPartyContext",
-    "3866": "PointerId",
-    "3867": "Transform3dScene",
-    "3868": "PrefersColorSchemeMediaFeature",
-    "3869": "PrefersContrastMediaFeature",
-    "3870": "ForcedColorsMediaFeature",
-    "3871": "PaymentRequestCSPViolation",
-    "3872": "WorkerControlledByServiceWorkerWithFetchEventHandlerOutOfScope",
-    "3873": "AuthorizationCoveredByWildcard",
-    "3874": "ElementGetInnerHTML",
-    "3875": "FileHandlingLaunch",
-    "3876": "SameOriginDocumentsWithDifferentCOOPStatus",
-    "3877": "HTMLMediaElementSetSinkId",
-    "3878": "PrefixedStorageQuotaThirdPartyContext",
-    "3879": "RequestedFileSystemPersistentThirdPartyContext",
-    "3880": "PrefixedStorageInfoThirdPartyContext",
-    "3881": "CrossOriginEmbedderPolicyCredentialless",
-    "3882": "PostMessageFromSecureToSecure",
-    "3883": "PostMessageFromInsecureToInsecure",
-    "3884": "WebAppManifestProtocolHandlers",
-    "3885": "RTCPeerConnectionOfferAllowExtmapMixedFalse",
-    "3886": "NewCanvas2DAPI",
-    "3887": "ServiceWorkerSubresourceFilter",
-    "3888": "WebGPU",
-    "3889": "CSSFilterColorMatrix",
-    "3890": "HTMLFencedFrameElement",
-    "3891": "CSSFilterLuminanceToAlpha",
-    "3892": "HandwritingRecognitionCreateRecognizer",
-    "3893": "HandwritingRecognitionQuerySupport",
-    "3894": "HandwritingRecognitionStartDrawing",
-    "3895": "HandwritingRecognitionGetPrediction",
-    "3896": "WebBluetoothManufacturerDataFilter",
-    "3897": "SanitizerAPIGetConfig",
-    "3898": "SanitizerAPIGetDefaultConfig",
-    "3899": "ComputePressureObserver_Constructor",
-    "3900": "ComputePressureObserver_Observe",
-    "3901": "ComputePressureObserver_Stop",
-    "3902": "WebAppWindowControlsOverlay",
-    "3903": "PaymentRequestShowWithoutGestureOrToken",
-    "3904": "V8Navigator_UpdateAdInterestGroups_Method",
-    "3905": "V8Screens_Onscreenschange_AttributeGetter",
-    "3906": "V8Screens_Onscreenschange_AttributeSetter",
-    "3907": "V8Screens_Oncurrentscreenchange_AttributeGetter",
-    "3908": "V8Screens_Oncurrentscreenchange_AttributeSetter",
-    "3909": "RTCOfferAnswerOptionsVoiceActivityDetection",
-    "3910": "MultiColAndListItem",
-    "3911": "CaptureHandle",
-    "3912": "SVGText",
-    "3913": "GetBBoxForText",
-    "3914": "SVGTextHangingFromPath",
-    "3915": "ClientHintsPrefersColorScheme",
-    "3916": "OverscrollBehaviorWillBeFixed",
-    "3917": "ControlledWorkerWillBeUncontrolled",
-    "3918": "ARIATouchpassthroughAttribute",
-    "3919": "ARIAVirtualcontentAttribute",
-    "3920": "AccessibilityTouchPassthroughSet",
-    "3921": "TextFragmentBlockedByForceLoadAtTop",
-    "3922": "UrnDocumentAccessedCookies",
-    "3923": "FontFaceAscentOverride",
-    "3924": "FontFaceDescentOverride",
-    "3925": "FontFaceLineGapOverride",
-    "3926": "FontFaceSizeAdjust",
-    "3927": "HiddenBackfaceWith3D",
-    "3928": "MainFrameNonSecurePrivateAddressSpace",
-    "3929": "CSSSelectorPseudoHas",
-    "3930": "HTMLMediaElementControlsListNoPlaybackRate",
-    "3931": "DocumentTransition",
-    "3932": "SpeculationRules",
-    "3933": "V8AbortSignal_Abort_Method",
-    "3934": "SelectionBackgroundColorInversion",
-    "3935": "RTCPeerConnectionPlanBThrewAnException",
-    "3936": "HTMLRootContained",
-    "3937": "HTMLBodyContained",
-    "3938": "XRFrameGetJointPose",
-    "3939": "XRFrameFillJointRadii",
-    "3940": "XRFrameFillPoses",
-    "3941": "WindowOpenNewPopupBehaviorMismatch",
-    "3942": "ExplicitPointerCaptureClickTargetDiff",
-    "3943": "ControlledNonBlobURLWorkerWillBeUncontrolled",
-    "3944": "MediaMetaThemeColor",
-    "3945": "ClientHintsUABitness",
-    "3946": "DifferentPerspectiveCBOrParent",
-    "3947": "WebkitImageSet",
-    "3948": "RTCPeerConnectionWithBlockingCsp",
-    "3949": "SanitizerAPISanitizeFor",
-    "3950": "SanitizerAPIElementSetSanitized",
-    "3951": "TextShadowInHighlightPseudo",
-    "3952": "TextShadowNotNoneInHighlightPseudo",
-    "3953": "SameSiteNoneRequired",
-    "3954": "SameSiteNoneIncludedBySamePartyTopResource",
-    "3955": "SameSiteNoneIncludedBySamePartyAncestors",
-    "3956": "SameSiteNoneIncludedBySameSiteLax",
-    "3957": "SameSiteNoneIncludedBySameSiteStrict",
-    "3958": "PrivateNetworkAccessNonSecureContextsAllowedDeprecationTrial",
-    "3959": "V8URLPattern_Constructor",
-    "3960": "V8URLPattern_Test_Method",
-    "3961": "V8URLPattern_Exec_Method"
-}
+BLINK_FEATURES = None
+CSS_FEATURES = None
+
+def load_feature_names():
+    """Load the feature name tables if they haven't been loaded yet"""
+    global BLINK_FEATURES
+    global CSS_FEATURES
+    if BLINK_FEATURES is None:
+        BLINK_FEATURES = []
+        CSS_FEATURES = []
+        try:
+            features_file = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'blink_features.json')
+            with open(features_file, 'r') as f:
+                features = json.load(f)
+            BLINK_FEATURES = features['features']
+            CSS_FEATURES = features['css_features']
+        except BaseException:
+            logging.exception('Error loading the blink feature names')
+
+def get_feature_name(names, feature_id):
+    """Look up a feature id in one of the feature name tables"""
+    if feature_id >= 0 and feature_id < len(names):
+        return names[feature_id]
+    return None
 
-##########################################################################
-#   CSS feature names from https://source.chromium.org/chromium/chromium/src/+/master:third_party/blink/public/mojom/use_counter/css_property_id.mojom
-##########################################################################
-CSS_FEATURES = {
-    "2": "CSSPropertyColor",
-    "3": "CSSPropertyDirection",
-    "4": "CSSPropertyDisplay",
-    "5": "CSSPropertyFont",
-    "6": "CSSPropertyFontFamily",
-    "7": "CSSPropertyFontSize",
-    "8": "CSSPropertyFontStyle",
-    "9": "CSSPropertyFontVariant",
-    "10": "CSSPropertyFontWeight",
-    "11": "CSSPropertyTextRendering",
-    "12": "CSSPropertyAliasWebkitFontFeatureSettings",
-    "13": "CSSPropertyFontKerning",
-    "14": "CSSPropertyWebkitFontSmoothing",
-    "15": "CSSPropertyFontVariantLigatures",
-    "16": "CSSPropertyWebkitLocale",
-    "17": "CSSPropertyWebkitTextOrientation",
-    "18": "CSSPropertyWebkitWritingMode",
-    "19": "CSSPropertyZoom",
-    "20": "CSSPropertyLineHeight",
-    "21": "CSSPropertyBackground",
-    "22": "CSSPropertyBackgroundAttachment",
-    "23": "CSSPropertyBackgroundClip",
-    "24": "CSSPropertyBackgroundColor",
-    "25": "CSSPropertyBackgroundImage",
-    "26": "CSSPropertyBackgroundOrigin",
-    "27": "CSSPropertyBackgroundPosition",
-    "28": "CSSPropertyBackgroundPositionX",
-    "29": "CSSPropertyBackgroundPositionY",
-    "30": "CSSPropertyBackgroundRepeat",
-    "31": "CSSPropertyBackgroundRepeatX",
-    "32": "CSSPropertyBackgroundRepeatY",
-    "33": "CSSPropertyBackgroundSize",
-    "34": "CSSPropertyBorder",
-    "35": "CSSPropertyBorderBottom",
-    "36": "CSSPropertyBorderBottomColor",
-    "37": "CSSPropertyBorderBottomLeftRadius",
-    "38": "CSSPropertyBorderBottomRightRadius",
-    "39": "CSSPropertyBorderBottomStyle",
-    "40": "CSSPropertyBorderBottomWidth",
-    "41": "CSSPropertyBorderCollapse",
-    "42": "CSSPropertyBorderColor",
-    "43": "CSSPropertyBorderImage",
-    "44": "CSSPropertyBorderImageOutset",
-    "45": "CSSPropertyBorderImageRepeat",
-    "46": "CSSPropertyBorderImageSlice",
-    "47": "CSSPropertyBorderImageSource",
-    "48": "CSSPropertyBorderImageWidth",
-    "49": "CSSPropertyBorderLeft",
-    "50": "CSSPropertyBorderLeftColor",
-    "51": "CSSPropertyBorderLeftStyle",
-    "52": "CSSPropertyBorderLeftWidth",
-    "53": "CSSPropertyBorderRadius",
-    "54": "CSSPropertyBorderRight",
-    "55": "CSSPropertyBorderRightColor",
-    "56": "CSSPropertyBorderRightStyle",
-    "57": "CSSPropertyBorderRightWidth",
-    "58": "CSSPropertyBorderSpacing",
-    "59": "CSSPropertyBorderStyle",
-    "60": "CSSPropertyBorderTop",
-    "61": "CSSPropertyBorderTopColor",
-    "62": "CSSPropertyBorderTopLeftRadius",
-    "63": "CSSPropertyBorderTopRightRadius",
-    "64": "CSSPropertyBorderTopStyle",
-    "65": "CSSPropertyBorderTopWidth",
-    "66": "CSSPropertyBorderWidth",
-    "67": "CSSPropertyBottom",
-    "68": "CSSPropertyBoxShadow",
-    "69": "CSSPropertyBoxSizing",
-    "70": "CSSPropertyCaptionSide",
-    "71": "CSSPropertyClear",
-    "72": "CSSPropertyClip",
-    "73": "CSSPropertyAliasWebkitClipPath",
-    "74": "CSSPropertyContent",
-    "75": "CSSPropertyCounterIncrement",
-    "76": "CSSPropertyCounterReset",
-    "77": "CSSPropertyCursor",
-    "78": "CSSPropertyEmptyCells",
-    "79": "CSSPropertyFloat",
-    "80": "CSSPropertyFontStretch",
-    "81": "CSSPropertyHeight",
-    "82": "CSSPropertyImageRendering",
-    "83": "CSSPropertyLeft",
-    "84": "CSSPropertyLetterSpacing",
-    "85": "CSSPropertyListStyle",
-    "86": "CSSPropertyListStyleImage",
-    "87": "CSSPropertyListStylePosition",
-    "88": "CSSPropertyListStyleType",
-    "89": "CSSPropertyMargin",
-    "90": "CSSPropertyMarginBottom",
-    "91": "CSSPropertyMarginLeft",
-    "92": "CSSPropertyMarginRight",
-    "93": "CSSPropertyMarginTop",
-    "94": "CSSPropertyMaxHeight",
-    "95": "CSSPropertyMaxWidth",
-    "96": "CSSPropertyMinHeight",
-    "97": "CSSPropertyMinWidth",
-    "98": "CSSPropertyOpacity",
-    "99": "CSSPropertyOrphans",
-    "100": "CSSPropertyOutline",
-    "101": "CSSPropertyOutlineColor",
-    "102": "CSSPropertyOutlineOffset",
-    "103": "CSSPropertyOutlineStyle",
-    "104": "CSSPropertyOutlineWidth",
-    "105": "CSSPropertyOverflow",
-    "106": "CSSPropertyOverflowWrap",
-    "107": "CSSPropertyOverflowX",
-    "108": "CSSPropertyOverflowY",
-    "109": "CSSPropertyPadding",
-    "110": "CSSPropertyPaddingBottom",
-    "111": "CSSPropertyPaddingLeft",
-    "112": "CSSPropertyPaddingRight",
-    "113": "CSSPropertyPaddingTop",
-    "114": "CSSPropertyPage",
-    "115": "CSSPropertyPageBreakAfter",
-    "116": "CSSPropertyPageBreakBefore",
-    "117": "CSSPropertyPageBreakInside",
-    "118": "CSSPropertyPointerEvents",
-    "119": "CSSPropertyPosition",
-    "120": "CSSPropertyQuotes",
-    "121": "CSSPropertyResize",
-    "122": "CSSPropertyRight",
-    "123": "CSSPropertySize",
-    "124": "CSSPropertySrc",
-    "125": "CSSPropertySpeak",
-    "126": "CSSPropertyTableLayout",
-    "127": "CSSPropertyTabSize",
-    "128": "CSSPropertyTextAlign",
-    "129": "CSSPropertyTextDecoration",
-    "130": "CSSPropertyTextIndent",
-    "136": "CSSPropertyTextOverflow",
-    "142": "CSSPropertyTextShadow",
-    "143": "CSSPropertyTextTransform",
-    "149": "CSSPropertyTop",
-    "150": "CSSPropertyTransition",
-    "151": "CSSPropertyTransitionDelay",
-    "152": "CSSPropertyTransitionDuration",
-    "153": "CSSPropertyTransitionProperty",
-    "154": "CSSPropertyTransitionTimingFunction",
-    "155": "CSSPropertyUnicodeBidi",
-    "156": "CSSPropertyUnicodeRange",
-    "157": "CSSPropertyVerticalAlign",
-    "158": "CSSPropertyVisibility",
-    "159": "CSSPropertyWhiteSpace",
-    "160": "CSSPropertyWidows",
-    "161": "CSSPropertyWidth",
-    "162": "CSSPropertyWordBreak",
-    "163": "CSSPropertyWordSpacing",
-    "164": "CSSPropertyWordWrap",
-    "165": "CSSPropertyZIndex",
-    "166": "CSSPropertyAliasWebkitAnimation",
-    "167": "CSSPropertyAliasWebkitAnimationDelay",
-    "168": "CSSPropertyAliasWebkitAnimationDirection",
-    "169": "CSSPropertyAliasWebkitAnimationDuration",
-    "170": "CSSPropertyAliasWebkitAnimationFillMode",
-    "171": "CSSPropertyAliasWebkitAnimationIterationCount",
-    "172": "CSSPropertyAliasWebkitAnimationName",
-    "173": "CSSPropertyAliasWebkitAnimationPlayState",
-    "174": "CSSPropertyAliasWebkitAnimationTimingFunction",
-    "175": "CSSPropertyWebkitAppearance",
-    "176": "CSSPropertyWebkitAspectRatio",
-    "177": "CSSPropertyAliasWebkitBackfaceVisibility",
-    "178": "CSSPropertyWebkitBackgroundClip",
-    "179": "CSSPropertyWebkitBackgroundComposite",
-    "180": "CSSPropertyWebkitBackgroundOrigin",
-    "181": "CSSPropertyAliasWebkitBackgroundSize",
-    "182": "CSSPropertyWebkitBorderAfter",
-    "183": "CSSPropertyWebkitBorderAfterColor",
-    "184": "CSSPropertyWebkitBorderAfterStyle",
-    "185": "CSSPropertyWebkitBorderAfterWidth",
-    "186": "CSSPropertyWebkitBorderBefore",
-    "187": "CSSPropertyWebkitBorderBeforeColor",
-    "188": "CSSPropertyWebkitBorderBeforeStyle",
-    "189": "CSSPropertyWebkitBorderBeforeWidth",
-    "190": "CSSPropertyWebkitBorderEnd",
-    "191": "CSSPropertyWebkitBorderEndColor",
-    "192": "CSSPropertyWebkitBorderEndStyle",
-    "193": "CSSPropertyWebkitBorderEndWidth",
-    "194": "CSSPropertyWebkitBorderFit",
-    "195": "CSSPropertyWebkitBorderHorizontalSpacing",
-    "196": "CSSPropertyWebkitBorderImage",
-    "197": "CSSPropertyAliasWebkitBorderRadius",
-    "198": "CSSPropertyWebkitBorderStart",
-    "199": "CSSPropertyWebkitBorderStartColor",
-    "200": "CSSPropertyWebkitBorderStartStyle",
-    "201": "CSSPropertyWebkitBorderStartWidth",
-    "202": "CSSPropertyWebkitBorderVerticalSpacing",
-    "203": "CSSPropertyWebkitBoxAlign",
-    "204": "CSSPropertyWebkitBoxDirection",
-    "205": "CSSPropertyWebkitBoxFlex",
-    "206": "CSSPropertyWebkitBoxFlexGroup",
-    "207": "CSSPropertyWebkitBoxLines",
-    "208": "CSSPropertyWebkitBoxOrdinalGroup",
-    "209": "CSSPropertyWebkitBoxOrient",
-    "210": "CSSPropertyWebkitBoxPack",
-    "211": "CSSPropertyWebkitBoxReflect",
-    "212": "CSSPropertyAliasWebkitBoxShadow",
-    "215": "CSSPropertyWebkitColumnBreakAfter",
-    "216": "CSSPropertyWebkitColumnBreakBefore",
-    "217": "CSSPropertyWebkitColumnBreakInside",
-    "218": "CSSPropertyAliasWebkitColumnCount",
-    "219": "CSSPropertyAliasWebkitColumnGap",
-    "220": "CSSPropertyWebkitColumnProgression",
-    "221": "CSSPropertyAliasWebkitColumnRule",
-    "222": "CSSPropertyAliasWebkitColumnRuleColor",
-    "223": "CSSPropertyAliasWebkitColumnRuleStyle",
-    "224": "CSSPropertyAliasWebkitColumnRuleWidth",
-    "225": "CSSPropertyAliasWebkitColumnSpan",
-    "226": "CSSPropertyAliasWebkitColumnWidth",
-    "227": "CSSPropertyAliasWebkitColumns",
-    "228": "CSSPropertyWebkitBoxDecorationBreak",
-    "229": "CSSPropertyWebkitFilter",
-    "230": "CSSPropertyAlignContent",
-    "231": "CSSPropertyAlignItems",
-    "232": "CSSPropertyAlignSelf",
-    "233": "CSSPropertyFlex",
-    "234": "CSSPropertyFlexBasis",
-    "235": "CSSPropertyFlexDirection",
-    "236": "CSSPropertyFlexFlow",
-    "237": "CSSPropertyFlexGrow",
-    "238": "CSSPropertyFlexShrink",
-    "239": "CSSPropertyFlexWrap",
-    "240": "CSSPropertyJustifyContent",
-    "241": "CSSPropertyWebkitFontSizeDelta",
-    "242": "CSSPropertyGridTemplateColumns",
-    "243": "CSSPropertyGridTemplateRows",
-    "244": "CSSPropertyGridColumnStart",
-    "245": "CSSPropertyGridColumnEnd",
-    "246": "CSSPropertyGridRowStart",
-    "247": "CSSPropertyGridRowEnd",
-    "248": "CSSPropertyGridColumn",
-    "249": "CSSPropertyGridRow",
-    "250": "CSSPropertyGridAutoFlow",
-    "251": "CSSPropertyWebkitHighlight",
-    "252": "CSSPropertyWebkitHyphenateCharacter",
-    "257": "CSSPropertyWebkitLineBoxContain",
-    "258": "CSSPropertyWebkitLineAlign",
-    "259": "CSSPropertyWebkitLineBreak",
-    "260": "CSSPropertyWebkitLineClamp",
-    "261": "CSSPropertyWebkitLineGrid",
-    "262": "CSSPropertyWebkitLineSnap",
-    "263": "CSSPropertyWebkitLogicalWidth",
-    "264": "CSSPropertyWebkitLogicalHeight",
-    "265": "CSSPropertyWebkitMarginAfterCollapse",
-    "266": "CSSPropertyWebkitMarginBeforeCollapse",
-    "267": "CSSPropertyWebkitMarginBottomCollapse",
-    "268": "CSSPropertyWebkitMarginTopCollapse",
-    "269": "CSSPropertyWebkitMarginCollapse",
-    "270": "CSSPropertyWebkitMarginAfter",
-    "271": "CSSPropertyWebkitMarginBefore",
-    "272": "CSSPropertyWebkitMarginEnd",
-    "273": "CSSPropertyWebkitMarginStart",
-    "280": "CSSPropertyWebkitMask",
-    "281": "CSSPropertyWebkitMaskBoxImage",
-    "282": "CSSPropertyWebkitMaskBoxImageOutset",
-    "283": "CSSPropertyWebkitMaskBoxImageRepeat",
-    "284": "CSSPropertyWebkitMaskBoxImageSlice",
-    "285": "CSSPropertyWebkitMaskBoxImageSource",
-    "286": "CSSPropertyWebkitMaskBoxImageWidth",
-    "287": "CSSPropertyWebkitMaskClip",
-    "288": "CSSPropertyWebkitMaskComposite",
-    "289": "CSSPropertyWebkitMaskImage",
-    "290": "CSSPropertyWebkitMaskOrigin",
-    "291": "CSSPropertyWebkitMaskPosition",
-    "292": "CSSPropertyWebkitMaskPositionX",
-    "293": "CSSPropertyWebkitMaskPositionY",
-    "294": "CSSPropertyWebkitMaskRepeat",
-    "295": "CSSPropertyWebkitMaskRepeatX",
-    "296": "CSSPropertyWebkitMaskRepeatY",
-    "297": "CSSPropertyWebkitMaskSize",
-    "298": "CSSPropertyWebkitMaxLogicalWidth",
-    "299": "CSSPropertyWebkitMaxLogicalHeight",
-    "300": "CSSPropertyWebkitMinLogicalWidth",
-    "301": "CSSPropertyWebkitMinLogicalHeight",
-    "303": "CSSPropertyOrder",
-    "304": "CSSPropertyWebkitPaddingAfter",
-    "305": "CSSPropertyWebkitPaddingBefore",
-    "306": "CSSPropertyWebkitPaddingEnd",
-    "307": "CSSPropertyWebkitPaddingStart",
-    "308": "CSSPropertyAliasWebkitPerspective",
-    "309": "CSSPropertyAliasWebkitPerspectiveOrigin",
-    "310": "CSSPropertyWebkitPerspectiveOriginX",
-    "311": "CSSPropertyWebkitPerspectiveOriginY",
-    "312": "CSSPropertyWebkitPrintColorAdjust",
-    "313": "CSSPropertyWebkitRtlOrdering",
-    "314": "CSSPropertyWebkitRubyPosition",
-    "315": "CSSPropertyWebkitTextCombine",
-    "316": "CSSPropertyWebkitTextDecorationsInEffect",
-    "317": "CSSPropertyWebkitTextEmphasis",
-    "318": "CSSPropertyWebkitTextEmphasisColor",
-    "319": "CSSPropertyWebkitTextEmphasisPosition",
-    "320": "CSSPropertyWebkitTextEmphasisStyle",
-    "321": "CSSPropertyWebkitTextFillColor",
-    "322": "CSSPropertyWebkitTextSecurity",
-    "323": "CSSPropertyWebkitTextStroke",
-    "324": "CSSPropertyWebkitTextStrokeColor",
-    "325": "CSSPropertyWebkitTextStrokeWidth",
-    "326": "CSSPropertyAliasWebkitTransform",
-    "327": "CSSPropertyAliasWebkitTransformOrigin",
-    "328": "CSSPropertyWebkitTransformOriginX",
-    "329": "CSSPropertyWebkitTransformOriginY",
-    "330": "CSSPropertyWebkitTransformOriginZ",
-    "331": "CSSPropertyAliasWebkitTransformStyle",
-    "332": "CSSPropertyAliasWebkitTransition",
-    "333": "CSSPropertyAliasWebkitTransitionDelay",
-    "334": "CSSPropertyAliasWebkitTransitionDuration",
-    "335": "CSSPropertyAliasWebkitTransitionProperty",
-    "336": "CSSPropertyAliasWebkitTransitionTimingFunction",
-    "337": "CSSPropertyWebkitUserDrag",
-    "338": "CSSPropertyWebkitUserModify",
-    "339": "CSSPropertyAliasWebkitUserSelect",
-    "340": "CSSPropertyWebkitFlowInto",
-    "341": "CSSPropertyWebkitFlowFrom",
-    "342": "CSSPropertyWebkitRegionFragment",
-    "343": "CSSPropertyWebkitRegionBreakAfter",
-    "344": "CSSPropertyWebkitRegionBreakBefore",
-    "345": "CSSPropertyWebkitRegionBreakInside",
-    "346": "CSSPropertyShapeInside",
-    "347": "CSSPropertyShapeOutside",
-    "348": "CSSPropertyShapeMargin",
-    "349": "CSSPropertyShapePadding",
-    "350": "CSSPropertyWebkitWrapFlow",
-    "351": "CSSPropertyWebkitWrapThrough",
-    "355": "CSSPropertyClipPath",
-    "356": "CSSPropertyClipRule",
-    "357": "CSSPropertyMask",
-    "359": "CSSPropertyFilter",
-    "360": "CSSPropertyFloodColor",
-    "361": "CSSPropertyFloodOpacity",
-    "362": "CSSPropertyLightingColor",
-    "363": "CSSPropertyStopColor",
-    "364": "CSSPropertyStopOpacity",
-    "365": "CSSPropertyColorInterpolation",
-    "366": "CSSPropertyColorInterpolationFilters",
-    "367": "CSSPropertyColorProfile",
-    "368": "CSSPropertyColorRendering",
-    "369": "CSSPropertyFill",
-    "370": "CSSPropertyFillOpacity",
-    "371": "CSSPropertyFillRule",
-    "372": "CSSPropertyMarker",
-    "373": "CSSPropertyMarkerEnd",
-    "374": "CSSPropertyMarkerMid",
-    "375": "CSSPropertyMarkerStart",
-    "376": "CSSPropertyMaskType",
-    "377": "CSSPropertyShapeRendering",
-    "378": "CSSPropertyStroke",
-    "379": "CSSPropertyStrokeDasharray",
-    "380": "CSSPropertyStrokeDashoffset",
-    "381": "CSSPropertyStrokeLinecap",
-    "382": "CSSPropertyStrokeLinejoin",
-    "383": "CSSPropertyStrokeMiterlimit",
-    "384": "CSSPropertyStrokeOpacity",
-    "385": "CSSPropertyStrokeWidth",
-    "386": "CSSPropertyAlignmentBaseline",
-    "387": "CSSPropertyBaselineShift",
-    "388": "CSSPropertyDominantBaseline",
-    "392": "CSSPropertyTextAnchor",
-    "393": "CSSPropertyVectorEffect",
-    "394": "CSSPropertyWritingMode",
-    "399": "CSSPropertyWebkitBlendMode",
-    "400": "CSSPropertyWebkitBackgroundBlendMode",
-    "401": "CSSPropertyTextDecorationLine",
-    "402": "CSSPropertyTextDecorationStyle",
-    "403": "CSSPropertyTextDecorationColor",
-    "404": "CSSPropertyTextAlignLast",
-    "405": "CSSPropertyTextUnderlinePosition",
-    "406": "CSSPropertyMaxZoom",
-    "407": "CSSPropertyMinZoom",
-    "408": "CSSPropertyOrientation",
-    "409": "CSSPropertyUserZoom",
-    "412": "CSSPropertyWebkitAppRegion",
-    "413": "CSSPropertyAliasWebkitFilter",
-    "414": "CSSPropertyWebkitBoxDecorationBreak",
-    "415": "CSSPropertyWebkitTapHighlightColor",
-    "416": "CSSPropertyBufferedRendering",
-    "417": "CSSPropertyGridAutoRows",
-    "418": "CSSPropertyGridAutoColumns",
-    "419": "CSSPropertyBackgroundBlendMode",
-    "420": "CSSPropertyMixBlendMode",
-    "421": "CSSPropertyTouchAction",
-    "422": "CSSPropertyGridArea",
-    "423": "CSSPropertyGridTemplateAreas",
-    "424": "CSSPropertyAnimation",
-    "425": "CSSPropertyAnimationDelay",
-    "426": "CSSPropertyAnimationDirection",
-    "427": "CSSPropertyAnimationDuration",
-    "428": "CSSPropertyAnimationFillMode",
-    "429": "CSSPropertyAnimationIterationCount",
-    "430": "CSSPropertyAnimationName",
-    "431": "CSSPropertyAnimationPlayState",
-    "432": "CSSPropertyAnimationTimingFunction",
-    "433": "CSSPropertyObjectFit",
-    "434": "CSSPropertyPaintOrder",
-    "435": "CSSPropertyMaskSourceType",
-    "436": "CSSPropertyIsolation",
-    "437": "CSSPropertyObjectPosition",
-    "438": "CSSPropertyInternalCallback",
-    "439": "CSSPropertyShapeImageThreshold",
-    "440": "CSSPropertyColumnFill",
-    "441": "CSSPropertyTextJustify",
-    "443": "CSSPropertyJustifySelf",
-    "444": "CSSPropertyScrollBehavior",
-    "445": "CSSPropertyWillChange",
-    "446": "CSSPropertyTransform",
-    "447": "CSSPropertyTransformOrigin",
-    "448": "CSSPropertyTransformStyle",
-    "449": "CSSPropertyPerspective",
-    "450": "CSSPropertyPerspectiveOrigin",
-    "451": "CSSPropertyBackfaceVisibility",
-    "452": "CSSPropertyGridTemplate",
-    "453": "CSSPropertyGrid",
-    "454": "CSSPropertyAll",
-    "455": "CSSPropertyJustifyItems",
-    "457": "CSSPropertyAliasMotionPath",
-    "458": "CSSPropertyAliasMotionOffset",
-    "459": "CSSPropertyAliasMotionRotation",
-    "460": "CSSPropertyMotion",
-    "461": "CSSPropertyX",
-    "462": "CSSPropertyY",
-    "463": "CSSPropertyRx",
-    "464": "CSSPropertyRy",
-    "465": "CSSPropertyFontSizeAdjust",
-    "466": "CSSPropertyCx",
-    "467": "CSSPropertyCy",
-    "468": "CSSPropertyR",
-    "469": "CSSPropertyAliasEpubCaptionSide",
-    "470": "CSSPropertyAliasEpubTextCombine",
-    "471": "CSSPropertyAliasEpubTextEmphasis",
-    "472": "CSSPropertyAliasEpubTextEmphasisColor",
-    "473": "CSSPropertyAliasEpubTextEmphasisStyle",
-    "474": "CSSPropertyAliasEpubTextOrientation",
-    "475": "CSSPropertyAliasEpubTextTransform",
-    "476": "CSSPropertyAliasEpubWordBreak",
-    "477": "CSSPropertyAliasEpubWritingMode",
-    "478": "CSSPropertyAliasWebkitAlignContent",
-    "479": "CSSPropertyAliasWebkitAlignItems",
-    "480": "CSSPropertyAliasWebkitAlignSelf",
-    "481": "CSSPropertyAliasWebkitBorderBottomLeftRadius",
-    "482": "CSSPropertyAliasWebkitBorderBottomRightRadius",
-    "483": "CSSPropertyAliasWebkitBorderTopLeftRadius",
-    "484": "CSSPropertyAliasWebkitBorderTopRightRadius",
-    "485": "CSSPropertyAliasWebkitBoxSizing",
-    "486": "CSSPropertyAliasWebkitFlex",
-    "487": "CSSPropertyAliasWebkitFlexBasis",
-    "488": "CSSPropertyAliasWebkitFlexDirection",
-    "489": "CSSPropertyAliasWebkitFlexFlow",
-    "490": "CSSPropertyAliasWebkitFlexGrow",
-    "491": "CSSPropertyAliasWebkitFlexShrink",
-    "492": "CSSPropertyAliasWebkitFlexWrap",
-    "493": "CSSPropertyAliasWebkitJustifyContent",
-    "494": "CSSPropertyAliasWebkitOpacity",
-    "495": "CSSPropertyAliasWebkitOrder",
-    "496": "CSSPropertyAliasWebkitShapeImageThreshold",
-    "497": "CSSPropertyAliasWebkitShapeMargin",
-    "498": "CSSPropertyAliasWebkitShapeOutside",
-    "499": "CSSPropertyScrollSnapType",
-    "500": "CSSPropertyScrollSnapPointsX",
-    "501": "CSSPropertyScrollSnapPointsY",
-    "502": "CSSPropertyScrollSnapCoordinate",
-    "503": "CSSPropertyScrollSnapDestination",
-    "504": "CSSPropertyTranslate",
-    "505": "CSSPropertyRotate",
-    "506": "CSSPropertyScale",
-    "507": "CSSPropertyImageOrientation",
-    "508": "CSSPropertyBackdropFilter",
-    "509": "CSSPropertyTextCombineUpright",
-    "510": "CSSPropertyTextOrientation",
-    "511": "CSSPropertyGridColumnGap",
-    "512": "CSSPropertyGridRowGap",
-    "513": "CSSPropertyGridGap",
-    "514": "CSSPropertyFontFeatureSettings",
-    "515": "CSSPropertyVariable",
-    "516": "CSSPropertyFontDisplay",
-    "517": "CSSPropertyContain",
-    "518": "CSSPropertyD",
-    "519": "CSSPropertySnapHeight",
-    "520": "CSSPropertyBreakAfter",
-    "521": "CSSPropertyBreakBefore",
-    "522": "CSSPropertyBreakInside",
-    "523": "CSSPropertyColumnCount",
-    "524": "CSSPropertyColumnGap",
-    "525": "CSSPropertyColumnRule",
-    "526": "CSSPropertyColumnRuleColor",
-    "527": "CSSPropertyColumnRuleStyle",
-    "528": "CSSPropertyColumnRuleWidth",
-    "529": "CSSPropertyColumnSpan",
-    "530": "CSSPropertyColumnWidth",
-    "531": "CSSPropertyColumns",
-    "532": "CSSPropertyApplyAtRule",
-    "533": "CSSPropertyFontVariantCaps",
-    "534": "CSSPropertyHyphens",
-    "535": "CSSPropertyFontVariantNumeric",
-    "536": "CSSPropertyTextSizeAdjust",
-    "537": "CSSPropertyAliasWebkitTextSizeAdjust",
-    "538": "CSSPropertyOverflowAnchor",
-    "539": "CSSPropertyUserSelect",
-    "540": "CSSPropertyOffsetDistance",
-    "541": "CSSPropertyOffsetPath",
-    "542": "CSSPropertyOffsetRotation",
-    "543": "CSSPropertyOffset",
-    "544": "CSSPropertyOffsetAnchor",
-    "545": "CSSPropertyOffsetPosition",
-    "546": "CSSPropertyTextDecorationSkip",
-    "547": "CSSPropertyCaretColor",
-    "548": "CSSPropertyOffsetRotate",
-    "549": "CSSPropertyFontVariationSettings",
-    "550": "CSSPropertyInlineSize",
-    "551": "CSSPropertyBlockSize",
-    "552": "CSSPropertyMinInlineSize",
-    "553": "CSSPropertyMinBlockSize",
-    "554": "CSSPropertyMaxInlineSize",
-    "555": "CSSPropertyMaxBlockSize",
-    "556": "CSSPropertyAliasLineBreak",
-    "557": "CSSPropertyPlaceContent",
-    "558": "CSSPropertyPlaceItems",
-    "559": "CSSPropertyTransformBox",
-    "560": "CSSPropertyPlaceSelf",
-    "561": "CSSPropertyScrollSnapAlign",
-    "562": "CSSPropertyScrollPadding",
-    "563": "CSSPropertyScrollPaddingTop",
-    "564": "CSSPropertyScrollPaddingRight",
-    "565": "CSSPropertyScrollPaddingBottom",
-    "566": "CSSPropertyScrollPaddingLeft",
-    "567": "CSSPropertyScrollPaddingBlock",
-    "568": "CSSPropertyScrollPaddingBlockStart",
-    "569": "CSSPropertyScrollPaddingBlockEnd",
-    "570": "CSSPropertyScrollPaddingInline",
-    "571": "CSSPropertyScrollPaddingInlineStart",
-    "572": "CSSPropertyScrollPaddingInlineEnd",
-    "573": "CSSPropertyScrollSnapMargin",
-    "574": "CSSPropertyScrollSnapMarginTop",
-    "575": "CSSPropertyScrollSnapMarginRight",
-    "576": "CSSPropertyScrollSnapMarginBottom",
-    "577": "CSSPropertyScrollSnapMarginLeft",
-    "578": "CSSPropertyScrollSnapMarginBlock",
-    "579": "CSSPropertyScrollSnapMarginBlockStart",
-    "580": "CSSPropertyScrollSnapMarginBlockEnd",
-    "581": "CSSPropertyScrollSnapMarginInline",
-    "582": "CSSPropertyScrollSnapMarginInlineStart",
-    "583": "CSSPropertyScrollSnapMarginInlineEnd",
-    "584": "CSSPropertyScrollSnapStop",
-    "585": "CSSPropertyScrollBoundaryBehavior",
-    "586": "CSSPropertyScrollBoundaryBehaviorX",
-    "587": "CSSPropertyScrollBoundaryBehaviorY",
-    "588": "CSSPropertyFontVariantEastAsian",
-    "589": "CSSPropertyTextDecorationSkipInk",
-    "590": "CSSPropertyScrollCustomization",
-    "591": "CSSPropertyRowGap",
-    "592": "CSSPropertyGap",
-    "593": "CSSPropertyViewportFit",
-    "594": "CSSPropertyMarginBlockStart",
-    "595": "CSSPropertyMarginBlockEnd",
-    "596": "CSSPropertyMarginInlineStart",
-    "597": "CSSPropertyMarginInlineEnd",
-    "598": "CSSPropertyPaddingBlockStart",
-    "599": "CSSPropertyPaddingBlockEnd",
-    "600": "CSSPropertyPaddingInlineStart",
-    "601": "CSSPropertyPaddingInlineEnd",
-    "602": "CSSPropertyBorderBlockEndColor",
-    "603": "CSSPropertyBorderBlockEndStyle",
-    "604": "CSSPropertyBorderBlockEndWidth",
-    "605": "CSSPropertyBorderBlockStartColor",
-    "606": "CSSPropertyBorderBlockStartStyle",
-    "607": "CSSPropertyBorderBlockStartWidth",
-    "608": "CSSPropertyBorderInlineEndColor",
-    "609": "CSSPropertyBorderInlineEndStyle",
-    "610": "CSSPropertyBorderInlineEndWidth",
-    "611": "CSSPropertyBorderInlineStartColor",
-    "612": "CSSPropertyBorderInlineStartStyle",
-    "613": "CSSPropertyBorderInlineStartWidth",
-    "614": "CSSPropertyBorderBlockStart",
-    "615": "CSSPropertyBorderBlockEnd",
-    "616": "CSSPropertyBorderInlineStart",
-    "617": "CSSPropertyBorderInlineEnd",
-    "618": "CSSPropertyMarginBlock",
-    "619": "CSSPropertyMarginInline",
-    "620": "CSSPropertyPaddingBlock",
-    "621": "CSSPropertyPaddingInline",
-    "622": "CSSPropertyBorderBlockColor",
-    "623": "CSSPropertyBorderBlockStyle",
-    "624": "CSSPropertyBorderBlockWidth",
-    "625": "CSSPropertyBorderInlineColor",
-    "626": "CSSPropertyBorderInlineStyle",
-    "627": "CSSPropertyBorderInlineWidth",
-    "628": "CSSPropertyBorderBlock",
-    "629": "CSSPropertyBorderInline",
-    "630": "CSSPropertyInsetBlockStart",
-    "631": "CSSPropertyInsetBlockEnd",
-    "632": "CSSPropertyInsetBlock",
-    "633": "CSSPropertyInsetInlineStart",
-    "634": "CSSPropertyInsetInlineEnd",
-    "635": "CSSPropertyInsetInline",
-    "636": "CSSPropertyInset",
-    "637": "CSSPropertyColorScheme",
-    "638": "CSSPropertyOverflowInline",
-    "639": "CSSPropertyOverflowBlock",
-    "640": "CSSPropertyForcedColorAdjust",
-    "641": "CSSPropertyInherits",
-    "642": "CSSPropertyInitialValue",
-    "643": "CSSPropertySyntax",
-    "644": "CSSPropertyOverscrollBehaviorInline",
-    "645": "CSSPropertyOverscrollBehaviorBlock",
-    "647": "CSSPropertyFontOpticalSizing",
-    "648": "CSSPropertyContainIntrinsicBlockSize",
-    "649": "CSSPropertyContainIntrinsicHeight",
-    "650": "CSSPropertyContainIntrinsicInlineSize",
-    "651": "CSSPropertyContainIntrinsicSize",
-    "652": "CSSPropertyContainIntrinsicWidth",
-    "654": "CSSPropertyOriginTrialTestProperty",
-    "656": "CSSPropertyMathStyle",
-    "657": "CSSPropertyAspectRatio",
-    "658": "CSSPropertyAppearance",
-    "660": "CSSPropertyRubyPosition",
-    "661": "CSSPropertyTextUnderlineOffset",
-    "662": "CSSPropertyContentVisibility",
-    "663": "CSSPropertyTextDecorationThickness",
-    "664": "CSSPropertyPageOrientation",
-    "665": "CSSPropertyAnimationTimeline",
-    "666": "CSSPropertyCounterSet",
-    "667": "CSSPropertySource",
-    "668": "CSSPropertyStart",
-    "669": "CSSPropertyEnd",
-    "670": "CSSPropertyTimeRange",
-    "671": "CSSPropertyScrollbarGutter",
-    "672": "CSSPropertyAscentOverride",
-    "673": "CSSPropertyDescentOverride",
-    "674": "CSSPropertyAdvanceOverride",
-    "675": "CSSPropertyLineGapOverride",
-    "676": "CSSPropertyMathShift",
-    "677": "CSSPropertyMathDepth",
-    "679": "CSSPropertyOverflowClipMargin",
-    "680": "CSSPropertyScrollbarWidth",
-    "681": "CSSPropertySystem",
-    "682": "CSSPropertyNegative",
-    "683": "CSSPropertyPrefix",
-    "684": "CSSPropertySuffix",
-    "685": "CSSPropertyRange",
-    "686": "CSSPropertyPad",
-    "687": "CSSPropertyFallback",
-    "688": "CSSPropertySymbols",
-    "689": "CSSPropertyAdditiveSymbols",
-    "690": "CSSPropertySpeakAs",
-    "691": "CSSPropertyBorderStartStartRadius",
-    "692": "CSSPropertyBorderStartEndRadius",
-    "693": "CSSPropertyBorderEndStartRadius",
-    "694": "CSSPropertyBorderEndEndRadius",
-    "695": "CSSPropertyAccentColor",
-    "696": "CSSPropertySizeAdjust",
-    "697": "CSSPropertyContainerName",
-    "698": "CSSPropertyContainerType",
-    "699": "CSSPropertyContainer"
-}
 
 if '__main__' == __name__:
     #import cProfile
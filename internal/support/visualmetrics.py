@@ -12,6 +12,7 @@ import gzip
 import json
 import logging
 import math
+import multiprocessing
 import os
 import platform
 import re
@@ -19,6 +20,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 if (sys.version_info >= (3, 0)):
     GZIP_TEXT = 'wt'
     GZIP_READ_TEXT = 'rt'
@@ -31,6 +34,10 @@ options = None
 client_viewport = None
 image_magick = {'convert': 'convert', 'compare': 'compare', 'mogrify': 'mogrify'}
 frame_cache = {}
+fast_compare = None
+decoded_frames = OrderedDict()
+decoded_frame_cache_enabled = True
+decoded_frame_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
 
 # #################################################################################################
 # Frame Extraction and de-duplication
@@ -431,7 +438,7 @@ def adjust_frame_times(directory):
                 new_time = frame_time - offset
                 dest = os.path.join(
                     directory, 'ms_{0:06d}.png'.format(new_time))
-                os.rename(frame, dest)
+                rename_frame(frame, dest)
 
 
 def find_first_frame(directory, white_file):
@@ -795,22 +802,10 @@ def is_color_frame(file, color_file):
                 int(width / 2), int(height / 5),
                 int(width / 4), height - int(height / 5) - 50))
             for crop in crops:
-                command = ('{0} "{1}" "(" "{2}" -crop {3} -resize 200x200! ")"'
-                           ' miff:- | {4} -metric AE - -fuzz 15% null:'
-                          ).format(image_magick['convert'], color_file, file, crop,
-                                   image_magick['compare'])
-                compare = subprocess.Popen(command, stderr=subprocess.PIPE, shell=True)
-                _, err = compare.communicate()
-                if (sys.version_info >= (3, 0)):
-                    try:
-                        err = err.decode('utf-8')
-                    except Exception:
-                        pass
-                if re.match('^[0-9]+$', err):
-                    different_pixels = int(err)
-                    if different_pixels < 100:
-                        match = True
-                        break
+                different_pixels = color_frame_differences(file, color_file, crop, width, height)
+                if different_pixels is not None and different_pixels < 100:
+                    match = True
+                    break
         except Exception:
             logging.exception('Error checking frame color')
     if file not in frame_cache:
@@ -819,41 +814,53 @@ def is_color_frame(file, color_file):
     return match
 
 
+def color_frame_differences(file, color_file, crop, width, height):
+    """Number of pixels in a cropped section of the frame (resized to 200x200)
+    that differ from the solid color image"""
+    if use_fast_compare():
+        return fast_count_differences(color_file, file, parse_crop(crop, width, height), 15)
+    command = ('{0} "{1}" "(" "{2}" -crop {3} -resize 200x200! ")"'
+               ' miff:- | {4} -metric AE - -fuzz 15% null:'
+              ).format(image_magick['convert'], color_file, file, crop,
+                       image_magick['compare'])
+    return image_magick_differences(command)
+
+
 def is_white_frame(file, white_file):
     white = False
     if os.path.isfile(white_file):
-        if options.viewport:
-            command = ('{0} "{1}" "(" "{2}" -resize 200x200! ")" miff:- | '
-                       '{3} -metric AE - -fuzz 10% null:').format(
-                           image_magick['convert'], white_file, file, image_magick['compare'])
-        else:
-            command = ('{0} "{1}" "(" "{2}" -gravity Center -crop 50%x33%+0+0 -resize 200x200! ")" miff:- | '
-                       '{3} -metric AE - -fuzz 10% null:').format(
-                           image_magick['convert'], white_file, file, image_magick['compare'])
-        if client_viewport is not None:
-            crop = '{0:d}x{1:d}+{2:d}+{3:d}'.format(
-                client_viewport['width'],
-                client_viewport['height'],
-                client_viewport['x'],
-                client_viewport['y'])
-            command = ('{0} "{1}" "(" "{2}" -crop {3} -resize 200x200! ")" miff:- | '
-                       '{4} -metric AE - -fuzz 10% null:').format(
-                           image_magick['convert'], white_file, file, crop, image_magick['compare'])
-        compare = subprocess.Popen(command, stderr=subprocess.PIPE, shell=True)
-        _, err = compare.communicate()
-        if (sys.version_info >= (3, 0)):
-            try:
-                err = err.decode('utf-8')
-            except Exception:
-                pass
-        if re.match('^[0-9]+$', err):
-            different_pixels = int(err)
-            if different_pixels < 500:
-                white = True
+        different_pixels = white_frame_differences(file, white_file)
+        if different_pixels is not None and different_pixels < 500:
+            white = True
 
     return white
 
 
+def white_frame_differences(file, white_file):
+    """Number of pixels in the middle of the frame (resized to 200x200) that
+    are not white"""
+    if use_fast_compare():
+        return fast_white_frame_differences(file, white_file)
+    if options.viewport:
+        command = ('{0} "{1}" "(" "{2}" -resize 200x200! ")" miff:- | '
+                   '{3} -metric AE - -fuzz 10% null:').format(
+                       image_magick['convert'], white_file, file, image_magick['compare'])
+    else:
+        command = ('{0} "{1}" "(" "{2}" -gravity Center -crop 50%x33%+0+0 -resize 200x200! ")" miff:- | '
+                   '{3} -metric AE - -fuzz 10% null:').format(
+                       image_magick['convert'], white_file, file, image_magick['compare'])
+    if client_viewport is not None:
+        crop = '{0:d}x{1:d}+{2:d}+{3:d}'.format(
+            client_viewport['width'],
+            client_viewport['height'],
+            client_viewport['x'],
+            client_viewport['y'])
+        command = ('{0} "{1}" "(" "{2}" -crop {3} -resize 200x200! ")" miff:- | '
+                   '{4} -metric AE - -fuzz 10% null:').format(
+                       image_magick['convert'], white_file, file, crop, image_magick['compare'])
+    return image_magick_differences(command)
+
+
 def colors_are_similar(a, b, threshold=15):
     similar = True
     sum = 0
@@ -870,7 +877,14 @@ def colors_are_similar(a, b, threshold=15):
 
 def frames_match(image1, image2, fuzz_percent,
                  max_differences, crop_region, mask_rect):
-    match = False
+    different_pixels = frame_differences(image1, image2, fuzz_percent, crop_region, mask_rect)
+    return different_pixels is not None and different_pixels <= max_differences
+
+
+def frame_differences(image1, image2, fuzz_percent, crop_region, mask_rect):
+    """Number of pixels that differ between two frames"""
+    if use_fast_compare():
+        return fast_frame_differences(image1, image2, fuzz_percent, crop_region, mask_rect)
     fuzz = ''
     if fuzz_percent > 0:
         fuzz = '-fuzz {0:d}% '.format(fuzz_percent)
@@ -889,6 +903,13 @@ def frames_match(image1, image2, fuzz_percent,
         image_magick['convert'], img1, img2, crop, image_magick['compare'], fuzz)
     if platform.system() != 'Windows':
         command = command.replace('(', '\\(').replace(')', '\\)')
+    return image_magick_differences(command)
+
+
+def image_magick_differences(command):
+    """Run a convert | compare -metric AE command and return the number of
+    different pixels (None if the images could not be compared)"""
+    different_pixels = None
     compare = subprocess.Popen(command, stderr=subprocess.PIPE, shell=True)
     _, err = compare.communicate()
     if (sys.version_info >= (3, 0)):
@@ -898,14 +919,274 @@ def frames_match(image1, image2, fuzz_percent,
             pass
     if re.match('^[0-9]+$', err):
         different_pixels = int(err)
-        if different_pixels <= max_differences:
-            match = True
     else:
-        logging.debug(
-            'Unexpected compare result: out: "{0}", err: "{1}"'.format(
-                out, err))
+        logging.debug('Unexpected compare result: "{0}"'.format(err))
+    return different_pixels
 
-    return match
+
+# #################################################################################################
+# Decoded frame cache
+# #################################################################################################
+
+def frame_cache_limit():
+    """Maximum size of the decoded frames to keep in memory (in bytes). Only the
+    in-process comparisons (--fastcompare) decode the same frames repeatedly."""
+    if not decoded_frame_cache_enabled or not use_fast_compare():
+        return 0
+    megabytes = 256
+    if options is not None:
+        megabytes = options.framecache
+    return max(megabytes, 0) * 1024 * 1024
+
+
+def load_frame(file, cache=True):
+    """Decode an image into a read-only array of 8-bit RGB pixels (rows x columns x 3).
+    Decoded frames are kept in a LRU cache keyed by path and validated against the
+    modification time so frames modified in place are decoded again. cache=False
+    is for the last use of a frame: a cached copy is used and released and a newly
+    decoded frame is not added."""
+    import numpy
+    from PIL import Image
+    global decoded_frames
+    path = os.path.realpath(file)
+    stat = os.stat(path)
+    version = (stat.st_mtime, stat.st_size)
+    entry = decoded_frames.pop(path, None)
+    if entry is not None:
+        if entry[0] == version:
+            decoded_frame_stats['hits'] += 1
+            if cache:
+                decoded_frames[path] = entry
+            else:
+                decoded_frame_stats['bytes'] -= entry[1].nbytes
+            return entry[1]
+        decoded_frame_stats['bytes'] -= entry[1].nbytes
+    decoded_frame_stats['misses'] += 1
+    with Image.open(path) as img:
+        pixels = numpy.array(img.convert('RGB'))
+    pixels.setflags(write=False)
+    limit = frame_cache_limit() if cache else 0
+    if pixels.nbytes <= limit:
+        decoded_frames[path] = (version, pixels)
+        decoded_frame_stats['bytes'] += pixels.nbytes
+        while decoded_frame_stats['bytes'] > limit:
+            _, evicted = decoded_frames.popitem(last=False)
+            decoded_frame_stats['bytes'] -= evicted[1].nbytes
+            decoded_frame_stats['evictions'] += 1
+    return pixels
+
+
+def disable_frame_cache():
+    """Pool worker initializer. The workers decode each frame once so caching
+    would only grow every worker by up to --framecache of memory."""
+    global decoded_frame_cache_enabled
+    decoded_frame_cache_enabled = False
+
+
+def rename_frame(src, dest):
+    """Rename a frame, keeping its decoded pixels in the cache"""
+    os.rename(src, dest)
+    entry = decoded_frames.pop(os.path.realpath(src), None)
+    if entry is not None:
+        dest = os.path.realpath(dest)
+        previous = decoded_frames.pop(dest, None)
+        if previous is not None:
+            decoded_frame_stats['bytes'] -= previous[1].nbytes
+        decoded_frames[dest] = entry
+
+
+def log_frame_cache_stats():
+    """Log how effective the decoded frame cache was"""
+    if decoded_frame_stats['hits'] or decoded_frame_stats['misses']:
+        logging.info('Decoded frame cache: %d hits, %d misses, %d evictions, %d frames (%0.1f MB) cached',
+                     decoded_frame_stats['hits'], decoded_frame_stats['misses'],
+                     decoded_frame_stats['evictions'], len(decoded_frames),
+                     decoded_frame_stats['bytes'] / (1024.0 * 1024.0))
+
+
+# #################################################################################################
+# In-process frame comparison (PIL + NumPy)
+# #################################################################################################
+
+# Lowest fuzz distance ImageMagick uses (MagickSQ1_2), any difference counts
+MIN_FUZZ = math.sqrt(0.5)
+# Scale from 8-bit channel values to ImageMagick's 16-bit quantum
+QUANTUM_SCALE = 257.0
+QUANTUM_RANGE = 65535.0
+
+
+def use_fast_compare():
+    """Compare frames in-process if requested and NumPy and PIL are available"""
+    global fast_compare
+    if fast_compare is None:
+        fast_compare = False
+        if options is not None and options.fastcompare:
+            try:
+                import numpy
+                from PIL import Image
+                fast_compare = True
+            except BaseException:
+                logging.warning('NumPy or PIL not available, comparing frames with ImageMagick')
+    return fast_compare
+
+
+def parse_crop(crop, width, height):
+    """Convert a WxH+X+Y crop geometry into a (left, top, right, bottom) box
+    clipped to the image the same way ImageMagick's -crop does"""
+    match = re.match(r'^(\d+)x(\d+)\+(-?\d+)\+(-?\d+)$', crop)
+    crop_width, crop_height, left, top = [int(value) for value in match.groups()]
+    right = min(left + crop_width, width)
+    bottom = min(top + crop_height, height)
+    left = max(left, 0)
+    top = max(top, 0)
+    return left, top, max(right, left), max(bottom, top)
+
+
+def center_crop(width, height, width_percent, height_percent):
+    """Box for ImageMagick's -gravity Center -crop W%xH%+0+0"""
+    crop_width = int(math.floor(width_percent * width / 100.0 + 0.5))
+    crop_height = int(math.floor(height_percent * height / 100.0 + 0.5))
+    left = max(width // 2 - crop_width // 2, 0)
+    top = max(height // 2 - crop_height // 2, 0)
+    return left, top, min(left + crop_width, width), min(top + crop_height, height)
+
+
+def resize_filter_weight(distance, enlarge):
+    """ImageMagick's default resize filters: Mitchell when enlarging, Lanczos otherwise"""
+    import numpy
+    distance = numpy.abs(distance)
+    if enlarge:
+        b = c = 1.0 / 3.0
+        near = ((12.0 - 9.0 * b - 6.0 * c) * distance ** 3 +
+                (-18.0 + 12.0 * b + 6.0 * c) * distance ** 2 + (6.0 - 2.0 * b)) / 6.0
+        far = ((-b - 6.0 * c) * distance ** 3 + (6.0 * b + 30.0 * c) * distance ** 2 +
+               (-12.0 * b - 48.0 * c) * distance + (8.0 * b + 24.0 * c)) / 6.0
+        return numpy.where(distance < 1.0, near, numpy.where(distance < 2.0, far, 0.0))
+    return numpy.where(distance < 3.0, numpy.sinc(distance) * numpy.sinc(distance / 3.0), 0.0)
+
+
+def resize_weights(src_size, dst_size, enlarge):
+    """Matrix of the contribution of each source pixel to each destination
+    pixel along one axis (ImageMagick's HorizontalFilter/VerticalFilter)"""
+    import numpy
+    factor = float(dst_size) / float(src_size)
+    scale = max(1.0 / factor, 1.0)
+    support = scale * (2.0 if enlarge else 3.0)
+    weights = numpy.zeros((dst_size, src_size))
+    for index in range(dst_size):
+        bisect = (index + 0.5) / factor + 1.0e-12
+        start = int(max(bisect - support + 0.5, 0.0))
+        stop = int(min(bisect + support + 0.5, float(src_size)))
+        contribution = resize_filter_weight(
+            (numpy.arange(start, stop) - bisect + 0.5) / scale, enlarge)
+        density = contribution.sum()
+        if density != 0.0 and density != 1.0:
+            contribution = contribution / density
+        weights[index, start:stop] = contribution
+    return weights
+
+
+def resize_frame(pixels, width, height):
+    """Resize 16-bit quantum pixels to exactly width x height the same way as
+    ImageMagick's -resize WxH!, including rounding the intermediate pass"""
+    import numpy
+    rows, columns = pixels.shape[:2]
+    if columns == width and rows == height:
+        return pixels
+    enlarge = float(width) / columns * float(height) / rows > 1.0
+    horizontal = resize_weights(columns, width, enlarge)
+    vertical = resize_weights(rows, height, enlarge)
+    quantize = lambda values: numpy.floor(numpy.clip(values, 0.0, QUANTUM_RANGE) + 0.5)
+
+    # Both passes are matrix products so they run through BLAS (einsum does not)
+    def resize_horizontal(values):
+        return quantize(numpy.matmul(horizontal, values))
+
+    def resize_vertical(values):
+        source_rows, source_columns, channels = values.shape
+        return quantize(numpy.dot(vertical, values.reshape(source_rows, source_columns * channels))
+                        .reshape(height, source_columns, channels))
+    if float(width) * (rows + height) > float(height) * (columns + width):
+        return resize_vertical(resize_horizontal(pixels))
+    return resize_horizontal(resize_vertical(pixels))
+
+
+def count_different_pixels(pixels1, pixels2, fuzz_percent, scale=1.0):
+    """Count the pixels where any channel differs by at least the fuzz distance,
+    the same as 'compare -metric AE -fuzz X%'. The pixel values are multiplied
+    by scale to get 16-bit quantum values."""
+    import numpy
+    if pixels1.shape != pixels2.shape:
+        return None
+    fuzz = max(fuzz_percent * (QUANTUM_RANGE + 1.0) / 100.0, MIN_FUZZ)
+    if pixels1.dtype == numpy.uint8:
+        delta = numpy.abs(pixels1.astype(numpy.int16) - pixels2.astype(numpy.int16))
+    else:
+        delta = numpy.abs(pixels1 - pixels2)
+    return int(numpy.count_nonzero((delta * scale >= fuzz).any(axis=2)))
+
+
+def fast_count_differences(reference_file, file, box, fuzz_percent):
+    """Compare a cropped region of a frame, resized to 200x200, against a
+    reference image (convert ref ( file -crop box -resize 200x200! ) | compare)"""
+    import numpy
+    reference = load_frame(reference_file).astype(numpy.float64) * QUANTUM_SCALE
+    pixels = load_frame(file)
+    if box is not None:
+        left, top, right, bottom = box
+        pixels = pixels[top:bottom, left:right]
+    if pixels.shape[0] == 0 or pixels.shape[1] == 0:
+        return None
+    pixels = resize_frame(pixels.astype(numpy.float64) * QUANTUM_SCALE, 200, 200)
+    return count_different_pixels(reference, pixels, fuzz_percent)
+
+
+def fast_white_frame_differences(file, white_file):
+    """In-process version of white_frame_differences"""
+    different_pixels = None
+    try:
+        box = None
+        if client_viewport is not None:
+            size = load_frame(file).shape
+            box = parse_crop('{0:d}x{1:d}+{2:d}+{3:d}'.format(
+                client_viewport['width'], client_viewport['height'],
+                client_viewport['x'], client_viewport['y']), size[1], size[0])
+        elif not options.viewport:
+            size = load_frame(file).shape
+            box = center_crop(size[1], size[0], 50, 33)
+        different_pixels = fast_count_differences(white_file, file, box, 10)
+    except Exception:
+        logging.exception('Error checking for a white frame')
+    return different_pixels
+
+
+def fast_frame_differences(image1, image2, fuzz_percent, crop_region, mask_rect):
+    """In-process version of frame_differences"""
+    different_pixels = None
+    try:
+        pixels1 = load_frame(image1)
+        pixels2 = load_frame(image2)
+        if pixels1.shape != pixels2.shape:
+            logging.debug('Frame sizes differ: %s, %s', image1, image2)
+            return None
+        if mask_rect is not None:
+            # Cover the masked area with white in both frames
+            pixels1 = pixels1.copy()
+            pixels2 = pixels2.copy()
+            top = max(mask_rect['y'], 0)
+            left = max(mask_rect['x'], 0)
+            bottom = max(mask_rect['y'] + mask_rect['height'], 0)
+            right = max(mask_rect['x'] + mask_rect['width'], 0)
+            pixels1[top:bottom, left:right] = 255
+            pixels2[top:bottom, left:right] = 255
+        if crop_region is not None:
+            left, top, right, bottom = parse_crop(crop_region, pixels1.shape[1], pixels1.shape[0])
+            pixels1 = pixels1[top:bottom, left:right]
+            pixels2 = pixels2[top:bottom, left:right]
+        different_pixels = count_different_pixels(pixels1, pixels2, fuzz_percent, QUANTUM_SCALE)
+    except Exception:
+        logging.exception('Error comparing frames')
+    return different_pixels
 
 
 def generate_orange_png(orange_file):
@@ -961,7 +1242,7 @@ def synchronize_to_timeline(directory, timeline_file):
                 if frame != dest:
                     if os.path.isfile(dest):
                         os.remove(dest)
-                    os.rename(frame, dest)
+                    rename_frame(frame, dest)
 
 
 def get_timeline_offset(timeline_file):
@@ -1090,17 +1371,32 @@ def calculate_histograms(directory, histograms_file, force):
                             'ms_*' +
                             extension)))
                 match = re.compile(r'ms_(?P<ms>[0-9]+)\.')
+                frame_times = []
                 for frame in frames:
                     m = re.search(match, frame)
                     if m is not None:
-                        frame_time = int(m.groupdict().get('ms'))
-                        histogram = calculate_image_histogram(frame)
+                        frame_times.append((int(m.groupdict().get('ms')), frame))
+                files = [frame for _, frame in frame_times]
+                jobs = min(job_count(), len(files))
+                if jobs > 1:
+                    # pool.map returns the results in frame order
+                    pool = multiprocessing.Pool(jobs, initializer=disable_frame_cache)
+                    try:
+                        frame_histograms = pool.map(calculate_image_histogram, files)
+                    finally:
+                        pool.close()
+                        pool.join()
+                else:
+                    frame_histograms = []
+                    for frame in files:
+                        frame_histograms.append(calculate_image_histogram(frame))
                         gc.collect()
-                        if histogram is not None:
-                            histograms.append(
-                                {'time': frame_time,
-                                 'file': os.path.basename(frame),
-                                 'histogram': histogram})
+                for (frame_time, frame), histogram in zip(frame_times, frame_histograms):
+                    if histogram is not None:
+                        histograms.append(
+                            {'time': frame_time,
+                             'file': os.path.basename(frame),
+                             'histogram': histogram})
                 if os.path.isfile(histograms_file):
                     os.remove(histograms_file)
                 f = gzip.open(histograms_file, GZIP_TEXT)
@@ -1117,6 +1413,27 @@ def calculate_histograms(directory, histograms_file, force):
 
 def calculate_image_histogram(file):
     logging.debug('Calculating histogram for ' + file)
+    try:
+        import numpy
+    except ImportError:
+        return calculate_image_histogram_colors(file)
+    try:
+        # This is the last pass over the frames so there is no point caching them
+        pixels = load_frame(file, cache=False)
+        # Don't include White pixels (with a tiny bit of slop for
+        # compression artifacts)
+        pixels = pixels[(pixels < 250).any(axis=2)]
+        histogram = {'r': numpy.bincount(pixels[:, 0], minlength=256).tolist(),
+                     'g': numpy.bincount(pixels[:, 1], minlength=256).tolist(),
+                     'b': numpy.bincount(pixels[:, 2], minlength=256).tolist()}
+    except Exception:
+        histogram = None
+        logging.exception('Error calculating histogram for ' + file)
+    return histogram
+
+
+def calculate_image_histogram_colors(file):
+    """Build the histogram from the image colors (used when NumPy is not available)"""
     from PIL import Image
     im = None
     try:
@@ -1177,11 +1494,22 @@ def convert_to_jpeg(directory, quality):
     logging.debug("Converting video frames to JPEG")
     directory = os.path.realpath(directory)
     pattern = os.path.join(directory, 'ms_*.png')
-    command = '{0} -format jpg -set colorspace sRGB -quality {1:d} "{2}"'.format(
-        image_magick['mogrify'], quality, pattern)
-    logging.debug(command)
-    subprocess.call(command, shell=True)
     files = sorted(glob.glob(pattern))
+    jobs = min(job_count(), len(files))
+    if jobs > 1:
+        # One mogrify per frame, the encoding runs in the mogrify processes
+        commands = ['{0} -format jpg -set colorspace sRGB -quality {1:d} "{2}"'.format(
+            image_magick['mogrify'], quality, file) for file in files]
+        pool = ThreadPool(jobs)
+        try:
+            pool.map(run_command, commands)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        command = '{0} -format jpg -set colorspace sRGB -quality {1:d} "{2}"'.format(
+            image_magick['mogrify'], quality, pattern)
+        run_command(command)
     match = re.compile(r'(?P<base>ms_[0-9]+\.)')
     for file in files:
         m = re.search(match, file)
@@ -1192,6 +1520,21 @@ def convert_to_jpeg(directory, quality):
     logging.debug("Done Converting video frames to JPEG")
 
 
+def job_count():
+    """Number of frames to process in parallel (--jobs, 0 for one per CPU)"""
+    jobs = 1
+    if options is not None:
+        jobs = options.jobs
+        if jobs <= 0:
+            jobs = multiprocessing.cpu_count()
+    return max(jobs, 1)
+
+
+def run_command(command):
+    logging.debug(command)
+    subprocess.call(command, shell=True)
+
+
 ##########################################################################
 #   Video rendering
 ##########################################################################
@@ -1394,12 +1737,27 @@ def load_histograms(histograms_file, start, end):
     return histograms
 
 
+# Below this many frames the batched NumPy progress is slower than doing each
+# frame on its own (see tests/benchmark_visualmetrics_progress.py)
+PROGRESS_BATCH_MIN = 8
+
+
 def calculate_visual_progress(histograms):
     progress = []
     first = histograms[0]['histogram']
     last = histograms[-1]['histogram']
-    for index, histogram in enumerate(histograms):
-        p = calculate_frame_progress(histogram['histogram'], first, last)
+    frame_progress = None
+    if len(histograms) >= PROGRESS_BATCH_MIN:
+        try:
+            import numpy
+            frame_progress = calculate_frames_progress(
+                [histogram['histogram'] for histogram in histograms], first, last)
+        except ImportError:
+            pass
+    if frame_progress is None:
+        frame_progress = [calculate_frame_progress(histogram['histogram'], first, last)
+                          for histogram in histograms]
+    for histogram, p in zip(histograms, frame_progress):
         file_name, ext = os.path.splitext(histogram['file'])
         progress.append({'time': histogram['time'],
                          'file': file_name,
@@ -1438,6 +1796,37 @@ def calculate_frame_progress(histogram, start, final):
     return math.floor(progress * 100)
 
 
+def calculate_frames_progress(histograms, start, final):
+    """Same as calculate_frame_progress for a list of histograms, matching all of the
+    frames and channels at once with NumPy (buckets are still matched in order)"""
+    import numpy
+    slop = 5  # allow for matching slight color variations
+    buckets = 256
+    channels = ['r', 'g', 'b']
+    frames = numpy.array([[histogram[channel] for channel in channels]
+                          for histogram in histograms], dtype=numpy.int64)
+    start = numpy.array([start[channel] for channel in channels], dtype=numpy.int64)
+    final = numpy.array([final[channel] for channel in channels], dtype=numpy.int64)
+    # frames x channels x buckets
+    available = numpy.abs(frames - start)
+    # The targets only depend on the first and last frames
+    targets = numpy.abs(final - start)
+    matched = numpy.zeros(frames.shape[:2], dtype=numpy.int64)
+    for i in numpy.flatnonzero(targets.any(axis=0)):
+        target = numpy.tile(targets[:, i], (len(histograms), 1))
+        for j in range(max(0, i - slop), min(buckets, i + slop)):
+            this_match = numpy.minimum(target, available[:, :, j])
+            available[:, :, j] -= this_match
+            matched += this_match
+            target -= this_match
+    total = int(targets.sum())
+    progress = []
+    for frame_matched in matched.sum(axis=1).tolist():
+        frame_progress = (float(frame_matched) / float(total)) if total else 1
+        progress.append(math.floor(frame_progress * 100))
+    return progress
+
+
 def find_visually_complete(progress):
     time = 0
     for p in progress:
@@ -1523,6 +1912,13 @@ def check_config():
         logging.critical('Pillow:  FAIL')
         ok = False
 
+    try:
+        import numpy
+
+        logging.critical('NumPy:   OK')
+    except BaseException:
+        logging.critical('NumPy:   FAIL (only needed for --fastcompare)')
+
     try:
         from ssim import compute_ssim # pylint: disable=import-error
 
@@ -1646,6 +2042,15 @@ def main():
     parser.add_argument('-j', '--json', action='store_true', default=False,
                         help="Set output format to JSON")
     parser.add_argument('--progress', help="Visual progress output file.")
+    parser.add_argument('--fastcompare', action='store_true', default=False,
+                        help="Compare frames in-process with PIL and NumPy instead of "
+                             "running ImageMagick for each comparison.")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Number of frames to process in parallel when calculating "
+                             "histograms and converting to JPEG (0 for one per CPU).")
+    parser.add_argument('--framecache', type=int, default=256,
+                        help="Memory to use for caching decoded frames between passes "
+                             "(in MB, defaults to 256, 0 to disable).")
 
     options = parser.parse_args()
 
@@ -1778,6 +2183,7 @@ def main():
     except Exception as e:
         logging.exception(e)
         ok = False
+    log_frame_cache_stats()
 
     # Clean up
     shutil.rmtree(temp_dir)
@@ -7,10 +7,12 @@
 import glob
 import logging
 import math
+import multiprocessing
 import os
 import re
 import subprocess
 import sys
+from multiprocessing.pool import ThreadPool
 
 VIDEO_SIZE = 400
 
@@ -34,11 +36,11 @@ class VideoProcessing(object):
                     'crop_pct' in self.task:
                 crop = '{0:d}%x{1:d}%+0+0'.format(self.task['crop_pct']['width'],
                                                   self.task['crop_pct']['height'])
+                commands = []
                 for path in sorted(glob.glob(os.path.join(self.video_path, 'ms_*.jpg'))):
-                    command = '{0} -define jpeg:dct-method=fast -crop {1} "{2}"'.format(
-                        self.job['image_magick']['mogrify'], crop, path)
-                    logging.debug(command)
-                    subprocess.call(command, shell=True)
+                    commands.append('{0} -define jpeg:dct-method=fast -crop {1} "{2}"'.format(
+                        self.job['image_magick']['mogrify'], crop, path))
+                self.run_commands(commands)
             # Make the initial screen shot the same size as the video
             logging.debug("Resizing initial video frame")
             from PIL import Image
@@ -74,6 +76,7 @@ class VideoProcessing(object):
                     else:
                         baseline = files[index]
             # Compress to the target quality and size
+            commands = []
             for path in sorted(glob.glob(os.path.join(self.video_path, 'ms_*.jpg'))):
                 thumb_size = VIDEO_SIZE
                 if 'thumbsize' in self.job:
@@ -83,11 +86,10 @@ class VideoProcessing(object):
                             thumb_size = size
                     except Exception:
                         pass
-                command = '{0} -define jpeg:dct-method=fast -resize {1:d}x{1:d} '\
+                commands.append('{0} -define jpeg:dct-method=fast -resize {1:d}x{1:d} '\
                     '-quality {2:d} "{3}"'.format(self.job['image_magick']['mogrify'],
-                                                  thumb_size, self.job['imageQuality'], path)
-                logging.debug(command)
-                subprocess.call(command, shell=True)
+                                                  thumb_size, self.job['imageQuality'], path))
+            self.run_commands(commands)
             # Run visualmetrics against them
             logging.debug("Processing video frames")
             if self.task['current_step'] == 1:
@@ -102,7 +104,10 @@ class VideoProcessing(object):
                 '_visual_progress.json.gz'
             visualmetrics = os.path.join(self.support_path, "visualmetrics.py")
             args = [sys.executable, visualmetrics, '-d', self.video_path,
-                    '--histogram', histograms, '--progress', progress_file]
+                    '--histogram', histograms, '--progress', progress_file,
+                    '--jobs', str(self.options.videojobs)]
+            if self.options.fastcompare:
+                args.append('--fastcompare')
             if 'renderVideo' in self.job and self.job['renderVideo']:
                 video_out = os.path.join(self.task['dir'], self.task['prefix']) + \
                     '_rendered_video.mp4'
@@ -118,6 +123,28 @@ class VideoProcessing(object):
                     pass
             subprocess.call(args)
 
+    def job_count(self):
+        """Number of frames to process in parallel (--videojobs, 0 for one per CPU)"""
+        jobs = self.options.videojobs
+        if jobs <= 0:
+            jobs = multiprocessing.cpu_count()
+        return max(jobs, 1)
+
+    def run_commands(self, commands):
+        """Run the per-frame image commands in parallel"""
+        if commands:
+            pool = ThreadPool(max(1, min(self.job_count(), len(commands))))
+            try:
+                pool.map(self.run_command, commands)
+            finally:
+                pool.close()
+                pool.join()
+
+    def run_command(self, command):
+        """Run a single image command"""
+        logging.debug(command)
+        subprocess.call(command, shell=True)
+
     def frames_match(self, image1, image2, crop_region, fuzz_percent, max_differences):
         """Compare video frames"""
         crop = ''
@@ -69,6 +69,7 @@ class WebPageTest(object):
         self.options = options
         self.last_test_id = None
         self.fps = options.fps
+        self.body_requests = options.bodyrequests
         self.test_run_count = 0
         self.log_formatter = logging.Formatter(fmt="%(asctime)s.%(msecs)03d - %(message)s",
                                                datefmt="%H:%M:%S")
@@ -514,6 +515,8 @@ class WebPageTest(object):
                     job['fvonly'] = 1
                 if 'fps' not in job:
                     job['fps'] = self.fps
+                if 'bodyRequests' not in job:
+                    job['bodyRequests'] = self.body_requests
                 if 'warmup' not in job:
                     job['warmup'] = 0
                 if 'wappalyzer' not in job:
@@ -0,0 +1,62 @@
+"""Time the frame comparisons in-process (--fastcompare) and with ImageMagick.
+
+Run directly: python tests/benchmark_visualmetrics_compare.py
+The ImageMagick timings are skipped when convert/compare are not installed.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from test_visualmetrics import build_frames, find_executable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'internal', 'support'))
+import visualmetrics  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def comparisons(frames, size):
+    """The comparisons the frame processing makes for each frame"""
+    width, height = size
+    render_crop = '{0:d}x{1:d}+0+15'.format(width - 26, height - 15 - 25)
+    color_crop = '{0:d}x{1:d}+{2:d}+{3:d}'.format(int(width / 2), int(height / 3),
+                                                  int(width / 4), int(height / 3))
+    return [
+        ('frame_differences', lambda name: visualmetrics.frame_differences(
+            frames['base'], frames[name], 10, render_crop, None)),
+        ('white_frame_differences', lambda name: visualmetrics.white_frame_differences(
+            frames[name], frames['white_ref'])),
+        ('color_frame_differences', lambda name: visualmetrics.color_frame_differences(
+            frames[name], frames['orange_ref'], color_crop, width, height))]
+
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        frames, size = build_frames(temp_dir)
+        names = sorted(name for name in frames if name.startswith('delta'))
+        visualmetrics.options = argparse.Namespace(fastcompare=True, viewport=False,
+                                                   framecache=256, jobs=1)
+        modes = [('fast', True)]
+        if find_executable('convert') and find_executable('compare'):
+            modes.append(('ImageMagick', False))
+        else:
+            print('ImageMagick is not installed, only timing the in-process comparisons')
+        for label, compare in comparisons(frames, size):
+            for mode, fast in modes:
+                visualmetrics.fast_compare = fast
+                visualmetrics.decoded_frames.clear()
+                visualmetrics.decoded_frame_stats['bytes'] = 0
+                start = time.time()
+                for name in names:
+                    compare(name)
+                elapsed = (time.time() - start) / len(names)
+                print('{0:>24s} {1:>12s}: {2:8.2f}ms per comparison'.format(label, mode,
+                                                                            elapsed * 1000.0))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Time the batched (NumPy) visual progress against the per-frame calculation.
+
+Run directly: python tests/benchmark_visualmetrics_progress.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'internal', 'support'))
+import visualmetrics  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def capture_histograms(rng, count):
+    """Histograms of a page that renders progressively from blank to complete"""
+    final = {}
+    for channel in ['r', 'g', 'b']:
+        final[channel] = [rng.randint(0, 5000) if rng.random() < 0.6 else 0 for _ in range(256)]
+    histograms = []
+    for index in range(count):
+        done = float(index) / max(count - 1, 1)
+        histogram = {}
+        for channel in final:
+            histogram[channel] = [int(value * done) + rng.randint(0, 3) for value in final[channel]]
+        histograms.append(histogram)
+    histograms[-1] = final
+    return histograms
+
+
+def main():
+    rng = random.Random(25)
+    for count in [2, 4, 8, 16, 50, 200, 1000]:
+        histograms = capture_histograms(rng, count)
+        start, final = histograms[0], histograms[-1]
+        begin = time.time()
+        expected = [visualmetrics.calculate_frame_progress(histogram, start, final)
+                    for histogram in histograms]
+        per_frame = time.time() - begin
+        begin = time.time()
+        actual = visualmetrics.calculate_frames_progress(histograms, start, final)
+        batched = time.time() - begin
+        print('{0:5d} frames: per-frame {1:8.1f}ms, batched {2:8.1f}ms{3}'.format(
+            count, per_frame * 1000.0, batched * 1000.0, '' if actual == expected else ' MISMATCH'))
+
+
+if __name__ == '__main__':
+    main()
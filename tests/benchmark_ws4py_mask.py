@@ -0,0 +1,28 @@
+"""Time the websocket frame masking against the per-octet loop.
+
+Run directly: python tests/benchmark_ws4py_mask.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ws4py.framing import Frame, OPCODE_BINARY  # noqa: E402 pylint: disable=wrong-import-position
+from test_ws4py_framing import reference_mask  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def main():
+    masking_key = os.urandom(4)
+    frame = Frame(opcode=OPCODE_BINARY, masking_key=masking_key, fin=1)
+    for size in [1024, 64 * 1024, 4 * 1024 * 1024]:
+        data = os.urandom(size)
+        number = max(1, (4 * 1024 * 1024) // size)
+        fast = min(timeit.repeat(lambda: frame.mask(data), number=number, repeat=3)) / number
+        slow = min(timeit.repeat(lambda: reference_mask(masking_key, data), number=1,
+                                 repeat=3))
+        print('{0:>8d} bytes: mask {1:9.3f}ms, per-octet loop {2:9.3f}ms ({3:.0f}x)'.format(
+            size, fast * 1000.0, slow * 1000.0, slow / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Tests for the devtools trace event handling"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from internal.devtools import DevToolsClient  # noqa: E402 pylint: disable=wrong-import-position
+
+
+class TestSplitTraceEvents(unittest.TestCase):
+    """Raw event text is only re-used when it can go straight into the
+    (ASCII-only) trace file"""
+    def setUp(self):
+        self.client = DevToolsClient('ws://127.0.0.1:1/devtools')
+
+    def split(self, events, **kwargs):
+        message = json.dumps({'method': 'Tracing.dataCollected', 'params': {'value': events}},
+                             **kwargs)
+        return self.client.split_trace_events(message)
+
+    def test_ascii_events(self):
+        events = [{'cat': 'devtools.timeline', 'name': 'Layout', 'ts': 1, 'args': {}},
+                  {'cat': 'v8', 'name': 'V8.Execute', 'ts': 2, 'args': {'data': [1, 2.5]}}]
+        trace_events = self.split(events, separators=(',', ':'))
+        self.assertEqual([trace_event for trace_event, _ in trace_events], events)
+        for trace_event, trace_json in trace_events:
+            self.assertIsNotNone(trace_json)
+            self.assertEqual(json.loads(trace_json), trace_event)
+
+    def test_non_ascii_events(self):
+        events = [{'cat': 'blink.user_timing', 'name': u'café \U0001f600', 'ts': 1},
+                  {'cat': 'devtools.timeline', 'name': 'Layout', 'ts': 2},
+                  {'cat': 'devtools.timeline', 'name': 'ParseHTML', 'ts': 3,
+                   'args': {'data': {'url': u'https://example.com/über'}}}]
+        trace_events = self.split(events, ensure_ascii=False)
+        self.assertEqual([trace_event for trace_event, _ in trace_events], events)
+        self.assertIsNone(trace_events[0][1])
+        self.assertEqual(json.loads(trace_events[1][1]), events[1])
+        self.assertIsNone(trace_events[2][1])
+        # Escaped non-ASCII text is already safe to re-use
+        trace_events = self.split(events)
+        for trace_event, trace_json in trace_events:
+            self.assertEqual(json.loads(trace_json), trace_event)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+"""Tests for the devtools log parser"""
+import copy
+import gzip
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'internal', 'support'))
+import devtools_parser  # noqa: E402 pylint: disable=wrong-import-position
+
+URLS = ['https://www.example.com/',
+        'https://www.example.com/app.js',
+        'https://www.example.com/style.css',
+        'https://cdn.example.com/logo.png',
+        'https://api.example.com/track']
+
+
+def build_devtools_events():
+    """Devtools events for a page with duplicate URLs, a mix of GET and POST
+    requests to the same URL and a redirect that re-uses the request ID"""
+    rng = random.Random(9)
+    events = [{'method': 'Page.frameNavigated', 'params': {'frame': {'id': 'F1'}}}]
+    timestamp = 1000.0
+    request_ids = []
+    for index in range(60):
+        request_id = 'R{0:d}'.format(index)
+        url = URLS[0] if index == 0 else rng.choice(URLS[1:])
+        method = 'POST' if url == URLS[4] and rng.random() < 0.5 else 'GET'
+        timestamp += 0.01
+        if index == 0:
+            # http:// -> https:// redirect for the base page
+            events.append({'method': 'Network.requestWillBeSent',
+                           'params': {'requestId': request_id, 'frameId': 'F1', 'timestamp': timestamp,
+                                      'type': 'Document',
+                                      'request': {'url': 'http://www.example.com/', 'method': 'GET',
+                                                  'headers': {'Accept': '*/*'}, 'initialPriority': 'VeryHigh'}}})
+            timestamp += 0.01
+            events.append({'method': 'Network.requestWillBeSent',
+                           'params': {'requestId': request_id, 'frameId': 'F1', 'timestamp': timestamp,
+                                      'type': 'Document',
+                                      'redirectResponse': {'url': 'http://www.example.com/', 'status': 301,
+                                                           'headers': {'location': URLS[0]},
+                                                           'fromDiskCache': False,
+                                                           'timing': {'requestTime': timestamp,
+                                                                      'sendStart': 0.5, 'sendEnd': 1.0,
+                                                                      'receiveHeadersEnd': 4.0}},
+                                      'request': {'url': url, 'method': 'GET',
+                                                  'headers': {'Accept': '*/*'}, 'initialPriority': 'VeryHigh'}}})
+        else:
+            events.append({'method': 'Network.requestWillBeSent',
+                           'params': {'requestId': request_id, 'frameId': 'F1', 'timestamp': timestamp,
+                                      'type': 'Other',
+                                      'request': {'url': url, 'method': method,
+                                                  'headers': {'Accept': '*/*'}, 'initialPriority': 'High'}}})
+        request_ids.append(request_id)
+    for index, request_id in enumerate(request_ids):
+        timestamp += 0.005
+        events.append({'method': 'Network.responseReceived',
+                       'params': {'requestId': request_id, 'timestamp': timestamp, 'type': 'Other',
+                                  'response': {'url': 'x', 'status': 200, 'fromDiskCache': False,
+                                               'headers': {'content-type': 'text/plain'},
+                                               'protocol': 'h2', 'connectionId': index % 4,
+                                               'timing': {'requestTime': timestamp, 'dnsStart': -1,
+                                                          'dnsEnd': -1, 'connectStart': -1,
+                                                          'connectEnd': -1, 'sslStart': -1, 'sslEnd': -1,
+                                                          'sendStart': 1.0, 'sendEnd': 1.5,
+                                                          'receiveHeadersEnd': 5.0}}}})
+        events.append({'method': 'Network.dataReceived',
+                       'params': {'requestId': request_id, 'timestamp': timestamp + 0.001,
+                                  'dataLength': 1000, 'encodedDataLength': 500}})
+        events.append({'method': 'Network.loadingFinished',
+                       'params': {'requestId': request_id, 'timestamp': timestamp + 0.002,
+                                  'encodedDataLength': 1500}})
+    events.append({'method': 'Page.loadEventFired', 'params': {'timestamp': timestamp + 1}})
+    return events
+
+
+def build_netlog():
+    """Netlog requests with several entries per URL, entries with and without
+    a method and entries that devtools did not see"""
+    rng = random.Random(10)
+    netlog = []
+    for index in range(90):
+        url = 'http://www.example.com/' if index == 0 else rng.choice(URLS + ['https://other.example.com/x'])
+        entry = {'url': url, 'start': 10.0 + index, 'first_byte': 20.5 + index, 'end': 30.25 + index,
+                 'priority': rng.choice(['HIGHEST', 'LOW', 'MEDIUM']), 'protocol': 'h2',
+                 'socket': index % 5, 'stream_id': index + 1, 'bytes_in': 1000 + index,
+                 'server_address': '192.0.2.{0:d}:443'.format(index % 3),
+                 'response_headers': [':status: 200', 'content-type: text/plain; charset=utf-8']}
+        if index % 3:
+            entry['method'] = 'POST' if rng.random() < 0.3 else 'GET'
+        if index % 13 == 5:
+            del entry['start']
+        netlog.append(entry)
+    return netlog
+
+
+class DevToolsParserTestCase(unittest.TestCase):
+    """Shared setup for the parser tests"""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.events = build_devtools_events()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_log(self, name, log_format):
+        """Write the events in one of the devtools log formats"""
+        path = os.path.join(self.temp_dir, name)
+        with gzip.open(path, 'wt') as f_out:
+            if log_format == 'jsonl':
+                for event in self.events:
+                    f_out.write(json.dumps(event) + '\n')
+            elif log_format == 'stream':
+                # The format DevTools.log_dev_tools_event writes
+                f_out.write('[{}')
+                for event in self.events:
+                    f_out.write(",\n" + json.dumps(event))
+                f_out.write("\n]")
+            else:
+                json.dump(self.events, f_out)
+        return path
+
+    def parse(self, devtools_file, **kwargs):
+        """Run the full parser and load the result"""
+        options = {'devtools': devtools_file,
+                   'out': os.path.join(self.temp_dir, os.path.basename(devtools_file) + '.out.json')}
+        options.update(kwargs)
+        devtools_parser.DevToolsParser(options).process()
+        with open(options['out']) as f_in:
+            return json.load(f_in)
+
+
+class TestDevToolsLogFormats(DevToolsParserTestCase):
+    """The compact (.jsonl) and streamed logs must parse exactly like the
+    single json array"""
+    def test_iterate_events(self):
+        for name, log_format in [('devtools.json.gz', 'array'),
+                                 ('stream_devtools.json.gz', 'stream'),
+                                 ('devtools.jsonl.gz', 'jsonl')]:
+            parser = devtools_parser.DevToolsParser({'devtools': self.write_log(name, log_format),
+                                                     'out': None})
+            self.assertEqual(list(parser.iterate_devtools_events()), self.events, log_format)
+
+    def test_same_results(self):
+        expected = self.parse(self.write_log('devtools.json.gz', 'array'))
+        self.assertEqual(len(expected['requests']), 61)
+        for name, log_format in [('stream_devtools.json.gz', 'stream'),
+                                 ('devtools.jsonl.gz', 'jsonl')]:
+            self.assertEqual(self.parse(self.write_log(name, log_format)), expected, log_format)
+
+
+
+def linear_netlog_matches(requests, netlog):
+    """The original matching: each request claims the first unclaimed netlog
+    entry (in netlog order) with the same URL and a compatible method"""
+    claimed = set()
+    matches = []
+    for request in requests:
+        for index, entry in enumerate(netlog):
+            if 'url' in entry and entry['url'] == request['full_url'] and \
+                    ('method' not in entry or 'method' not in request or
+                     entry['method'] == request['method']) and \
+                    'start' in entry and index not in claimed:
+                claimed.add(index)
+                matches.append((request['id'], entry['stream_id']))
+                break
+    unclaimed = [entry['stream_id'] for index, entry in enumerate(netlog)
+                 if index not in claimed and 'url' in entry and 'start' in entry]
+    return matches, unclaimed
+
+
+class TestNetlogMatching(DevToolsParserTestCase):
+    """The URL index must pair requests with the same netlog entries as
+    scanning the whole netlog for every request"""
+    def test_matches_linear_scan(self):
+        netlog = build_netlog()
+        netlog_file = os.path.join(self.temp_dir, 'netlog_requests.json')
+        with open(netlog_file, 'w') as f_out:
+            json.dump(netlog, f_out)
+        parser = devtools_parser.DevToolsParser({'devtools': self.write_log('devtools.json.gz', 'stream'),
+                                                 'netlog': netlog_file, 'out': None})
+        raw_requests, raw_page_data = parser.extract_net_requests()
+        parser.process_requests(raw_requests, raw_page_data)
+        expected, unclaimed = linear_netlog_matches(copy.deepcopy(parser.result['requests']), netlog)
+        # Make sure the fixture covers redirects, repeated URLs and methods
+        self.assertIn(('R0', 1), expected)
+        self.assertGreater(len(expected), len(URLS) * 2)
+        self.assertTrue(unclaimed)
+        parser.process_netlog_requests()
+        requests = parser.result['requests']
+        self.assertEqual(len(requests), len(expected) + len(unclaimed))
+        # The merged list is re-sorted by start time, with the netlog-only
+        # requests mixed in
+        matched_ids = set(request_id for request_id, _ in expected)
+        self.assertEqual(sorted((request['id'], request['http2_stream_id'])
+                                for request in requests if request['id'] in matched_ids),
+                         sorted(expected))
+        self.assertEqual(sorted(request['http2_stream_id']
+                                for request in requests if request['id'] not in matched_ids),
+                         sorted(unclaimed))
+        by_url = parser.get_requests_by_url()
+        self.assertEqual(sum(len(matches) for matches in by_url.values()), len(requests))
+        for url in by_url:
+            self.assertEqual(by_url[url], [request for request in requests if request['full_url'] == url])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+"""Tests for the Chrome trace parser"""
+import gzip
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'internal', 'support'))
+import trace_parser  # noqa: E402 pylint: disable=wrong-import-position
+
+OUTPUTS = ['WriteUserTiming', 'WriteCPUSlices', 'WriteScriptTimings', 'WriteFeatureUsage',
+           'WriteInteractive', 'WriteLongTasks', 'WriteNetlog', 'WriteTimelineRequests',
+           'WriteV8Stats']
+
+
+def build_trace_events():
+    """Trace events in the order Chrome writes them: slightly out of order
+    within chunks and with the metadata events (ts=0) at the end"""
+    rng = random.Random(12)
+    pid = 1
+    events = [{'cat': 'blink.user_timing,rail', 'name': 'navigationStart', 'pid': pid, 'tid': 5,
+               'ts': 1000, 'ph': 'R', 'args': {'frame': 'F1', 'data': {}}},
+              {'cat': 'devtools.timeline', 'name': 'ResourceSendRequest', 'pid': pid, 'tid': 5,
+               'ts': 1010, 'ph': 'I',
+               'args': {'data': {'url': 'https://www.example.com/', 'requestId': 'R0',
+                                 'priority': 'VeryHigh', 'frame': 'F1'}}}]
+    ts = 1100
+    for index in range(300):
+        tid = rng.choice([5, 5, 5, 6, 7])
+        duration = rng.choice([20, 200, 2000, 60000])
+        events.append({'cat': 'devtools.timeline', 'name': 'FunctionCall', 'pid': pid, 'tid': tid,
+                       'ts': ts, 'ph': 'X', 'dur': duration,
+                       'args': {'data': {'url': 'https://www.example.com/s{0:d}.js'.format(index % 7)}}})
+        events.append({'cat': 'devtools.timeline', 'name': 'Layout', 'pid': pid, 'tid': tid,
+                       'ts': ts + 1, 'ph': 'X', 'dur': max(1, duration // 3), 'args': {}})
+        if index % 10 == 0:
+            events.append({'cat': 'disabled-by-default-v8.runtime_stats', 'name': 'V8.Execute',
+                           'pid': pid, 'tid': tid, 'ts': ts + 2, 'ph': 'X', 'dur': 10,
+                           'args': {'runtime-call-stats': {'JS_Execution': [3, 400]}}})
+        if index % 25 == 0:
+            events.append({'cat': 'blink.feature_usage', 'name': 'FeatureFirstUsed', 'pid': pid,
+                           'tid': tid, 'ts': ts + 3, 'ph': 'I', 'args': {'feature': index}})
+        ts += duration + rng.randint(5, 500)
+    # shuffle within small windows like the chunks Chrome flushes
+    for index in range(0, len(events) - 8, 8):
+        if rng.random() < 0.5:
+            other = index + rng.randint(1, 7)
+            events[index], events[other] = events[other], events[index]
+    for tid in [7, 6, 5]:
+        events.append({'cat': '__metadata', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'ts': 0,
+                       'ph': 'M', 'args': {'name': 'CrRendererMain'}})
+    events.append({'cat': '__metadata', 'name': 'process_labels', 'pid': 2, 'tid': 1, 'ts': 0,
+                   'ph': 'M', 'args': {'labels': 'Subframe: https://frame.example.com/'}})
+    return events
+
+
+class TestTraceReorderWindow(unittest.TestCase):
+    """The streaming reorder window must produce the same outputs as the
+    buffered (sort everything) mode"""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.trace_file = os.path.join(self.temp_dir, 'trace.json.gz')
+        with gzip.open(self.trace_file, 'wt') as f:
+            for trace_event in build_trace_events():
+                f.write(json.dumps(trace_event) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def process(self, window):
+        """Process the trace and load all of the outputs"""
+        trace = trace_parser.Trace()
+        trace.Process(self.trace_file, window)
+        outputs = {}
+        for writer in OUTPUTS:
+            out_file = os.path.join(self.temp_dir, '{0}-{1}.json'.format(writer, window))
+            getattr(trace, writer)(out_file)
+            if os.path.isfile(out_file):
+                with open(out_file) as f:
+                    outputs[writer] = f.read()
+        return trace, outputs
+
+    def test_trailing_metadata(self):
+        buffered, expected = self.process(None)
+        self.assertEqual(buffered.cpu['main_threads'], ['1:7', '1:6', '1:5'])
+        self.assertEqual(buffered.cpu['subframes'], ['2'])
+        for window in [50, 10]:
+            streamed, outputs = self.process(window)
+            self.assertEqual(streamed.reorder_late, 0)
+            self.assertEqual(streamed.cpu['main_threads'], buffered.cpu['main_threads'])
+            self.assertEqual(streamed.cpu['subframes'], buffered.cpu['subframes'])
+            self.assertEqual(sorted(outputs.keys()), sorted(expected.keys()))
+            for writer in expected:
+                self.assertEqual(outputs[writer], expected[writer], writer)
+
+
+
+def build_long_event_trace():
+    """Nested timeline events long enough to span many CPU slices, with
+    overlapping events that push slices past 100%"""
+    rng = random.Random(13)
+    pid = 1
+    events = [{'cat': 'blink.user_timing,rail', 'name': 'navigationStart', 'pid': pid, 'tid': 5,
+               'ts': 1000, 'ph': 'R', 'args': {'frame': 'F1', 'data': {}}}]
+    ts = 2000
+    for _ in range(40):
+        tid = rng.choice([5, 5, 6])
+        duration = rng.choice([500, 30000, 400000, 2000000])
+        events.append({'cat': 'devtools.timeline', 'name': 'FunctionCall', 'pid': pid, 'tid': tid,
+                       'ts': ts, 'ph': 'X', 'dur': duration, 'args': {}})
+        child_ts = ts + rng.randint(0, duration // 4)
+        for name in ['Layout', 'Paint', 'EvaluateScript']:
+            child_duration = rng.randint(1, max(1, duration // 3))
+            events.append({'cat': 'devtools.timeline', 'name': name, 'pid': pid, 'tid': tid,
+                           'ts': child_ts, 'ph': 'X', 'dur': child_duration, 'args': {}})
+            child_ts += child_duration + rng.randint(0, 1000)
+        if rng.random() < 0.3:
+            # Overlaps the previous event on the same thread
+            events.append({'cat': 'devtools.timeline', 'name': 'ParseHTML', 'pid': pid, 'tid': tid,
+                           'ts': ts + duration // 2, 'ph': 'X', 'dur': duration, 'args': {}})
+        ts += duration + rng.randint(-duration // 2, 50000)
+    for tid in [5, 6]:
+        events.append({'cat': '__metadata', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'ts': 0,
+                       'ph': 'M', 'args': {'name': 'CrRendererMain'}})
+    return events
+
+
+@unittest.skipUnless(trace_parser.numpy is not None, 'NumPy is not installed')
+class TestTimelineSlices(unittest.TestCase):
+    """The numpy updates of long events must produce the same CPU slices as
+    the per-slice pure-Python path"""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.trace_file = os.path.join(self.temp_dir, 'trace.json.gz')
+        with gzip.open(self.trace_file, 'wt') as f:
+            for trace_event in build_long_event_trace():
+                f.write(json.dumps(trace_event) + '\n')
+        self.numpy = trace_parser.numpy
+
+    def tearDown(self):
+        trace_parser.numpy = self.numpy
+        shutil.rmtree(self.temp_dir)
+
+    def process(self, use_numpy):
+        """Process the trace and return the CPU slices and vectorized call count"""
+        trace_parser.numpy = self.numpy if use_numpy else None
+        trace = trace_parser.Trace()
+        calls = []
+        vectorized = trace.AdjustTimelineSlices
+
+        def count_calls(*args):
+            calls.append(args)
+            return vectorized(*args)
+        trace.AdjustTimelineSlices = count_calls
+        trace.Process(self.trace_file)
+        out_file = os.path.join(self.temp_dir, 'cpu-{0}.json'.format(use_numpy))
+        trace.WriteCPUSlices(out_file)
+        with open(out_file) as f:
+            return f.read(), len(calls)
+
+    def test_same_slices(self):
+        expected, python_calls = self.process(False)
+        actual, numpy_calls = self.process(True)
+        self.assertEqual(python_calls, 0)
+        self.assertGreater(numpy_calls, 10)
+        self.assertEqual(actual, expected)
+
+
+def netlog_event(name, source_id, phase, ts, source_type, params=None):
+    """A netlog trace event as Chrome reports it"""
+    args = {'source_type': source_type}
+    if params is not None:
+        args['params'] = params
+    return {'cat': 'netlog', 'name': name, 'id': hex(source_id), 'ph': phase, 'pid': 1, 'tid': 9,
+            'ts': ts, 'args': args}
+
+
+class TestNetlogHostIndexes(unittest.TestCase):
+    """The h2 session and DNS host indexes built during ingest must join the
+    same netlog entries as scanning all of them"""
+    def process(self, events):
+        trace = trace_parser.Trace()
+        for trace_event in events:
+            trace.ProcessTraceEvent(trace_event)
+        return trace, trace.post_process_netlog_events()
+
+    def test_h2_host_sessions(self):
+        headers = [':method: GET', ':scheme: https', ':path: /app.js']
+        events = []
+        # Sessions for another host (with the same stream and path) and a
+        # session for the right host that doesn't have the stream
+        for session_id, socket_id, host in [(0x10, 0x50, 'cdn.example.com:443'),
+                                            (0x11, 0x51, 'www.example.com:443'),
+                                            (0x12, 0x52, 'www.example.com:8443')]:
+            events.append(netlog_event('HTTP2_SESSION_INITIALIZED', session_id, 'n', 1000,
+                                       'HTTP2_SESSION',
+                                       {'source_dependency': {'id': socket_id, 'type': 'SOCKET'},
+                                        'host': host, 'protocol': 'h2'}))
+            if session_id != 0x11:
+                events.append(netlog_event('HTTP2_SESSION_SEND_HEADERS', session_id, 'n', 1100,
+                                           'HTTP2_SESSION',
+                                           {'stream_id': 3, 'headers': headers, 'weight': 220,
+                                            'exclusive': True, 'parent_stream_id': 0}))
+        events.append(netlog_event('REQUEST_ALIVE', 0x30, 'b', 1095, 'URL_REQUEST',
+                                   {'url': 'https://www.example.com/app.js', 'method': 'GET'}))
+        events.append(netlog_event('HTTP_TRANSACTION_HTTP2_SEND_REQUEST_HEADERS', 0x30, 'n', 1100,
+                                   'URL_REQUEST',
+                                   {'headers': headers, 'line': 'GET /app.js HTTP/2', 'stream_id': 3}))
+        trace, requests = self.process(events)
+        self.assertEqual(trace.netlog['h2_host_sessions'],
+                         {'cdn.example.com': [0x10], 'www.example.com': [0x11, 0x12]})
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0]['h2_session'], 0x12)
+        self.assertEqual(requests[0]['socket'], 0x52)
+
+    def test_dns_hosts(self):
+        events = [
+            # The first lookup only reports its host after the second one
+            netlog_event('HOST_RESOLVER_IMPL_ATTEMPT_STARTED', 0x20, 'n', 100, 'HOST_RESOLVER_IMPL_JOB'),
+            netlog_event('HOST_RESOLVER_IMPL_REQUEST', 0x21, 'b', 150, 'HOST_RESOLVER_IMPL_JOB',
+                         {'host': 'www.example.com:443'}),
+            netlog_event('HOST_RESOLVER_IMPL_REQUEST', 0x22, 'b', 160, 'HOST_RESOLVER_IMPL_JOB',
+                         {'host': 'cdn.example.com'}),
+            netlog_event('HOST_RESOLVER_IMPL_REQUEST', 0x20, 'b', 170, 'HOST_RESOLVER_IMPL_JOB',
+                         {'host': 'www.example.com:443'}),
+            netlog_event('HOST_RESOLVER_IMPL_ATTEMPT_FINISHED', 0x20, 'n', 200, 'HOST_RESOLVER_IMPL_JOB',
+                         {'address_list': ['192.0.2.1:443']}),
+            netlog_event('HOST_RESOLVER_IMPL_REQUEST', 0x21, 'e', 250, 'HOST_RESOLVER_IMPL_JOB',
+                         {'address_list': ['192.0.2.2:443']}),
+            netlog_event('HOST_RESOLVER_IMPL_REQUEST', 0x22, 'e', 230, 'HOST_RESOLVER_IMPL_JOB',
+                         {'address_list': ['192.0.2.3:443']}),
+            netlog_event('REQUEST_ALIVE', 0x30, 'b', 1000, 'URL_REQUEST',
+                         {'url': 'https://www.example.com/', 'method': 'GET'}),
+            netlog_event('REQUEST_ALIVE', 0x31, 'b', 1010, 'URL_REQUEST',
+                         {'url': 'https://cdn.example.com/logo.png', 'method': 'GET'}),
+            netlog_event('HTTP_TRANSACTION_SEND_REQUEST_HEADERS', 0x30, 'n', 1020, 'URL_REQUEST',
+                         {'headers': ['Host: www.example.com'], 'line': 'GET / HTTP/1.1'}),
+            netlog_event('HTTP_TRANSACTION_SEND_REQUEST_HEADERS', 0x31, 'n', 1030, 'URL_REQUEST',
+                         {'headers': ['Host: cdn.example.com'], 'line': 'GET /logo.png HTTP/1.1'})]
+        trace, requests = self.process(events)
+        self.assertEqual(trace.netlog['dns_hosts'],
+                         {'www.example.com': [0x21, 0x20], 'cdn.example.com': [0x22]})
+        # Both www lookups took 100us so the one that started first (in
+        # netlog order) wins the tie
+        dns_times = dict((request['url'], (int(round(request['dns_start'] * 1000 + trace.start_time)),
+                                           int(round(request['dns_end'] * 1000 + trace.start_time))))
+                         for request in requests)
+        self.assertEqual(dns_times, {'https://www.example.com/': (100, 200),
+                                     'https://cdn.example.com/logo.png': (160, 230)})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,409 @@
+"""Tests for the video frame analysis in visualmetrics"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'internal', 'support'))
+import visualmetrics  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def find_executable(name):
+    """Find an executable on the path"""
+    for path in os.environ.get('PATH', '').split(os.pathsep):
+        candidate = os.path.join(path, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+def has_numpy():
+    try:
+        import numpy  # noqa: F401 pylint: disable=unused-import
+        from PIL import Image  # noqa: F401 pylint: disable=unused-import
+        return True
+    except ImportError:
+        return False
+
+
+def build_frames(directory):
+    """Synthetic frames that exercise the comparisons the frame processing
+    makes. Returns the paths by name and the frame size."""
+    import numpy
+    from PIL import Image
+    rng = random.Random(21)
+    nprng = numpy.random.RandomState(21)
+    width, height = 643, 481
+    rows, columns = numpy.mgrid[0:height, 0:width]
+    base = numpy.full((height, width, 3), 255, numpy.uint8)
+    base[:, :, 0] = (columns * 255 // width).astype(numpy.uint8)
+    base[:, :, 1] = (rows * 255 // height).astype(numpy.uint8)
+    base[60:200, 40:400] = (30, 60, 200)
+    base[300:420, 350:600] = nprng.randint(0, 256, (120, 250, 3))
+    frames = {}
+
+    def save(name, pixels):
+        path = os.path.join(directory, name + '.png')
+        Image.fromarray(pixels).save(path)
+        frames[name] = path
+
+    save('base', base)
+    # Per-channel differences on either side of the 1%, 5%, 10% and 15%
+    # fuzz thresholds (2.55, 12.75, 25.5 and 38.25 in 8-bit values)
+    for delta in [1, 2, 3, 12, 13, 25, 26, 38, 39, 120]:
+        pixels = base.astype(numpy.int16)
+        for _ in range(400):
+            y = rng.randrange(height)
+            x = rng.randrange(width)
+            channel = rng.randrange(3)
+            pixels[y, x, channel] += delta if pixels[y, x, channel] < 128 else -delta
+        save('delta{0:d}'.format(delta), pixels.astype(numpy.uint8))
+    white = numpy.full((height, width, 3), 255, numpy.uint8)
+    save('white', white)
+    noisy_white = white.copy()
+    noisy_white[nprng.rand(height, width) < 0.2] = (235, 240, 228)
+    noisy_white[200:260, 250:330] = (20, 20, 20)
+    save('noisy_white', noisy_white)
+    orange = numpy.zeros((height, width, 3), numpy.uint8)
+    orange[:] = (222, 100, 13)
+    orange[nprng.rand(height, width) < 0.1] = (250, 130, 40)
+    save('orange', orange)
+    gray = numpy.full((height, width, 3), 128, numpy.uint8)
+    gray[100:150, 100:550] = (200, 200, 200)
+    save('gray', gray)
+    for name, generate in [('white_ref', visualmetrics.generate_white_png),
+                           ('orange_ref', visualmetrics.generate_orange_png),
+                           ('gray_ref', visualmetrics.generate_gray_png)]:
+        frames[name] = os.path.join(directory, name + '.png')
+        generate(frames[name])
+    return frames, (width, height)
+
+
+@unittest.skipUnless(find_executable('convert') and find_executable('compare'),
+                     'ImageMagick is not installed')
+@unittest.skipUnless(has_numpy(), 'NumPy and Pillow are not installed')
+class TestFastCompareParity(unittest.TestCase):
+    """The in-process comparisons (--fastcompare) must count the same
+    different pixels as 'compare -metric AE -fuzz' for the comparisons that
+    the frame processing makes. Comparisons without a resize must match
+    exactly. The 200x200 resizes can round differently from ImageMagick's
+    (which varies by version and quantum depth), so those only need to be
+    close."""
+    # Allowed difference in the counts of resized comparisons, as a fraction
+    # of the count and as a minimum number of pixels (out of 40,000)
+    RESIZE_TOLERANCE = 0.02
+    RESIZE_TOLERANCE_PIXELS = 20
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.frames, cls.size = build_frames(cls.temp_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        visualmetrics.options = argparse.Namespace(fastcompare=True, viewport=False,
+                                                   framecache=256, jobs=1)
+        visualmetrics.client_viewport = None
+        visualmetrics.fast_compare = None
+
+    def tearDown(self):
+        visualmetrics.options = None
+        visualmetrics.client_viewport = None
+        visualmetrics.fast_compare = None
+
+    def assert_same_counts(self, compare, resized=False):
+        """Run the comparison through both implementations"""
+        visualmetrics.fast_compare = False
+        expected = compare()
+        visualmetrics.fast_compare = True
+        self.assertTrue(visualmetrics.use_fast_compare())
+        actual = compare()
+        if not resized:
+            self.assertEqual(actual, expected)
+            return
+        self.assertEqual(len(actual), len(expected))
+        self.assertNotIn(None, expected)
+        for index, (count, expected_count) in enumerate(zip(actual, expected)):
+            tolerance = max(self.RESIZE_TOLERANCE_PIXELS, expected_count * self.RESIZE_TOLERANCE)
+            self.assertLessEqual(abs(count - expected_count), tolerance,
+                                 'comparison {0:d}: {1:d} != {2:d}'.format(index, count, expected_count))
+
+    def test_frame_differences(self):
+        width, height = self.size
+        # find_first_frame, find_render_start, eliminate_duplicate_frames and
+        # eliminate_similar_frames
+        first_frame_crop = '{0:d}x{1:d}+0+0'.format(width, int(height * 25 / 100.0))
+        render_crop = '{0:d}x{1:d}+0+15'.format(width - 26, height - 15 - 25)
+        mask = {'width': int(width * 0.1), 'height': int(height * 0.1)}
+        mask['x'] = int(width / 2 - mask['width'] / 2)
+        mask['y'] = int(height / 2 - mask['height'] / 2)
+        comparisons = [(5, first_frame_crop, None), (10, render_crop, mask),
+                       (10, render_crop, None), (1, None, None), (1, render_crop, None)]
+        names = sorted(name for name in self.frames if name.startswith('delta')) + ['white']
+
+        def compare():
+            counts = []
+            for fuzz, crop, mask_rect in comparisons:
+                for name in names:
+                    counts.append(visualmetrics.frame_differences(
+                        self.frames['base'], self.frames[name], fuzz, crop, mask_rect))
+            return counts
+        self.assert_same_counts(compare)
+
+    def test_white_frame_differences(self):
+        names = ['white', 'noisy_white', 'base', 'delta26']
+
+        def compare():
+            counts = []
+            for viewport in [False, True]:
+                visualmetrics.options.viewport = viewport
+                for name in names:
+                    counts.append(visualmetrics.white_frame_differences(
+                        self.frames[name], self.frames['white_ref']))
+            visualmetrics.client_viewport = {'x': 7, 'y': 31, 'width': 600, 'height': 420}
+            for name in names:
+                counts.append(visualmetrics.white_frame_differences(
+                    self.frames[name], self.frames['white_ref']))
+            visualmetrics.client_viewport = None
+            return counts
+        self.assert_same_counts(compare, resized=True)
+
+    def test_color_frame_differences(self):
+        width, height = self.size
+        crops = ['{0:d}x{1:d}+{2:d}+{3:d}'.format(int(width / 2), int(height / 3),
+                                                  int(width / 4), int(height / 3)),
+                 '{0:d}x{1:d}+{2:d}+{3:d}'.format(int(width / 2), int(height / 5),
+                                                  int(width / 4), 50),
+                 '{0:d}x{1:d}+{2:d}+{3:d}'.format(int(width / 2), int(height / 5),
+                                                  int(width / 4), height - int(height / 5) - 50)]
+
+        def compare():
+            counts = []
+            for reference in ['orange_ref', 'gray_ref']:
+                for name in ['orange', 'gray', 'base']:
+                    for crop in crops:
+                        counts.append(visualmetrics.color_frame_differences(
+                            self.frames[name], self.frames[reference], crop, width, height))
+            return counts
+        self.assert_same_counts(compare, resized=True)
+
+
+
+@unittest.skipUnless(has_numpy(), 'NumPy and Pillow are not installed')
+class TestDecodedFrameCache(unittest.TestCase):
+    """Frames are decoded once and re-used across the in-process comparisons"""
+    def setUp(self):
+        import numpy
+        from PIL import Image
+        self.temp_dir = tempfile.mkdtemp()
+        nprng = numpy.random.RandomState(22)
+        self.frames = []
+        for index in range(6):
+            path = os.path.join(self.temp_dir, 'ms_{0:06d}.png'.format(index * 100))
+            Image.fromarray(nprng.randint(0, 256, (48, 64, 3)).astype(numpy.uint8)).save(path)
+            self.frames.append(path)
+        self.reset(fastcompare=True)
+
+    def tearDown(self):
+        self.reset(fastcompare=False)
+        visualmetrics.options = None
+        shutil.rmtree(self.temp_dir)
+
+    def reset(self, fastcompare):
+        visualmetrics.options = argparse.Namespace(fastcompare=fastcompare, viewport=False,
+                                                   framecache=256, jobs=1)
+        visualmetrics.fast_compare = None
+        visualmetrics.client_viewport = None
+        visualmetrics.decoded_frame_cache_enabled = True
+        visualmetrics.decoded_frames.clear()
+        for key in visualmetrics.decoded_frame_stats:
+            visualmetrics.decoded_frame_stats[key] = 0
+
+    def stats(self):
+        return dict((key, visualmetrics.decoded_frame_stats[key]) for key in ['hits', 'misses'])
+
+    def test_reused_with_fast_compare(self):
+        # Each frame is compared with the next one, like eliminate_duplicate_frames
+        for image1, image2 in zip(self.frames, self.frames[1:]):
+            self.assertIsNotNone(visualmetrics.frame_differences(image1, image2, 10, None, None))
+        self.assertEqual(self.stats(), {'hits': len(self.frames) - 2, 'misses': len(self.frames)})
+        self.assertEqual(len(visualmetrics.decoded_frames), len(self.frames))
+        # The histograms are the last pass so they use and release the cached frames
+        histograms = [visualmetrics.calculate_image_histogram(frame) for frame in self.frames]
+        self.assertEqual(self.stats(), {'hits': len(self.frames) * 2 - 2, 'misses': len(self.frames)})
+        self.assertEqual(len(visualmetrics.decoded_frames), 0)
+        self.assertEqual(visualmetrics.decoded_frame_stats['bytes'], 0)
+        self.assertEqual(histograms,
+                         [visualmetrics.calculate_image_histogram(frame) for frame in self.frames])
+
+    def test_not_cached_without_fast_compare(self):
+        self.reset(fastcompare=False)
+        for _ in range(2):
+            for frame in self.frames:
+                self.assertIsNotNone(visualmetrics.calculate_image_histogram(frame))
+        self.assertEqual(self.stats(), {'hits': 0, 'misses': len(self.frames) * 2})
+        self.assertEqual(len(visualmetrics.decoded_frames), 0)
+        self.assertEqual(visualmetrics.decoded_frame_stats['bytes'], 0)
+
+    def test_renamed_and_modified_frames(self):
+        from PIL import Image
+        pixels = visualmetrics.load_frame(self.frames[0])
+        dest = os.path.join(self.temp_dir, 'renamed.png')
+        visualmetrics.rename_frame(self.frames[0], dest)
+        self.assertIs(visualmetrics.load_frame(dest), pixels)
+        self.assertEqual(self.stats(), {'hits': 1, 'misses': 1})
+        # Replacing the file decodes it again
+        Image.new('RGB', (64, 48), (255, 255, 255)).save(dest)
+        stat = os.stat(dest)
+        os.utime(dest, (stat.st_atime, stat.st_mtime + 10))
+        self.assertEqual(int(visualmetrics.load_frame(dest).min()), 255)
+        self.assertEqual(self.stats(), {'hits': 1, 'misses': 2})
+        self.assertEqual(visualmetrics.decoded_frame_stats['bytes'], 64 * 48 * 3)
+
+
+@unittest.skipUnless(has_numpy(), 'NumPy and Pillow are not installed')
+class TestImageHistogram(unittest.TestCase):
+    """The NumPy histogram must match the histogram built from the image
+    colors, including which near-white pixels are left out"""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        visualmetrics.options = None
+        visualmetrics.fast_compare = None
+
+    def tearDown(self):
+        visualmetrics.fast_compare = None
+        shutil.rmtree(self.temp_dir)
+
+    def save(self, name, pixels):
+        from PIL import Image
+        path = os.path.join(self.temp_dir, name)
+        Image.fromarray(pixels).save(path)
+        return path
+
+    def test_white_threshold(self):
+        import numpy
+        # Pixels are only left out if every channel is at least 250
+        colors = [(255, 255, 255), (250, 250, 250), (249, 250, 250), (250, 249, 250),
+                  (250, 250, 249), (249, 249, 249), (0, 250, 255), (251, 252, 253)]
+        pixels = numpy.array([colors], numpy.uint8)
+        expected = {'r': [0] * 256, 'g': [0] * 256, 'b': [0] * 256}
+        for color in colors:
+            if min(color) < 250:
+                for channel, value in zip('rgb', color):
+                    expected[channel][value] += 1
+        path = self.save('threshold.png', pixels)
+        self.assertEqual(visualmetrics.calculate_image_histogram(path), expected)
+        self.assertEqual(visualmetrics.calculate_image_histogram_colors(path), expected)
+
+    def test_synthetic_frames(self):
+        import numpy
+        nprng = numpy.random.RandomState(23)
+        frames = {'white.png': numpy.full((48, 64, 3), 255, numpy.uint8),
+                  'near_white.png': nprng.randint(245, 256, (48, 64, 3)).astype(numpy.uint8),
+                  'random.png': nprng.randint(0, 256, (120, 160, 3)).astype(numpy.uint8)}
+        page = numpy.full((240, 320, 3), 255, numpy.uint8)
+        page[20:60, 10:300] = (30, 60, 200)
+        page[100:200, 40:280] = nprng.randint(0, 256, (100, 240, 3))
+        page[210:230] = nprng.randint(248, 252, (20, 320, 3))
+        frames['page.png'] = page
+        frames['page.jpg'] = page
+        for name, pixels in frames.items():
+            path = self.save(name, pixels)
+            histogram = visualmetrics.calculate_image_histogram(path)
+            self.assertEqual(histogram, visualmetrics.calculate_image_histogram_colors(path), name)
+            self.assertEqual(sorted(histogram.keys()), ['b', 'g', 'r'])
+            for channel in histogram:
+                self.assertEqual(len(histogram[channel]), 256)
+        self.assertEqual(sum(visualmetrics.calculate_image_histogram(
+            os.path.join(self.temp_dir, 'white.png'))['r']), 0)
+
+
+def random_histogram(rng, kind):
+    """A random histogram: dense, sparse with large counts, or empty"""
+    histogram = {}
+    for channel in ['r', 'g', 'b']:
+        if kind == 'dense':
+            histogram[channel] = [rng.randint(0, 50) for _ in range(256)]
+        elif kind == 'sparse':
+            histogram[channel] = [rng.choice([0, 0, 0, rng.randint(0, 1000000)]) for _ in range(256)]
+        else:
+            histogram[channel] = [0] * 256
+    return histogram
+
+
+def random_histograms(rng, count):
+    """Histograms for a capture, with repeated frames to create ties"""
+    histograms = []
+    for _ in range(count):
+        if histograms and rng.random() < 0.2:
+            histograms.append(rng.choice(histograms))
+        else:
+            histograms.append(random_histogram(rng, rng.choice(['dense', 'sparse', 'sparse', 'empty'])))
+    return histograms
+
+
+@unittest.skipUnless(has_numpy(), 'NumPy and Pillow are not installed')
+class TestFramesProgress(unittest.TestCase):
+    """The batched progress must match calculate_frame_progress for every frame"""
+    def assert_same_progress(self, histograms):
+        start = histograms[0]
+        final = histograms[-1]
+        expected = [visualmetrics.calculate_frame_progress(histogram, start, final)
+                    for histogram in histograms]
+        actual = visualmetrics.calculate_frames_progress(histograms, start, final)
+        self.assertEqual(actual, expected)
+        self.assertEqual([type(progress) for progress in actual],
+                         [type(progress) for progress in expected])
+
+    def test_randomized(self):
+        rng = random.Random(25)
+        for _ in range(50):
+            self.assert_same_progress(random_histograms(rng, rng.randint(1, 12)))
+
+    def test_visual_progress(self):
+        rng = random.Random(27)
+        for count in [1, visualmetrics.PROGRESS_BATCH_MIN - 1, visualmetrics.PROGRESS_BATCH_MIN, 20]:
+            histograms = random_histograms(rng, count)
+            frames = [{'time': index * 100, 'file': 'ms_{0:06d}.png'.format(index * 100),
+                       'histogram': histogram} for index, histogram in enumerate(histograms)]
+            progress = visualmetrics.calculate_visual_progress(frames)
+            self.assertEqual([frame['time'] for frame in progress], [frame['time'] for frame in frames])
+            self.assertEqual([frame['file'] for frame in progress],
+                             ['ms_{0:06d}'.format(index * 100) for index in range(count)])
+            self.assertEqual([frame['progress'] for frame in progress],
+                             [visualmetrics.calculate_frame_progress(histogram, histograms[0], histograms[-1])
+                              for histogram in histograms])
+
+    def test_edge_cases(self):
+        rng = random.Random(26)
+        empty = random_histogram(rng, 'empty')
+        dense = random_histogram(rng, 'dense')
+        sparse = random_histogram(rng, 'sparse')
+        # Single frames, all-empty captures (no change, 100%) and captures
+        # where the first and last frames are the same
+        for histograms in [[dense], [empty], [empty, empty, empty], [dense, sparse, dense],
+                           [empty, dense, sparse], [sparse, empty], [dense, dense, sparse, sparse]]:
+            self.assert_same_progress(histograms)
+        self.assertEqual(visualmetrics.calculate_frames_progress([empty, empty], empty, empty), [100, 100])
+
+    def test_slop_window(self):
+        # Colors that moved by up to 4 buckets still match, 5 or more do not
+        for shift, progress in [(4, 100), (5, 0), (-5, 100), (-6, 0)]:
+            start = {'r': [0] * 256, 'g': [0] * 256, 'b': [0] * 256}
+            final = {'r': [0] * 256, 'g': [0] * 256, 'b': [0] * 256}
+            frame = {'r': [0] * 256, 'g': [0] * 256, 'b': [0] * 256}
+            final['r'][100] = 10
+            frame['r'][100 + shift] = 10
+            self.assertEqual(visualmetrics.calculate_frames_progress([start, frame, final], start, final),
+                             [0, progress, 100])
+            self.assertEqual(visualmetrics.calculate_frame_progress(frame, start, final), progress)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Tests for the websocket frame masking in ws4py"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ws4py.framing import Frame, OPCODE_BINARY  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def reference_mask(masking_key, data):
+    """The per-octet masking algorithm from RFC 6455 section 5.3"""
+    key = bytearray(masking_key)
+    masked = bytearray(data)
+    for i in range(len(masked)):
+        masked[i] ^= key[i % 4]
+    return masked
+
+
+class TestFrameMask(unittest.TestCase):
+    """Masking the whole payload at once must match the per-octet loop"""
+    def test_matches_reference(self):
+        rng = random.Random(5)
+        for length in [0, 1, 2, 3, 4, 5, 7, 8, 125, 126, 1023, 1024, 65536, 65537]:
+            masking_key = bytes(bytearray(rng.randrange(256) for _ in range(4)))
+            data = bytes(bytearray(rng.randrange(256) for _ in range(length)))
+            frame = Frame(opcode=OPCODE_BINARY, body=data, masking_key=masking_key, fin=1)
+            masked = frame.mask(data)
+            self.assertIsInstance(masked, bytearray)
+            self.assertEqual(len(masked), length)
+            self.assertEqual(masked, reference_mask(masking_key, data), length)
+            self.assertEqual(bytes(frame.unmask(bytes(masked))), data)
+
+    def test_leading_zeros(self):
+        """Zero bytes at the start of the payload or key must be preserved"""
+        for masking_key in [b'\x00\x00\x00\x00', b'\x00\x01\x00\x02', b'\xff\xff\xff\xff']:
+            frame = Frame(opcode=OPCODE_BINARY, masking_key=masking_key, fin=1)
+            for data in [b'\x00', b'\x00\x00\x00\x00\x00\x01', b'\xff\x00\xff\x00\xff']:
+                self.assertEqual(frame.mask(data), reference_mask(masking_key, data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1009,6 +1009,9 @@ def main():
     parser.add_argument('--collectversion', action='store_true', default=False,
                         help="Collection browser versions and submit to controller.")
     parser.add_argument('--healthcheckport', type=int, default=8889, help='Run a HTTP health check server on the given port.')
+    parser.add_argument('--bodyrequests', type=int, default=8,
+                        help='Number of response body requests to keep in flight when '
+                        'collecting bodies from Chrome (defaults to 8).')
 
     # Video capture/display settings
     parser.add_argument('--xvfb', action='store_true', default=False,
@@ -1016,6 +1019,12 @@ def main():
     parser.add_argument('--fps', type=int, choices=range(1, 61), default=10,
                         help='Video capture frame rate (defaults to 10). '
                              'Valid range is 1-60 (Linux only).')
+    parser.add_argument('--videojobs', type=int, default=0,
+                        help='Number of video frames to process in parallel after each run '
+                             '(defaults to 0, one per CPU).')
+    parser.add_argument('--fastcompare', action='store_true', default=False,
+                        help='Compare video frames in-process with NumPy and Pillow instead of '
+                             'running ImageMagick for each comparison.')
 
     # Server/location configuration
     parser.add_argument('--server',
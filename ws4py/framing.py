@@ -35,7 +35,7 @@ class Frame(object):
 
         .. seealso:: Data Framing http://tools.ietf.org/html/rfc6455#section-5.2
         """
-        if not isinstance(body, bytes):
+        if not isinstance(body, (bytes, bytearray)):
             raise TypeError("The body must be properly encoded")
 
         self.opcode = opcode
@@ -239,12 +239,17 @@ class Frame(object):
         if len(buf) < self.payload_length:
             nxt_buf_size = self.payload_length - len(buf)
             some_bytes = (yield nxt_buf_size)
-            some_bytes = buf + (some_bytes or b'')
-            while len(some_bytes) < self.payload_length:
-                l = self.payload_length - len(some_bytes)
+            # Reassemble the payload in a single growing bytearray rather
+            # than concatenating (and copying) the bytes for every chunk
+            payload = bytearray(buf)
+            if some_bytes:
+                payload += some_bytes
+            while len(payload) < self.payload_length:
+                l = self.payload_length - len(payload)
                 b = (yield l)
                 if b is not None:
-                    some_bytes = some_bytes + b
+                    payload += b
+            some_bytes = payload
         else:
             if self.payload_length == len(buf):
                 some_bytes = buf
@@ -264,10 +269,19 @@ class Frame(object):
            transformed-octet-i = original-octet-i XOR masking-key-octet-j
 
         """
+        length = len(data)
+        if py3k:
+            if not length:
+                return bytearray()
+            # XOR the whole payload at once as a single big integer against
+            # the key repeated to the payload length
+            key = bytes(self.masking_key)
+            key = (key * (length // 4 + 1))[:length]
+            masked = int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')
+            return bytearray(masked.to_bytes(length, 'big'))
         masked = bytearray(data)
-        if py3k: key = self.masking_key
-        else: key = map(ord, self.masking_key)
-        for i in range(len(data)):
+        key = map(ord, self.masking_key)
+        for i in range(length):
             masked[i] = masked[i] ^ key[i%4]
         return masked
     unmask = mask
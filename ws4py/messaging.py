@@ -36,9 +36,7 @@ class Message(object):
             if not encoding:
                 raise TypeError("unicode data without an encoding")
             data = data.encode(encoding)
-        elif isinstance(data, bytearray):
-            data = bytes(data)
-        elif not isinstance(data, bytes):
+        elif not isinstance(data, (bytes, bytearray)):
             raise TypeError("%s is not a supported data type" % type(data))
 
         self.data = data
@@ -91,10 +89,11 @@ class Message(object):
         """
         Add more ``data`` to the message.
         """
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, bytearray)):
+            if not isinstance(self.data, bytearray):
+                # Switch to a bytearray so fragmented messages grow in place
+                self.data = bytearray(self.data)
             self.data += data
-        elif isinstance(data, bytearray):
-            self.data += bytes(data)
         elif isinstance(data, unicode):
             self.data += data.encode(self.encoding)
         else:
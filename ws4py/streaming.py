@@ -210,8 +210,10 @@ class Stream(object):
                             # in the utf8 validator as we need integers
                             # when we get each byte one by one.
                             # Our only solution here is to convert our
-                            # string to a bytearray.
-                            some_bytes = bytearray(some_bytes)
+                            # string to a bytearray (large payloads are
+                            # already reassembled into one).
+                            if not isinstance(some_bytes, bytearray):
+                                some_bytes = bytearray(some_bytes)
 
                     if frame.opcode == OPCODE_TEXT:
                         if self.message and not self.message.completed: